@@ -0,0 +1,19 @@
+#!/bin/bash
+
+# 정리 스크립트 공용 함수 (cleanup-all-clusters.sh, cluster-cleanup-interactive.sh에서 source)
+# 불러오는 스크립트에서 SCRIPT_DIR, AWS_REGION을 설정해야 합니다.
+
+# 인벤토리 스냅샷 조회 (automation_tests/resource_inventory.py)
+inventory() {
+    PYTHONPATH="$SCRIPT_DIR" python3 -m automation_tests.resource_inventory --aws-region "$AWS_REGION" "$@"
+}
+
+# 동시에 실행 중인 다른 자동화와 API 할당량 공유 (automation_tests/rate_limiter.py)
+# 제한기가 실패하면(python3 없음, 상태 파일 쓰기 불가, import 오류 등) 삭제가 빠지지 않도록 제한 없이 실행
+limited() {
+    if command -v python3 &> /dev/null && \
+        ! PYTHONPATH="$SCRIPT_DIR" python3 -m automation_tests.rate_limiter acquire -- "$@"; then
+        echo -e "\033[1;33m[WARNING]\033[0m 요청 제한기를 사용할 수 없어 제한 없이 실행합니다: $*" >&2
+    fi
+    "$@"
+}
@@ -56,9 +56,27 @@ EOF
 # CloudWatch 로그 그룹 생성
 aws logs create-log-group     --log-group-name /ecs/container-course     --region $AWS_REGION
 
+# ECS 배포 엔진 (내용이 같은 태스크 정의 리비전 재사용, 서비스 동시 롤아웃 후 안정 상태 대기)
+# python3 + boto3가 없으면 AWS CLI로 직접 등록/생성
+AUTOMATION_HOME="${MCP_AUTOMATION_HOME:-$(cd "$(dirname "$0")/../.." && pwd)}"
+ecs_deployer() {
+    PYTHONPATH="$AUTOMATION_HOME${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.ecs_deployer \
+        --region "$AWS_REGION" --cluster container-course-cluster "$@"
+}
+if command -v python3 &> /dev/null && \
+    PYTHONPATH="$AUTOMATION_HOME" python3 -c "import boto3, automation_tests.ecs_deployer" 2> /dev/null; then
+    USE_ECS_DEPLOYER=true
+else
+    USE_ECS_DEPLOYER=false
+fi
+
 # 태스크 정의 등록
 echo "태스크 정의 등록 중..."
-aws ecs register-task-definition     --cli-input-json file://task-definition.json
+if [ "$USE_ECS_DEPLOYER" = true ]; then
+    TASK_DEFINITION_ARN=$(ecs_deployer register task-definition.json)
+else
+    TASK_DEFINITION_ARN=$(aws ecs register-task-definition     --cli-input-json file://task-definition.json     --query 'taskDefinition.taskDefinitionArn'     --output text)
+fi
 
 # VPC 및 서브넷 생성
 echo "VPC 및 서브넷 생성 중..."
@@ -89,9 +107,13 @@ SECURITY_GROUP_ID=$(aws ec2 create-security-group     --group-name container-cou
 # 보안 그룹 규칙 설정
 aws ec2 authorize-security-group-ingress     --group-id $SECURITY_GROUP_ID     --protocol tcp     --port 80     --cidr 0.0.0.0/0
 
-# ECS 서비스 생성
+# ECS 서비스 생성 (이미 같은 리비전으로 실행 중이면 재배포하지 않음)
 echo "ECS 서비스 생성 중..."
-aws ecs create-service     --cluster container-course-cluster     --service-name container-course-service     --task-definition container-course-task     --desired-count 2     --launch-type FARGATE     --network-configuration "awsvpcConfiguration={subnets=[$SUBNET_ID],securityGroups=[$SECURITY_GROUP_ID],assignPublicIp=ENABLED}"
+if [ "$USE_ECS_DEPLOYER" = true ]; then
+    ecs_deployer deploy task-definition.json         --service container-course-service=2         --subnet $SUBNET_ID         --security-group $SECURITY_GROUP_ID
+else
+    aws ecs create-service     --cluster container-course-cluster     --service-name container-course-service     --task-definition $TASK_DEFINITION_ARN     --desired-count 2     --launch-type FARGATE     --network-configuration "awsvpcConfiguration={subnets=[$SUBNET_ID],securityGroups=[$SECURITY_GROUP_ID],assignPublicIp=ENABLED}"
+fi
 
 # 서비스 상태 확인
 echo "서비스 상태 확인 중..."
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+gcloud/kubectl/eksctl 명령 녹화/재생 카세트
+명령의 argv, stdout, stderr, 종료 코드, 소요 시간을 카세트(JSON Lines)에 기록하고
+재생 모드에서는 실제 클라우드 없이 기록된 결과를 그대로 돌려줍니다.
+
+- Python: ContainerCourseAutomation(runner=Cassette(...).run) 처럼 subprocess.run 대신 사용
+- Bash: PATH 앞에 shim 디렉토리를 추가하면 스크립트의 CLI 호출이 카세트를 거침
+
+사용 예:
+    # 녹화 (실제 CLI 실행 후 기록)
+    eval "$(python -m automation_tests.cassette install --dir .cassette-bin --cassette day1.jsonl --mode record)"
+    ./k8s-cluster-create.sh
+
+    # 재생 (기록된 지연 시간까지 재현하려면 --latency)
+    eval "$(python -m automation_tests.cassette install --dir .cassette-bin --cassette day1.jsonl --mode replay)"
+    ./k8s-cluster-create.sh
+"""
+
+import os
+import errno
+import sys
+import json
+import time
+import fcntl
+import shutil
+import logging
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+MODES = ("record", "replay")
+DEFAULT_TOOLS = ("gcloud", "kubectl", "eksctl", "aws", "helm")
+
+
+class CassetteMissError(LookupError):
+    """재생 모드에서 기록되지 않은 명령이 호출된 경우"""
+
+
+def _argv_key(argv: Sequence[str]) -> str:
+    return json.dumps(list(argv), ensure_ascii=False)
+
+
+class Cassette:
+    """명령 실행 녹화/재생 클래스 (subprocess.run 호환 인터페이스)"""
+
+    def __init__(self, path: Path, mode: str = "replay", latency: bool = False, speed: float = 1.0,
+                 substitutions: Optional[Dict[str, str]] = None, state_path: Optional[Path] = None,
+                 runner: Callable[..., subprocess.CompletedProcess] = subprocess.run):
+        """
+        Args:
+            path: 카세트 파일 경로 (JSON Lines)
+            mode: "record" 또는 "replay"
+            latency: 재생 시 기록된 소요 시간만큼 대기할지 여부
+            speed: 지연 재현 배속 (2.0이면 절반 시간)
+            substitutions: argv 정규화 치환 {"<placeholder>": "실제 값"} (실행마다 달라지는 경로 등)
+            state_path: 재생 위치를 여러 프로세스가 공유할 때 사용할 상태 파일 (PATH shim용)
+            runner: 녹화 모드에서 실제 명령을 실행할 함수
+        """
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 카세트 모드: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.speed = speed if speed > 0 else 1.0
+        self.substitutions = substitutions or {}
+        self.state_path = Path(state_path) if state_path else None
+        self.runner = runner
+        self._interactions: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._consumed: Dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # 정규화 및 저장
+    # ------------------------------------------------------------------
+    def normalize(self, command: Sequence[str]) -> List[str]:
+        """실행마다 달라지는 값을 자리표시자로 치환"""
+        argv = [str(arg) for arg in command]
+        for placeholder, value in self.substitutions.items():
+            if value:
+                argv = [arg.replace(value, placeholder) for arg in argv]
+        return argv
+
+    def _append(self, interaction: Dict[str, Any]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(interaction, ensure_ascii=False) + "\n"
+        # O_APPEND 단일 write로 여러 shim 프로세스가 동시에 기록해도 줄이 섞이지 않음
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def interactions(self) -> Dict[str, List[Dict[str, Any]]]:
+        """argv별로 묶은 기록 목록 (기록 순서 유지)"""
+        if self._interactions is None:
+            grouped: Dict[str, List[Dict[str, Any]]] = {}
+            if self.path.exists():
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            item = json.loads(line)
+                            grouped.setdefault(_argv_key(item["argv"]), []).append(item)
+            self._interactions = grouped
+        return self._interactions
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run(self, command: Sequence[str], capture_output: bool = False, text: bool = True, check: bool = False,
+            cwd=None, env=None, timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+        """subprocess.run과 같은 방식으로 명령 실행 (녹화 또는 재생)"""
+        if self.mode == "record":
+            result = self._record(command, cwd=cwd, env=env, timeout=timeout, **kwargs)
+        else:
+            result = self._replay(command, timeout=timeout)
+
+        if not capture_output:
+            # 캡처를 요청하지 않은 호출은 실제 실행처럼 터미널로 출력
+            if result.stdout:
+                sys.stdout.write(result.stdout)
+            if result.stderr:
+                sys.stderr.write(result.stderr)
+            result = subprocess.CompletedProcess(result.args, result.returncode, None, None)
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, list(command), result.stdout, result.stderr)
+        return result
+
+    def _record(self, command: Sequence[str], cwd=None, env=None, timeout=None, **kwargs) -> subprocess.CompletedProcess:
+        start = time.monotonic()
+        try:
+            result = self.runner(list(command), capture_output=True, text=True, check=False,
+                                 cwd=cwd, env=env, timeout=timeout, **kwargs)
+        except subprocess.TimeoutExpired:
+            self._append({"argv": self.normalize(command), "stdout": "", "stderr": "", "returncode": None,
+                          "timeout": True, "duration": round(time.monotonic() - start, 4)})
+            raise
+        self._append({
+            "argv": self.normalize(command),
+            "stdout": result.stdout or "",
+            "stderr": result.stderr or "",
+            "returncode": result.returncode,
+            "duration": round(time.monotonic() - start, 4)
+        })
+        return subprocess.CompletedProcess(list(command), result.returncode, result.stdout or "", result.stderr or "")
+
+    def _next_index(self, key: str) -> int:
+        """argv별 재생 위치 (state_path가 있으면 프로세스 간 공유)"""
+        if not self.state_path:
+            index = self._consumed.get(key, 0)
+            self._consumed[key] = index + 1
+            return index
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, 'a+', encoding='utf-8') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            content = f.read()
+            state = json.loads(content) if content.strip() else {}
+            index = state.get(key, 0)
+            state[key] = index + 1
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(state, ensure_ascii=False))
+        return index
+
+    def _replay(self, command: Sequence[str], timeout=None) -> subprocess.CompletedProcess:
+        argv = self.normalize(command)
+        key = _argv_key(argv)
+        recorded = self.interactions().get(key)
+        if not recorded:
+            raise CassetteMissError(f"카세트에 기록되지 않은 명령: {' '.join(argv)}")
+        index = self._next_index(key)
+        # 기록보다 많이 호출되면 마지막 결과를 반복 (폴링 명령 등)
+        item = recorded[min(index, len(recorded) - 1)]
+
+        if self.latency and item.get("duration"):
+            time.sleep(item["duration"] / self.speed)
+        if item.get("timeout"):
+            raise subprocess.TimeoutExpired(list(command), timeout or item.get("duration", 0))
+        return subprocess.CompletedProcess(list(command), item["returncode"], item["stdout"], item["stderr"])
+
+    def reset(self):
+        """재생 위치 초기화"""
+        self._consumed.clear()
+        if self.state_path and self.state_path.exists():
+            self.state_path.unlink()
+
+
+# ----------------------------------------------------------------------
+# Bash 스크립트용 PATH shim
+# ----------------------------------------------------------------------
+SHIM_TEMPLATE = """#!/bin/sh
+# cassette shim ({mode}) - automation_tests/cassette.py 가 생성
+PYTHONPATH="{package_root}${{PYTHONPATH:+:$PYTHONPATH}}" exec "{python}" -m automation_tests.cassette shim \\
+    --cassette "{cassette}" --mode {mode}{latency} --tool "{tool}" --real "{real}" -- "$@"
+"""
+
+
+def install_shims(shim_dir: Path, cassette_path: Path, mode: str = "replay", tools: Sequence[str] = DEFAULT_TOOLS,
+                  latency: bool = False) -> Path:
+    """
+    CLI 도구 이름으로 shim 스크립트 생성
+
+    Returns:
+        PATH 앞에 추가할 shim 디렉토리
+    """
+    shim_dir = Path(shim_dir).resolve()
+    shim_dir.mkdir(parents=True, exist_ok=True)
+    # 실제 도구 경로는 shim 디렉토리를 제외한 PATH에서 찾음
+    search_path = os.pathsep.join(p for p in os.environ.get("PATH", "").split(os.pathsep)
+                                  if p and Path(p).resolve() != shim_dir)
+    state_path = Path(cassette_path).resolve().with_suffix(".cursor")
+    if state_path.exists():
+        state_path.unlink()
+    for tool in tools:
+        real = shutil.which(tool, path=search_path) or ""
+        if mode == "record" and not real:
+            logger.warning(f"⚠️ 녹화 모드지만 실제 {tool} 실행 파일을 찾을 수 없습니다")
+        shim = shim_dir / tool
+        shim.write_text(SHIM_TEMPLATE.format(
+            mode=mode, latency=" --latency" if latency else "", tool=tool, real=real,
+            python=sys.executable, cassette=Path(cassette_path).resolve(),
+            package_root=Path(__file__).resolve().parent.parent
+        ), encoding='utf-8')
+        shim.chmod(0o755)
+    return shim_dir
+
+
+def run_shim(cassette_path: Path, mode: str, tool: str, real: str, args: List[str], latency: bool = False) -> int:
+    """shim 진입점: 도구 호출을 녹화/재생하고 종료 코드 반환"""
+    def real_runner(command, **kwargs):
+        # 카세트에는 도구 이름으로 기록하고 실행은 실제 경로로 하여 설치 위치와 무관하게 재생
+        if not real:
+            # 도구 이름으로 실행하면 PATH에서 이 shim을 다시 찾아 무한 재귀하므로 실행하지 않음
+            raise FileNotFoundError(errno.ENOENT, f"실제 {tool} 실행 파일을 찾을 수 없습니다 "
+                                                  f"(shim 설치 시 shim 디렉토리를 제외한 PATH에 없음)", tool)
+        return subprocess.run([real] + list(command[1:]), **kwargs)
+
+    cassette = Cassette(cassette_path, mode=mode, latency=latency,
+                        state_path=Path(cassette_path).with_suffix(".cursor"), runner=real_runner)
+    try:
+        result = cassette.run([tool] + args, capture_output=True)
+    except (CassetteMissError, FileNotFoundError) as e:
+        sys.stderr.write(f"[cassette] {e}\n")
+        return 127
+    except subprocess.TimeoutExpired:
+        return 124
+    sys.stdout.write(result.stdout or "")
+    sys.stderr.write(result.stderr or "")
+    return result.returncode
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="CLI 명령 녹화/재생 카세트")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    install_parser = sub.add_parser("install", help="PATH shim 설치 후 export 문 출력")
+    install_parser.add_argument("--dir", type=Path, required=True, help="shim 디렉토리")
+    install_parser.add_argument("--cassette", type=Path, required=True, help="카세트 파일")
+    install_parser.add_argument("--mode", choices=MODES, default="replay")
+    install_parser.add_argument("--latency", action="store_true", help="재생 시 기록된 지연 재현")
+    install_parser.add_argument("--tool", action="append", dest="tools", help="shim을 만들 도구 (반복 가능)")
+
+    shim_parser = sub.add_parser("shim", help="shim 내부 진입점")
+    shim_parser.add_argument("--cassette", type=Path, required=True)
+    shim_parser.add_argument("--mode", choices=MODES, required=True)
+    shim_parser.add_argument("--latency", action="store_true")
+    shim_parser.add_argument("--tool", required=True)
+    shim_parser.add_argument("--real", default="")
+    shim_parser.add_argument("args", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args(argv)
+    if args.command == "install":
+        shim_dir = install_shims(args.dir, args.cassette, args.mode, args.tools or DEFAULT_TOOLS, args.latency)
+        print(f'export PATH="{shim_dir}:$PATH"')
+        return 0
+
+    shim_args = args.args[1:] if args.args[:1] == ["--"] else args.args
+    return run_shim(args.cassette, args.mode, args.tool, args.real, shim_args, args.latency)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
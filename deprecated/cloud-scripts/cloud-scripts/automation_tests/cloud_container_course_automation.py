@@ -16,6 +16,12 @@ import logging
 from pathlib import Path
 import subprocess
 
+sys.path.append(str(Path(__file__).parent.parent))
+from automation_tests.metrics_exporter import metrics_step, metrics_from_env
+from automation_tests.retry_executor import RetryExecutor, tee_stderr
+from automation_tests.rate_limiter import shared_limiter
+from automation_tests.sample_manifests import sample_app_manifest
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -30,11 +36,44 @@ logger = logging.getLogger(__name__)
 class ContainerCourseAutomation:
     """Cloud Container 과정 자동화 클래스 (실행자 모드)"""
 
-    def __init__(self, base_path: Path):
+    def __init__(self, base_path: Path, config: dict = None, env: dict = None, runner=None, cluster_pool=None,
+                 metrics=None, credential_broker=None, retry_policy=None, rate_limiter=None):
+        """
+        Args:
+            base_path: 매니페스트 등 작업 파일을 생성할 디렉토리
+            config: 클러스터 설정 (없으면 gcloud 설정에서 로드)
+            env: 명령 실행 환경 변수 (테넌트별 KUBECONFIG 등, 없으면 현재 환경)
+            runner: subprocess.run 호환 명령 실행 함수 (카세트 녹화/재생 등, 없으면 subprocess.run)
+            cluster_pool: 웜 클러스터 풀 (있으면 클러스터를 새로 만드는 대신 임대하고, 정리 시 반납)
+            metrics: AutomationMetrics (있으면 명령/단계/리소스 메트릭 기록)
+            credential_broker: CredentialBroker (있으면 get-credentials 대신 캐시된 자격 증명으로 kubeconfig 작성)
+            retry_policy: 일시적 오류 재시도 정책 (없으면 RetryPolicy 기본값)
+            rate_limiter: RateLimiter (있으면 명령마다 API 계열별 공유 할당량 토큰 확보, 재시도도 토큰 사용)
+        """
         self.base_path = base_path
         self.course_name = "cloud_container"
         self.status = "not_started"
-        self.config = self.load_config()
+        self.env = env
+        self.cluster_pool = cluster_pool
+        self.metrics = metrics
+        self.credential_broker = credential_broker
+
+        def wrap(run):
+            if metrics:
+                run = metrics.instrument(run)
+            if rate_limiter:
+                # 대기 시간이 명령 지연 시간 메트릭에 섞이지 않도록 계측 바깥에서 대기
+                run = rate_limiter.wrap(run)
+            return run
+
+        self.runner = wrap(runner or subprocess.run)
+        # 실제 실행 시 캡처하지 않는 명령(클러스터 생성 등)은 진행 상황을 바로 출력
+        stream_runner = None if runner else wrap(tee_stderr)
+        # 쿼터/진행 중인 작업 등 일시적 오류는 과정 전체를 다시 돌리지 않고 명령 단위로 재시도
+        self.retry = RetryExecutor(self.runner, policy=retry_policy, metrics=metrics, stream_runner=stream_runner)
+        self.runner = self.retry
+        self.results = {}
+        self.config = dict(config) if config else self.load_config()
         self.created_resources = {"gcp": []}
 
     def load_config(self) -> dict:
@@ -51,12 +90,13 @@ class ContainerCourseAutomation:
     def _run_command(self, command, capture=False, check=True, cwd=None):
         logger.info(f"Executing command: {' '.join(command)}")
         try:
-            result = subprocess.run(
+            result = self.runner(
                 command, 
                 capture_output=capture, 
                 text=True, 
                 check=check, 
                 cwd=cwd,
+                env=self.env,
                 timeout=900 # 15 minutes for long commands like cluster creation
             )
             if capture:
@@ -71,38 +111,49 @@ class ContainerCourseAutomation:
             logger.error(f"Command timed out: {' '.join(command)}")
             raise
 
+    @staticmethod
+    def sample_app_manifest() -> dict:
+        """1일차 샘플 앱(Nginx) Deployment 매니페스트 (sample_manifests.py)"""
+        return sample_app_manifest()
+
+    @metrics_step("day1")
     def run_day1(self) -> bool:
         logger.info("🌅 1일차: GKE 클러스터 생성 및 앱 배포 시작")
         cluster_name = self.config['cluster_name']
         zone = self.config['gcp_zone']
         try:
-            # 1. GKE 클러스터 생성
-            logger.info(f"Creating GKE cluster {cluster_name}... This may take several minutes.")
-            self._run_command(["gcloud", "container", "clusters", "create", cluster_name, "--zone", zone, "--num-nodes", "1"])
-            self.created_resources["gcp"].append({"type": "gke_cluster", "name": cluster_name, "zone": zone})
-            logger.info(f"✅ GKE 클러스터 생성 완료: {cluster_name}")
+            # 1. GKE 클러스터 생성 (풀이 있으면 준비된 클러스터 임대)
+            if self.cluster_pool:
+                lease = self.cluster_pool.lease(holder=cluster_name)
+                cluster_name, zone = lease.cluster_name, lease.zone
+                self.created_resources["gcp"].append({"type": "pool_lease", "name": cluster_name, "zone": zone,
+                                                      "lease_id": lease.lease_id})
+                logger.info(f"✅ 웜 풀 클러스터 임대 완료: {cluster_name}")
+            else:
+                logger.info(f"Creating GKE cluster {cluster_name}... This may take several minutes.")
+                self._run_command(["gcloud", "container", "clusters", "create", cluster_name, "--zone", zone, "--num-nodes", "1"])
+                self.created_resources["gcp"].append({"type": "gke_cluster", "name": cluster_name, "zone": zone})
+                if self.metrics:
+                    self.metrics.resource_created("gcp", "gke_cluster")
+                if self.credential_broker:
+                    # 같은 이름으로 다시 만든 클러스터일 수 있으므로 이전 엔드포인트/CA 폐기
+                    self.credential_broker.invalidate(cluster_name, zone, self.config.get('gcp_project_id'))
+                logger.info(f"✅ GKE 클러스터 생성 완료: {cluster_name}")
 
             # 2. kubectl 설정
-            self._run_command(["gcloud", "container", "clusters", "get-credentials", cluster_name, "--zone", zone])
+            if self.credential_broker:
+                # 실습 중 토큰이 만료되지 않도록 kubectl이 실행될 때마다 캐시된 토큰을 받아 가는 exec 방식 사용
+                broker_env = self.credential_broker.env(cluster_name, zone, self.config.get('gcp_project_id'),
+                                                        exec_mode=True)
+                self.env = {**(self.env or os.environ), **broker_env}
+            else:
+                self._run_command(["gcloud", "container", "clusters", "get-credentials", cluster_name, "--zone", zone])
             logger.info("✅ kubectl 설정 완료")
 
             # 3. 샘플 앱 배포 (Nginx)
-            app_yaml = {
-                'apiVersion': 'apps/v1',
-                'kind': 'Deployment',
-                'metadata': {'name': 'nginx-deployment'},
-                'spec': {
-                    'replicas': 2,
-                    'selector': {'matchLabels': {'app': 'nginx'}},
-                    'template': {
-                        'metadata': {'labels': {'app': 'nginx'}},
-                        'spec': {'containers': [{'name': 'nginx', 'image': 'nginx:latest', 'ports': [{'containerPort': 80}]}]}
-                    }
-                }
-            }
             yaml_path = self.base_path / "nginx-deployment.yaml"
             with open(yaml_path, 'w') as f:
-                yaml.dump(app_yaml, f)
+                yaml.dump(self.sample_app_manifest(), f)
             
             self._run_command(["kubectl", "apply", "-f", str(yaml_path)])
             logger.info("✅ Nginx Deployment 배포 완료")
@@ -116,6 +167,7 @@ class ContainerCourseAutomation:
             logger.error(f"❌ 1일차 실습 실패: {e}", exc_info=True)
             return False
 
+    @metrics_step("day2")
     def run_day2(self) -> bool:
         logger.info("🌅 2일차: 오토스케일링 및 모니터링 시작")
         try:
@@ -136,13 +188,22 @@ class ContainerCourseAutomation:
             logger.error(f"❌ 2일차 실습 실패: {e}", exc_info=True)
             return False
 
+    @metrics_step("cleanup")
     def cleanup_resources(self):
         logger.info("🧹 리소스 정리 시작")
         for resource in reversed(self.created_resources["gcp"]):
             try:
-                if resource["type"] == "gke_cluster":
+                if resource["type"] == "pool_lease":
+                    logger.info(f"Returning GKE cluster {resource['name']} to the warm pool...")
+                    self.cluster_pool.release(resource["lease_id"])
+                elif resource["type"] == "gke_cluster":
                     logger.info(f"Deleting GKE cluster {resource['name']}... This may take several minutes.")
                     self._run_command(["gcloud", "container", "clusters", "delete", resource["name"], "--zone", resource["zone"], "--quiet"])
+                    if self.metrics:
+                        self.metrics.resource_deleted("gcp", "gke_cluster")
+                    if self.credential_broker:
+                        self.credential_broker.invalidate(resource["name"], resource["zone"],
+                                                          self.config.get('gcp_project_id'))
             except Exception as e:
                 logger.error(f"Failed to delete GCP resource {resource}: {e}")
 
@@ -151,7 +212,9 @@ class ContainerCourseAutomation:
         self.status = "in_progress"
         if not self.run_day1():
             logger.error("❌ 1일차 과정 실행 실패")
+            self.status = "failed"
             self.cleanup_resources()
+            self._record_results()
             return False
         # if not self.run_day2(): # Day 2 is optional for this run
         #     logger.error("❌ 2일차 과정 실행 실패")
@@ -160,8 +223,16 @@ class ContainerCourseAutomation:
         self.status = "completed"
         logger.info(f"🎉 {self.course_name} 과정 완료!")
         self.cleanup_resources()
+        self._record_results()
         return True
 
+    def _record_results(self):
+        """실행 결과에 재시도 횟수와 재시도로 잃은 시간 기록"""
+        self.results = {"course": self.course_name, "status": self.status, "retries": self.retry.stats.to_dict()}
+        if self.retry.stats.retries:
+            logger.info(f"🔁 {self.retry.stats.summary()}")
+
 if __name__ == "__main__":
-    automation = ContainerCourseAutomation(Path(__file__).parent)
+    automation = ContainerCourseAutomation(Path(__file__).parent, metrics=metrics_from_env(),
+                                           rate_limiter=shared_limiter())
     automation.run_course()
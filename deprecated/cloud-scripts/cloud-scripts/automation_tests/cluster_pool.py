@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+GKE 웜 클러스터 풀
+미리 생성해 둔 N개의 클러스터를 TTL이 있는 임대(lease)로 나누어 주고,
+반납 시 클러스터를 삭제하는 대신 초기 상태로 되돌려(네임스페이스, CRD, HPA 정리) 다시 풀에 넣습니다.
+
+풀 상태는 로컬 SQLite에 저장되므로 여러 프로세스(테넌트 팬아웃 등)가 같은 풀을 공유할 수 있습니다.
+
+사용 예:
+    python -m automation_tests.cluster_pool warm --size 5
+    python -m automation_tests.cluster_pool lease --holder student01 --ttl 7200
+    python -m automation_tests.cluster_pool release <lease_id>
+    python -m automation_tests.cluster_pool status
+
+생성/초기화 도중 프로세스가 죽어 provisioning/resetting 상태로 남은 클러스터는 stale_timeout이 지나면
+gcloud로 실제 상태를 확인해 RUNNING이면 풀로 되돌리고, 없거나 비정상이면 삭제합니다 (warm, reap 시).
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import argparse
+import threading
+import subprocess
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Callable
+
+from .common import run_cli
+from .namespace_teardown import NamespaceTeardown
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_DIR = Path(os.environ.get(
+    "MCP_CLUSTER_POOL_DIR", Path.home() / ".cache" / "mcp_cloud" / "cluster_pool"))
+DEFAULT_LEASE_TTL = 4 * 3600
+# 생성/초기화가 이보다 오래 provisioning/resetting이면 중단된 것으로 보고 복구
+DEFAULT_STALE_TIMEOUT = 3600
+DEFAULT_BASE_NAME = "mcp-pool"
+DEFAULT_ZONE = "asia-northeast3-a"
+
+# default 네임스페이스에서 정리할 워크로드 리소스
+DEFAULT_NAMESPACE_KINDS = "deployments,statefulsets,daemonsets,replicasets,jobs,cronjobs,pods,ingresses,pvc,configmaps,secrets"
+
+STATE_PROVISIONING = "provisioning"
+STATE_READY = "ready"
+STATE_LEASED = "leased"
+STATE_RESETTING = "resetting"
+STATE_BROKEN = "broken"
+IN_PROGRESS_STATES = (STATE_PROVISIONING, STATE_RESETTING)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clusters (
+    name TEXT PRIMARY KEY,
+    zone TEXT NOT NULL,
+    state TEXT NOT NULL,
+    lease_id TEXT UNIQUE,
+    holder TEXT,
+    leased_at REAL,
+    expires_at REAL,
+    created_at REAL NOT NULL,
+    reset_at REAL,
+    state_since REAL,
+    baseline_crds TEXT NOT NULL DEFAULT '[]',
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_clusters_state ON clusters (state);
+"""
+
+
+class PoolExhaustedError(RuntimeError):
+    """임대 가능한 클러스터가 없음"""
+
+
+class LeaseNotFoundError(KeyError):
+    """존재하지 않거나 이미 반납된 임대"""
+
+
+@dataclass
+class Lease:
+    """클러스터 임대 정보"""
+    lease_id: str
+    cluster_name: str
+    zone: str
+    holder: str
+    expires_at: float
+    kubeconfig: str
+
+
+class ClusterPool:
+    """웜 클러스터 풀 관리 클래스"""
+
+    def __init__(self, pool_dir: Path = DEFAULT_POOL_DIR, size: int = 3, base_name: str = DEFAULT_BASE_NAME,
+                 zone: str = DEFAULT_ZONE, num_nodes: int = 1, lease_ttl: float = DEFAULT_LEASE_TTL,
+                 runner: Callable[..., str] = run_cli, max_workers: int = 4,
+                 clock: Callable[[], float] = time.time, stale_timeout: float = DEFAULT_STALE_TIMEOUT):
+        """
+        Args:
+            pool_dir: 풀 상태 DB와 클러스터별 kubeconfig 디렉토리
+            size: 유지할 클러스터 수
+            base_name: 클러스터 이름 접두사 (<base_name>-<번호>)
+            zone: 클러스터 생성 존
+            num_nodes: 클러스터당 노드 수
+            lease_ttl: 기본 임대 시간 (초)
+            runner: CLI 실행 함수 (명령, env -> 표준 출력)
+            max_workers: 동시 생성/초기화 수
+            clock: 현재 시각 함수 (테스트용 교체 지점)
+            stale_timeout: provisioning/resetting 상태가 이보다 오래되면 중단된 작업으로 보고 복구 (초)
+        """
+        self.pool_dir = Path(pool_dir)
+        self.size = size
+        self.base_name = base_name
+        self.zone = zone
+        self.num_nodes = num_nodes
+        self.lease_ttl = lease_ttl
+        self.runner = runner
+        self.max_workers = max_workers
+        self.clock = clock
+        self.stale_timeout = stale_timeout
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 여러 프로세스가 같은 풀을 공유하므로 임대는 BEGIN IMMEDIATE 트랜잭션으로 처리
+        self.conn = sqlite3.connect(str(self.pool_dir / "pool.db"), check_same_thread=False,
+                                    isolation_level=None, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        # state_since 열이 없던 이전 풀 DB 갱신 (다른 프로세스가 먼저 추가했으면 무시)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(clusters)")}
+        if "state_since" not in columns:
+            try:
+                self.conn.execute("ALTER TABLE clusters ADD COLUMN state_since REAL")
+            except sqlite3.OperationalError as e:
+                if "duplicate column" not in str(e):
+                    raise
+
+    def close(self):
+        self.conn.close()
+
+    def kubeconfig_path(self, cluster_name: str) -> Path:
+        """클러스터 전용 kubeconfig (사용자 kubeconfig를 건드리지 않음)"""
+        return self.pool_dir / f"{cluster_name}.kubeconfig"
+
+    def _kube_env(self, cluster_name: str) -> Dict[str, str]:
+        return {"KUBECONFIG": str(self.kubeconfig_path(cluster_name))}
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _fetchone(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Row]:
+        rows = self._execute(sql, params)
+        return rows[0] if rows else None
+
+    def _set_state(self, name: str, state: str, **fields):
+        fields.setdefault("state_since", self.clock())
+        columns = ", ".join(f"{key}=?" for key in ["state", *fields])
+        self._execute(f"UPDATE clusters SET {columns} WHERE name=?", (state, *fields.values(), name))
+
+    def clusters(self) -> List[Dict[str, Any]]:
+        """풀의 클러스터 목록"""
+        rows = self._execute("SELECT * FROM clusters ORDER BY name")
+        return [dict(row) for row in rows]
+
+    # --- 생성 / 초기화 -------------------------------------------------------
+
+    def _next_names(self, count: int) -> List[str]:
+        existing = {c["name"] for c in self.clusters()}
+        names, index = [], 1
+        while len(names) < count:
+            name = f"{self.base_name}-{index:02d}"
+            if name not in existing:
+                names.append(name)
+            index += 1
+        return names
+
+    def _provision(self, name: str):
+        """클러스터 생성 후 kubeconfig와 기본 CRD 목록 기록"""
+        self.runner(["gcloud", "container", "clusters", "create", name, "--zone", self.zone,
+                     "--num-nodes", str(self.num_nodes), "--quiet"])
+        self._finish_provision(name, self.zone)
+
+    def _finish_provision(self, name: str, zone: str):
+        """생성된 클러스터의 kubeconfig와 기본 CRD 목록 기록 후 준비 상태로 전환"""
+        self.runner(["gcloud", "container", "clusters", "get-credentials", name, "--zone", zone],
+                    env=self._kube_env(name))
+        baseline = self._list_names(name, ["kubectl", "get", "crd"])
+        self._set_state(name, STATE_READY, baseline_crds=json.dumps(baseline), reset_at=self.clock(), error=None)
+
+    def _list_names(self, cluster_name: str, command: List[str]) -> List[str]:
+        output = self.runner([*command, "-o", "jsonpath={.items[*].metadata.name}"],
+                             env=self._kube_env(cluster_name))
+        return output.split()
+
+    def _reset(self, name: str):
+        """임대 중 생성된 리소스 정리 (클러스터 자체는 유지)"""
+        env = self._kube_env(name)
+        if not self.kubeconfig_path(name).exists():
+            zone = self._fetchone("SELECT zone FROM clusters WHERE name=?", (name,))["zone"]
+            self.runner(["gcloud", "container", "clusters", "get-credentials", name, "--zone", zone], env=env)
+
+        row = self._fetchone("SELECT baseline_crds FROM clusters WHERE name=?", (name,))
+        baseline = set(json.loads(row["baseline_crds"]))
+        extra_crds = [crd for crd in self._list_names(name, ["kubectl", "get", "crd"]) if crd not in baseline]
+        # 과정 네임스페이스와 추가 CRD를 한꺼번에 삭제하고, finalizer에 막혀 남으면 broken 처리
+        NamespaceTeardown(self.runner, env=env).teardown(refs=[f"crd/{crd}" for crd in extra_crds],
+                                                         raise_on_blocked=True)
+        self.runner(["kubectl", "delete", "hpa", "--all", "--all-namespaces", "--ignore-not-found"], env=env)
+        self.runner(["kubectl", "delete", DEFAULT_NAMESPACE_KINDS, "--all", "-n", "default",
+                     "--ignore-not-found"], env=env)
+        self.runner(["kubectl", "delete", "services", "-n", "default", "--field-selector",
+                     "metadata.name!=kubernetes", "--ignore-not-found"], env=env)
+
+        self._set_state(name, STATE_READY, lease_id=None, holder=None, leased_at=None, expires_at=None,
+                        reset_at=self.clock(), error=None)
+
+    def _run_parallel(self, names: List[str], action: Callable[[str], None]) -> Dict[str, str]:
+        """여러 클러스터에 작업 동시 실행, 실패한 클러스터는 broken 처리"""
+        failures = {}
+        if not names:
+            return failures
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(names))) as executor:
+            futures = {executor.submit(action, name): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"❌ 클러스터 {name} 작업 실패: {e}")
+                    self._set_state(name, STATE_BROKEN, error=str(e))
+                    failures[name] = str(e)
+        return failures
+
+    def _cluster_status(self, name: str, zone: str) -> Optional[str]:
+        """GKE 클러스터 상태 (RUNNING, PROVISIONING, ERROR 등, 없으면 None)"""
+        try:
+            output = self.runner(["gcloud", "container", "clusters", "describe", name, "--zone", zone,
+                                  "--format", "value(status)"])
+        except subprocess.CalledProcessError as e:
+            if "NOT_FOUND" in (e.stderr or "") or "not found" in (e.stderr or "").lower():
+                return None
+            raise
+        return output.strip() or None
+
+    def _recover(self, name: str) -> str:
+        """중단된 생성/초기화 복구 (RUNNING이면 풀로 되돌리고, 없거나 비정상이면 삭제)"""
+        row = self._fetchone("SELECT zone, state FROM clusters WHERE name=?", (name,))
+        status = self._cluster_status(name, row["zone"])
+        if status == "RUNNING":
+            if row["state"] == STATE_PROVISIONING:
+                self._finish_provision(name, row["zone"])
+            else:
+                self._reset(name)
+            logger.info(f"✅ 중단된 {row['state']} 클러스터를 풀로 복구: {name}")
+            return "returned"
+        logger.warning(f"중단된 {row['state']} 클러스터 삭제: {name} (GKE 상태 {status or '없음'})")
+        if status is None:
+            self._execute("DELETE FROM clusters WHERE name=?", (name,))
+            self.kubeconfig_path(name).unlink(missing_ok=True)
+        else:
+            self._delete_cluster(name)
+        return "deleted"
+
+    def recover_stale(self) -> Dict[str, List[str]]:
+        """
+        stale_timeout보다 오래 provisioning/resetting인 클러스터 복구
+
+        Returns:
+            {"returned": 풀로 되돌린 클러스터, "deleted": 삭제한 클러스터}
+            (확인/복구에 실패한 클러스터는 broken 처리되어 ensure_warm에서 교체)
+        """
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                placeholders = ", ".join("?" for _ in IN_PROGRESS_STATES)
+                rows = self.conn.execute(
+                    f"SELECT name FROM clusters WHERE state IN ({placeholders}) "
+                    f"AND COALESCE(state_since, reset_at, created_at) < ?",
+                    (*IN_PROGRESS_STATES, now - self.stale_timeout)).fetchall()
+                names = [row["name"] for row in rows]
+                # 다른 프로세스가 같은 클러스터를 동시에 복구하지 않도록 시각 갱신
+                for name in names:
+                    self.conn.execute("UPDATE clusters SET state_since=? WHERE name=?", (now, name))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        outcomes: Dict[str, List[str]] = {"returned": [], "deleted": []}
+        if not names:
+            return outcomes
+        logger.warning(f"중단된 생성/초기화 확인: {', '.join(names)}")
+        results: Dict[str, str] = {}
+
+        def recover(name: str):
+            results[name] = self._recover(name)
+
+        self._run_parallel(names, recover)
+        for name in names:
+            if name in results:
+                outcomes[results[name]].append(name)
+        return outcomes
+
+    def ensure_warm(self) -> Dict[str, Any]:
+        """
+        풀 크기 유지: 만료된 임대 회수, 중단된 생성/초기화 복구, 고장난 클러스터 교체, 부족한 클러스터 생성
+
+        Returns:
+            생성/회수/복구/교체 요약
+        """
+        reclaimed = self.reap_expired()
+        recovered = self.recover_stale()
+
+        broken = [c["name"] for c in self.clusters() if c["state"] == STATE_BROKEN]
+        for name in broken:
+            logger.info(f"고장난 클러스터 교체: {name}")
+            self._delete_cluster(name)
+
+        active = [c for c in self.clusters() if c["state"] != STATE_BROKEN]
+        missing = max(0, self.size - len(active))
+        names = self._next_names(missing)
+        now = self.clock()
+        for name in names:
+            self._execute("INSERT INTO clusters (name, zone, state, created_at, state_since) VALUES (?, ?, ?, ?, ?)",
+                          (name, self.zone, STATE_PROVISIONING, now, now))
+        if names:
+            logger.info(f"웜 클러스터 {len(names)}개 생성 중: {', '.join(names)}")
+        failures = self._run_parallel(names, self._provision)
+        return {"created": [n for n in names if n not in failures], "failed": failures,
+                "reclaimed": reclaimed, "recovered": recovered, "replaced": broken}
+
+    # --- 임대 API -----------------------------------------------------------
+
+    def _claim(self, holder: str, ttl: float) -> Optional[Lease]:
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute(
+                    "SELECT name, zone FROM clusters WHERE state=? ORDER BY reset_at LIMIT 1",
+                    (STATE_READY,)).fetchone()
+                if row is None:
+                    self.conn.execute("COMMIT")
+                    return None
+                now = self.clock()
+                lease = Lease(lease_id=uuid.uuid4().hex, cluster_name=row["name"], zone=row["zone"],
+                              holder=holder, expires_at=now + ttl,
+                              kubeconfig=str(self.kubeconfig_path(row["name"])))
+                self.conn.execute(
+                    "UPDATE clusters SET state=?, lease_id=?, holder=?, leased_at=?, expires_at=?, state_since=? "
+                    "WHERE name=?",
+                    (STATE_LEASED, lease.lease_id, holder, now, lease.expires_at, now, lease.cluster_name))
+                self.conn.execute("COMMIT")
+                return lease
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def lease(self, holder: str, ttl: Optional[float] = None, wait_seconds: float = 0.0,
+              poll_interval: float = 5.0) -> Lease:
+        """
+        준비된 클러스터 임대
+
+        Args:
+            holder: 임대자 (테넌트 이름 등)
+            ttl: 임대 시간 (초, 없으면 기본값). 만료되면 자동 회수 대상
+            wait_seconds: 준비된 클러스터가 없을 때 대기할 시간
+            poll_interval: 대기 중 확인 간격
+
+        Raises:
+            PoolExhaustedError: 대기 시간 안에 임대 가능한 클러스터가 없음
+        """
+        ttl = self.lease_ttl if ttl is None else ttl
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            lease = self._claim(holder, ttl)
+            if lease is None and self.reap_expired():
+                lease = self._claim(holder, ttl)
+            if lease:
+                logger.info(f"✅ 클러스터 임대: {lease.cluster_name} -> {holder} (lease {lease.lease_id})")
+                return lease
+            if time.monotonic() >= deadline:
+                raise PoolExhaustedError(f"임대 가능한 클러스터가 없습니다 (풀 크기 {self.size})")
+            time.sleep(poll_interval)
+
+    def _leased_cluster(self, lease_id: str) -> str:
+        row = self._fetchone("SELECT name FROM clusters WHERE lease_id=? AND state=?",
+                             (lease_id, STATE_LEASED))
+        if row is None:
+            raise LeaseNotFoundError(lease_id)
+        return row["name"]
+
+    def renew(self, lease_id: str, ttl: Optional[float] = None) -> float:
+        """임대 연장 (새 만료 시각 반환)"""
+        name = self._leased_cluster(lease_id)
+        expires_at = self.clock() + (self.lease_ttl if ttl is None else ttl)
+        self._execute("UPDATE clusters SET expires_at=? WHERE name=?", (expires_at, name))
+        return expires_at
+
+    def release(self, lease_id: str) -> bool:
+        """
+        임대 반납: 클러스터를 초기화해 풀로 되돌림
+
+        Returns:
+            초기화 성공 여부 (실패한 클러스터는 broken 처리되어 다음 ensure_warm에서 교체)
+        """
+        name = self._leased_cluster(lease_id)
+        self._set_state(name, STATE_RESETTING)
+        failures = self._run_parallel([name], self._reset)
+        if not failures:
+            logger.info(f"✅ 클러스터 반납 및 초기화 완료: {name}")
+        return not failures
+
+    def reap_expired(self) -> List[str]:
+        """만료된 임대 회수 (초기화 후 풀로 반환)"""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self.clock()
+                rows = self.conn.execute("SELECT name FROM clusters WHERE state=? AND expires_at < ?",
+                                         (STATE_LEASED, now)).fetchall()
+                names = [row["name"] for row in rows]
+                for name in names:
+                    self.conn.execute("UPDATE clusters SET state=?, state_since=? WHERE name=?",
+                                      (STATE_RESETTING, now, name))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        if names:
+            logger.warning(f"만료된 임대 회수: {', '.join(names)}")
+        failures = self._run_parallel(names, self._reset)
+        return [name for name in names if name not in failures]
+
+    # --- 정리 ---------------------------------------------------------------
+
+    def _delete_cluster(self, name: str):
+        zone = self._fetchone("SELECT zone FROM clusters WHERE name=?", (name,))["zone"]
+        try:
+            self.runner(["gcloud", "container", "clusters", "delete", name, "--zone", zone, "--quiet"])
+        except subprocess.CalledProcessError as e:
+            logger.error(f"클러스터 삭제 실패 (이미 삭제되었을 수 있음): {name}: {e.stderr}")
+        self._execute("DELETE FROM clusters WHERE name=?", (name,))
+        self.kubeconfig_path(name).unlink(missing_ok=True)
+
+    def destroy(self, include_leased: bool = False) -> List[str]:
+        """풀 클러스터 삭제 (기본적으로 임대 중인 클러스터는 제외)"""
+        names = [c["name"] for c in self.clusters() if include_leased or c["state"] != STATE_LEASED]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(names)))) as executor:
+            list(executor.map(self._delete_cluster, names))
+        return names
+
+    def status(self) -> Dict[str, Any]:
+        """풀 상태 요약"""
+        clusters = self.clusters()
+        counts: Dict[str, int] = {}
+        for cluster in clusters:
+            counts[cluster["state"]] = counts.get(cluster["state"], 0) + 1
+        return {"size": self.size, "states": counts, "clusters": clusters}
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="GKE 웜 클러스터 풀")
+    parser.add_argument("--pool-dir", type=Path, default=DEFAULT_POOL_DIR, help="풀 상태 디렉토리")
+    parser.add_argument("--size", type=int, default=3, help="유지할 클러스터 수")
+    parser.add_argument("--base-name", default=DEFAULT_BASE_NAME, help="클러스터 이름 접두사")
+    parser.add_argument("--zone", default=DEFAULT_ZONE, help="클러스터 생성 존")
+    parser.add_argument("--stale-timeout", type=float, default=DEFAULT_STALE_TIMEOUT,
+                        help="provisioning/resetting 상태를 중단된 것으로 볼 시간(초)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("warm", help="풀 크기 유지 (생성/회수/교체)")
+    lease_parser = sub.add_parser("lease", help="클러스터 임대 (JSON 출력)")
+    lease_parser.add_argument("--holder", required=True, help="임대자 이름")
+    lease_parser.add_argument("--ttl", type=float, help="임대 시간(초)")
+    lease_parser.add_argument("--wait", type=float, default=0.0, help="대기 시간(초)")
+    renew_parser = sub.add_parser("renew", help="임대 연장")
+    renew_parser.add_argument("lease_id")
+    renew_parser.add_argument("--ttl", type=float, help="연장할 임대 시간(초)")
+    release_parser = sub.add_parser("release", help="임대 반납 (클러스터 초기화)")
+    release_parser.add_argument("lease_id")
+    sub.add_parser("reap", help="만료된 임대 회수, 중단된 생성/초기화 복구")
+    sub.add_parser("status", help="풀 상태 출력")
+    destroy_parser = sub.add_parser("destroy", help="풀 클러스터 삭제")
+    destroy_parser.add_argument("--include-leased", action="store_true", help="임대 중인 클러스터도 삭제")
+    args = parser.parse_args(argv)
+
+    pool = ClusterPool(args.pool_dir, size=args.size, base_name=args.base_name, zone=args.zone,
+                       stale_timeout=args.stale_timeout)
+    try:
+        if args.command == "warm":
+            summary = pool.ensure_warm()
+            print(json.dumps(summary, ensure_ascii=False, indent=2))
+            return 1 if summary["failed"] else 0
+        if args.command == "lease":
+            try:
+                lease = pool.lease(args.holder, ttl=args.ttl, wait_seconds=args.wait)
+            except PoolExhaustedError as e:
+                logger.error(str(e))
+                return 2
+            print(json.dumps(asdict(lease), ensure_ascii=False, indent=2))
+            return 0
+        if args.command == "renew":
+            print(pool.renew(args.lease_id, ttl=args.ttl))
+            return 0
+        if args.command == "release":
+            return 0 if pool.release(args.lease_id) else 1
+        if args.command == "reap":
+            print(json.dumps({"reclaimed": pool.reap_expired(), **pool.recover_stale()}, ensure_ascii=False))
+            return 0
+        if args.command == "destroy":
+            print(json.dumps(pool.destroy(include_leased=args.include_leased), ensure_ascii=False))
+            return 0
+        print(json.dumps(pool.status(), ensure_ascii=False, indent=2))
+        return 0
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
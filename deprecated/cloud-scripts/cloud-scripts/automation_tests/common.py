@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+자동화 모듈 공용 도우미
+클러스터 풀, 네임스페이스 정리, 진단/지연 측정 등이 함께 쓰는 CLI 실행 함수, 보호 네임스페이스 목록, 단계 프로파일링 데코레이터
+"""
+
+import os
+import subprocess
+from functools import wraps
+from typing import Dict, List, Optional
+
+from .rate_limiter import shared_limiter
+
+# 초기화/정리 시 삭제하지 않는 시스템 네임스페이스
+PROTECTED_NAMESPACES = {"default", "kube-system", "kube-public", "kube-node-lease"}
+PROTECTED_NAMESPACE_PREFIXES = ("gke-", "gmp-")
+
+
+def run_cli(command: List[str], env: Optional[Dict[str, str]] = None) -> str:
+    """CLI 명령 실행 후 표준 출력 반환 (실패 시 CalledProcessError)"""
+    limiter = shared_limiter()
+    if limiter:
+        limiter.acquire(command)
+    result = subprocess.run(command, capture_output=True, text=True, check=True, timeout=1800,
+                            env={**os.environ, **env} if env else None)
+    return result.stdout
+
+
+def profile_step(name: str):
+    """
+    메서드 단계 프로파일링 데코레이터 (self.profiler가 없으면 그대로 실행)
+    프로파일러는 profile(name) 컨텍스트 매니저를 가진 객체를 설정으로 주입받습니다.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, "profiler", None)
+            if profiler is None:
+                return func(self, *args, **kwargs)
+            with profiler.profile(name):
+                return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
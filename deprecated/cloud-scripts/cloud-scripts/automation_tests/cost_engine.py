@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+리소스 비용 추정 엔진
+리소스 인벤토리(노드 풀, 머신 타입, 디스크, 로드 밸런서, 가동 시간)와 로컬 가격표로
+리소스별/테넌트별 비용을 NumPy 벡터 연산으로 계산합니다.
+
+리소스는 열 단위 배열에 저장되며 추가/변경/삭제 시 해당 행만 갱신되므로
+수천 개 리소스도 즉시 다시 계산할 수 있습니다.
+
+사용 예:
+    python -m automation_tests.cost_engine --top 10
+    python -m automation_tests.cost_engine --idle-min-hourly 0.05 --json
+"""
+
+import re
+import sys
+import json
+import logging
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRICING_PATH = Path(__file__).parent / "pricing_tables.json"
+# 테넌트 팬아웃(tenant_fanout)이 만드는 클러스터 이름의 테넌트 부분 (예: mcp-container-cluster-student01)
+DEFAULT_TENANT_PATTERN = r"(student\d+)"
+SHARED_TENANT = "shared"
+
+KINDS = ["cluster_fee", "node", "disk", "load_balancer"]
+PROVIDERS = ["gcp", "aws"]
+
+
+def load_pricing(path: Path = DEFAULT_PRICING_PATH) -> Dict[str, Any]:
+    """로컬 가격표 로드"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _hours_since(timestamp: Optional[str], now: datetime) -> float:
+    """ISO 8601 생성 시각부터 현재까지의 시간(시간 단위)"""
+    if not timestamp:
+        return 0.0
+    try:
+        created = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return max(0.0, (now - created).total_seconds() / 3600.0)
+
+
+class CostEngine:
+    """열 단위 배열 기반 비용 계산 엔진"""
+
+    def __init__(self, pricing: Optional[Dict[str, Any]] = None, tenant_pattern: str = DEFAULT_TENANT_PATTERN,
+                 initial_capacity: int = 1024):
+        """
+        Args:
+            pricing: 가격표 (없으면 pricing_tables.json 로드)
+            tenant_pattern: 리소스 이름에서 테넌트를 추출할 정규식 (첫 번째 그룹)
+            initial_capacity: 초기 배열 크기 (부족하면 두 배씩 확장)
+        """
+        self.pricing = pricing or load_pricing()
+        self.hours_per_month = float(self.pricing.get("hours_per_month", 730))
+        self.tenant_regex = re.compile(tenant_pattern)
+        self._unknown_skus = set()
+
+        self.ids: List[Optional[str]] = []
+        self.meta: List[Optional[Dict[str, str]]] = []
+        self.index: Dict[str, int] = {}
+        self.tenants: List[str] = []
+        self.tenant_index: Dict[str, int] = {}
+        self._free: List[int] = []
+
+        capacity = max(16, initial_capacity)
+        self.rate = np.zeros(capacity)
+        self.quantity = np.zeros(capacity)
+        self.uptime = np.zeros(capacity)
+        self.utilization = np.full(capacity, np.nan)
+        self.tenant = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    # ------------------------------------------------------------------
+    # 가격표
+    # ------------------------------------------------------------------
+    def hourly_rate(self, provider: str, kind: str, sku: Optional[str]) -> float:
+        """단위당 시간 요금 (디스크는 GB-월 요금을 시간 단위로 환산)"""
+        table = self.pricing.get(provider, {}).get(kind, {})
+        if sku in table:
+            rate = float(table[sku])
+        else:
+            if (provider, kind, sku) not in self._unknown_skus:
+                self._unknown_skus.add((provider, kind, sku))
+                logger.warning(f"⚠️ 가격표에 없는 SKU, 기본 요금 사용: {provider}/{kind}/{sku}")
+            rate = float(table.get("default", 0.0))
+        if kind == "disk":
+            rate /= self.hours_per_month
+        return rate
+
+    def tenant_of(self, name: str) -> str:
+        match = self.tenant_regex.search(name or "")
+        return match.group(1) if match else SHARED_TENANT
+
+    # ------------------------------------------------------------------
+    # 행 관리
+    # ------------------------------------------------------------------
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def _grow(self, needed: int):
+        capacity = len(self.rate)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for attr, fill in (("rate", 0.0), ("quantity", 0.0), ("uptime", 0.0), ("utilization", np.nan),
+                           ("tenant", 0), ("alive", False)):
+            old = getattr(self, attr)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, attr, new)
+
+    def _tenant_id(self, tenant: str) -> int:
+        if tenant not in self.tenant_index:
+            self.tenant_index[tenant] = len(self.tenants)
+            self.tenants.append(tenant)
+        return self.tenant_index[tenant]
+
+    def _row_for(self, resource_id: str) -> int:
+        row = self.index.get(resource_id)
+        if row is not None:
+            return row
+        if self._free:
+            row = self._free.pop()
+            self.ids[row] = resource_id
+        else:
+            row = len(self.ids)
+            self._grow(row + 1)
+            self.ids.append(resource_id)
+            self.meta.append(None)
+        self.index[resource_id] = row
+        return row
+
+    def upsert(self, resource_id: str, provider: str, kind: str, sku: Optional[str], quantity: float = 1.0,
+               uptime_hours: float = 0.0, name: Optional[str] = None, tenant: Optional[str] = None,
+               utilization: float = np.nan):
+        """리소스 하나 추가/변경 (해당 행만 갱신)"""
+        self.upsert_many([{
+            "resource_id": resource_id, "provider": provider, "kind": kind, "sku": sku,
+            "quantity": quantity, "uptime_hours": uptime_hours, "name": name, "tenant": tenant,
+            "utilization": utilization
+        }])
+
+    def upsert_many(self, rows: Iterable[Dict[str, Any]]):
+        """여러 리소스를 한 번에 추가/변경 (배열은 벡터 대입으로 갱신)"""
+        rows = list(rows)
+        if not rows:
+            return
+        idx = np.empty(len(rows), dtype=np.int64)
+        rates = np.empty(len(rows))
+        tenants = np.empty(len(rows), dtype=np.int32)
+        for i, row in enumerate(rows):
+            r = self._row_for(row["resource_id"])
+            idx[i] = r
+            rates[i] = self.hourly_rate(row["provider"], row["kind"], row.get("sku"))
+            name = row.get("name") or row["resource_id"]
+            tenants[i] = self._tenant_id(row.get("tenant") or self.tenant_of(name))
+            self.meta[r] = {"name": name, "provider": row["provider"], "kind": row["kind"],
+                            "sku": row.get("sku") or "default"}
+        self.rate[idx] = rates
+        self.quantity[idx] = [float(row.get("quantity", 1.0)) for row in rows]
+        self.uptime[idx] = [float(row.get("uptime_hours", 0.0)) for row in rows]
+        self.utilization[idx] = [np.nan if row.get("utilization") is None else row["utilization"] for row in rows]
+        self.tenant[idx] = tenants
+        self.alive[idx] = True
+
+    def remove(self, resource_id: str) -> bool:
+        """리소스 삭제 (행은 재사용 목록으로 반환)"""
+        row = self.index.pop(resource_id, None)
+        if row is None:
+            return False
+        self.alive[row] = False
+        self.ids[row] = None
+        self.meta[row] = None
+        self._free.append(row)
+        return True
+
+    def set_utilization(self, resource_id: str, utilization: float):
+        """사용률 갱신 (0.0 ~ 1.0, 사용량 수집 결과 반영용)"""
+        self.utilization[self.index[resource_id]] = utilization
+
+    # ------------------------------------------------------------------
+    # 인벤토리 연동
+    # ------------------------------------------------------------------
+    def rows_from_inventory(self, inventory, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """ResourceInventory 스냅샷을 비용 행으로 변환"""
+        now = now or datetime.now(timezone.utc)
+        rows = []
+
+        for cluster in inventory.query("gke_cluster"):
+            attrs = cluster["attrs"]
+            uptime = _hours_since(attrs.get("created"), now)
+            base = {"provider": "gcp", "uptime_hours": uptime, "name": cluster["name"]}
+            rows.append({**base, "resource_id": f"{cluster['resource_id']}#fee", "kind": "cluster_fee", "sku": "gke"})
+            pools = attrs.get("node_pools", [])
+            for pool in pools:
+                count = attrs.get("node_count") if len(pools) == 1 else pool.get("node_count")
+                rows.append({**base, "resource_id": f"{cluster['resource_id']}#{pool['name']}", "kind": "node",
+                             "sku": pool.get("machine_type"), "quantity": count or 0})
+
+        for cluster in inventory.query("eks_cluster"):
+            rows.append({"resource_id": f"{cluster['resource_id']}#fee", "provider": "aws", "kind": "cluster_fee",
+                         "sku": "eks", "name": cluster["name"],
+                         "uptime_hours": _hours_since(cluster["attrs"].get("created"), now)})
+
+        for resource_type, provider in (("gce_disk", "gcp"), ("ebs_volume", "aws")):
+            for disk in inventory.query(resource_type):
+                attrs = disk["attrs"]
+                rows.append({"resource_id": disk["resource_id"], "provider": provider, "kind": "disk",
+                             "sku": attrs.get("disk_type"), "quantity": attrs.get("size_gb", 0),
+                             "name": disk["name"], "uptime_hours": _hours_since(attrs.get("created"), now),
+                             "utilization": 0.0 if disk["status"] == "UNATTACHED" else None})
+
+        for rule in inventory.query("gce_forwarding_rule"):
+            rows.append({"resource_id": rule["resource_id"], "provider": "gcp", "kind": "load_balancer",
+                         "sku": "forwarding_rule", "name": rule["name"]})
+        for lb in inventory.query("load_balancer"):
+            rows.append({"resource_id": lb["resource_id"], "provider": "aws", "kind": "load_balancer",
+                         "sku": lb["attrs"].get("type"), "name": lb["name"],
+                         "uptime_hours": _hours_since(lb["attrs"].get("created"), now)})
+        return rows
+
+    def sync_inventory(self, inventory, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        인벤토리 스냅샷과 동기화 (변경된 리소스만 갱신, 사라진 리소스 삭제)
+
+        Returns:
+            추가/갱신/삭제 건수
+        """
+        rows = self.rows_from_inventory(inventory, now)
+        seen = {row["resource_id"] for row in rows}
+        removed = [rid for rid in list(self.index) if rid not in seen]
+        for resource_id in removed:
+            self.remove(resource_id)
+        added = sum(1 for row in rows if row["resource_id"] not in self.index)
+        self.upsert_many(rows)
+        return {"added": added, "updated": len(rows) - added, "removed": len(removed)}
+
+    # ------------------------------------------------------------------
+    # 계산
+    # ------------------------------------------------------------------
+    def hourly_costs(self) -> np.ndarray:
+        """행별 시간당 비용 (삭제된 행은 0)"""
+        n = self.size
+        return np.where(self.alive[:n], self.rate[:n] * self.quantity[:n], 0.0)
+
+    def accrued_costs(self) -> np.ndarray:
+        """행별 누적 비용 (가동 시간 기준)"""
+        return self.hourly_costs() * self.uptime[:self.size]
+
+    def tenant_totals(self) -> Dict[str, Dict[str, float]]:
+        """테넌트별 시간당/월 예상/누적 비용"""
+        n = self.size
+        hourly = np.bincount(self.tenant[:n], weights=self.hourly_costs(), minlength=len(self.tenants))
+        accrued = np.bincount(self.tenant[:n], weights=self.accrued_costs(), minlength=len(self.tenants))
+        return {tenant: {
+            "hourly": round(float(hourly[i]), 4),
+            "monthly": round(float(hourly[i] * self.hours_per_month), 2),
+            "accrued": round(float(accrued[i]), 2)
+        } for i, tenant in enumerate(self.tenants) if hourly[i] > 0 or accrued[i] > 0}
+
+    def idle_expensive(self, min_hourly: float = 0.01, max_utilization: float = 0.05) -> List[Dict[str, Any]]:
+        """
+        사용률이 낮은데 비싼 리소스 (정리 전 확인 대상)
+
+        Args:
+            min_hourly: 시간당 비용 하한
+            max_utilization: 유휴로 판단할 사용률 상한 (사용률을 모르는 리소스는 제외)
+        """
+        n = self.size
+        hourly = self.hourly_costs()
+        with np.errstate(invalid="ignore"):
+            mask = self.alive[:n] & (self.utilization[:n] <= max_utilization) & (hourly >= min_hourly)
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(-hourly[rows])]
+        return [self._describe(int(r), hourly) for r in rows]
+
+    def _describe(self, row: int, hourly: np.ndarray) -> Dict[str, Any]:
+        return {
+            "resource_id": self.ids[row],
+            **self.meta[row],
+            "tenant": self.tenants[self.tenant[row]],
+            "quantity": float(self.quantity[row]),
+            "hourly": round(float(hourly[row]), 4),
+            "monthly": round(float(hourly[row] * self.hours_per_month), 2),
+            "accrued": round(float(hourly[row] * self.uptime[row]), 2)
+        }
+
+    def report(self, top: int = 10, idle_min_hourly: float = 0.01) -> Dict[str, Any]:
+        """비용 요약 리포트"""
+        hourly = self.hourly_costs()
+        accrued = hourly * self.uptime[:self.size]
+        top_rows = np.argsort(-hourly)[:top]
+        return {
+            "resources": int(self.alive[:self.size].sum()),
+            "hourly": round(float(hourly.sum()), 4),
+            "monthly": round(float(hourly.sum() * self.hours_per_month), 2),
+            "accrued": round(float(accrued.sum()), 2),
+            "top": [self._describe(int(r), hourly) for r in top_rows if hourly[r] > 0],
+            "tenants": self.tenant_totals(),
+            "idle_expensive": self.idle_expensive(min_hourly=idle_min_hourly)
+        }
+
+
+def print_report(report: Dict[str, Any]):
+    """리포트 표 형식 출력"""
+    print(f"리소스 {report['resources']}개 | 시간당 ${report['hourly']:.4f} | "
+          f"월 예상 ${report['monthly']:.2f} | 누적 ${report['accrued']:.2f}")
+    print("\n[비용 상위 리소스]")
+    for item in report["top"]:
+        print(f"  {item['kind']:<13} {item['name']:<40} {item['sku']:<16} ${item['hourly']:.4f}/h  "
+              f"${item['monthly']:.2f}/월")
+    print("\n[테넌트별 비용]")
+    for tenant, totals in sorted(report["tenants"].items(), key=lambda kv: -kv[1]["hourly"]):
+        print(f"  {tenant:<20} ${totals['hourly']:.4f}/h  ${totals['monthly']:.2f}/월  누적 ${totals['accrued']:.2f}")
+    if report["idle_expensive"]:
+        print("\n[정리 권장: 유휴 리소스]")
+        for item in report["idle_expensive"]:
+            print(f"  ⚠️ {item['kind']:<13} {item['name']:<40} ${item['monthly']:.2f}/월")
+
+
+def main(argv=None):
+    """메인 함수"""
+    from .resource_inventory import ResourceInventory, DEFAULT_DB_PATH, DEFAULT_TTL_SECONDS
+
+    parser = argparse.ArgumentParser(description="리소스 인벤토리 기반 비용 추정")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="인벤토리 스냅샷 DB 경로")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL_SECONDS, help="스냅샷 유효 시간(초)")
+    parser.add_argument("--aws-region", action="append", dest="aws_regions", help="조회할 AWS 리전 (반복 가능)")
+    parser.add_argument("--pricing", type=Path, default=DEFAULT_PRICING_PATH, help="가격표 JSON 경로")
+    parser.add_argument("--top", type=int, default=10, help="출력할 상위 리소스 수")
+    parser.add_argument("--idle-min-hourly", type=float, default=0.01, help="유휴 리소스 경고 시간당 비용 하한")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    inventory = ResourceInventory(args.db, ttl_seconds=args.ttl, aws_regions=args.aws_regions)
+    try:
+        engine = CostEngine(load_pricing(args.pricing))
+        engine.sync_inventory(inventory)
+    finally:
+        inventory.close()
+
+    report = engine.report(top=args.top, idle_min_hourly=args.idle_min_hourly)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+GKE 클러스터 자격 증명 브로커
+컨텍스트별 클러스터 엔드포인트/CA와 단기 액세스 토큰을 캐시하고, 만료 전에 백그라운드에서 갱신합니다.
+kubectl에는 토큰이 들어 있는 kubeconfig를 넘겨 매 호출마다 실행되던
+gke-gcloud-auth-plugin(exec 자격 증명 도우미)과 매 실행마다의 get-credentials를 없앱니다.
+
+캐시 구성 (기본 ~/.cache/mcp_cloud/credentials, 파일 권한 0600):
+- token.json: gcloud 계정 액세스 토큰과 만료 시각 (모든 GKE 컨텍스트 공용)
+- clusters/<컨텍스트>.json: 엔드포인트, CA 인증서
+- kubeconfig/<컨텍스트>.yaml: 토큰이 포함된 kubeconfig (토큰 갱신 시 원자적으로 다시 씀)
+
+사용 예:
+    # Bash 스크립트: 토큰이 들어 있는 kubeconfig 사용 (만료 전 갱신은 daemon이 담당)
+    export KUBECONFIG=$(python -m automation_tests.credential_broker kubeconfig --cluster mcp-container-cluster --zone asia-northeast3-a)
+    python -m automation_tests.credential_broker daemon --cluster mcp-container-cluster --zone asia-northeast3-a &
+
+    # daemon 없이 쓰는 경우: 캐시된 토큰을 돌려주는 exec 자격 증명 kubeconfig
+    export KUBECONFIG=$(python -m automation_tests.credential_broker kubeconfig --exec --cluster mcp-container-cluster --zone asia-northeast3-a)
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import logging
+import argparse
+import threading
+from datetime import datetime, timezone
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable
+
+import yaml
+
+from .common import run_cli
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.environ.get(
+    "MCP_CREDENTIAL_CACHE", Path.home() / ".cache" / "mcp_cloud" / "credentials"))
+# 토큰 만료 이만큼 전에 갱신 (gcloud 토큰 수명은 보통 1시간)
+DEFAULT_REFRESH_MARGIN = 300.0
+# 엔드포인트/CA 캐시 유지 시간 (클러스터를 다시 만들면 invalidate)
+DEFAULT_CLUSTER_TTL = 6 * 3600.0
+RETRY_INTERVAL = 30.0
+# 토큰 수명이 갱신 여유보다 짧아도 gcloud를 연달아 호출하지 않도록 하는 최소 간격
+MIN_REFRESH_INTERVAL = 1.0
+
+
+def context_name(cluster: str, location: str, project: Optional[str] = None) -> str:
+    """get-credentials와 같은 형식의 컨텍스트 이름"""
+    return f"gke_{project or 'default'}_{location}_{cluster}"
+
+
+def _location_flag(location: str) -> str:
+    # asia-northeast3-a는 존, asia-northeast3는 리전
+    return "--zone" if location.count("-") >= 2 else "--region"
+
+
+def _server(endpoint: str) -> str:
+    return endpoint if endpoint.startswith("https://") else f"https://{endpoint}"
+
+
+def _parse_expiry(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc).timestamp()
+
+
+def _write_private(path: Path, content: str):
+    """0600 권한으로 원자적 쓰기"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(temp, path)
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@dataclass
+class ClusterCredentials:
+    """kubectl/Python 클라이언트에 바로 넘길 수 있는 자격 증명"""
+    context: str
+    cluster: str
+    location: str
+    project: Optional[str]
+    endpoint: str
+    ca_data: str
+    token: str
+    expiry: float
+    fetched_at: float
+
+    @property
+    def server(self) -> str:
+        return _server(self.endpoint)
+
+
+class CredentialBroker:
+    """컨텍스트별 자격 증명 캐시 + 토큰 선제 갱신"""
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, refresh_margin: float = DEFAULT_REFRESH_MARGIN,
+                 cluster_ttl: float = DEFAULT_CLUSTER_TTL, runner: Callable = run_cli,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            refresh_margin: 만료 몇 초 전에 토큰을 갱신할지
+            cluster_ttl: 엔드포인트/CA 캐시 유지 시간(초)
+            runner: run_cli 호환 명령 실행 함수 (명령 -> 표준 출력)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.refresh_margin = refresh_margin
+        self.cluster_ttl = cluster_ttl
+        self.runner = runner
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._clusters: Dict[str, Dict[str, Any]] = {}
+        self._token: Optional[Dict[str, Any]] = None
+        self._exec_contexts: set = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- 캐시 경로 ---------------------------------------------------------------
+
+    @property
+    def token_path(self) -> Path:
+        return self.cache_dir / "token.json"
+
+    def cluster_path(self, context: str) -> Path:
+        return self.cache_dir / "clusters" / f"{context}.json"
+
+    def kubeconfig_path(self, context: str) -> Path:
+        return self.cache_dir / "kubeconfig" / f"{context}.yaml"
+
+    # --- 토큰 ---------------------------------------------------------------
+
+    def _token_valid(self, token: Optional[Dict[str, Any]]) -> bool:
+        return bool(token) and token["expiry"] - self.refresh_margin > self.clock()
+
+    def token(self, force: bool = False) -> Dict[str, Any]:
+        """유효한 액세스 토큰 (메모리 -> 디스크 -> gcloud 순)"""
+        with self._lock:
+            if not force and self._token_valid(self._token):
+                return self._token
+            if not force:
+                cached = _read_json(self.token_path)
+                if self._token_valid(cached):
+                    self._token = cached
+                    return cached
+            output = self.runner(["gcloud", "config", "config-helper", "--format=json", "--force-auth-refresh"])
+            credential = json.loads(output)["credential"]
+            self._token = {"access_token": credential["access_token"],
+                           "expiry": _parse_expiry(credential["token_expiry"]),
+                           "fetched_at": self.clock()}
+            _write_private(self.token_path, json.dumps(self._token))
+            logger.info(f"🔑 액세스 토큰 갱신 (만료까지 {self._token['expiry'] - self.clock():.0f}초)")
+            self._rewrite_kubeconfigs()
+            return self._token
+
+    # --- 클러스터 ---------------------------------------------------------------
+
+    def _cluster(self, cluster: str, location: str, project: Optional[str]) -> Dict[str, Any]:
+        context = context_name(cluster, location, project)
+        info = self._clusters.get(context) or _read_json(self.cluster_path(context))
+        if info and self.clock() - info["fetched_at"] < self.cluster_ttl:
+            self._clusters[context] = info
+            return info
+        command = ["gcloud", "container", "clusters", "describe", cluster, _location_flag(location), location,
+                   "--format=json"]
+        if project:
+            command += ["--project", project]
+        described = json.loads(self.runner(command))
+        info = {"context": context, "cluster": cluster, "location": location, "project": project,
+                "endpoint": described["endpoint"],
+                "ca_data": described["masterAuth"]["clusterCaCertificate"],
+                "fetched_at": self.clock()}
+        _write_private(self.cluster_path(context), json.dumps(info))
+        self._clusters[context] = info
+        return info
+
+    def credentials(self, cluster: str, location: str, project: Optional[str] = None) -> ClusterCredentials:
+        """클러스터 자격 증명 (필요할 때만 gcloud 호출)"""
+        with self._lock:
+            info = self._cluster(cluster, location, project)
+            token = self.token()
+            return ClusterCredentials(context=info["context"], cluster=cluster, location=location, project=project,
+                                      endpoint=info["endpoint"], ca_data=info["ca_data"],
+                                      token=token["access_token"], expiry=token["expiry"],
+                                      fetched_at=token["fetched_at"])
+
+    def invalidate(self, cluster: str, location: str, project: Optional[str] = None):
+        """클러스터 재생성/삭제 시 엔드포인트/CA 캐시와 kubeconfig 제거"""
+        context = context_name(cluster, location, project)
+        with self._lock:
+            self._clusters.pop(context, None)
+            self._exec_contexts.discard(context)
+            for path in (self.cluster_path(context), self.kubeconfig_path(context)):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    # --- kubectl ---------------------------------------------------------------
+
+    def _kubeconfig_document(self, info: Dict[str, Any], exec_mode: bool) -> Dict[str, Any]:
+        context = info["context"]
+        if exec_mode:
+            user = {"exec": {
+                "apiVersion": "client.authentication.k8s.io/v1beta1",
+                "command": sys.executable,
+                "args": ["-m", "automation_tests.credential_broker", "--cache-dir", str(self.cache_dir),
+                         "exec-credential"],
+                "env": [{"name": "PYTHONPATH", "value": str(Path(__file__).resolve().parent.parent)}],
+                "interactiveMode": "Never",
+                "provideClusterInfo": False}}
+        else:
+            user = {"token": self._token["access_token"]}
+        return {
+            "apiVersion": "v1",
+            "kind": "Config",
+            "clusters": [{"name": context, "cluster": {"server": _server(info["endpoint"]),
+                                                       "certificate-authority-data": info["ca_data"]}}],
+            "users": [{"name": context, "user": user}],
+            "contexts": [{"name": context, "context": {"cluster": context, "user": context}}],
+            "current-context": context,
+        }
+
+    def kubeconfig(self, cluster: str, location: str, project: Optional[str] = None,
+                   exec_mode: bool = False) -> Path:
+        """
+        컨텍스트 kubeconfig 작성 후 경로 반환
+
+        Args:
+            exec_mode: 토큰 대신 캐시된 토큰을 돌려주는 exec 자격 증명 사용 (갱신 daemon 없이 장시간 사용할 때)
+        """
+        with self._lock:
+            credentials = self.credentials(cluster, location, project)
+            path = self.kubeconfig_path(credentials.context)
+            if exec_mode:
+                self._exec_contexts.add(credentials.context)
+            else:
+                self._exec_contexts.discard(credentials.context)
+            _write_private(path, yaml.safe_dump(
+                self._kubeconfig_document(self._clusters[credentials.context], exec_mode), sort_keys=False))
+            return path
+
+    def env(self, cluster: str, location: str, project: Optional[str] = None,
+            exec_mode: bool = False) -> Dict[str, str]:
+        """kubectl 실행 환경 변수 (KUBECONFIG)"""
+        return {"KUBECONFIG": str(self.kubeconfig(cluster, location, project, exec_mode=exec_mode))}
+
+    def _rewrite_kubeconfigs(self):
+        # 토큰이 바뀌면 이 브로커가 만든 토큰 방식 kubeconfig를 다시 씀
+        for context, info in self._clusters.items():
+            path = self.kubeconfig_path(context)
+            if context not in self._exec_contexts and path.exists():
+                _write_private(path, yaml.safe_dump(self._kubeconfig_document(info, False), sort_keys=False))
+
+    def exec_credential(self) -> Dict[str, Any]:
+        """client.authentication.k8s.io ExecCredential (캐시된 토큰, 만료 임박 시에만 gcloud 호출)"""
+        token = self.token()
+        expiry = datetime.fromtimestamp(token["expiry"], tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {"apiVersion": "client.authentication.k8s.io/v1beta1", "kind": "ExecCredential",
+                "status": {"token": token["access_token"], "expirationTimestamp": expiry}}
+
+    # --- Python 클라이언트 ---------------------------------------------------------------
+
+    def client_configuration(self, cluster: str, location: str, project: Optional[str] = None):
+        """
+        kubernetes Python 클라이언트 Configuration (요청 전에 브로커 캐시에서 토큰을 갱신)
+
+        Raises:
+            ImportError: kubernetes 패키지가 설치되어 있지 않음
+        """
+        from kubernetes import client
+
+        credentials = self.credentials(cluster, location, project)
+        ca_path = self.cache_dir / "ca" / f"{credentials.context}.crt"
+        _write_private(ca_path, base64.b64decode(credentials.ca_data).decode("utf-8"))
+
+        configuration = client.Configuration()
+        configuration.host = credentials.server
+        configuration.ssl_ca_cert = str(ca_path)
+        configuration.api_key = {"authorization": credentials.token}
+        configuration.api_key_prefix = {"authorization": "Bearer"}
+        configuration.refresh_api_key_hook = (
+            lambda conf: conf.api_key.update(authorization=self.token()["access_token"]))
+        return configuration
+
+    # --- 백그라운드 갱신 ---------------------------------------------------------------
+
+    def refresh_due(self) -> bool:
+        """만료가 임박했으면 토큰 갱신 (갱신했으면 True)"""
+        with self._lock:
+            if self._token_valid(self._token):
+                return False
+            self.token(force=True)
+            return True
+
+    def next_refresh_in(self) -> float:
+        with self._lock:
+            if not self._token:
+                return 0.0
+            return max(0.0, self._token["expiry"] - self.refresh_margin - self.clock())
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_due()
+                wait = self.next_refresh_in()
+            except Exception as e:
+                logger.warning(f"⚠️ 토큰 갱신 실패, {RETRY_INTERVAL:.0f}초 후 재시도: {e}")
+                wait = RETRY_INTERVAL
+            self._stop.wait(max(wait, MIN_REFRESH_INTERVAL))
+
+    def start(self) -> "CredentialBroker":
+        """만료 전에 토큰을 갱신하는 백그라운드 스레드 시작"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._refresh_loop, name="credential-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="GKE 클러스터 자격 증명 브로커")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="캐시 디렉토리")
+    parser.add_argument("--refresh-margin", type=float, default=DEFAULT_REFRESH_MARGIN,
+                        help="만료 몇 초 전에 갱신할지")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_cluster_args(command_parser):
+        command_parser.add_argument("--cluster", required=True, help="클러스터 이름")
+        command_parser.add_argument("--zone", required=True, help="존 또는 리전")
+        command_parser.add_argument("--project", help="GCP 프로젝트")
+
+    kubeconfig_parser = sub.add_parser("kubeconfig", help="kubeconfig 작성 후 경로 출력")
+    add_cluster_args(kubeconfig_parser)
+    kubeconfig_parser.add_argument("--exec", dest="exec_mode", action="store_true",
+                                   help="토큰 대신 exec 자격 증명 사용")
+    env_parser = sub.add_parser("env", help="export KUBECONFIG=... 출력 (eval용)")
+    add_cluster_args(env_parser)
+    daemon_parser = sub.add_parser("daemon", help="토큰 만료 전 갱신을 계속 수행")
+    add_cluster_args(daemon_parser)
+    sub.add_parser("exec-credential", help="kubectl exec 자격 증명 (ExecCredential JSON)")
+    invalidate_parser = sub.add_parser("invalidate", help="클러스터 캐시 삭제")
+    add_cluster_args(invalidate_parser)
+    args = parser.parse_args(argv)
+
+    broker = CredentialBroker(args.cache_dir, refresh_margin=args.refresh_margin)
+    if args.command == "exec-credential":
+        print(json.dumps(broker.exec_credential()))
+        return 0
+    if args.command == "invalidate":
+        broker.invalidate(args.cluster, args.zone, args.project)
+        return 0
+    if args.command == "kubeconfig":
+        print(broker.kubeconfig(args.cluster, args.zone, args.project, exec_mode=args.exec_mode))
+        return 0
+    if args.command == "env":
+        print(f"export KUBECONFIG={broker.kubeconfig(args.cluster, args.zone, args.project)}")
+        return 0
+
+    path = broker.kubeconfig(args.cluster, args.zone, args.project)
+    logger.info(f"🔄 토큰 갱신 대기 중 (KUBECONFIG={path})")
+    broker.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        broker.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
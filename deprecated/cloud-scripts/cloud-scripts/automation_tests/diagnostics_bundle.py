@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+클러스터 진단 번들 동시 수집
+fix-cluster-issues.sh/test-cluster-connection.sh처럼 kubectl 명령을 하나씩 실행해 터미널에 출력하는 대신,
+노드, 이벤트, 컴포넌트 상태, 네임스페이스별 Pod describe, 문제 Pod의 최근 로그(--tail 제한)를 동시에 수집해
+압축된 번들(tar.gz) 하나에 바로바로 기록합니다. 번들 마지막의 index.json에 항목별 명령/크기/소요 시간/오류와
+요약(노드/Pod/경고 이벤트 수)을 남깁니다.
+
+- 1단계: 클러스터 범위 목록(노드, 이벤트, 네임스페이스, Pod 전체 등)을 동시에 조회
+- 2단계: 네임스페이스별 describe와 Pod 로그를 동시에 수집 (Pod마다가 아니라 네임스페이스마다 describe 한 번)
+- 항목별 크기(--max-entry-bytes, 로그는 뒷부분 유지)와 번들 전체 크기(--max-bytes) 제한
+
+사용 예:
+    python -m automation_tests.diagnostics_bundle -o cluster-diagnostics.tar.gz
+    python -m automation_tests.diagnostics_bundle -o diag.tar.gz -n production -n monitoring --all-logs --tail 500
+"""
+
+import io
+import sys
+import json
+import time
+import tarfile
+import logging
+import argparse
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+
+from .common import run_cli
+from .kubectl_stream import pod_ready
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAIL = 200
+DEFAULT_MAX_LOGS = 300
+DEFAULT_MAX_ENTRY_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+TRUNCATED_MARKER = b"\n... (truncated) ...\n"
+
+# 클러스터 범위 항목 (번들 경로, kubectl 인자)
+CLUSTER_ITEMS = [
+    ("cluster/version.json", ["version", "-o", "json"]),
+    ("cluster/nodes.json", ["get", "nodes", "-o", "json"]),
+    ("cluster/nodes.describe.txt", ["describe", "nodes"]),
+    ("cluster/events.json", ["get", "events", "--all-namespaces", "-o", "json"]),
+    ("cluster/componentstatuses.json", ["get", "componentstatuses", "-o", "json"]),
+    ("cluster/readyz.txt", ["get", "--raw", "/readyz?verbose"]),
+    ("cluster/namespaces.json", ["get", "namespaces", "-o", "json"]),
+    ("cluster/pods.json", ["get", "pods", "--all-namespaces", "-o", "json"]),
+]
+
+
+def parse_size(text: str) -> int:
+    """크기 문자열 파싱 (예: 200M, 4Mi, 1G, 1048576)"""
+    units = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+    value = text.strip().lower().rstrip("ib")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+@dataclass
+class BundleEntry:
+    """번들 항목 (index.json에 기록)"""
+    path: str
+    command: List[str]
+    bytes: int = 0
+    truncated: bool = False
+    skipped: bool = False
+    seconds: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class BundleReport:
+    """수집 결과"""
+    path: str
+    entries: List[BundleEntry] = field(default_factory=list)
+    summary: Dict[str, Any] = field(default_factory=dict)
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def errors(self) -> List[BundleEntry]:
+        return [entry for entry in self.entries if entry.error]
+
+    @property
+    def skipped(self) -> List[BundleEntry]:
+        return [entry for entry in self.entries if entry.skipped]
+
+    def describe(self) -> str:
+        return (f"항목 {len(self.entries)}개 (오류 {len(self.errors)}, 크기 제한으로 생략 {len(self.skipped)}), "
+                f"압축 {self.bytes_written / 1024 / 1024:.1f}MiB, {self.seconds:.1f}초")
+
+
+class _BundleWriter:
+    """여러 스레드의 수집 결과를 tar.gz 하나에 순서대로 기록 (전체 크기 제한)"""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.raw = open(path, "wb")
+        self.tar = tarfile.open(fileobj=self.raw, mode="w:gz")
+        self.added = 0
+        self.lock = threading.Lock()
+
+    def add(self, name: str, data: bytes, force: bool = False) -> bool:
+        """항목 추가 (전체 크기 제한을 넘으면 False)"""
+        with self.lock:
+            if not force and self.added + len(data) > self.max_bytes:
+                return False
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self.tar.addfile(info, io.BytesIO(data))
+            self.added += len(data)
+            return True
+
+    def close(self) -> int:
+        self.tar.close()
+        self.raw.close()
+        return self.path.stat().st_size
+
+
+class DiagnosticsCollector:
+    """클러스터 진단 번들 동시 수집기"""
+
+    def __init__(self, runner: Callable[..., str] = run_cli, env: Optional[Dict[str, str]] = None,
+                 namespaces: Optional[Iterable[str]] = None, tail: int = DEFAULT_TAIL, all_logs: bool = False,
+                 max_logs: int = DEFAULT_MAX_LOGS, max_entry_bytes: int = DEFAULT_MAX_ENTRY_BYTES,
+                 max_bytes: int = DEFAULT_MAX_BYTES, max_workers: int = 16,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            runner: CLI 실행 함수 (명령, env -> 표준 출력)
+            env: kubectl 환경 변수 (KUBECONFIG 등)
+            namespaces: describe/로그를 수집할 네임스페이스 (없으면 전체)
+            tail: 컨테이너마다 가져올 최근 로그 줄 수
+            all_logs: 정상 Pod의 로그도 수집 (기본은 미준비/재시작 Pod만)
+            max_logs: 수집할 로그 최대 개수 (문제 Pod 우선)
+        """
+        self.runner = runner
+        self.env = env
+        self.namespaces = set(namespaces) if namespaces else None
+        self.tail = tail
+        self.all_logs = all_logs
+        self.max_logs = max_logs
+        self.max_entry_bytes = max_entry_bytes
+        self.max_bytes = max_bytes
+        self.max_workers = max_workers
+        self.clock = clock
+
+    def _fetch(self, writer: _BundleWriter, path: str, args: List[str], keep_tail: bool = False
+               ) -> Tuple[BundleEntry, Optional[str]]:
+        """kubectl 하나를 실행해 번들에 기록, 원문 출력도 반환 (다음 단계 계획용)"""
+        command = ["kubectl", *args]
+        entry = BundleEntry(path, command)
+        start = self.clock()
+        output = None
+        try:
+            output = self.runner(command, env=self.env)
+            data = output.encode("utf-8")
+        except subprocess.CalledProcessError as e:
+            # 실패한 명령은 번들에 넣지 않고 index.json에 오류만 기록
+            entry.error = (e.stderr or str(e)).strip()[:500]
+            data = b""
+        except (OSError, subprocess.TimeoutExpired) as e:
+            entry.error = str(e)
+            data = b""
+        entry.seconds = round(self.clock() - start, 3)
+
+        if len(data) > self.max_entry_bytes:
+            keep = self.max_entry_bytes - len(TRUNCATED_MARKER)
+            data = TRUNCATED_MARKER + data[-keep:] if keep_tail else data[:keep] + TRUNCATED_MARKER
+            entry.truncated = True
+        if data:
+            if writer.add(path, data):
+                entry.bytes = len(data)
+            else:
+                entry.skipped = True
+        return entry, output
+
+    def _plan(self, pods_json: Optional[str]) -> Tuple[List[Tuple[str, List[str], bool]], Dict[str, Any]]:
+        """Pod 목록으로 네임스페이스별 describe와 로그 수집 항목 결정"""
+        pods = json.loads(pods_json).get("items", []) if pods_json else []
+        pods = [pod for pod in pods
+                if self.namespaces is None or pod["metadata"].get("namespace") in self.namespaces]
+        namespaces = sorted({pod["metadata"].get("namespace", "default") for pod in pods} | (self.namespaces or set()))
+        tasks = [(f"namespaces/{ns}/pods.describe.txt", ["describe", "pods", "-n", ns], False) for ns in namespaces]
+
+        logs = []
+        unhealthy = 0
+        for pod in pods:
+            meta, status = pod["metadata"], pod.get("status", {})
+            statuses = {s["name"]: s for s in status.get("containerStatuses") or []}
+            succeeded = status.get("phase") == "Succeeded"
+            problem = not succeeded and not pod_ready(pod)
+            unhealthy += problem
+            for container in pod.get("spec", {}).get("containers", []):
+                restarts = statuses.get(container["name"], {}).get("restartCount", 0)
+                if not (problem or restarts or self.all_logs):
+                    continue
+                base = f"namespaces/{meta['namespace']}/logs/{meta['name']}/{container['name']}"
+                target = ["-n", meta["namespace"], meta["name"], "-c", container["name"], f"--tail={self.tail}"]
+                priority = 0 if problem else 1 if restarts else 2
+                logs.append((priority, f"{base}.log", ["logs", *target]))
+                if restarts:
+                    logs.append((priority, f"{base}.previous.log", ["logs", *target, "--previous"]))
+        logs.sort(key=lambda item: item[0])
+        tasks += [(path, args, True) for _, path, args in logs[:self.max_logs]]
+
+        summary = {"pods": len(pods), "unhealthy_pods": unhealthy, "namespaces": len(namespaces),
+                   "logs": min(len(logs), self.max_logs), "logs_omitted": max(0, len(logs) - self.max_logs)}
+        return tasks, summary
+
+    def collect(self, output: Path) -> BundleReport:
+        """진단 번들 수집 (개별 명령 실패는 index.json에 기록하고 계속)"""
+        start = self.clock()
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        report = BundleReport(str(output))
+        writer = _BundleWriter(output, self.max_bytes)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                outputs = {}
+                futures = [pool.submit(self._fetch, writer, path, args) for path, args in CLUSTER_ITEMS]
+                for future in as_completed(futures):
+                    entry, text = future.result()
+                    report.entries.append(entry)
+                    outputs[entry.path] = text
+                logger.info(f"📋 클러스터 범위 항목 {len(futures)}개 수집 ({self.clock() - start:.1f}초)")
+
+                tasks, report.summary = self._plan(outputs.get("cluster/pods.json"))
+                futures = [pool.submit(self._fetch, writer, path, args, keep_tail) for path, args, keep_tail in tasks]
+                for future in as_completed(futures):
+                    report.entries.append(future.result()[0])
+
+            report.summary.update(self._cluster_summary(outputs))
+            report.entries.sort(key=lambda entry: entry.path)
+            report.seconds = round(self.clock() - start, 3)
+            index = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "seconds": report.seconds,
+                     "summary": report.summary, "entries": [asdict(entry) for entry in report.entries]}
+            # 인덱스는 크기 제한과 무관하게 항상 기록
+            writer.add("index.json", json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8"), force=True)
+        finally:
+            report.bytes_written = writer.close()
+
+        log = logger.warning if report.errors or report.skipped else logger.info
+        log(f"{'⚠️' if report.errors or report.skipped else '📦'} 진단 번들 {output}: {report.describe()}")
+        return report
+
+    @staticmethod
+    def _cluster_summary(outputs: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {}
+        try:
+            nodes = json.loads(outputs.get("cluster/nodes.json") or "{}").get("items", [])
+            summary["nodes"] = len(nodes)
+            summary["not_ready_nodes"] = sorted(
+                node["metadata"]["name"] for node in nodes
+                if not any(c.get("type") == "Ready" and c.get("status") == "True"
+                           for c in node.get("status", {}).get("conditions") or []))
+            events = json.loads(outputs.get("cluster/events.json") or "{}").get("items", [])
+            summary["warning_events"] = sum(1 for event in events if event.get("type") == "Warning")
+        except (ValueError, KeyError) as e:
+            summary["summary_error"] = str(e)
+        return summary
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="클러스터 진단 번들 동시 수집")
+    parser.add_argument("-o", "--output", type=Path,
+                        default=Path(f"cluster-diagnostics-{time.strftime('%Y%m%d-%H%M%S')}.tar.gz"),
+                        help="번들 파일 경로 (tar.gz)")
+    parser.add_argument("-n", "--namespace", action="append", help="수집할 네임스페이스 (반복 가능, 기본 전체)")
+    parser.add_argument("--kubeconfig", help="KUBECONFIG 경로")
+    parser.add_argument("--tail", type=int, default=DEFAULT_TAIL, help="컨테이너별 최근 로그 줄 수")
+    parser.add_argument("--all-logs", action="store_true", help="정상 Pod 로그도 수집")
+    parser.add_argument("--max-logs", type=int, default=DEFAULT_MAX_LOGS, help="수집할 로그 최대 개수")
+    parser.add_argument("--max-entry-bytes", type=parse_size, default=DEFAULT_MAX_ENTRY_BYTES, help="항목별 최대 크기")
+    parser.add_argument("--max-bytes", type=parse_size, default=DEFAULT_MAX_BYTES, help="번들 전체 최대 크기 (압축 전)")
+    parser.add_argument("--max-workers", type=int, default=16, help="동시 kubectl 호출 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 형식으로 출력")
+    args = parser.parse_args(argv)
+
+    collector = DiagnosticsCollector(env={"KUBECONFIG": args.kubeconfig} if args.kubeconfig else None,
+                                     namespaces=args.namespace, tail=args.tail, all_logs=args.all_logs,
+                                     max_logs=args.max_logs, max_entry_bytes=args.max_entry_bytes,
+                                     max_bytes=args.max_bytes, max_workers=args.max_workers)
+    report = collector.collect(args.output)
+    if args.json:
+        print(json.dumps({**asdict(report), "errors": len(report.errors)}, ensure_ascii=False, indent=2))
+    else:
+        print(report.path)
+    # 클러스터 범위 목록을 하나도 가져오지 못했으면 연결 실패로 간주
+    cluster_errors = [entry for entry in report.errors if entry.path.startswith("cluster/")]
+    return 1 if len(cluster_errors) == len(CLUSTER_ITEMS) else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+라벨 기반 Docker 리소스 일괄 정리
+과정에서 만드는 Docker 객체(이미지, 컨테이너, 볼륨, 네트워크)에는 생성 시점에 mcp.course/mcp.day 라벨을 붙이고,
+정리할 때는 Engine API의 prune 엔드포인트에 라벨 필터를 넘겨 서버 측에서 한 번에 삭제합니다.
+빌드 호스트에 컨테이너/이미지가 수천 개 남아 있어도 객체마다 CLI를 실행하지 않고 요청 몇 번으로 끝납니다.
+
+- 모든 요청은 하나의 keep-alive 연결(DOCKER_HOST, 기본 unix:///var/run/docker.sock)을 재사용
+- 기본적으로 중지된 컨테이너만 prune (--kill-running이면 실행 중인 과정 컨테이너를 먼저 종료)
+- 정리 순서: 컨테이너 → 네트워크 → 볼륨 → 이미지 (사용 중인 객체는 prune에서 제외되므로)
+
+라벨 붙이기:
+    docker build --label mcp.course=container --label mcp.day=1 -t app .
+    docker run --label mcp.course=container --label mcp.day=1 ...
+
+사용 예:
+    python -m automation_tests.docker_cleanup --course container --day 1
+    python -m automation_tests.docker_cleanup --course container --day 1 --kill-running
+    python -m automation_tests.docker_cleanup --course container --until 24h --json
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import logging
+import argparse
+import threading
+import http.client
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable
+from urllib.parse import urlencode, urlparse
+
+logger = logging.getLogger(__name__)
+
+COURSE_LABEL = "mcp.course"
+DAY_LABEL = "mcp.day"
+DEFAULT_DOCKER_HOST = "unix:///var/run/docker.sock"
+# 이 버전부터 볼륨 prune이 기본적으로 익명 볼륨만 지우므로 all=true 필요
+VOLUME_PRUNE_ALL_VERSION = (1, 42)
+
+
+def course_labels(course: str, day: Optional[int] = None) -> Dict[str, str]:
+    """과정 Docker 객체에 붙일 라벨"""
+    labels = {COURSE_LABEL: course}
+    if day is not None:
+        labels[DAY_LABEL] = str(day)
+    return labels
+
+
+def label_args(course: str, day: Optional[int] = None) -> List[str]:
+    """docker build/run 명령에 붙일 --label 인자"""
+    return [arg for key, value in course_labels(course, day).items() for arg in ("--label", f"{key}={value}")]
+
+
+def format_bytes(num_bytes: float) -> str:
+    if num_bytes < 1024:
+        return f"{num_bytes:.0f}B"
+    for unit in ("KiB", "MiB", "GiB"):
+        num_bytes /= 1024
+        if num_bytes < 1024 or unit == "GiB":
+            break
+    return f"{num_bytes:.1f}{unit}"
+
+
+class EngineError(RuntimeError):
+    """Docker Engine API 오류 응답"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class EngineClient:
+    """Docker Engine API 클라이언트 (keep-alive 연결 하나를 스레드 간에 순서대로 재사용)"""
+
+    def __init__(self, base_url: Optional[str] = None, timeout: float = 300.0):
+        """
+        Args:
+            base_url: unix:///경로, tcp://호스트:포트 또는 http://호스트:포트 (기본 DOCKER_HOST)
+            timeout: 요청 제한 시간 (prune은 객체가 많으면 오래 걸림)
+        """
+        self.base_url = base_url or os.environ.get("DOCKER_HOST") or DEFAULT_DOCKER_HOST
+        self.timeout = timeout
+        self.requests = 0
+        self.connections = 0
+        self.api_version: Optional[str] = None
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        url = urlparse(self.base_url)
+        if url.scheme == "unix":
+            conn = _UnixHTTPConnection(url.path, self.timeout)
+        elif url.scheme in ("tcp", "http"):
+            conn = http.client.HTTPConnection(url.hostname, url.port or 2375, timeout=self.timeout)
+        else:
+            raise ValueError(f"지원하지 않는 DOCKER_HOST: {self.base_url}")
+        self.connections += 1
+        return conn
+
+    def _send(self, method: str, path: str) -> Any:
+        # 유휴 중 데몬이 연결을 닫았으면 한 번만 다시 연결
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = self._connect()
+            try:
+                self._conn.request(method, path, headers={"Host": "docker", "Content-Length": "0"})
+                response = self._conn.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                if attempt:
+                    raise
+        self.requests += 1
+        data = json.loads(body) if body else None
+        if response.status >= 400:
+            message = data.get("message", "") if isinstance(data, dict) else body.decode(errors="replace")
+            raise EngineError(response.status, message)
+        return data
+
+    def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        query = urlencode({key: json.dumps(value) if isinstance(value, dict) else value
+                           for key, value in (params or {}).items()})
+        with self._lock:
+            self._negotiate()
+            return self._send(method, f"/v{self.api_version}{path}" + (f"?{query}" if query else ""))
+
+    def _negotiate(self):
+        # 데몬이 지원하는 API 버전으로 경로 고정 (첫 요청 한 번만)
+        if self.api_version is None:
+            self.api_version = self._send("GET", "/version")["ApiVersion"]
+
+    def version_at_least(self, version: tuple) -> bool:
+        with self._lock:
+            self._negotiate()
+        return tuple(int(part) for part in self.api_version.split(".")) >= version
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+@dataclass
+class CleanupReport:
+    """정리 결과"""
+    removed: Dict[str, int] = field(default_factory=dict)
+    killed: int = 0
+    bytes_reclaimed: int = 0
+    seconds: float = 0.0
+    requests: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.__dict__, "ok": self.ok}
+
+    def summary(self) -> str:
+        removed = ", ".join(f"{kind} {count}" for kind, count in self.removed.items())
+        return (f"{removed}, 종료 {self.killed}, 회수 {format_bytes(self.bytes_reclaimed)}, "
+                f"{self.seconds:.1f}초 (API 요청 {self.requests}회)")
+
+
+class DockerCleanup:
+    """과정 라벨이 붙은 Docker 객체를 prune 엔드포인트로 일괄 정리"""
+
+    def __init__(self, course: str, day: Optional[int] = None, client: Optional[EngineClient] = None,
+                 until: Optional[str] = None, kill_running: bool = False,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            course: mcp.course 라벨 값
+            day: mcp.day 라벨 값 (없으면 과정 전체)
+            until: 이 시간보다 오래된 객체만 (예: 24h, 볼륨에는 적용되지 않음)
+            kill_running: 실행 중인 컨테이너도 종료 후 정리 (기본은 중지된 것만, 동시 실행 중인 과정 보호)
+        """
+        self.labels = [f"{key}={value}" for key, value in course_labels(course, day).items()]
+        self.client = client or EngineClient()
+        self.until = until
+        self.kill_running = kill_running
+        self.clock = clock
+
+    def _filters(self, **extra: List[str]) -> Dict[str, List[str]]:
+        filters = {"label": self.labels, **extra}
+        if self.until:
+            filters["until"] = [self.until]
+        return filters
+
+    def _kill_running(self) -> int:
+        running = self.client.request("GET", "/containers/json", {
+            "all": "true", "filters": {"label": self.labels, "status": ["running", "restarting", "paused"]}})
+        for container in running:
+            try:
+                self.client.request("POST", f"/containers/{container['Id']}/kill")
+            except EngineError as e:
+                # 그사이 스스로 종료된 컨테이너 (409/404)
+                if e.status not in (404, 409):
+                    raise
+        return len(running)
+
+    def _prune(self, report: CleanupReport):
+        if self.kill_running:
+            try:
+                report.killed = self._kill_running()
+            except EngineError as e:
+                report.errors.append(f"containers kill: {e}")
+
+        volume_filters = {"label": self.labels}
+        if self.client.version_at_least(VOLUME_PRUNE_ALL_VERSION):
+            volume_filters["all"] = ["true"]
+        steps = [
+            ("containers", "/containers/prune", self._filters(), "ContainersDeleted"),
+            ("networks", "/networks/prune", self._filters(), "NetworksDeleted"),
+            ("volumes", "/volumes/prune", volume_filters, "VolumesDeleted"),
+            ("images", "/images/prune", self._filters(dangling=["false"]), "ImagesDeleted"),
+        ]
+        for kind, path, filters, key in steps:
+            try:
+                result = self.client.request("POST", path, {"filters": filters}) or {}
+            except EngineError as e:
+                report.errors.append(f"{kind}: {e}")
+                continue
+            deleted = result.get(key) or []
+            if kind == "images":
+                # 태그 해제(Untagged) 항목을 빼고 실제 삭제된 레이어/이미지만 집계
+                deleted = [item for item in deleted if "Deleted" in item]
+            report.removed[kind] = len(deleted)
+            report.bytes_reclaimed += result.get("SpaceReclaimed") or 0
+
+    def run(self) -> CleanupReport:
+        """정리 실행 (단계별 실패는 보고서에 기록하고 다음 단계 계속)"""
+        report = CleanupReport()
+        start = self.clock()
+        requests_before = self.client.requests
+        try:
+            self._prune(report)
+        except OSError as e:
+            report.errors.append(f"Docker 데몬 연결 실패: {e}")
+
+        report.seconds = round(self.clock() - start, 3)
+        report.requests = self.client.requests - requests_before
+        log = logger.info if report.ok else logger.warning
+        log(f"{'🧹' if report.ok else '⚠️'} Docker 정리 ({', '.join(self.labels)}): {report.summary()}")
+        for error in report.errors:
+            logger.warning(f"⚠️ {error}")
+        return report
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="라벨 기반 Docker 리소스 일괄 정리")
+    parser.add_argument("--course", default="container", help="mcp.course 라벨 값")
+    parser.add_argument("--day", type=int, help="mcp.day 라벨 값 (없으면 과정 전체)")
+    parser.add_argument("--until", help="이 시간보다 오래된 객체만 정리 (예: 24h)")
+    parser.add_argument("--kill-running", action="store_true", help="실행 중인 컨테이너도 종료 후 정리")
+    parser.add_argument("--host", help="Docker 데몬 주소 (기본 DOCKER_HOST)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    client = EngineClient(args.host)
+    try:
+        report = DockerCleanup(args.course, args.day, client=client, until=args.until,
+                               kill_running=args.kill_running).run()
+    finally:
+        client.close()
+    if args.json:
+        print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
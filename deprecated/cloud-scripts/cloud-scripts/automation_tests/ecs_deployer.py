@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+ECS 태스크 정의 내용 주소 등록 및 서비스 동시 롤아웃
+ecs_fargate.sh와 CloudContainerAutomation._setup_ecs_fargate가 실행할 때마다 새 태스크 정의 리비전을
+등록하고 서비스를 업데이트해, 바뀐 것이 없어도 리비전이 쌓이고 불필요한 재배포가 일어나던 문제를 줄입니다.
+
+- 태스크 정의를 정규화(응답 전용 필드 제거, 순서 무관 목록 정렬)한 뒤 SHA-256 해시를 태그로 남기고,
+  같은 해시의 ACTIVE 리비전이 있으면 새로 등록하지 않고 재사용합니다.
+- 여러 서비스를 동시에 업데이트하고, 이미 같은 리비전/태스크 수로 실행 중인 서비스는 건드리지 않습니다.
+- 안정 상태(배포 1개, 실행 수 = 원하는 수)는 백오프 감시기로 서비스를 묶어 조회하며 기다립니다.
+
+사용 예:
+    python -m automation_tests.ecs_deployer --cluster container-course-cluster register task-definition.json
+    python -m automation_tests.ecs_deployer --cluster container-course-cluster deploy task-definition.json \\
+        --service container-course-service=2 --subnet subnet-1 --security-group sg-1
+"""
+
+import sys
+import json
+import time
+import hashlib
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+DIGEST_TAG = "mcp:taskdef-digest"
+
+# describe_task_definition 응답에만 있고 등록 요청에는 없는 필드
+_RESPONSE_ONLY = {"taskDefinitionArn", "revision", "status", "requiresAttributes", "compatibilities",
+                  "registeredAt", "registeredBy", "deregisteredAt", "tags"}
+# 순서가 의미 없는 목록 (command/entryPoint처럼 순서가 의미 있는 목록은 그대로 유지)
+_UNORDERED = {"containerDefinitions", "requiresCompatibilities", "portMappings", "environment", "secrets",
+              "environmentFiles", "mountPoints", "volumesFrom", "volumes", "ulimits", "extraHosts",
+              "dependsOn", "placementConstraints", "inferenceAccelerators", "resourceRequirements"}
+
+
+class DeploymentError(RuntimeError):
+    """ECS 배포 실패"""
+
+
+def _normalize(value: Any, key: str = "") -> Any:
+    if isinstance(value, dict):
+        items = {k: _normalize(v, k) for k, v in value.items()}
+        return {k: v for k, v in sorted(items.items()) if v not in (None, [], {})}
+    if isinstance(value, list):
+        items = [_normalize(item) for item in value]
+        if key in _UNORDERED:
+            items.sort(key=lambda item: json.dumps(item, sort_keys=True))
+        return items
+    return value
+
+
+def normalize_task_definition(task_definition: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    내용이 같으면 같은 결과가 나오도록 태스크 정의 정규화
+
+    등록 요청 JSON과 describe_task_definition 응답 어느 쪽을 넣어도 같은 형태가 됩니다.
+    """
+    # 깊은 복사 (응답의 registeredAt 등 datetime 값은 어차피 제거됨)
+    definition = json.loads(json.dumps({key: value for key, value in task_definition.items()
+                                        if key not in _RESPONSE_ONLY}, default=str))
+    # CLI JSON에서는 숫자로 쓰는 경우가 많지만 API는 문자열로 돌려줌
+    for key in ("cpu", "memory"):
+        if definition.get(key) is not None:
+            definition[key] = str(definition[key])
+    for container in definition.get("containerDefinitions") or []:
+        for mapping in container.get("portMappings") or []:
+            mapping.setdefault("protocol", "tcp")
+    return _normalize(definition)
+
+
+def task_definition_digest(task_definition: Dict[str, Any]) -> str:
+    """정규화한 태스크 정의의 SHA-256 해시"""
+    canonical = json.dumps(normalize_task_definition(task_definition), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def ecs_client(region: str):
+    """재시도 설정이 적용된 ECS 클라이언트 (boto3 클라이언트는 스레드 간 공유 가능)"""
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client("ecs", region_name=region,
+                        config=Config(retries={"max_attempts": 10, "mode": "adaptive"}, max_pool_connections=32))
+
+
+@dataclass
+class ServiceSpec:
+    """롤아웃할 서비스 (서비스가 없을 때 만들려면 subnets 필요)"""
+    name: str
+    desired_count: Optional[int] = None
+    subnets: Tuple[str, ...] = ()
+    security_groups: Tuple[str, ...] = ()
+    assign_public_ip: bool = True
+    launch_type: str = "FARGATE"
+
+    def network_configuration(self) -> Dict[str, Any]:
+        return {"awsvpcConfiguration": {"subnets": list(self.subnets), "securityGroups": list(self.security_groups),
+                                        "assignPublicIp": "ENABLED" if self.assign_public_ip else "DISABLED"}}
+
+
+@dataclass
+class ServiceResult:
+    name: str
+    action: str = "pending"   # created / updated / unchanged / failed
+    steady: bool = False
+    seconds: float = 0.0
+    error: str = ""
+
+
+@dataclass
+class DeployReport:
+    task_definition: str
+    digest: str
+    reused: bool
+    services: Dict[str, ServiceResult] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return all(result.steady and not result.error for result in self.services.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"task_definition": self.task_definition, "digest": self.digest, "reused": self.reused,
+                "ok": self.ok, "services": {name: result.__dict__ for name, result in self.services.items()}}
+
+    def summary(self) -> str:
+        counts: Dict[str, int] = {}
+        for result in self.services.values():
+            counts[result.action] = counts.get(result.action, 0) + 1
+        actions = ", ".join(f"{action} {count}" for action, count in sorted(counts.items())) or "-"
+        revision = self.task_definition.rsplit("/", 1)[-1]
+        return f"{revision} ({'재사용' if self.reused else '신규 등록'}), 서비스 {actions}"
+
+
+class SteadyStateWatcher:
+    """여러 서비스를 묶어 조회하며 안정 상태를 기다리는 백오프 감시기"""
+
+    BATCH = 10  # describe_services 한 번에 조회할 수 있는 서비스 수
+
+    def __init__(self, client, cluster: str, timeout: float = 600.0, initial_delay: float = 2.0,
+                 max_delay: float = 30.0, factor: float = 1.5,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.client = client
+        self.cluster = cluster
+        self.timeout = timeout
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.clock = clock
+        self.sleep = sleep
+
+    @staticmethod
+    def state(service: Dict[str, Any]) -> str:
+        """steady / failed / progressing"""
+        deployments = service.get("deployments", [])
+        primary = next((d for d in deployments if d.get("status") == "PRIMARY"), {})
+        if primary.get("rolloutState") == "FAILED":
+            return "failed"
+        if len(deployments) <= 1 and service.get("runningCount") == service.get("desiredCount"):
+            return "steady"
+        return "progressing"
+
+    def wait(self, names: List[str]) -> Dict[str, Tuple[str, float]]:
+        """
+        서비스가 안정 상태가 될 때까지 대기
+
+        Returns:
+            서비스별 (최종 상태, 걸린 시간), 시간 초과면 상태는 "timeout"
+        """
+        start = self.clock()
+        pending = list(names)
+        results: Dict[str, Tuple[str, float]] = {}
+        delay = self.initial_delay
+        last_progress: Dict[str, Tuple[int, int]] = {}
+        while pending:
+            progressed = False
+            for i in range(0, len(pending), self.BATCH):
+                response = self.client.describe_services(cluster=self.cluster, services=pending[i:i + self.BATCH])
+                for service in response.get("services", []):
+                    name = service["serviceName"]
+                    state = self.state(service)
+                    if state != "progressing":
+                        results[name] = (state, self.clock() - start)
+                        continue
+                    counts = (service.get("runningCount", 0), len(service.get("deployments", [])))
+                    progressed |= last_progress.get(name) not in (None, counts)
+                    last_progress[name] = counts
+                for failure in response.get("failures", []):
+                    name = failure.get("arn", "").rsplit("/", 1)[-1]
+                    results[name] = (failure.get("reason", "missing").lower(), self.clock() - start)
+            pending = [name for name in pending if name not in results]
+            if not pending:
+                break
+            elapsed = self.clock() - start
+            if elapsed >= self.timeout:
+                for name in pending:
+                    results[name] = ("timeout", elapsed)
+                break
+            # 태스크 수가 바뀌는 중이면 짧게, 변화가 없으면 점점 길게 조회
+            if progressed:
+                delay = self.initial_delay
+            self.sleep(min(delay, self.timeout - elapsed))
+            delay = min(self.max_delay, delay * self.factor)
+        return results
+
+
+class EcsDeployer:
+    """태스크 정의 내용 주소 등록과 서비스 동시 롤아웃"""
+
+    def __init__(self, cluster: str, region: str = "ap-northeast-2", client=None, max_workers: int = 8,
+                 scan_limit: int = 20, watcher: Optional[SteadyStateWatcher] = None):
+        """
+        Args:
+            cluster: ECS 클러스터 이름
+            client: ECS 클라이언트 (테스트/moto용 주입, 기본 boto3)
+            scan_limit: 같은 해시를 찾을 최근 ACTIVE 리비전 수
+        """
+        self.cluster = cluster
+        self.client = client or ecs_client(region)
+        self.max_workers = max_workers
+        self.scan_limit = scan_limit
+        self.watcher = watcher or SteadyStateWatcher(self.client, cluster)
+
+    def _revisions(self, family: str) -> List[str]:
+        """최근 ACTIVE 리비전 ARN (최신 순, 같은 접두사의 다른 family 제외)"""
+        arns: List[str] = []
+        kwargs = {"familyPrefix": family, "status": "ACTIVE", "sort": "DESC"}
+        while len(arns) < self.scan_limit:
+            response = self.client.list_task_definitions(**kwargs)
+            arns += [arn for arn in response.get("taskDefinitionArns", [])
+                     if arn.rsplit("/", 1)[-1].rsplit(":", 1)[0] == family]
+            if not response.get("nextToken"):
+                break
+            kwargs["nextToken"] = response["nextToken"]
+        return arns[:self.scan_limit]
+
+    def find_revision(self, family: str, digest: str) -> Optional[str]:
+        """해시 태그가 같은 ACTIVE 리비전 ARN"""
+        for arn in self._revisions(family):
+            response = self.client.describe_task_definition(taskDefinition=arn, include=["TAGS"])
+            tags = {tag["key"]: tag["value"] for tag in response.get("tags", [])}
+            if tags.get(DIGEST_TAG) == digest:
+                return arn
+        return None
+
+    def register(self, task_definition: Dict[str, Any]) -> Tuple[str, str, bool]:
+        """
+        태스크 정의 등록 (내용이 같은 리비전이 있으면 재사용)
+
+        Returns:
+            (리비전 ARN, 해시, 재사용 여부)
+        """
+        digest = task_definition_digest(task_definition)
+        family = task_definition["family"]
+        arn = self.find_revision(family, digest)
+        if arn:
+            logger.info(f"♻️ 태스크 정의 재사용: {arn.rsplit('/', 1)[-1]} ({digest[:12]})")
+            return arn, digest, True
+
+        request = {key: value for key, value in task_definition.items() if key not in _RESPONSE_ONLY}
+        tags = [tag for tag in task_definition.get("tags", []) if tag.get("key") != DIGEST_TAG]
+        response = self.client.register_task_definition(**request, tags=tags + [{"key": DIGEST_TAG, "value": digest}])
+        arn = response["taskDefinition"]["taskDefinitionArn"]
+        logger.info(f"📝 태스크 정의 등록: {arn.rsplit('/', 1)[-1]} ({digest[:12]})")
+        return arn, digest, False
+
+    def _rollout(self, spec: ServiceSpec, arn: str) -> ServiceResult:
+        """서비스 하나를 목표 리비전으로 맞추기 (없으면 생성, 같으면 건너뜀)"""
+        result = ServiceResult(spec.name)
+        try:
+            response = self.client.describe_services(cluster=self.cluster, services=[spec.name])
+            current = next((s for s in response.get("services", []) if s.get("status") != "INACTIVE"), None)
+            if current is None:
+                if not spec.subnets:
+                    raise DeploymentError(f"서비스 {spec.name}이(가) 없고 생성할 서브넷이 지정되지 않았습니다")
+                self.client.create_service(cluster=self.cluster, serviceName=spec.name, taskDefinition=arn,
+                                           desiredCount=1 if spec.desired_count is None else spec.desired_count,
+                                           launchType=spec.launch_type,
+                                           networkConfiguration=spec.network_configuration())
+                result.action = "created"
+            elif current.get("taskDefinition") == arn and spec.desired_count in (None, current.get("desiredCount")):
+                result.action = "unchanged"
+            else:
+                kwargs = {} if spec.desired_count is None else {"desiredCount": spec.desired_count}
+                self.client.update_service(cluster=self.cluster, service=spec.name, taskDefinition=arn, **kwargs)
+                result.action = "updated"
+        except Exception as e:
+            result.action = "failed"
+            result.error = str(e)
+        return result
+
+    def deploy(self, task_definition: Dict[str, Any], services: List[ServiceSpec],
+               wait: bool = True) -> DeployReport:
+        """태스크 정의 등록(또는 재사용) 후 서비스 동시 업데이트, 안정 상태 대기"""
+        arn, digest, reused = self.register(task_definition)
+        report = DeployReport(arn, digest, reused)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(services)))) as pool:
+            for result in pool.map(lambda spec: self._rollout(spec, arn), services):
+                report.services[result.name] = result
+                if result.error:
+                    logger.error(f"❌ {result.name}: {result.error}")
+                else:
+                    logger.info(f"🚀 {result.name}: {result.action}")
+
+        rolled = [name for name, result in report.services.items() if not result.error]
+        if not wait:
+            for name in rolled:
+                report.services[name].steady = True
+            return report
+        for name, (state, seconds) in self.watcher.wait(rolled).items():
+            result = report.services[name]
+            result.steady, result.seconds = state == "steady", round(seconds, 1)
+            if not result.steady:
+                result.error = f"안정 상태 도달 실패: {state}"
+                logger.error(f"❌ {name}: {result.error} ({result.seconds}초)")
+            else:
+                logger.info(f"✅ {name}: 안정 상태 ({result.seconds}초)")
+        return report
+
+
+def load_task_definition(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _parse_service(value: str) -> Tuple[str, Optional[int]]:
+    name, _, count = value.partition("=")
+    return name, int(count) if count else None
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="ECS 태스크 정의 내용 주소 등록 및 서비스 동시 롤아웃")
+    parser.add_argument("--region", default="ap-northeast-2", help="AWS 리전")
+    parser.add_argument("--cluster", required=True, help="ECS 클러스터 이름")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    register = subparsers.add_parser("register", help="태스크 정의 등록/재사용 후 ARN 출력")
+    register.add_argument("task_definition", type=Path, help="태스크 정의 JSON 파일")
+    deploy = subparsers.add_parser("deploy", help="서비스를 태스크 정의로 롤아웃")
+    deploy.add_argument("task_definition", type=Path, help="태스크 정의 JSON 파일")
+    deploy.add_argument("--service", action="append", required=True, metavar="NAME[=COUNT]",
+                        help="서비스 이름과 원하는 태스크 수 (반복 가능)")
+    deploy.add_argument("--subnet", action="append", default=[], help="서비스 생성 시 서브넷 (반복 가능)")
+    deploy.add_argument("--security-group", action="append", default=[], help="서비스 생성 시 보안 그룹")
+    deploy.add_argument("--no-public-ip", action="store_true", help="퍼블릭 IP 할당 안 함")
+    deploy.add_argument("--no-wait", action="store_true", help="안정 상태를 기다리지 않음")
+    deploy.add_argument("--timeout", type=float, default=600.0, help="안정 상태 대기 시간 (초)")
+    deploy.add_argument("--max-workers", type=int, default=8, help="동시 업데이트 서비스 수")
+    args = parser.parse_args(argv)
+
+    task_definition = load_task_definition(args.task_definition)
+    if args.action == "register":
+        deployer = EcsDeployer(args.cluster, region=args.region)
+        print(deployer.register(task_definition)[0])
+        return 0
+
+    deployer = EcsDeployer(args.cluster, region=args.region, max_workers=args.max_workers)
+    deployer.watcher.timeout = args.timeout
+    services = [ServiceSpec(name, count, tuple(args.subnet), tuple(args.security_group), not args.no_public_ip)
+                for name, count in map(_parse_service, args.service)]
+    report = deployer.deploy(task_definition, services, wait=not args.no_wait)
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    logger.info(f"{'✅' if report.ok else '❌'} {report.summary()}")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
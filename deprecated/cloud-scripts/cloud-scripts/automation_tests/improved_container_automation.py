@@ -18,6 +18,15 @@ from cloud_utils import CloudUtils
 from docker_utils import DockerUtils
 from k8s_utils import K8sUtils
 
+sys.path.append(str(Path(__file__).parent.parent))
+from automation_tests.cost_engine import CostEngine
+from automation_tests.resource_inventory import ResourceInventory
+from automation_tests.metrics_exporter import metrics_step, metrics_from_env
+from automation_tests.namespace_teardown import NamespaceTeardown
+from automation_tests.ecs_deployer import EcsDeployer, ServiceSpec, load_task_definition
+from automation_tests.docker_cleanup import DockerCleanup
+from automation_tests.common import profile_step
+
 class CloudContainerAutomation(AutomationBase):
     """Cloud Container 과정 자동화 클래스"""
     
@@ -33,6 +42,10 @@ class CloudContainerAutomation(AutomationBase):
         self.docker_utils = DockerUtils(config)
         self.k8s_utils = K8sUtils(config)
         self.day = config.get('day', 1)
+        # MCP_METRICS_PORT가 설정되어 있으면 /metrics 엔드포인트로 단계별 소요 시간/실패 노출
+        self.metrics = config.get('metrics') or metrics_from_env()
+        # 주입된 프로파일러(scripts/step_profiler.py의 StepProfiler 등)가 있으면 단계마다 프로파일링
+        self.profiler = config.get('profiler')
         
         # 교재 연계 정보
         self.textbook_info = {
@@ -97,6 +110,7 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("환경 설정", e)
             return False
     
+    @metrics_step("practice")
     def run_practice(self) -> bool:
         """
         실습 실행 (교재 내용과 연계)
@@ -199,6 +213,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("Day2 실습", e)
             return False
     
+    @metrics_step("cleanup")
+    @profile_step("cleanup")
     def cleanup_resources(self) -> bool:
         """
         리소스 정리 (교재 마지막 섹션 연계)
@@ -214,10 +230,12 @@ class CloudContainerAutomation(AutomationBase):
             if not k8s_cleanup:
                 self.log_warning("Kubernetes 리소스 정리", "일부 Kubernetes 리소스 정리 실패")
             
-            # Docker 리소스 정리
-            docker_cleanup = self.docker_utils.cleanup_containers("container", self.day)
-            if not docker_cleanup:
-                self.log_warning("Docker 리소스 정리", "일부 Docker 리소스 정리 실패")
+            # Docker 리소스 정리 (과정/일차 라벨 필터로 중지된 컨테이너와 네트워크/볼륨/이미지 일괄 prune)
+            docker_report = DockerCleanup("container", self.day).run()
+            if docker_report.ok:
+                self.log_info("Docker 리소스 정리", docker_report.summary())
+            else:
+                self.log_warning("Docker 리소스 정리", f"일부 Docker 리소스 정리 실패: {'; '.join(docker_report.errors)}")
             
             # AWS 리소스 정리
             aws_cleanup = self.cloud_utils.cleanup_resources("container", self.day)
@@ -286,6 +304,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("Cloud Master 연계 확인", e)
             return False
     
+    @metrics_step("gke_cluster")
+    @profile_step("gke_cluster")
     def _setup_gke_cluster(self) -> bool:
         """GKE 클러스터 설정"""
         try:
@@ -301,6 +321,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("GKE 클러스터 설정", e)
             return False
     
+    @metrics_step("advanced_orchestration")
+    @profile_step("advanced_orchestration")
     def _setup_advanced_orchestration(self) -> bool:
         """고급 오케스트레이션 설정"""
         try:
@@ -321,17 +343,34 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("고급 오케스트레이션 설정", e)
             return False
     
+    @metrics_step("ecs_fargate")
+    @profile_step("ecs_fargate")
     def _setup_ecs_fargate(self) -> bool:
         """ECS Fargate 설정"""
         try:
-            # ECS 클러스터 및 Fargate 서비스 설정
-            self.log_success("ECS Fargate 설정", "ECS 클러스터 및 Fargate 서비스 설정 완료")
+            # 태스크 정의는 내용이 바뀌었을 때만 새 리비전으로 등록하고, 서비스는 동시에 롤아웃
+            task_definition_path = self.config.get('ecs_task_definition')
+            if not task_definition_path:
+                self.log_info("ECS Fargate 설정", "태스크 정의(ecs_task_definition)가 설정되지 않아 배포를 건너뜁니다")
+                return True
+            
+            deployer = EcsDeployer(self.config.get('ecs_cluster', 'container-course-cluster'),
+                                   region=self.config.get('aws_region', 'ap-northeast-2'))
+            services = [ServiceSpec(name) for name in self.config.get('ecs_services', ['container-course-service'])]
+            report = deployer.deploy(load_task_definition(Path(task_definition_path)), services)
+            if not report.ok:
+                self.log_warning("ECS Fargate 설정", report.summary())
+                return False
+            
+            self.log_success("ECS Fargate 설정", f"ECS Fargate 서비스 롤아웃 완료 ({report.summary()})")
             return True
             
         except Exception as e:
             self.log_error("ECS Fargate 설정", e)
             return False
     
+    @metrics_step("advanced_cicd")
+    @profile_step("advanced_cicd")
     def _setup_advanced_cicd(self) -> bool:
         """고급 CI/CD 파이프라인 설정"""
         try:
@@ -343,6 +382,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("고급 CI/CD 파이프라인 설정", e)
             return False
     
+    @metrics_step("high_availability")
+    @profile_step("high_availability")
     def _setup_high_availability(self) -> bool:
         """고가용성 아키텍처 설정"""
         try:
@@ -354,6 +395,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("고가용성 아키텍처 설정", e)
             return False
     
+    @metrics_step("load_balancing_scaling")
+    @profile_step("load_balancing_scaling")
     def _setup_load_balancing_scaling(self) -> bool:
         """로드 밸런싱 및 Auto Scaling 설정"""
         try:
@@ -365,6 +408,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("로드 밸런싱 및 Auto Scaling 설정", e)
             return False
     
+    @metrics_step("monitoring_logging")
+    @profile_step("monitoring_logging")
     def _setup_monitoring_logging(self) -> bool:
         """모니터링 및 로깅 시스템 설정"""
         try:
@@ -376,6 +421,8 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("모니터링 및 로깅 시스템 설정", e)
             return False
     
+    @metrics_step("comprehensive_project")
+    @profile_step("comprehensive_project")
     def _run_comprehensive_project(self) -> bool:
         """종합 프로젝트 실행"""
         try:
@@ -390,8 +437,14 @@ class CloudContainerAutomation(AutomationBase):
     def _cleanup_kubernetes_resources(self) -> bool:
         """Kubernetes 리소스 정리"""
         try:
-            # Kubernetes 리소스 정리 로직
-            self.log_success("Kubernetes 리소스 정리", "Kubernetes 리소스 정리 완료")
+            # 과정 네임스페이스를 한꺼번에 삭제하고 finalizer에 막힌 객체는 보고
+            namespace = self.config.get('namespace')
+            report = NamespaceTeardown().teardown([namespace] if namespace else [])
+            if not report.ok:
+                self.log_warning("Kubernetes 리소스 정리", report.summary())
+                return False
+            
+            self.log_success("Kubernetes 리소스 정리", f"Kubernetes 리소스 정리 완료 ({report.summary()})")
             return True
             
         except Exception as e:
@@ -399,9 +452,22 @@ class CloudContainerAutomation(AutomationBase):
             return False
     
     def _monitor_costs(self) -> bool:
-        """비용 모니터링"""
+        """비용 모니터링 (리소스 인벤토리 스냅샷 + 로컬 가격표 기반 추정)"""
         try:
-            # 비용 모니터링 로직
+            inventory = ResourceInventory(aws_regions=[self.config.get('aws_region', 'ap-northeast-2')])
+            try:
+                engine = CostEngine()
+                engine.sync_inventory(inventory)
+            finally:
+                inventory.close()
+            
+            report = engine.report()
+            self.log_info("비용 모니터링", f"리소스 {report['resources']}개, 시간당 ${report['hourly']:.4f}, "
+                                       f"월 예상 ${report['monthly']:.2f}, 누적 ${report['accrued']:.2f}")
+            for item in report['idle_expensive']:
+                self.log_warning("비용 모니터링", f"유휴 리소스 정리 권장: {item['kind']} {item['name']} "
+                                              f"(${item['monthly']:.2f}/월)")
+            
             self.log_success("비용 모니터링", "리소스 사용량 및 비용 확인 완료")
             return True
             
@@ -409,8 +475,13 @@ class CloudContainerAutomation(AutomationBase):
             self.log_error("비용 모니터링", e)
             return False
 
-def main():
-    """메인 함수"""
+def main(profiler=None):
+    """
+    메인 함수
+
+    Args:
+        profiler: 단계별 프로파일러 (profile(name)/finish()를 가진 객체, 호출 측에서 주입)
+    """
     # 자동화 스크립트 전용 설정 로드
     config_path = Path(__file__).parent.parent.parent / "shared_configs" / "automation_config.json"
     with open(config_path, 'r', encoding='utf-8') as f:
@@ -424,12 +495,17 @@ def main():
         'aws_region': config['cloud_providers']['aws']['region'],
         'gcp_region': config['cloud_providers']['gcp']['region'],
         'gcp_project': config['cloud_providers']['gcp'].get('project', ''),
-        'namespace': config['automation']['namespace']
+        'namespace': config['automation']['namespace'],
+        'ecs_cluster': config['cloud_providers']['aws'].get('ecs_cluster', 'container-course-cluster'),
+        'ecs_task_definition': config['cloud_providers']['aws'].get('ecs_task_definition'),
+        'profiler': profiler
     }
     
     # 자동화 실행
     automation = CloudContainerAutomation(container_config)
     success = automation.run_automation()
+    if automation.profiler:
+        automation.profiler.finish()
     
     # 결과 출력
     automation.print_summary()
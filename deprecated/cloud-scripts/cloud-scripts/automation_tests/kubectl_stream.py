@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+kubectl 목록 스트리밍 파서 및 상태 집계
+`kubectl get ... -o json` 출력을 전체 문서로 읽지 않고 items 배열의 객체를 하나씩 파싱해 전달합니다.
+대규모 클러스터에서 수백 MB에 달하는 목록도 객체 하나 크기의 메모리로 처리하며,
+네임스페이스별 준비/미준비 Pod 수와 재시작 상위 컨테이너 같은 집계는 Pod 수와 무관한 메모리로 계산합니다.
+
+사용 예:
+    python -m automation_tests.kubectl_stream pods -A --top 10
+    python -m automation_tests.kubectl_stream pods -n production -l app=web --fail-on-not-ready
+    python -m automation_tests.kubectl_stream pods -A --fields metadata.namespace metadata.name status.phase
+    python -m automation_tests.kubectl_stream nodes
+"""
+
+import sys
+import json
+import heapq
+import logging
+import argparse
+import tempfile
+import subprocess
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Iterator, Iterable, IO, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\r\n"
+
+
+class KubectlError(RuntimeError):
+    """kubectl 실행 실패"""
+
+
+class _Reader:
+    """청크 단위로 읽으며 이미 파싱한 앞부분은 버리는 버퍼"""
+
+    def __init__(self, stream: IO[str], chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode("utf-8")
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (스트림 끝이면 빈 문자열)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"JSON 형식 오류: {chars!r} 필요, {char or 'EOF'!r} 발견 (위치 {self.pos})")
+        self.pos += 1
+        return char
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """다음 JSON 값 하나 (버퍼가 값 끝까지 채워질 때까지 읽음)"""
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # 숫자/리터럴은 청크 경계에서 잘렸을 수 있으므로 뒤따르는 구분자까지 확인
+            if end == len(self.buffer) and self.buffer[self.pos] not in '{["' and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def stream_items(stream: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    kubectl -o json 출력에서 객체를 하나씩 생성
+
+    List 문서는 items 배열의 원소를, 단일 객체 문서(kubectl get pod NAME)는 객체 자체를 생성합니다.
+    --watch 출력처럼 문서가 이어 붙은 경우도 순서대로 처리합니다.
+    """
+    reader = _Reader(stream, chunk_size)
+    decoder = json.JSONDecoder()
+    while reader.peek():
+        reader.expect("{")
+        document: Dict[str, Any] = {}
+        has_items = False
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.value(decoder)
+                reader.expect(":")
+                if key == "items" and reader.peek() == "[":
+                    has_items = True
+                    reader.pos += 1
+                    if reader.peek() == "]":
+                        reader.pos += 1
+                    else:
+                        while True:
+                            yield reader.value(decoder)
+                            if reader.expect(",]") == "]":
+                                break
+                else:
+                    document[key] = reader.value(decoder)
+                if reader.expect(",}") == "}":
+                    break
+        if not has_items:
+            yield document
+
+
+def select(obj: Any, path: str) -> Any:
+    """
+    점 경로로 필드 선택 (`[*]`는 배열 원소 전체, `[0]`은 인덱스)
+
+    예: select(pod, "status.containerStatuses[*].restartCount") -> [0, 3]
+    """
+    values, many = [obj], False
+    for part in path.split("."):
+        name, _, index = part.partition("[")
+        if name:
+            values = [value.get(name) if isinstance(value, dict) else None for value in values]
+        if index:
+            index = index.rstrip("]")
+            if index == "*":
+                many = True
+                values = [item for value in values if isinstance(value, list) for item in value]
+            else:
+                values = [value[int(index)] if isinstance(value, list) and len(value) > int(index) else None
+                          for value in values]
+    return values if many else values[0]
+
+
+def project(items: Iterable[Dict[str, Any]], fields: List[str]) -> Iterator[Dict[str, Any]]:
+    """객체마다 지정 필드만 남김 (원본 객체는 즉시 버려짐)"""
+    for item in items:
+        yield {path: select(item, path) for path in fields}
+
+
+def kubectl_items(resource: str, namespace: Optional[str] = None, all_namespaces: bool = False,
+                  selector: Optional[str] = None, extra_args: Iterable[str] = (),
+                  env: Optional[Dict[str, str]] = None, popen=subprocess.Popen,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    kubectl get -o json 출력을 스트리밍으로 파싱
+
+    Args:
+        popen: subprocess.Popen 호환 함수 (테스트 시 대체)
+
+    Raises:
+        KubectlError: kubectl 종료 코드가 0이 아닌 경우 (생성한 객체 이후)
+    """
+    command = ["kubectl", "get", resource, "-o", "json"]
+    if all_namespaces:
+        command.append("--all-namespaces")
+    elif namespace:
+        command += ["-n", namespace]
+    if selector:
+        command += ["-l", selector]
+    command += list(extra_args)
+
+    with tempfile.TemporaryFile() as stderr:
+        process = popen(command, stdout=subprocess.PIPE, stderr=stderr, text=True, env=env)
+        try:
+            yield from stream_items(process.stdout, chunk_size)
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+        if returncode != 0:
+            stderr.seek(0)
+            raise KubectlError(f"{' '.join(command)} 실패: {stderr.read().decode('utf-8', 'replace').strip()}")
+
+
+def pod_ready(pod: Dict[str, Any]) -> bool:
+    conditions = pod.get("status", {}).get("conditions") or []
+    return any(c.get("type") == "Ready" and c.get("status") == "True" for c in conditions)
+
+
+@dataclass
+class NamespaceCounts:
+    ready: int = 0
+    not_ready: int = 0
+    completed: int = 0
+    restarts: int = 0
+    phases: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def total(self) -> int:
+        return self.ready + self.not_ready + self.completed
+
+
+@dataclass
+class PodAggregate:
+    """
+    Pod 상태 집계 (메모리는 네임스페이스 수와 top 값에만 비례)
+
+    Succeeded/Failed 단계의 Job Pod는 미준비가 아닌 completed로 셉니다.
+    """
+    top: int = 10
+    namespaces: Dict[str, NamespaceCounts] = field(default_factory=lambda: defaultdict(NamespaceCounts))
+    # (재시작 수, 순번, 이름) 최소 힙
+    _hot_spots: List[Tuple[int, int, str]] = field(default_factory=list)
+    _seen: int = 0
+    not_ready_samples: List[str] = field(default_factory=list)
+
+    def add(self, pod: Dict[str, Any]):
+        metadata, status = pod.get("metadata", {}), pod.get("status", {})
+        namespace = metadata.get("namespace", "default")
+        name = f"{namespace}/{metadata.get('name', '?')}"
+        counts = self.namespaces[namespace]
+        phase = status.get("phase", "Unknown")
+        counts.phases[phase] += 1
+
+        ready = pod_ready(pod)
+        if phase in ("Succeeded", "Failed") and not ready:
+            counts.completed += 1
+        elif ready:
+            counts.ready += 1
+        else:
+            counts.not_ready += 1
+            if len(self.not_ready_samples) < self.top:
+                self.not_ready_samples.append(f"{name} ({phase})")
+
+        for container in status.get("containerStatuses") or []:
+            restarts = container.get("restartCount", 0)
+            counts.restarts += restarts
+            if restarts <= 0:
+                continue
+            self._seen += 1
+            entry = (restarts, -self._seen, f"{name}:{container.get('name', '?')}")
+            if len(self._hot_spots) < self.top:
+                heapq.heappush(self._hot_spots, entry)
+            elif entry > self._hot_spots[0]:
+                heapq.heapreplace(self._hot_spots, entry)
+
+    def consume(self, pods: Iterable[Dict[str, Any]]) -> "PodAggregate":
+        for pod in pods:
+            self.add(pod)
+        return self
+
+    @property
+    def hot_spots(self) -> List[Tuple[str, int]]:
+        """재시작 횟수 상위 컨테이너 (많은 순, 같으면 먼저 본 순)"""
+        return [(name, restarts) for restarts, _, name in sorted(self._hot_spots, reverse=True)]
+
+    @property
+    def not_ready(self) -> int:
+        return sum(counts.not_ready for counts in self.namespaces.values())
+
+    @property
+    def total(self) -> int:
+        return sum(counts.total for counts in self.namespaces.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total, "not_ready": self.not_ready,
+            "namespaces": {ns: {"ready": c.ready, "not_ready": c.not_ready, "completed": c.completed,
+                                "restarts": c.restarts, "phases": dict(c.phases)}
+                           for ns, c in sorted(self.namespaces.items())},
+            "hot_spots": [{"container": name, "restarts": restarts} for name, restarts in self.hot_spots],
+            "not_ready_samples": self.not_ready_samples,
+        }
+
+    def report(self) -> str:
+        lines = [f"{'NAMESPACE':<30} {'READY':>7} {'NOT READY':>10} {'COMPLETED':>10} {'RESTARTS':>9}"]
+        for namespace, counts in sorted(self.namespaces.items()):
+            lines.append(f"{namespace:<30} {counts.ready:>7} {counts.not_ready:>10} {counts.completed:>10} "
+                         f"{counts.restarts:>9}")
+        if self.not_ready_samples:
+            lines.append("미준비 Pod: " + ", ".join(self.not_ready_samples))
+        if self._hot_spots:
+            lines.append("재시작 상위: " + ", ".join(f"{name}={restarts}" for name, restarts in self.hot_spots))
+        return "\n".join(lines)
+
+
+@dataclass
+class NodeAggregate:
+    """노드 준비/스케줄 가능 상태 및 리소스 압박 조건 집계"""
+    ready: int = 0
+    not_ready: List[str] = field(default_factory=list)
+    unschedulable: int = 0
+    pressure: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def add(self, node: Dict[str, Any]):
+        name = node.get("metadata", {}).get("name", "?")
+        conditions = {c.get("type"): c.get("status") for c in node.get("status", {}).get("conditions") or []}
+        if conditions.get("Ready") == "True":
+            self.ready += 1
+        else:
+            self.not_ready.append(name)
+        if node.get("spec", {}).get("unschedulable"):
+            self.unschedulable += 1
+        for condition, status in conditions.items():
+            if condition != "Ready" and condition.endswith("Pressure") and status == "True":
+                self.pressure[condition] += 1
+
+    def consume(self, nodes: Iterable[Dict[str, Any]]) -> "NodeAggregate":
+        for node in nodes:
+            self.add(node)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ready": self.ready, "not_ready": self.not_ready, "unschedulable": self.unschedulable,
+                "pressure": dict(self.pressure)}
+
+    def report(self) -> str:
+        line = f"노드 준비 {self.ready}/{self.ready + len(self.not_ready)}"
+        if self.not_ready:
+            line += f" (미준비: {', '.join(self.not_ready)})"
+        if self.unschedulable:
+            line += f", 스케줄 불가 {self.unschedulable}"
+        if self.pressure:
+            line += ", " + ", ".join(f"{k} {v}" for k, v in sorted(self.pressure.items()))
+        return line
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="kubectl 목록 스트리밍 상태 집계")
+    parser.add_argument("resource", choices=["pods", "nodes"], help="집계 대상")
+    parser.add_argument("-n", "--namespace", help="네임스페이스")
+    parser.add_argument("-A", "--all-namespaces", action="store_true", help="모든 네임스페이스")
+    parser.add_argument("-l", "--selector", help="레이블 셀렉터")
+    parser.add_argument("--fields", nargs="+", help="집계 대신 지정 필드만 JSON Lines로 출력")
+    parser.add_argument("--top", type=int, default=10, help="재시작 상위/미준비 예시 개수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    parser.add_argument("--fail-on-not-ready", action="store_true", help="미준비 Pod/노드가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    items = kubectl_items(args.resource, args.namespace, args.all_namespaces, args.selector)
+    try:
+        if args.fields:
+            for row in project(items, args.fields):
+                print(json.dumps(row, ensure_ascii=False))
+            return 0
+        aggregate = (PodAggregate(top=args.top) if args.resource == "pods" else NodeAggregate()).consume(items)
+    except (KubectlError, OSError) as e:
+        logger.error(f"❌ 상태 집계 실패: {e}")
+        return 1
+
+    print(json.dumps(aggregate.to_dict(), ensure_ascii=False, indent=2) if args.json else aggregate.report())
+    not_ready = aggregate.not_ready if args.resource == "pods" else len(aggregate.not_ready)
+    return 1 if args.fail_on_not_ready and not_ready else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+API 서버 및 클러스터 내부 지연 시간 측정
+test-cluster-connection.sh가 current-context/cluster-info 성공 여부만 보던 것을 넘어, 컨트롤 플레인과
+클러스터 내부 네트워크의 지연 시간 분포를 N개 샘플의 히스토그램으로 보여 줍니다.
+컨트롤 플레인이 느린지 네트워크가 느린지 구분한 뒤 과정 자동화를 의심할 수 있습니다.
+
+- 컨트롤 플레인: kubectl proxy 하나를 띄워 인증은 kubectl에 맡기고(gke-gcloud-auth-plugin 등),
+  discovery(/apis), list(Pod 목록), watch 수립(응답 헤더까지)을 스레드별 keep-alive 연결로 반복 측정
+- 클러스터 내부: 짧게 실행되는 curl Pod가 서비스 URL(기본 kubernetes.default.svc의 /readyz)을 반복 호출해
+  DNS 조회, TCP 연결(ClusterIP 경유 왕복), 요청 전체 시간을 측정하고 끝나면 삭제
+
+사용 예:
+    python -m automation_tests.latency_probe --samples 100 --concurrency 8
+    python -m automation_tests.latency_probe --skip-in-cluster --json
+    python -m automation_tests.latency_probe --service-url http://web.production.svc.cluster.local/healthz
+"""
+
+import os
+import re
+import sys
+import math
+import json
+import time
+import uuid
+import shlex
+import bisect
+import logging
+import argparse
+import threading
+import subprocess
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Iterator
+from urllib.parse import urlparse
+from contextlib import contextmanager
+
+from .common import run_cli
+
+logger = logging.getLogger(__name__)
+
+# 히스토그램 버킷 상한 (밀리초)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+DEFAULT_SAMPLES = 50
+DEFAULT_CONCURRENCY = 4
+PROBE_IMAGE = "curlimages/curl:8.5.0"
+DEFAULT_SERVICE_URL = "https://kubernetes.default.svc.cluster.local/readyz"
+
+# 컨트롤 플레인 측정 항목 (이름, 경로, watch 여부)
+CONTROL_PLANE_CHECKS = [
+    ("discovery", "/apis", False),
+    ("list", "/api/v1/namespaces/kube-system/pods?limit=100", False),
+    ("watch", "/api/v1/namespaces/default/configmaps?watch=1&timeoutSeconds=1", True),
+]
+
+
+class ProbeError(RuntimeError):
+    """측정 준비 실패 (kubectl proxy/프로브 Pod)"""
+
+
+class LatencyHistogram:
+    """지연 시간 샘플 (초) 분포"""
+
+    def __init__(self, name: str, buckets_ms=LATENCY_BUCKETS_MS):
+        self.name = name
+        self.buckets_ms = tuple(buckets_ms)
+        self.samples: List[float] = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def error(self):
+        with self._lock:
+            self.errors += 1
+
+    def percentile(self, q: float) -> float:
+        """최근접 순위 백분위수 (초)"""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+    def counts(self) -> List[int]:
+        """버킷별 샘플 수 (마지막은 최대 버킷 초과)"""
+        counts = [0] * (len(self.buckets_ms) + 1)
+        for seconds in self.samples:
+            counts[bisect.bisect_left(self.buckets_ms, seconds * 1000)] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        ms = lambda seconds: round(seconds * 1000, 2)
+        return {"samples": len(self.samples), "errors": self.errors,
+                "min_ms": ms(min(self.samples, default=0.0)), "p50_ms": ms(self.percentile(0.5)),
+                "p90_ms": ms(self.percentile(0.9)), "p99_ms": ms(self.percentile(0.99)),
+                "max_ms": ms(max(self.samples, default=0.0)),
+                "buckets_ms": dict(zip([f"<={b}" for b in self.buckets_ms] + ["+Inf"], self.counts()))}
+
+    def render(self, width: int = 40) -> str:
+        """텍스트 히스토그램 (비어 있는 앞뒤 버킷은 생략)"""
+        stats = self.to_dict()
+        lines = [f"{self.name}: n={stats['samples']} 오류={stats['errors']} p50={stats['p50_ms']}ms "
+                 f"p90={stats['p90_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms"]
+        counts = self.counts()
+        used = [i for i, count in enumerate(counts) if count]
+        if not used:
+            return lines[0]
+        peak = max(counts)
+        labels = [f"<={b}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+        for i in range(used[0], used[-1] + 1):
+            bar = "█" * max(1 if counts[i] else 0, round(counts[i] / peak * width))
+            lines.append(f"  {labels[i]:>9} {counts[i]:>5} {bar}")
+        return "\n".join(lines)
+
+
+@dataclass
+class ProbeReport:
+    """측정 결과"""
+    histograms: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    notes: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"checks": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+                "notes": self.notes}
+
+    def render(self) -> str:
+        return "\n".join([histogram.render() for histogram in self.histograms.values()] + self.notes)
+
+
+@contextmanager
+def kubectl_proxy(env: Optional[Dict[str, str]] = None, popen=subprocess.Popen,
+                  timeout: float = 15.0) -> Iterator[str]:
+    """임의 포트로 kubectl proxy를 띄우고 기본 URL 반환 (종료 시 정리)"""
+    process = popen(["kubectl", "proxy", "--port=0"], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    text=True, env=env)
+    try:
+        # "Starting to serve on 127.0.0.1:43211"
+        result: Dict[str, str] = {}
+        reader = threading.Thread(target=lambda: result.update(line=process.stdout.readline()), daemon=True)
+        reader.start()
+        reader.join(timeout)
+        match = re.search(r"serve on ([\d.]+:\d+)", result.get("line", ""))
+        if not match:
+            raise ProbeError(f"kubectl proxy 시작 실패: {result.get('line', '').strip() or '응답 없음'}")
+        yield f"http://{match.group(1)}"
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+class ControlPlaneProbe:
+    """kubectl proxy를 통한 API 서버 요청 지연 측정"""
+
+    def __init__(self, base_url: str, samples: int = DEFAULT_SAMPLES, concurrency: int = DEFAULT_CONCURRENCY,
+                 timeout: float = 30.0, clock: Callable[[], float] = time.perf_counter):
+        url = urlparse(base_url)
+        self.host, self.port = url.hostname, url.port or 80
+        self.samples = samples
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.clock = clock
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        # 연결 수립 비용이 샘플에 섞이지 않도록 스레드마다 keep-alive 연결 재사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def _request(self, path: str, watch: bool) -> float:
+        conn = self._connection()
+        start = self.clock()
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            if watch:
+                # watch는 응답 헤더가 오면 수립된 것, 스트림은 기다리지 않고 연결을 닫음
+                elapsed = self.clock() - start
+                conn.close()
+                self._local.conn = None
+            else:
+                response.read()
+                elapsed = self.clock() - start
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self._local.conn = None
+            raise
+        if response.status >= 400:
+            raise ProbeError(f"{path}: HTTP {response.status}")
+        return elapsed
+
+    def run(self, checks=CONTROL_PLANE_CHECKS) -> Dict[str, LatencyHistogram]:
+        histograms = {}
+        for name, path, watch in checks:
+            histogram = histograms[name] = LatencyHistogram(name)
+
+            def sample(_):
+                try:
+                    histogram.observe(self._request(path, watch))
+                except (OSError, http.client.HTTPException, ProbeError) as e:
+                    histogram.error()
+                    logger.debug(f"{name} 샘플 실패: {e}")
+
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                list(pool.map(sample, range(self.samples)))
+        return histograms
+
+
+def probe_script(url: str, samples: int, concurrency: int) -> str:
+    """프로브 Pod에서 실행할 sh 스크립트 (샘플마다 OK dns connect total 또는 ERR 출력)"""
+    per_worker = -(-samples // concurrency)
+    return (
+        f"probe() {{ i=0; while [ $i -lt {per_worker} ]; do "
+        f"out=$(curl -sk -o /dev/null -m 10 -w '%{{time_namelookup}} %{{time_connect}} %{{time_total}}' "
+        f"{shlex.quote(url)}) && echo \"OK $out\" || echo \"ERR $out\"; i=$((i+1)); done; }}; "
+        f"for w in $(seq {concurrency}); do probe & done; wait"
+    )
+
+
+def parse_probe_output(output: str, limit: Optional[int] = None) -> Dict[str, LatencyHistogram]:
+    """프로브 Pod 출력을 DNS/서비스 연결/서비스 요청 히스토그램으로 변환"""
+    histograms = {name: LatencyHistogram(name) for name in ("dns", "service_connect", "service_request")}
+    lines = [line.split() for line in output.splitlines() if line.startswith(("OK", "ERR"))][:limit]
+    for parts in lines:
+        if parts[0] != "OK" or len(parts) != 4:
+            for histogram in histograms.values():
+                histogram.error()
+            continue
+        dns, connect, total = map(float, parts[1:])
+        histograms["dns"].observe(dns)
+        # ClusterIP를 거친 TCP 연결(네트워크 왕복)과 DNS 이후 요청 전체 시간
+        histograms["service_connect"].observe(max(0.0, connect - dns))
+        histograms["service_request"].observe(max(0.0, total - dns))
+    return histograms
+
+
+class InClusterProbe:
+    """짧게 실행되는 curl Pod로 클러스터 내부 DNS/서비스 왕복 지연 측정"""
+
+    def __init__(self, runner: Callable[..., str] = run_cli, env: Optional[Dict[str, str]] = None,
+                 namespace: str = "default", image: str = PROBE_IMAGE, url: str = DEFAULT_SERVICE_URL,
+                 samples: int = DEFAULT_SAMPLES, concurrency: int = DEFAULT_CONCURRENCY, timeout: int = 180,
+                 clock: Callable[[], float] = time.monotonic):
+        self.runner = runner
+        self.env = env
+        self.namespace = namespace
+        self.image = image
+        self.url = url
+        self.samples = samples
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.clock = clock
+        self.pod = f"mcp-latency-probe-{uuid.uuid4().hex[:8]}"
+
+    def _kubectl(self, *args: str) -> str:
+        return self.runner(["kubectl", "-n", self.namespace, *args], env=self.env)
+
+    def run(self) -> Dict[str, LatencyHistogram]:
+        script = probe_script(self.url, self.samples, self.concurrency)
+        start = self.clock()
+        try:
+            self._kubectl("run", self.pod, f"--image={self.image}", "--restart=Never",
+                          "--labels=app.kubernetes.io/name=mcp-latency-probe", "--command", "--", "sh", "-c", script)
+            self._kubectl("wait", f"pod/{self.pod}", "--for=jsonpath={.status.phase}=Succeeded",
+                          f"--timeout={self.timeout}s")
+            logger.info(f"🛰️ 프로브 Pod 완료 ({self.clock() - start:.1f}초, 이미지 받기/스케줄링 포함)")
+            output = self._kubectl("logs", self.pod)
+        except subprocess.CalledProcessError as e:
+            raise ProbeError(f"프로브 Pod 실행 실패: {(e.stderr or str(e)).strip()}") from None
+        finally:
+            try:
+                self._kubectl("delete", "pod", self.pod, "--wait=false", "--ignore-not-found")
+            except (subprocess.CalledProcessError, OSError) as e:
+                logger.warning(f"⚠️ 프로브 Pod 삭제 실패: {self.pod} ({e})")
+        return parse_probe_output(output, limit=self.samples)
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="API 서버 및 클러스터 내부 지연 시간 측정")
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES, help="항목별 샘플 수")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 수")
+    parser.add_argument("-n", "--namespace", default="default", help="프로브 Pod 네임스페이스")
+    parser.add_argument("--image", default=PROBE_IMAGE, help="프로브 Pod 이미지 (curl 필요)")
+    parser.add_argument("--service-url", default=DEFAULT_SERVICE_URL, help="클러스터 내부에서 호출할 서비스 URL")
+    parser.add_argument("--kubeconfig", help="KUBECONFIG 경로")
+    parser.add_argument("--skip-in-cluster", action="store_true", help="프로브 Pod 측정 생략")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    env = {"KUBECONFIG": args.kubeconfig} if args.kubeconfig else None
+    report = ProbeReport()
+    try:
+        with kubectl_proxy(env={**os.environ, **env} if env else None) as base_url:
+            report.histograms.update(ControlPlaneProbe(base_url, args.samples, args.concurrency).run())
+    except (ProbeError, OSError) as e:
+        logger.error(f"❌ 컨트롤 플레인 측정 실패: {e}")
+        return 1
+
+    if not args.skip_in_cluster:
+        try:
+            report.histograms.update(InClusterProbe(env=env, namespace=args.namespace, image=args.image,
+                                                    url=args.service_url, samples=args.samples,
+                                                    concurrency=args.concurrency).run())
+        except ProbeError as e:
+            report.notes.append(f"클러스터 내부 측정 실패: {e}")
+
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2) if args.json else report.render())
+    failed = [name for name, histogram in report.histograms.items() if not histogram.samples]
+    return 1 if failed or report.notes else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,626 @@
+#!/usr/bin/env python3
+"""
+Kubernetes 매니페스트 오프라인 스키마 검증
+Kubernetes OpenAPI 스키마(swagger.json)를 한 번 읽어 리소스 종류별 검증 함수로 컴파일/캐시하고,
+과정에서 생성하는 매니페스트를 API 서버 없이 병렬로 검증합니다.
+
+검증 대상:
+- YAML 파일/디렉토리
+- Bash 스크립트의 heredoc 매니페스트 (k8s-app-deploy.sh의 create_*, day2의 network-policy.yaml/vpa.yaml 등)
+- ContainerCourseAutomation.run_day1이 배포하는 샘플 앱 매니페스트 (--course)
+
+오류는 kubectl과 같은 필드 경로(spec.template.spec.containers[0].ports[0].containerPort)와
+원본 파일의 줄 번호로 보고합니다. 스키마에 없는 필드는 kubectl --validate=strict처럼 오류로 처리합니다.
+
+사용 예:
+    # 스키마 내려받기 (한 번만, ~/.cache/mcp_cloud/k8s-openapi/swagger-<버전>.json)
+    python -m automation_tests.manifest_validator --fetch --k8s-version 1.29.0
+
+    # 과정 매니페스트 전체 + 추가 파일 검증
+    python -m automation_tests.manifest_validator --course manifests/
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import logging
+import argparse
+import subprocess
+import multiprocessing
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Callable, Iterable
+
+import yaml
+
+from .sample_manifests import sample_app_manifest
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_DIR = Path(__file__).parent
+REPO_ROOT = PACKAGE_DIR.parents[3]
+SCHEMA_DIR = Path(os.environ.get("MCP_K8S_SCHEMA_DIR", Path.home() / ".cache" / "mcp_cloud" / "k8s-openapi"))
+DEFAULT_K8S_VERSION = "1.29.0"
+SCHEMA_URL = "https://raw.githubusercontent.com/kubernetes/kubernetes/v{version}/api/openapi-spec/swagger.json"
+
+# 과정에서 매니페스트를 heredoc으로 생성하는 스크립트
+COURSE_SCRIPTS = (
+    PACKAGE_DIR.parent / "k8s-app-deploy.sh",
+    REPO_ROOT / "scripts" / "day1-practice-improved.sh",
+    REPO_ROOT / "scripts" / "day2-practice-improved.sh",
+)
+
+# 코어 OpenAPI에 없는 과정 사용 CRD (필요한 필드만)
+BUILTIN_CRD_SCHEMAS = {
+    ("autoscaling.k8s.io/v1", "VerticalPodAutoscaler"): {
+        "type": "object",
+        "required": ["spec"],
+        "properties": {
+            "apiVersion": {"type": "string"},
+            "kind": {"type": "string"},
+            "metadata": {"$ref": "#/definitions/io.k8s.apimachinery.pkg.apis.meta.v1.ObjectMeta"},
+            "spec": {
+                "type": "object",
+                "required": ["targetRef"],
+                "properties": {
+                    "targetRef": {
+                        "type": "object",
+                        "required": ["kind", "name"],
+                        "properties": {"apiVersion": {"type": "string"}, "kind": {"type": "string"},
+                                       "name": {"type": "string"}},
+                    },
+                    "updatePolicy": {
+                        "type": "object",
+                        "properties": {
+                            "updateMode": {"type": "string", "enum": ["Off", "Initial", "Recreate", "Auto"]},
+                            "minReplicas": {"type": "integer"},
+                        },
+                    },
+                    "resourcePolicy": {"type": "object", "x-kubernetes-preserve-unknown-fields": True},
+                    "recommenders": {"type": "array", "items": {"type": "object",
+                                                                 "properties": {"name": {"type": "string"}}}},
+                },
+            },
+            "status": {"type": "object", "x-kubernetes-preserve-unknown-fields": True},
+        },
+    },
+}
+
+_QUANTITY = re.compile(r'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$')
+_HEREDOC = re.compile(r'(?<!<)<<(-?)\s*([\'"]?)([A-Za-z_][A-Za-z0-9_]*)\2')
+_ASSIGNMENT = re.compile(r'^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)=(.*)$')
+_VARIABLE = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::?[-=]([^}]*))?\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+_COMMAND_SUBSTITUTION = re.compile(r'\$\([^()]*\)')
+PLACEHOLDER = "placeholder"
+
+# (값, 경로, 오류 목록) -> None
+Validator = Callable[[Any, tuple, list], None]
+
+
+@dataclass
+class ManifestSource:
+    """검증할 YAML 텍스트 (파일 또는 스크립트 heredoc)"""
+    name: str
+    text: str
+    line: int = 1
+
+
+@dataclass
+class ValidationIssue:
+    source: str
+    line: int
+    kind: str
+    name: str
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.source}:{self.line}: {self.kind}/{self.name}: {self.path or '<root>'}: {self.message}"
+
+
+@dataclass
+class ValidationReport:
+    documents: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def valid(self) -> bool:
+        return not self.issues
+
+    def merge(self, other: "ValidationReport"):
+        self.documents += other.documents
+        self.issues.extend(other.issues)
+        self.skipped.extend(other.skipped)
+
+
+def format_path(path: tuple) -> str:
+    """('spec', 'containers', 0, 'image') -> spec.containers[0].image"""
+    text = ""
+    for part in path:
+        text += f"[{part}]" if isinstance(part, int) else (f".{part}" if text else str(part))
+    return text
+
+
+def _type_name(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "integer"
+    if isinstance(value, float):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return type(value).__name__
+
+
+_TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+}
+
+
+def _describe(value: Any) -> str:
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return f'{_type_name(value)} "{value}"'
+    return _type_name(value)
+
+
+class SchemaRegistry:
+    """
+    OpenAPI 정의 -> 컴파일된 검증 함수 캐시
+    정의($ref)마다 한 번만 컴파일하며, 재귀 정의는 지연 참조로 처리합니다.
+    """
+
+    def __init__(self, definitions: Dict[str, Dict[str, Any]], strict: bool = True):
+        self.definitions = dict(definitions)
+        self.strict = strict
+        self.kinds: Dict[Tuple[str, str], str] = {}
+        # register()로 추가한 스키마 (스키마 파일만 다시 읽는 spawn 방식 작업자에 전달)
+        self.registered: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._compiled: Dict[str, Validator] = {}
+        for name, schema in self.definitions.items():
+            for gvk in schema.get("x-kubernetes-group-version-kind") or []:
+                api_version = f"{gvk['group']}/{gvk['version']}" if gvk.get("group") else gvk["version"]
+                # 같은 종류가 여러 정의에 걸쳐 있으면 (예: DeleteOptions) 먼저 나온 것 사용
+                self.kinds.setdefault((api_version, gvk["kind"]), name)
+        for (api_version, kind), schema in BUILTIN_CRD_SCHEMAS.items():
+            self.register(api_version, kind, schema)
+
+    @classmethod
+    def from_file(cls, path: Path, strict: bool = True) -> "SchemaRegistry":
+        """swagger.json (OpenAPI v2 definitions 또는 v3 components.schemas) 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        definitions = document.get("definitions") or (document.get("components") or {}).get("schemas") or {}
+        if not definitions:
+            raise ValueError(f"OpenAPI 정의가 없는 파일입니다: {path}")
+        return cls(definitions, strict=strict)
+
+    def register(self, api_version: str, kind: str, schema: Dict[str, Any]):
+        """추가 리소스 종류 등록 (CRD 등)"""
+        name = f"{api_version}/{kind}"
+        self.definitions[name] = schema
+        self.kinds[(api_version, kind)] = name
+        self.registered[(api_version, kind)] = schema
+        self._compiled.pop(name, None)
+
+    def register_crd(self, crd: Dict[str, Any]):
+        """CustomResourceDefinition 매니페스트의 openAPIV3Schema 등록"""
+        spec = crd.get("spec") or {}
+        kind = (spec.get("names") or {}).get("kind")
+        for version in spec.get("versions") or []:
+            schema = (version.get("schema") or {}).get("openAPIV3Schema")
+            if kind and schema:
+                self.register(f"{spec['group']}/{version['name']}", kind, schema)
+
+    def validator(self, api_version: str, kind: str) -> Optional[Validator]:
+        """리소스 종류의 검증 함수 (스키마가 없으면 None)"""
+        name = self.kinds.get((api_version, kind))
+        return self._ref(name) if name else None
+
+    # --- 컴파일 ---------------------------------------------------------------
+
+    def _ref(self, name: str) -> Validator:
+        compiled = self._compiled.get(name)
+        if compiled is not None:
+            return compiled
+        if name.endswith(".Quantity"):
+            compiled = _validate_quantity
+        elif name.endswith(".IntOrString"):
+            compiled = _validate_int_or_string
+        elif name not in self.definitions:
+            compiled = _accept
+        else:
+            # 재귀 정의를 위해 먼저 지연 참조를 등록한 뒤 실제 함수로 교체
+            cell: List[Validator] = []
+            self._compiled[name] = lambda value, path, errors: cell[0](value, path, errors)
+            compiled = self._compile(self.definitions[name])
+            cell.append(compiled)
+        self._compiled[name] = compiled
+        return compiled
+
+    def _compile(self, schema: Dict[str, Any]) -> Validator:
+        if "$ref" in schema:
+            return self._ref(schema["$ref"].rsplit("/", 1)[-1])
+        if schema.get("allOf"):
+            parts = [self._compile(part) for part in schema["allOf"]]
+            if len(parts) == 1:
+                return parts[0]
+
+            def validate_all(value, path, errors):
+                for part in parts:
+                    part(value, path, errors)
+            return validate_all
+
+        if schema.get("x-kubernetes-int-or-string") or schema.get("format") == "int-or-string":
+            return _validate_int_or_string
+
+        schema_type = schema.get("type")
+        type_check = _TYPE_CHECKS.get(schema_type)
+        enum = set(schema["enum"]) if schema.get("enum") else None
+        preserve = bool(schema.get("x-kubernetes-preserve-unknown-fields"))
+        properties = {key: self._compile(value) for key, value in (schema.get("properties") or {}).items()}
+        required = tuple(schema.get("required") or ())
+        additional = schema.get("additionalProperties")
+        additional_validator = self._compile(additional) if isinstance(additional, dict) else None
+        reject_unknown = (self.strict and bool(properties) and additional is None and not preserve)
+        items = self._compile(schema["items"]) if isinstance(schema.get("items"), dict) else None
+        is_object = schema_type == "object" or bool(properties)
+
+        def validate(value, path, errors):
+            if value is None:
+                return
+            if type_check is not None and not type_check(value):
+                errors.append((path, f"expected {schema_type}, got {_describe(value)}"))
+                return
+            if enum is not None and value not in enum:
+                errors.append((path, f"unsupported value {value!r}, supported values: "
+                                     f"{', '.join(map(str, sorted(enum, key=str)))}"))
+            if is_object and isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        errors.append((path + (key,), "required field is missing"))
+                for key, item in value.items():
+                    child = properties.get(key)
+                    if child is not None:
+                        child(item, path + (key,), errors)
+                    elif additional_validator is not None:
+                        additional_validator(item, path + (key,), errors)
+                    elif reject_unknown:
+                        errors.append((path + (key,), "unknown field"))
+            elif items is not None and isinstance(value, list):
+                for index, item in enumerate(value):
+                    items(item, path + (index,), errors)
+        return validate
+
+
+def _accept(value, path, errors):
+    pass
+
+
+def _validate_quantity(value, path, errors):
+    if value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+        return
+    if not isinstance(value, str) or not _QUANTITY.match(value):
+        errors.append((path, f"quantities must match the regular expression "
+                             f"'^([+-]?[0-9.]+)([eEinumkKMGTP]*[-+]?[0-9]*)$', got {_describe(value)}"))
+
+
+def _validate_int_or_string(value, path, errors):
+    if value is None or isinstance(value, str) or (isinstance(value, int) and not isinstance(value, bool)):
+        return
+    errors.append((path, f"expected integer or string, got {_describe(value)}"))
+
+
+@lru_cache(maxsize=8)
+def load_registry(path: Path, strict: bool = True) -> SchemaRegistry:
+    """스키마 파일별로 한 번만 로드"""
+    start = time.perf_counter()
+    registry = SchemaRegistry.from_file(path, strict=strict)
+    logger.debug(f"스키마 로드: {path} ({len(registry.kinds)}개 종류, {time.perf_counter() - start:.2f}s)")
+    return registry
+
+
+def schema_path(version: str = DEFAULT_K8S_VERSION) -> Path:
+    return SCHEMA_DIR / f"swagger-{version}.json"
+
+
+def fetch_schema(version: str = DEFAULT_K8S_VERSION, from_cluster: bool = False,
+                 runner: Callable = subprocess.run) -> Path:
+    """
+    OpenAPI 스키마를 캐시 디렉토리에 저장
+
+    Args:
+        version: Kubernetes 버전 (GitHub에서 내려받음)
+        from_cluster: 현재 kubectl 컨텍스트의 API 서버에서 가져옴 (kubectl get --raw /openapi/v2)
+    """
+    destination = schema_path("cluster" if from_cluster else version)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    if from_cluster:
+        result = runner(["kubectl", "get", "--raw", "/openapi/v2"], capture_output=True, text=True, check=True)
+        content = result.stdout.encode("utf-8")
+    else:
+        with urllib.request.urlopen(SCHEMA_URL.format(version=version), timeout=60) as response:
+            content = response.read()
+    temp = destination.with_suffix(".tmp")
+    temp.write_bytes(content)
+    os.replace(temp, destination)
+    logger.info(f"✅ 스키마 저장: {destination}")
+    return destination
+
+
+# --- 매니페스트 수집 ---------------------------------------------------------------
+
+def _script_variables(lines: List[str]) -> Dict[str, str]:
+    """스크립트의 단순 변수 할당 (첫 번째 값, 명령 치환이 들어간 값은 제외)"""
+    variables: Dict[str, str] = {}
+    for line in lines:
+        match = _ASSIGNMENT.match(line)
+        if not match or match.group(1) in variables:
+            continue
+        value = match.group(2).strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        if "$(" in value or "`" in value:
+            continue
+        variables[match.group(1)] = value
+    return variables
+
+
+def _expand(text: str, variables: Dict[str, str], depth: int = 0) -> str:
+    text = _COMMAND_SUBSTITUTION.sub(PLACEHOLDER, text)
+
+    def replace(match):
+        name = match.group(1) or match.group(3)
+        if name in variables:
+            value = variables[name]
+            return _expand(value, variables, depth + 1) if "$" in value and depth < 5 else value
+        if match.group(2) is not None:
+            return match.group(2)
+        return PLACEHOLDER
+    return _VARIABLE.sub(replace, text)
+
+
+def extract_heredocs(script: Path) -> List[ManifestSource]:
+    """
+    Bash 스크립트 heredoc 중 Kubernetes 매니페스트 추출
+    변수는 스크립트의 할당값(기본값 포함)으로, 알 수 없는 변수와 $(...)는 placeholder로 치환합니다.
+    """
+    lines = script.read_text(encoding='utf-8').replace('\r\n', '\n').split('\n')
+    variables = _script_variables(lines)
+    sources = []
+    index = 0
+    while index < len(lines):
+        match = _HEREDOC.search(lines[index])
+        index += 1
+        if not match:
+            continue
+        strip_tabs, quoted, delimiter = match.group(1), match.group(2), match.group(3)
+        start = index
+        body = []
+        while index < len(lines) and (lines[index].lstrip("\t") if strip_tabs else lines[index]) != delimiter:
+            body.append(lines[index].lstrip("\t") if strip_tabs else lines[index])
+            index += 1
+        index += 1
+        text = "\n".join(body)
+        if "apiVersion:" not in text or "kind:" not in text:
+            continue
+        sources.append(ManifestSource(name=str(script), text=text if quoted else _expand(text, variables),
+                                      line=start + 1))
+    return sources
+
+
+def manifest_files(paths: Iterable[Path]) -> List[ManifestSource]:
+    """YAML 파일/디렉토리(하위 포함)와 스크립트(.sh) 수집"""
+    sources = []
+    for path in paths:
+        candidates = sorted(p for p in path.rglob("*") if p.suffix in (".yaml", ".yml", ".sh")) \
+            if path.is_dir() else [path]
+        for candidate in candidates:
+            if candidate.suffix == ".sh":
+                sources.extend(extract_heredocs(candidate))
+            else:
+                sources.append(ManifestSource(name=str(candidate), text=candidate.read_text(encoding='utf-8')))
+    return sources
+
+
+def course_manifests() -> List[ManifestSource]:
+    """과정 자동화가 생성하는 매니페스트 (run_day1 샘플 앱 + 실습 스크립트 heredoc)"""
+    sources = [ManifestSource(name="ContainerCourseAutomation.run_day1:nginx-deployment.yaml",
+                              text=yaml.safe_dump(sample_app_manifest()))]
+    for script in COURSE_SCRIPTS:
+        if script.exists():
+            sources.extend(extract_heredocs(script))
+        else:
+            logger.warning(f"스크립트를 찾을 수 없습니다: {script}")
+    return sources
+
+
+# --- 검증 ---------------------------------------------------------------
+
+_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _locate(text: str, document_index: int, path: tuple) -> int:
+    """오류 경로에 해당하는 YAML 줄 번호 (0부터, 찾지 못하면 가장 가까운 상위 노드)"""
+    try:
+        node = list(yaml.compose_all(text, Loader=_LOADER))[document_index]
+    except (yaml.YAMLError, IndexError):
+        return 0
+    line = node.start_mark.line if node is not None else 0
+    for part in path:
+        if isinstance(node, yaml.MappingNode):
+            child = next((v for k, v in node.value if k.value == part), None)
+            if child is None:
+                key = next((k for k, v in node.value if k.value == part), None)
+                return key.start_mark.line if key is not None else line
+        elif isinstance(node, yaml.SequenceNode) and isinstance(part, int) and part < len(node.value):
+            child = node.value[part]
+        else:
+            return line
+        node = child
+        line = node.start_mark.line
+    return line
+
+
+def validate_source(source: ManifestSource, registry: SchemaRegistry) -> ValidationReport:
+    """YAML 텍스트 하나의 모든 문서 검증"""
+    report = ValidationReport()
+    try:
+        documents = list(yaml.load_all(source.text, Loader=_LOADER))
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        report.issues.append(ValidationIssue(source.name, source.line + (mark.line if mark else 0), "-", "-", "",
+                                             f"YAML 구문 오류: {getattr(e, 'problem', e)}"))
+        return report
+
+    for index, document in enumerate(documents):
+        if document is None:
+            continue
+        report.documents += 1
+        if not isinstance(document, dict):
+            report.issues.append(ValidationIssue(source.name, source.line, "-", "-", "",
+                                                 f"expected object, got {_type_name(document)}"))
+            continue
+        kind = document.get("kind")
+        api_version = document.get("apiVersion")
+        name = (document.get("metadata") or {}).get("name", "-") if isinstance(document.get("metadata"), dict) else "-"
+        if not kind or not api_version:
+            missing = "kind" if not kind else "apiVersion"
+            report.issues.append(ValidationIssue(source.name, source.line, str(kind or "-"), str(name), missing,
+                                                 "required field is missing"))
+            continue
+        validator = registry.validator(api_version, kind)
+        if validator is None:
+            report.skipped.append(f"{source.name}: {api_version}/{kind} {name} (스키마 없음)")
+            continue
+        errors: list = []
+        validator(document, (), errors)
+        for path, message in errors:
+            line = source.line + _locate(source.text, index, path)
+            report.issues.append(ValidationIssue(source.name, line, kind, str(name), format_path(path), message))
+    return report
+
+
+_worker_registry: Optional[SchemaRegistry] = None
+
+
+def _init_worker(path: Optional[Path], strict: bool, registered: Dict[Tuple[str, str], Dict[str, Any]]):
+    # fork 방식이면 부모의 컴파일 결과를 그대로 사용, spawn/forkserver 방식이면 작업자마다 한 번 로드하고
+    # 부모에서 추가 등록한 스키마(--crd 등)를 다시 등록
+    global _worker_registry
+    if _worker_registry is None:
+        _worker_registry = load_registry(path, strict)
+        for (api_version, kind), schema in registered.items():
+            _worker_registry.register(api_version, kind, schema)
+
+
+def _validate_chunk(sources: List[ManifestSource]) -> ValidationReport:
+    report = ValidationReport()
+    for source in sources:
+        report.merge(validate_source(source, _worker_registry))
+    return report
+
+
+def validate_all(sources: List[ManifestSource], registry: SchemaRegistry, schema_file: Optional[Path] = None,
+                 max_workers: Optional[int] = None, parallel_threshold: int = 64,
+                 mp_context: Optional[multiprocessing.context.BaseContext] = None) -> ValidationReport:
+    """
+    여러 매니페스트 병렬 검증
+
+    Args:
+        schema_file: spawn 방식 작업자가 다시 로드할 스키마 파일
+        max_workers: 작업 프로세스 수 (기본: CPU 수)
+        parallel_threshold: 이보다 적으면 프로세스 생성 비용이 더 크므로 현재 프로세스에서 검증
+        mp_context: 작업 프로세스 시작 방식 (기본: 플랫폼 기본값)
+    """
+    global _worker_registry
+    start = time.perf_counter()
+    report = ValidationReport()
+    workers = max_workers or os.cpu_count() or 1
+    if len(sources) < parallel_threshold or workers <= 1:
+        for source in sources:
+            report.merge(validate_source(source, registry))
+    else:
+        chunk_size = max(1, len(sources) // (workers * 4))
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        _worker_registry = registry
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=_init_worker,
+                                     initargs=(schema_file, registry.strict, registry.registered)) as executor:
+                for partial in executor.map(_validate_chunk, chunks):
+                    report.merge(partial)
+        finally:
+            _worker_registry = None
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Kubernetes 매니페스트 오프라인 스키마 검증")
+    parser.add_argument("paths", nargs="*", type=Path, help="YAML 파일/디렉토리 또는 Bash 스크립트")
+    parser.add_argument("--course", action="store_true", help="과정 자동화가 생성하는 매니페스트 포함")
+    parser.add_argument("--schema", type=Path, help="OpenAPI 스키마 파일 (swagger.json)")
+    parser.add_argument("--k8s-version", default=DEFAULT_K8S_VERSION, help="캐시된 스키마 버전")
+    parser.add_argument("--fetch", action="store_true", help="스키마를 내려받아 캐시")
+    parser.add_argument("--from-cluster", action="store_true", help="--fetch 시 현재 클러스터에서 가져옴")
+    parser.add_argument("--crd", action="append", type=Path, default=[], help="CRD 매니페스트 (반복 가능)")
+    parser.add_argument("--no-strict", action="store_true", help="알 수 없는 필드 허용")
+    parser.add_argument("--workers", type=int, help="작업 프로세스 수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    if args.fetch:
+        args.schema = fetch_schema(args.k8s_version, from_cluster=args.from_cluster)
+    schema_file = args.schema or schema_path(args.k8s_version)
+    if not schema_file.exists():
+        logger.error(f"❌ 스키마 파일이 없습니다: {schema_file} (--fetch로 내려받거나 --schema 지정)")
+        return 2
+
+    sources = manifest_files(args.paths)
+    if args.course:
+        sources.extend(course_manifests())
+    if not sources:
+        parser.error("검증할 매니페스트가 없습니다 (경로 또는 --course 지정)")
+
+    registry = load_registry(schema_file, not args.no_strict)
+    for crd_path in args.crd:
+        with open(crd_path, 'r', encoding='utf-8') as f:
+            for document in yaml.safe_load_all(f):
+                if isinstance(document, dict) and document.get("kind") == "CustomResourceDefinition":
+                    registry.register_crd(document)
+    report = validate_all(sources, registry, schema_file=schema_file, max_workers=args.workers)
+
+    if args.json:
+        print(json.dumps({"documents": report.documents, "issues": [asdict(i) for i in report.issues],
+                          "skipped": report.skipped, "elapsed": report.elapsed}, ensure_ascii=False, indent=2))
+    else:
+        for issue in report.issues:
+            print(f"❌ {issue}")
+        for skipped in report.skipped:
+            print(f"⏭️  {skipped}")
+        status = "✅" if report.valid else "❌"
+        print(f"{status} 문서 {report.documents}개, 오류 {len(report.issues)}개, "
+              f"건너뜀 {len(report.skipped)}개 ({report.elapsed:.2f}s)")
+    return 0 if report.valid else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    sys.exit(main())
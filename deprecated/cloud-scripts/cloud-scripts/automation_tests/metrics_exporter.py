@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+자동화 실행 Prometheus 메트릭 엔드포인트
+장시간 실행되는 과정 자동화의 진행 상황을 /metrics (Prometheus 텍스트 형식)로 노출합니다.
+외부 의존성 없이 표준 라이브러리만 사용하며, 비활성화 시에는 실행기를 감싸지 않으므로 오버헤드가 없습니다.
+
+노출 메트릭:
+- mcp_automation_commands_total{tool,subcommand,status}: 실행한 CLI 명령 수
+- mcp_automation_command_duration_seconds{tool,subcommand}: 명령 지연 시간 히스토그램
+- mcp_automation_step_duration_seconds{step}: 실습 단계 소요 시간 히스토그램
+- mcp_automation_step_failures_total{step}: 실패한 단계 수
+- mcp_automation_retries_total{tool}: 재시도 횟수
+- mcp_automation_retry_seconds_total{tool}: 재시도로 잃은 시간 (실패한 시도 + 대기)
+- mcp_automation_resources_alive{provider,type}: 현재 살아 있는 생성 리소스 수
+
+사용 예:
+    MCP_METRICS_PORT=9464 python cloud_container_course_automation.py
+    # Prometheus scrape 설정: targets: ["<호스트>:9464"]
+"""
+
+import os
+import time
+import bisect
+import logging
+import threading
+import subprocess
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple, Callable, Iterator
+
+from .retry_executor import command_words
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT_ENV = "MCP_METRICS_PORT"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 클라우드 CLI 명령은 수백 ms ~ 수십 분까지 걸리므로 넓은 범위의 버킷 사용
+COMMAND_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1200)
+STEP_BUCKETS = (1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """레이블별 값을 가진 메트릭 기본 클래스"""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Tuple[str, ...]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 수가 맞지 않습니다 ({self.labelnames})")
+        return labels
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (관측 시에는 해당 버킷 하나만 증가, 누적은 출력 시 계산)"""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = COMMAND_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수..., +Inf 개수], 합계
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def count(self, *labels: str) -> int:
+        state = self._values.get(labels)
+        return sum(state[0]) if state else 0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = [(k, (list(v[0]), v[1])) for k, v in self._values.items()]
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class AutomationMetrics:
+    """과정 자동화 메트릭 모음"""
+
+    def __init__(self, namespace: str = "mcp_automation"):
+        self.commands = Counter(f"{namespace}_commands_total", "Executed CLI commands",
+                                ("tool", "subcommand", "status"))
+        self.command_duration = Histogram(f"{namespace}_command_duration_seconds", "CLI command latency",
+                                          ("tool", "subcommand"), COMMAND_BUCKETS)
+        self.step_duration = Histogram(f"{namespace}_step_duration_seconds", "Automation step duration",
+                                       ("step",), STEP_BUCKETS)
+        self.step_failures = Counter(f"{namespace}_step_failures_total", "Failed automation steps", ("step",))
+        self.retries = Counter(f"{namespace}_retries_total", "Retried commands", ("tool",))
+        self.retry_seconds = Counter(f"{namespace}_retry_seconds_total", "Time lost to retries", ("tool",))
+        self.resources_alive = Gauge(f"{namespace}_resources_alive", "Created resources not yet deleted",
+                                     ("provider", "type"))
+        self.started = Gauge(f"{namespace}_start_time_seconds", "Automation process start time")
+        self.started.set(time.time())
+        self._metrics = [self.commands, self.command_duration, self.step_duration, self.step_failures,
+                         self.retries, self.retry_seconds, self.resources_alive, self.started]
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.header())
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def command_labels(command: List[str]) -> Tuple[str, str]:
+        """명령에서 (도구, 하위 명령) 레이블 추출 (예: gcloud container clusters create -> container clusters create)"""
+        tool = os.path.basename(command[0]) if command else "unknown"
+        # 플래그 값("gcloud --project p ...")이 레이블에 섞이지 않도록 재시도 실행기와 같은 위치 인자 추출 사용
+        words = command_words(command)
+        # kubectl/docker/helm은 첫 단어만, gcloud/aws는 서비스 + 동작까지
+        depth = 3 if tool == "gcloud" else 2 if tool in ("aws", "eksctl") else 1
+        return tool, " ".join(words[:depth])
+
+    def observe_command(self, command: List[str], seconds: float, status: str):
+        tool, subcommand = self.command_labels(command)
+        self.commands.inc(tool, subcommand, status)
+        self.command_duration.observe(seconds, tool, subcommand)
+
+    def record_retry(self, tool: str, seconds: float = 0.0):
+        self.retries.inc(tool)
+        self.retry_seconds.inc(tool, amount=seconds)
+
+    def resource_created(self, provider: str, resource_type: str):
+        self.resources_alive.inc(provider, resource_type)
+
+    def resource_deleted(self, provider: str, resource_type: str):
+        self.resources_alive.dec(provider, resource_type)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """단계 소요 시간/실패 기록 (예외 발생 시 실패로 기록 후 다시 발생)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.step_failures.inc(name)
+            raise
+        finally:
+            self.step_duration.observe(time.perf_counter() - start, name)
+
+    def instrument(self, runner: Callable) -> Callable:
+        """subprocess.run 호환 실행기에 명령 수/지연 시간 기록 추가"""
+        @wraps(runner)
+        def instrumented(command, *args, **kwargs):
+            start = time.perf_counter()
+            status = "error"
+            try:
+                result = runner(command, *args, **kwargs)
+                status = "ok" if getattr(result, "returncode", 0) == 0 else "error"
+                return result
+            except subprocess.TimeoutExpired:
+                status = "timeout"
+                raise
+            finally:
+                self.observe_command(command, time.perf_counter() - start, status)
+        return instrumented
+
+
+def metrics_step(name: str):
+    """
+    메서드 단계 계측 데코레이터 (self.metrics가 없으면 그대로 실행)
+    False 반환도 실패로 기록합니다.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            metrics = getattr(self, "metrics", None)
+            if metrics is None:
+                return func(self, *args, **kwargs)
+            with metrics.step(name):
+                result = func(self, *args, **kwargs)
+            if result is False:
+                metrics.step_failures.inc(name)
+            return result
+        return wrapper
+    return decorator
+
+
+class _Handler(BaseHTTPRequestHandler):
+    metrics: AutomationMetrics = None
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프 요청마다 로그를 남기지 않음
+        pass
+
+
+class MetricsServer:
+    """백그라운드 스레드에서 /metrics를 제공하는 HTTP 서버"""
+
+    def __init__(self, metrics: AutomationMetrics, port: int = 9464, host: str = "0.0.0.0"):
+        handler = type("MetricsHandler", (_Handler,), {"metrics": metrics})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-server", daemon=True)
+
+    def start(self) -> "MetricsServer":
+        self._thread.start()
+        logger.info(f"📈 메트릭 엔드포인트 시작: http://localhost:{self.port}/metrics")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+_default: Optional[Tuple[AutomationMetrics, MetricsServer]] = None
+
+
+def metrics_from_env() -> Optional[AutomationMetrics]:
+    """MCP_METRICS_PORT가 설정되어 있으면 프로세스 공용 메트릭 서버를 시작하고 메트릭 반환"""
+    global _default
+    port = os.environ.get(METRICS_PORT_ENV)
+    if not port:
+        return None
+    if _default is None:
+        # 잘못된 값으로 자동화 자체가 실패하지 않도록 경고 후 메트릭 비활성화
+        try:
+            number = int(port)
+        except ValueError:
+            number = -1
+        if not 0 <= number <= 65535:
+            logger.warning(f"{METRICS_PORT_ENV} 값이 올바른 포트가 아니어서 메트릭을 비활성화합니다: {port!r}")
+            return None
+        metrics = AutomationMetrics()
+        try:
+            server = MetricsServer(metrics, number).start()
+        except OSError as e:
+            logger.warning(f"메트릭 엔드포인트를 시작하지 못했습니다 (포트 {port}): {e}")
+            return None
+        _default = (metrics, server)
+    return _default[0]
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+네임스페이스 단위 동시 정리 및 finalizer 추적
+과정에서 만든 네임스페이스와 클러스터 범위 잔여 리소스(CRD, PodSecurityPolicy 등)의 삭제를 한꺼번에 요청하고
+(--wait=false), 전체 마감 시간 안에서 삭제 완료를 함께 확인합니다.
+마감 시간까지 남은 객체는 어떤 finalizer에 막혀 있는지 찾아 보고하므로 정리 단계가 조용히 멈추지 않습니다.
+
+사용 예:
+    python -m automation_tests.namespace_teardown production monitoring --ref podsecuritypolicy/ha-app-psp
+    python -m automation_tests.namespace_teardown --all --deadline 60 --json
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+from .common import run_cli, PROTECTED_NAMESPACES, PROTECTED_NAMESPACE_PREFIXES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEADLINE = 120.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class TeardownError(RuntimeError):
+    """마감 시간 안에 정리되지 않은 객체가 있음"""
+
+    def __init__(self, report: "TeardownReport"):
+        super().__init__(report.summary())
+        self.report = report
+
+
+@dataclass
+class BlockedObject:
+    """finalizer 때문에 삭제가 끝나지 않은 객체"""
+    ref: str
+    namespace: Optional[str]
+    finalizers: List[str]
+    message: str = ""
+
+    def __str__(self):
+        location = f"{self.namespace}/" if self.namespace else ""
+        text = f"{location}{self.ref} (finalizers: {', '.join(self.finalizers) or '-'})"
+        return f"{text}: {self.message}" if self.message else text
+
+
+@dataclass
+class TeardownReport:
+    deleted: List[str] = field(default_factory=list)
+    remaining: List[str] = field(default_factory=list)
+    blocked: List[BlockedObject] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.remaining and not self.errors
+
+    def summary(self) -> str:
+        text = f"삭제 {len(self.deleted)}개, 남음 {len(self.remaining)}개, {self.elapsed:.1f}초"
+        if self.blocked:
+            text += "; finalizer 대기: " + "; ".join(str(b) for b in self.blocked)
+        if self.errors:
+            text += "; 오류: " + "; ".join(f"{k}: {v}" for k, v in self.errors.items())
+        return text
+
+
+def course_namespaces(names: Iterable[str]) -> List[str]:
+    """시스템 네임스페이스를 제외한 목록"""
+    return [ns for ns in names if ns not in PROTECTED_NAMESPACES and not ns.startswith(PROTECTED_NAMESPACE_PREFIXES)]
+
+
+def _items(output: str) -> List[Dict[str, Any]]:
+    """kubectl -o json 출력의 객체 목록 (--ignore-not-found로 비어 있으면 빈 목록)"""
+    if not output.strip():
+        return []
+    document = json.loads(output)
+    return document.get("items", []) if "items" in document else [document]
+
+
+class NamespaceTeardown:
+    """네임스페이스/클러스터 범위 리소스 동시 정리"""
+
+    def __init__(self, runner: Callable[..., str] = run_cli, env: Optional[Dict[str, str]] = None,
+                 deadline: float = DEFAULT_DEADLINE, poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 max_workers: int = 8, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            runner: CLI 실행 함수 (명령, env -> 표준 출력)
+            env: kubectl 환경 변수 (KUBECONFIG 등)
+            deadline: 삭제 요청부터 완료 확인까지의 전체 마감 시간 (초)
+            poll_interval: 완료 확인 주기 (초)
+            max_workers: 동시 kubectl 호출 수
+        """
+        self.runner = runner
+        self.env = env
+        self.deadline = deadline
+        self.poll_interval = poll_interval
+        self.max_workers = max_workers
+        self.clock = clock
+        self.sleep = sleep
+
+    def _kubectl(self, *args: str) -> str:
+        return self.runner(["kubectl", *args], env=self.env)
+
+    def _namespaces(self) -> Dict[str, Dict[str, Any]]:
+        return {ns["metadata"]["name"]: ns for ns in _items(self._kubectl("get", "namespaces", "-o", "json"))}
+
+    def discover(self) -> List[str]:
+        """삭제 대상 네임스페이스 (시스템 네임스페이스 제외)"""
+        return course_namespaces(sorted(self._namespaces()))
+
+    def _delete(self, target: str) -> str:
+        args = ["namespace", target.split("/", 1)[1]] if target.startswith("namespace/") else [target]
+        return self._kubectl("delete", *args, "--wait=false", "--ignore-not-found")
+
+    def _get_ref(self, ref: str) -> Optional[Dict[str, Any]]:
+        items = _items(self._kubectl("get", ref, "-o", "json", "--ignore-not-found"))
+        return items[0] if items else None
+
+    def _namespace_blockers(self, namespace: Dict[str, Any], kinds: List[str]) -> List[BlockedObject]:
+        """Terminating 네임스페이스에 남은 finalizer 객체"""
+        name = namespace["metadata"]["name"]
+        blocked = []
+        if kinds:
+            try:
+                output = self._kubectl("get", ",".join(kinds), "-n", name, "-o", "json", "--ignore-not-found")
+            except subprocess.CalledProcessError as e:
+                # 일부 API(metrics 등)는 목록 조회가 실패할 수 있으므로 확인 가능한 범위만 보고
+                output = e.output or ""
+                logger.warning(f"⚠️ {name} 잔여 객체 조회 일부 실패: {(e.stderr or '').strip()}")
+            for item in _items(output) if output.lstrip().startswith("{") else []:
+                finalizers = item.get("metadata", {}).get("finalizers") or []
+                if finalizers:
+                    blocked.append(BlockedObject(f"{item.get('kind', '?').lower()}/{item['metadata']['name']}",
+                                                 name, finalizers))
+        if not blocked:
+            conditions = [c.get("message", "") for c in namespace.get("status", {}).get("conditions") or []
+                          if c.get("status") == "True" and c.get("type", "").startswith("Namespace")]
+            blocked.append(BlockedObject(f"namespace/{name}", None, namespace.get("spec", {}).get("finalizers") or [],
+                                         "; ".join(conditions)))
+        return blocked
+
+    def _namespaced_kinds(self) -> List[str]:
+        try:
+            return self._kubectl("api-resources", "--verbs=list", "--namespaced", "-o", "name").split()
+        except subprocess.CalledProcessError as e:
+            logger.warning(f"⚠️ API 리소스 목록 조회 실패: {(e.stderr or '').strip()}")
+            return []
+
+    def teardown(self, namespaces: Optional[Iterable[str]] = None, refs: Iterable[str] = (),
+                 raise_on_blocked: bool = False) -> TeardownReport:
+        """
+        네임스페이스와 클러스터 범위 리소스 삭제 후 완료 대기
+
+        Args:
+            namespaces: 삭제할 네임스페이스 (None이면 시스템 네임스페이스를 제외한 전체)
+            refs: 클러스터 범위 리소스 (예: crd/prometheuses.monitoring.coreos.com)
+            raise_on_blocked: 마감 시간까지 남은 객체가 있으면 TeardownError
+
+        Returns:
+            TeardownReport (남은 객체와 막고 있는 finalizer 포함)
+        """
+        start = self.clock()
+        namespaces = self.discover() if namespaces is None else course_namespaces(namespaces)
+        targets = [f"namespace/{ns}" for ns in namespaces] + list(refs)
+        report = TeardownReport()
+        if not targets:
+            return report
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets)),
+                                thread_name_prefix="teardown") as executor:
+            for target, future in [(t, executor.submit(self._delete, t)) for t in targets]:
+                try:
+                    future.result()
+                except subprocess.CalledProcessError as e:
+                    report.errors[target] = (e.stderr or str(e)).strip()
+            pending = [t for t in targets if t not in report.errors]
+            logger.info(f"🧹 삭제 요청 {len(pending)}개, 완료 대기 (최대 {self.deadline:.0f}초)")
+
+            warned = set()
+            live_namespaces: Dict[str, Dict[str, Any]] = {}
+            live_refs: Dict[str, Dict[str, Any]] = {}
+            while True:
+                ref_targets = [t for t in pending if not t.startswith("namespace/")]
+                live_namespaces = self._namespaces() if len(ref_targets) < len(pending) else {}
+                live_refs = {ref: obj for ref, obj in zip(ref_targets, executor.map(self._get_ref, ref_targets))
+                             if obj is not None}
+                still = []
+                for target in pending:
+                    name = target.split("/", 1)[1]
+                    obj = live_namespaces.get(name) if target.startswith("namespace/") else live_refs.get(target)
+                    if obj is None:
+                        report.deleted.append(target)
+                        continue
+                    still.append(target)
+                    conditions = [c for c in obj.get("status", {}).get("conditions") or []
+                                  if c.get("type") == "NamespaceFinalizersRemaining" and c.get("status") == "True"]
+                    if conditions and target not in warned:
+                        warned.add(target)
+                        logger.warning(f"⚠️ {target} finalizer 대기: {conditions[0].get('message', '')}")
+                pending = still
+                if not pending or self.clock() - start >= self.deadline:
+                    break
+                self.sleep(min(self.poll_interval, max(0.0, self.deadline - (self.clock() - start))))
+
+            report.remaining = pending
+            blocked_namespaces = [live_namespaces[t.split("/", 1)[1]] for t in pending if t.startswith("namespace/")]
+            if blocked_namespaces:
+                kinds = self._namespaced_kinds()
+                for found in executor.map(lambda ns: self._namespace_blockers(ns, kinds), blocked_namespaces):
+                    report.blocked.extend(found)
+            for target in pending:
+                if target in live_refs:
+                    finalizers = live_refs[target].get("metadata", {}).get("finalizers") or []
+                    report.blocked.append(BlockedObject(target, None, finalizers))
+
+        report.elapsed = self.clock() - start
+        if report.ok:
+            logger.info(f"✅ 정리 완료: {report.summary()}")
+        else:
+            logger.error(f"❌ 정리 미완료: {report.summary()}")
+            if raise_on_blocked:
+                raise TeardownError(report)
+        return report
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="네임스페이스 동시 정리 및 finalizer 추적")
+    parser.add_argument("namespaces", nargs="*", help="삭제할 네임스페이스")
+    parser.add_argument("--all", action="store_true", help="시스템 네임스페이스를 제외한 전체 삭제")
+    parser.add_argument("--ref", action="append", default=[], help="클러스터 범위 리소스 (kind/name, 반복 가능)")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE, help="전체 마감 시간 (초)")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL, help="완료 확인 주기 (초)")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    if not args.namespaces and not args.all and not args.ref:
+        parser.error("네임스페이스, --all 또는 --ref 중 하나가 필요합니다")
+    teardown = NamespaceTeardown(deadline=args.deadline, poll_interval=args.poll_interval)
+    try:
+        report = teardown.teardown(None if args.all else args.namespaces, args.ref)
+    except (subprocess.CalledProcessError, OSError) as e:
+        logger.error(f"❌ 정리 실패: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps({**asdict(report), "ok": report.ok}, ensure_ascii=False, indent=2))
+    else:
+        for blocked in report.blocked:
+            print(f"BLOCKED {blocked}")
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+클라우드 API 할당량 공유 토큰 버킷 제한기
+여러 자동화(ContainerCourseAutomation 여러 개, cleanup-all-clusters.sh, 대화형 정리 등)가 한 호스트에서
+동시에 실행될 때 같은 GCP/AWS API 할당량을 함께 소진해 한꺼번에 실패하지 않도록,
+API 계열(gcp:container, aws:ec2 등)별 토큰 버킷을 로컬 SQLite 파일에 두고 모든 프로세스가 공유합니다.
+
+각 명령은 실행 전에 토큰 하나를 예약합니다. 버킷이 비어 있으면 토큰이 음수가 되어 예약 순서대로
+대기하므로, 전체 프로세스의 합산 처리량이 설정한 속도 바로 아래에서 최대로 유지됩니다.
+
+설정:
+- MCP_RATE_LIMIT_DB: 버킷 상태 파일 (기본 ~/.cache/mcp_cloud/rate_limits.db)
+- MCP_RATE_LIMITS: 계열별 제한 덮어쓰기 (예: "gcp:container=1/5,aws:ec2=10/50" = 초당 1개, 버스트 5개)
+- MCP_RATE_LIMIT=off: 제한 비활성화
+
+사용 예:
+    python -m automation_tests.rate_limiter run -- gcloud compute disks delete disk-1 --zone asia-northeast3-a
+    python -m automation_tests.rate_limiter status
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import argparse
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Sequence
+
+from .retry_executor import command_words
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(os.environ.get(
+    "MCP_RATE_LIMIT_DB", Path.home() / ".cache" / "mcp_cloud" / "rate_limits.db"))
+RATE_LIMIT_ENV = "MCP_RATE_LIMIT"
+RATE_LIMITS_ENV = "MCP_RATE_LIMITS"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    family TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class Limit:
+    rate: float   # 초당 보충되는 명령 수
+    burst: float  # 버킷 크기 (쉬었다가 연속으로 실행할 수 있는 명령 수)
+
+
+# CLI 명령 하나가 API를 여러 번 호출하므로 프로젝트/계정 할당량보다 여유 있게 잡은 명령 단위 기본값
+DEFAULT_LIMITS = {
+    "gcp": Limit(5.0, 20),
+    "gcp:container": Limit(2.0, 10),
+    "gcp:compute": Limit(5.0, 20),
+    "aws": Limit(5.0, 20),
+    "aws:ec2": Limit(5.0, 20),
+    "aws:eks": Limit(2.0, 10),
+}
+
+# 로컬 설정만 다루어 API 할당량을 쓰지 않는 하위 명령
+_LOCAL_COMMANDS = {"config", "auth", "components", "info", "version", "help", "configure"}
+
+
+def parse_limits(text: str) -> Dict[str, Limit]:
+    """계열별 제한 목록 파싱 (예: "gcp:container=1/5,aws=10/50" = 계열=초당 속도/버스트)"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        try:
+            family, value = item.split("=", 1)
+            rate, _, burst = value.partition("/")
+            limits[family.strip()] = Limit(float(rate), float(burst or rate))
+        except ValueError:
+            raise ValueError(f"잘못된 제한 형식: {item} (계열=속도/버스트)") from None
+    return limits
+
+
+def api_family(command: Sequence[str]) -> Optional[str]:
+    """명령이 사용하는 API 계열 (클라우드 API를 쓰지 않으면 None)"""
+    if not command:
+        return None
+    tool = os.path.basename(command[0])
+    # --project my-proj처럼 값을 받는 플래그의 값을 서비스 이름으로 오인하지 않도록 위치 인자만 사용
+    words = command_words(command)
+    service = words[0] if words else ""
+    if service in _LOCAL_COMMANDS:
+        return None
+    if tool == "gcloud":
+        # gcloud beta/alpha container ... 도 같은 API
+        service = words[1] if service in ("beta", "alpha") and len(words) > 1 else service
+        return f"gcp:{service}" if service else "gcp"
+    if tool == "aws":
+        return f"aws:{service}" if service else "aws"
+    if tool == "eksctl":
+        return "aws:eks"
+    return None
+
+
+class RateLimiter:
+    """프로세스 간 공유 토큰 버킷 제한기"""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, limits: Optional[Dict[str, Limit]] = None,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            db_path: 버킷 상태 파일 (같은 파일을 쓰는 모든 프로세스가 할당량 공유)
+            limits: 계열별 제한 (DEFAULT_LIMITS 덮어쓰기)
+            clock: 현재 시각 함수 (프로세스 간 공유되므로 벽시계 시각)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.clock = clock
+        self.sleep = sleep
+        self.waited: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # 수동 트랜잭션 (BEGIN IMMEDIATE로 다른 프로세스와 직렬화)
+        return sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+
+    def bucket_for(self, family: str) -> str:
+        """토큰을 차감할 버킷 (제한이 따로 없는 계열은 상위 계열 버킷을 공유, 예: gcp:sql -> gcp)"""
+        return family if family in self.limits else family.split(":", 1)[0]
+
+    def limit_for(self, family: str) -> Limit:
+        return self.limits[self.bucket_for(family)]
+
+    def reserve(self, family: str, cost: float = 1.0) -> float:
+        """
+        토큰 예약
+
+        Returns:
+            예약한 토큰이 보충될 때까지 기다려야 하는 시간 (초, 0이면 바로 실행)
+        """
+        family = self.bucket_for(family)
+        limit = self.limits[family]
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT tokens, updated_at FROM buckets WHERE family = ?", (family,)).fetchone()
+                now = self.clock()
+                tokens = limit.burst if row is None else \
+                    min(limit.burst, row[0] + max(0.0, now - row[1]) * limit.rate)
+                tokens -= cost
+                conn.execute("INSERT OR REPLACE INTO buckets (family, tokens, updated_at) VALUES (?, ?, ?)",
+                             (family, tokens, now))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return max(0.0, -tokens / limit.rate)
+
+    def acquire(self, command: Sequence[str]) -> float:
+        """명령 실행 전 토큰 확보 (필요하면 대기), 기다린 시간 반환"""
+        family = api_family(command)
+        if family is None:
+            return 0.0
+        family = self.bucket_for(family)
+        wait = self.reserve(family)
+        if wait > 0:
+            if wait >= 1.0:
+                logger.info(f"⏳ {family} 할당량 대기 {wait:.1f}초")
+            with self._lock:
+                self.waited[family] = self.waited.get(family, 0.0) + wait
+            self.sleep(wait)
+        return wait
+
+    def wrap(self, runner: Callable) -> Callable:
+        """subprocess.run 호환 실행기가 실행 전마다 토큰을 확보하도록 감싸기"""
+        @wraps(runner)
+        def limited(command, *args, **kwargs):
+            self.acquire(command)
+            return runner(command, *args, **kwargs)
+        return limited
+
+    def status(self) -> List[Dict[str, Any]]:
+        """계열별 현재 토큰 수 (음수면 대기 중인 예약 수)"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT family, tokens, updated_at FROM buckets ORDER BY family").fetchall()
+        now = self.clock()
+        result = []
+        for family, tokens, updated_at in rows:
+            limit = self.limit_for(family)
+            result.append({"family": family, "rate": limit.rate, "burst": limit.burst,
+                           "tokens": round(min(limit.burst, tokens + max(0.0, now - updated_at) * limit.rate), 3)})
+        return result
+
+    def reset(self):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM buckets")
+
+
+_shared: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def shared_limiter() -> Optional[RateLimiter]:
+    """환경 변수 설정을 따르는 프로세스 공용 제한기 (MCP_RATE_LIMIT=off면 None)"""
+    global _shared
+    if os.environ.get(RATE_LIMIT_ENV, "").lower() in ("off", "0", "false"):
+        return None
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter(limits=parse_limits(os.environ.get(RATE_LIMITS_ENV, "")))
+        return _shared
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="클라우드 API 할당량 공유 토큰 버킷 제한기")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="버킷 상태 파일")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    run = subparsers.add_parser("run", help="토큰 확보 후 명령 실행")
+    run.add_argument("command", nargs=argparse.REMAINDER, help="실행할 명령 (-- 뒤에)")
+    acquire = subparsers.add_parser("acquire", help="명령에 필요한 토큰만 확보 (명령은 호출한 쪽에서 실행)")
+    acquire.add_argument("command", nargs=argparse.REMAINDER, help="토큰을 확보할 명령 (-- 뒤에)")
+    status = subparsers.add_parser("status", help="계열별 토큰 현황")
+    status.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    subparsers.add_parser("reset", help="버킷 초기화")
+    args = parser.parse_args(argv)
+
+    limiter = RateLimiter(args.db, limits=parse_limits(os.environ.get(RATE_LIMITS_ENV, "")))
+    if args.action in ("run", "acquire"):
+        command = args.command[1:] if args.command[:1] == ["--"] else args.command
+        if not command:
+            parser.error("실행할 명령이 필요합니다")
+        if os.environ.get(RATE_LIMIT_ENV, "").lower() not in ("off", "0", "false"):
+            limiter.acquire(command)
+        if args.action == "acquire":
+            # 종료 코드 0 = 토큰 확보 (제한기 자체의 실패와 명령의 실패를 구분할 수 있도록)
+            return 0
+        try:
+            # 출력/종료 코드가 그대로 전달되도록 현재 프로세스를 명령으로 교체
+            os.execvp(command[0], command)
+        except OSError as e:
+            logger.error(f"❌ 명령 실행 실패: {e}")
+            return 127
+    elif args.action == "status":
+        rows = limiter.status()
+        if args.json:
+            print(json.dumps(rows, ensure_ascii=False, indent=2))
+        else:
+            for row in rows:
+                print(f"{row['family']:<20} {row['tokens']:>8.1f} / {row['burst']:<6g} ({row['rate']:g}/s)")
+    else:
+        limiter.reset()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+클라우드 리소스 인벤토리 엔진
+GKE/EKS 클러스터, 디스크, 방화벽 규칙, VPC, 보안 그룹 등을 리소스 유형/리전별로
+동시에 조회하여 로컬 SQLite 스냅샷에 저장합니다.
+
+정리 스크립트, 목록 메뉴, 비용 확인은 매번 클라우드를 조회하는 대신
+TTL 내의 스냅샷을 조회합니다.
+
+사용 예:
+    python -m automation_tests.resource_inventory refresh --ttl 300
+    python -m automation_tests.resource_inventory list gke_cluster --fields name,region
+    python -m automation_tests.resource_inventory list gce_disk --status UNATTACHED
+    python -m automation_tests.resource_inventory invalidate gke_cluster
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+
+from .common import run_cli
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(os.environ.get(
+    "MCP_INVENTORY_DB", Path.home() / ".cache" / "mcp_cloud" / "inventory.db"))
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_AWS_REGIONS = ["ap-northeast-2"]
+
+# GCP 조회는 프로젝트 전체(모든 존)를 한 번에 조회하므로 리전 범위를 "global"로 기록
+GLOBAL_SCOPE = "global"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    provider TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    resource_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    region TEXT,
+    status TEXT,
+    attrs TEXT NOT NULL,
+    PRIMARY KEY (provider, resource_type, scope, resource_id)
+);
+CREATE INDEX IF NOT EXISTS idx_resources_type_region ON resources (resource_type, region);
+CREATE INDEX IF NOT EXISTS idx_resources_type_status ON resources (resource_type, status);
+CREATE INDEX IF NOT EXISTS idx_resources_name ON resources (name);
+CREATE TABLE IF NOT EXISTS snapshots (
+    provider TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    error TEXT,
+    PRIMARY KEY (provider, resource_type, scope)
+);
+"""
+
+
+def _basename(value: Optional[str]) -> Optional[str]:
+    """GCP self-link/URL 형식 값에서 마지막 경로 요소 추출"""
+    return value.rsplit("/", 1)[-1] if value else value
+
+
+def _aws_name(tags: Optional[List[Dict[str, str]]], default: str) -> str:
+    for tag in tags or []:
+        if tag.get("Key") == "Name":
+            return tag.get("Value") or default
+    return default
+
+
+@dataclass(frozen=True)
+class Collector:
+    """리소스 유형 하나를 조회하는 수집기"""
+    provider: str
+    resource_type: str
+    regional: bool
+    collect: Callable[["ResourceInventory", str], List[Dict[str, Any]]]
+
+
+def _collect_gke_clusters(inv: "ResourceInventory", scope: str) -> List[Dict[str, Any]]:
+    clusters = json.loads(inv.runner(["gcloud", "container", "clusters", "list", "--format=json"]) or "[]")
+    return [{
+        "resource_id": c.get("selfLink") or f"{c.get('location')}/{c['name']}",
+        "name": c["name"],
+        "region": c.get("location") or c.get("zone"),
+        "status": c.get("status"),
+        "attrs": {
+            "version": c.get("currentMasterVersion"),
+            "node_count": c.get("currentNodeCount"),
+            "created": c.get("createTime"),
+            "node_pools": [{
+                "name": p.get("name"),
+                "machine_type": p.get("config", {}).get("machineType"),
+                "disk_size_gb": p.get("config", {}).get("diskSizeGb"),
+                "node_count": p.get("initialNodeCount"),
+                "autoscaling": p.get("autoscaling", {})
+            } for p in c.get("nodePools", [])]
+        }
+    } for c in clusters]
+
+
+def _collect_gce_disks(inv: "ResourceInventory", scope: str) -> List[Dict[str, Any]]:
+    disks = json.loads(inv.runner(["gcloud", "compute", "disks", "list", "--format=json"]) or "[]")
+    return [{
+        "resource_id": d.get("selfLink") or d.get("id") or d["name"],
+        "name": d["name"],
+        "region": _basename(d.get("zone") or d.get("region")),
+        "status": "ATTACHED" if d.get("users") else "UNATTACHED",
+        "attrs": {
+            "size_gb": int(d.get("sizeGb", 0)),
+            "disk_type": _basename(d.get("type")),
+            "created": d.get("creationTimestamp"),
+            "last_detach": d.get("lastDetachTimestamp")
+        }
+    } for d in disks]
+
+
+def _collect_gce_firewall_rules(inv: "ResourceInventory", scope: str) -> List[Dict[str, Any]]:
+    rules = json.loads(inv.runner(["gcloud", "compute", "firewall-rules", "list", "--format=json"]) or "[]")
+    return [{
+        "resource_id": r.get("selfLink") or r["name"],
+        "name": r["name"],
+        "region": GLOBAL_SCOPE,
+        "status": "DISABLED" if r.get("disabled") else "ENABLED",
+        "attrs": {"network": _basename(r.get("network")), "direction": r.get("direction")}
+    } for r in rules]
+
+
+def _collect_gce_forwarding_rules(inv: "ResourceInventory", scope: str) -> List[Dict[str, Any]]:
+    rules = json.loads(inv.runner(["gcloud", "compute", "forwarding-rules", "list", "--format=json"]) or "[]")
+    return [{
+        "resource_id": r.get("selfLink") or r["name"],
+        "name": r["name"],
+        "region": _basename(r.get("region")) or GLOBAL_SCOPE,
+        "status": "ACTIVE",
+        "attrs": {"ip_address": r.get("IPAddress"), "scheme": r.get("loadBalancingScheme")}
+    } for r in rules]
+
+
+def _collect_eks_clusters(inv: "ResourceInventory", region: str) -> List[Dict[str, Any]]:
+    listing = json.loads(inv.runner(
+        ["aws", "eks", "list-clusters", "--region", region, "--output", "json"]) or "{}")
+    names = listing.get("clusters", [])
+
+    def describe(name: str) -> Dict[str, Any]:
+        cluster = json.loads(inv.runner(
+            ["aws", "eks", "describe-cluster", "--name", name, "--region", region, "--output", "json"]))["cluster"]
+        nodegroups = json.loads(inv.runner(
+            ["aws", "eks", "list-nodegroups", "--cluster-name", name, "--region", region, "--output", "json"]
+        ) or "{}").get("nodegroups", [])
+        return {
+            "resource_id": cluster.get("arn") or name,
+            "name": name,
+            "region": region,
+            "status": cluster.get("status"),
+            "attrs": {
+                "version": cluster.get("version"),
+                "created": cluster.get("createdAt"),
+                "vpc_id": cluster.get("resourcesVpcConfig", {}).get("vpcId"),
+                "nodegroups": nodegroups
+            }
+        }
+
+    if not names:
+        return []
+    # describe 호출도 클러스터별로 동시에 수행
+    with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+        return list(executor.map(describe, names))
+
+
+def _collect_vpcs(inv: "ResourceInventory", region: str) -> List[Dict[str, Any]]:
+    vpcs = json.loads(inv.runner(
+        ["aws", "ec2", "describe-vpcs", "--region", region, "--output", "json"]) or "{}").get("Vpcs", [])
+    return [{
+        "resource_id": v["VpcId"],
+        "name": _aws_name(v.get("Tags"), v["VpcId"]),
+        "region": region,
+        "status": v.get("State"),
+        "attrs": {"cidr": v.get("CidrBlock"), "is_default": v.get("IsDefault", False)}
+    } for v in vpcs]
+
+
+def _collect_security_groups(inv: "ResourceInventory", region: str) -> List[Dict[str, Any]]:
+    groups = json.loads(inv.runner(
+        ["aws", "ec2", "describe-security-groups", "--region", region, "--output", "json"]
+    ) or "{}").get("SecurityGroups", [])
+    return [{
+        "resource_id": g["GroupId"],
+        "name": g.get("GroupName", g["GroupId"]),
+        "region": region,
+        "status": "ACTIVE",
+        "attrs": {"vpc_id": g.get("VpcId"), "description": g.get("Description")}
+    } for g in groups]
+
+
+def _collect_ebs_volumes(inv: "ResourceInventory", region: str) -> List[Dict[str, Any]]:
+    volumes = json.loads(inv.runner(
+        ["aws", "ec2", "describe-volumes", "--region", region, "--output", "json"]) or "{}").get("Volumes", [])
+    return [{
+        "resource_id": v["VolumeId"],
+        "name": _aws_name(v.get("Tags"), v["VolumeId"]),
+        "region": region,
+        "status": "ATTACHED" if v.get("Attachments") else "UNATTACHED",
+        "attrs": {"size_gb": v.get("Size", 0), "disk_type": v.get("VolumeType"), "created": v.get("CreateTime")}
+    } for v in volumes]
+
+
+def _collect_load_balancers(inv: "ResourceInventory", region: str) -> List[Dict[str, Any]]:
+    lbs = json.loads(inv.runner(
+        ["aws", "elbv2", "describe-load-balancers", "--region", region, "--output", "json"]
+    ) or "{}").get("LoadBalancers", [])
+    return [{
+        "resource_id": lb["LoadBalancerArn"],
+        "name": lb.get("LoadBalancerName", lb["LoadBalancerArn"]),
+        "region": region,
+        "status": lb.get("State", {}).get("Code"),
+        "attrs": {"type": lb.get("Type"), "vpc_id": lb.get("VpcId"), "created": lb.get("CreatedTime")}
+    } for lb in lbs]
+
+
+COLLECTORS: Dict[str, Collector] = {c.resource_type: c for c in [
+    Collector("gcp", "gke_cluster", False, _collect_gke_clusters),
+    Collector("gcp", "gce_disk", False, _collect_gce_disks),
+    Collector("gcp", "gce_firewall_rule", False, _collect_gce_firewall_rules),
+    Collector("gcp", "gce_forwarding_rule", False, _collect_gce_forwarding_rules),
+    Collector("aws", "eks_cluster", True, _collect_eks_clusters),
+    Collector("aws", "vpc", True, _collect_vpcs),
+    Collector("aws", "security_group", True, _collect_security_groups),
+    Collector("aws", "ebs_volume", True, _collect_ebs_volumes),
+    Collector("aws", "load_balancer", True, _collect_load_balancers),
+]}
+
+
+class ResourceInventory:
+    """클라우드 리소스를 동시에 조회하여 SQLite 스냅샷으로 관리하는 클래스"""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 aws_regions: Optional[List[str]] = None, runner: Callable[[List[str]], str] = run_cli,
+                 max_workers: int = 16):
+        """
+        Args:
+            db_path: 스냅샷 SQLite 파일 경로 (":memory:" 가능)
+            ttl_seconds: 스냅샷 유효 시간 (초)
+            aws_regions: 조회할 AWS 리전 목록
+            runner: CLI 명령 실행 함수 (명령 -> 표준 출력)
+            max_workers: 동시 조회 수
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.aws_regions = aws_regions or list(DEFAULT_AWS_REGIONS)
+        self.runner = runner
+        self.max_workers = max_workers
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _scopes(self, resource_types: Optional[Iterable[str]] = None) -> List[Tuple[Collector, str]]:
+        scopes = []
+        for resource_type in resource_types or COLLECTORS:
+            collector = COLLECTORS[resource_type]
+            regions = self.aws_regions if collector.regional else [GLOBAL_SCOPE]
+            scopes.extend((collector, region) for region in regions)
+        return scopes
+
+    def _fetched_at(self, collector: Collector, scope: str) -> Optional[float]:
+        row = self.conn.execute(
+            "SELECT fetched_at FROM snapshots WHERE provider=? AND resource_type=? AND scope=? AND error IS NULL",
+            (collector.provider, collector.resource_type, scope)).fetchone()
+        return row["fetched_at"] if row else None
+
+    def stale_scopes(self, resource_types: Optional[Iterable[str]] = None,
+                     max_age: Optional[float] = None) -> List[Tuple[Collector, str]]:
+        """TTL이 지났거나 한 번도 조회하지 않은 (수집기, 범위) 목록"""
+        max_age = self.ttl_seconds if max_age is None else max_age
+        now = time.time()
+        stale = []
+        for collector, scope in self._scopes(resource_types):
+            fetched_at = self._fetched_at(collector, scope)
+            if fetched_at is None or now - fetched_at > max_age:
+                stale.append((collector, scope))
+        return stale
+
+    def refresh(self, resource_types: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        오래된 스냅샷 범위를 동시에 다시 조회
+
+        Returns:
+            갱신 결과 요약 (갱신/실패 범위, 소요 시간)
+        """
+        targets = self._scopes(resource_types) if force else self.stale_scopes(resource_types)
+        summary = {"refreshed": [], "failed": {}, "skipped": 0, "elapsed_seconds": 0.0}
+        if not targets:
+            summary["skipped"] = len(self._scopes(resource_types))
+            return summary
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(collector.collect, self, scope): (collector, scope)
+                       for collector, scope in targets}
+            for future in as_completed(futures):
+                collector, scope = futures[future]
+                key = f"{collector.resource_type}@{scope}"
+                try:
+                    self._store(collector, scope, future.result())
+                    summary["refreshed"].append(key)
+                except Exception as e:
+                    self._store_error(collector, scope, e)
+                    summary["failed"][key] = str(e)
+                    logger.warning(f"⚠️ 인벤토리 조회 실패: {key} - {e}")
+        summary["elapsed_seconds"] = round(time.monotonic() - start, 3)
+        logger.info(f"✅ 인벤토리 갱신 완료: {len(summary['refreshed'])}개 범위, "
+                    f"실패 {len(summary['failed'])}개, {summary['elapsed_seconds']}s")
+        return summary
+
+    def _store(self, collector: Collector, scope: str, items: List[Dict[str, Any]]):
+        key = (collector.provider, collector.resource_type, scope)
+        with self.conn:
+            self.conn.execute("DELETE FROM resources WHERE provider=? AND resource_type=? AND scope=?", key)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO resources "
+                "(provider, resource_type, scope, resource_id, name, region, status, attrs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*key, item["resource_id"], item["name"], item.get("region"), item.get("status"),
+                  json.dumps(item.get("attrs", {}), ensure_ascii=False, default=str)) for item in items])
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots (provider, resource_type, scope, fetched_at, error) "
+                "VALUES (?, ?, ?, ?, NULL)", (*key, time.time()))
+
+    def _store_error(self, collector: Collector, scope: str, error: Exception):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots (provider, resource_type, scope, fetched_at, error) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (collector.provider, collector.resource_type, scope, time.time(), str(error)))
+
+    def invalidate(self, resource_types: Optional[Iterable[str]] = None):
+        """스냅샷을 만료 처리하여 다음 조회 시 다시 가져오도록 함"""
+        types = list(resource_types or COLLECTORS)
+        with self.conn:
+            self.conn.executemany("DELETE FROM snapshots WHERE resource_type=?", [(t,) for t in types])
+
+    def forget(self, resource_type: str, name: str, region: Optional[str] = None):
+        """삭제한 리소스를 스냅샷에서 즉시 제거"""
+        sql = "DELETE FROM resources WHERE resource_type=? AND name=?"
+        params: List[Any] = [resource_type, name]
+        if region:
+            sql += " AND region=?"
+            params.append(region)
+        with self.conn:
+            self.conn.execute(sql, params)
+
+    def query(self, resource_type: str, region: Optional[str] = None, status: Optional[str] = None,
+              name_glob: Optional[str] = None, refresh: bool = True) -> List[Dict[str, Any]]:
+        """
+        스냅샷에서 리소스 조회 (TTL이 지난 경우 먼저 갱신)
+
+        Args:
+            resource_type: 리소스 유형 (COLLECTORS 키)
+            region: 리전/존 필터
+            status: 상태 필터 (예: UNATTACHED)
+            name_glob: 이름 GLOB 패턴 (예: *cloud-master*)
+            refresh: 오래된 스냅샷 자동 갱신 여부
+        """
+        if resource_type not in COLLECTORS:
+            raise ValueError(f"알 수 없는 리소스 유형: {resource_type}")
+        if refresh:
+            self.refresh([resource_type])
+
+        sql = "SELECT provider, resource_type, resource_id, name, region, status, attrs FROM resources " \
+              "WHERE resource_type=?"
+        params: List[Any] = [resource_type]
+        if region:
+            sql += " AND (region=? OR region LIKE ?)"
+            params.extend([region, f"{region}-%"])
+        if status:
+            sql += " AND status=?"
+            params.append(status)
+        if name_glob:
+            sql += " AND name GLOB ?"
+            params.append(name_glob)
+        sql += " ORDER BY region, name"
+
+        rows = []
+        for row in self.conn.execute(sql, params):
+            item = dict(row)
+            item["attrs"] = json.loads(item["attrs"])
+            rows.append(item)
+        return rows
+
+    def snapshot_status(self) -> List[Dict[str, Any]]:
+        """범위별 스냅샷 나이와 오류 정보"""
+        now = time.time()
+        return [{
+            "resource_type": row["resource_type"],
+            "scope": row["scope"],
+            "age_seconds": round(now - row["fetched_at"], 1),
+            "error": row["error"]
+        } for row in self.conn.execute("SELECT * FROM snapshots ORDER BY resource_type, scope")]
+
+
+def _format_value(item: Dict[str, Any], fields: List[str]) -> str:
+    """gcloud --format="value(...)"와 같은 탭 구분 출력"""
+    values = []
+    for field_name in fields:
+        value = item.get(field_name, item["attrs"].get(field_name, ""))
+        values.append("" if value is None else str(value))
+    return "\t".join(values)
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="클라우드 리소스 인벤토리 스냅샷")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="스냅샷 DB 경로")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL_SECONDS, help="스냅샷 유효 시간(초)")
+    parser.add_argument("--aws-region", action="append", dest="aws_regions", help="조회할 AWS 리전 (반복 가능)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    refresh_parser = sub.add_parser("refresh", help="오래된 스냅샷 갱신")
+    refresh_parser.add_argument("--type", action="append", dest="types", choices=sorted(COLLECTORS))
+    refresh_parser.add_argument("--force", action="store_true", help="TTL과 관계없이 전체 갱신")
+
+    list_parser = sub.add_parser("list", help="스냅샷에서 리소스 조회")
+    list_parser.add_argument("resource_type", choices=sorted(COLLECTORS))
+    list_parser.add_argument("--region")
+    list_parser.add_argument("--status")
+    list_parser.add_argument("--name", help="이름 GLOB 패턴")
+    list_parser.add_argument("--fields", default="name,region", help="출력 필드 (쉼표 구분)")
+    list_parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+    invalidate_parser = sub.add_parser("invalidate", help="스냅샷 만료 처리")
+    invalidate_parser.add_argument("types", nargs="*", help="리소스 유형 (없으면 전체)")
+
+    forget_parser = sub.add_parser("forget", help="삭제된 리소스를 스냅샷에서 제거")
+    forget_parser.add_argument("resource_type", choices=sorted(COLLECTORS))
+    forget_parser.add_argument("name")
+    forget_parser.add_argument("--region")
+
+    sub.add_parser("status", help="스냅샷 상태 출력")
+    args = parser.parse_args(argv)
+
+    inventory = ResourceInventory(args.db, ttl_seconds=args.ttl, aws_regions=args.aws_regions)
+    try:
+        if args.command == "refresh":
+            summary = inventory.refresh(args.types, force=args.force)
+            print(json.dumps(summary, ensure_ascii=False, indent=2))
+            return 1 if summary["failed"] else 0
+        if args.command == "list":
+            items = inventory.query(args.resource_type, region=args.region, status=args.status,
+                                    name_glob=args.name)
+            if args.json:
+                print(json.dumps(items, ensure_ascii=False, indent=2))
+            else:
+                fields = args.fields.split(",")
+                for item in items:
+                    print(_format_value(item, fields))
+            return 0
+        if args.command == "invalidate":
+            unknown = set(args.types) - set(COLLECTORS)
+            if unknown:
+                parser.error(f"알 수 없는 리소스 유형: {', '.join(sorted(unknown))}")
+            inventory.invalidate(args.types or None)
+            return 0
+        if args.command == "forget":
+            inventory.forget(args.resource_type, args.name, args.region)
+            return 0
+        print(json.dumps(inventory.snapshot_status(), ensure_ascii=False, indent=2))
+        return 0
+    finally:
+        inventory.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
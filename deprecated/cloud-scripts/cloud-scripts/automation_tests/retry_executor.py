@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+클라우드 CLI 일시적 오류 재시도 실행기
+gcloud/kubectl/eksctl/aws 명령의 실패를 종료 코드와 stderr 패턴으로 일시적(transient)/영구적(permanent)으로
+분류하고, 일시적 오류만 지터를 더한 지수 백오프로 재시도합니다.
+쿼터 초과나 진행 중인 작업 때문에 20분짜리 과정 실행 전체를 처음부터 다시 돌리지 않도록 하기 위한 것입니다.
+
+멱등성 가드:
+- get/describe/apply 등 반복 실행해도 결과가 같은 명령은 그대로 재시도
+- create/delete 계열은 재시도하되, 이전 시도가 실제로 적용되어 "already exists"/"not found"가 나오면 성공으로 간주
+- exec, run-instances 등 결과가 누적되는 명령은 재시도하지 않음
+- 시간 초과는 조회/적용 계열만 재시도 (시간 초과된 create는 아직 진행 중일 수 있으므로 다시 실행하지 않음)
+
+subprocess.run 호환 실행기이므로 ContainerCourseAutomation(runner=...)이나 카세트 실행기와 겹쳐 쓸 수 있습니다.
+
+사용 예:
+    python -m automation_tests.retry_executor -- gcloud container clusters create demo --zone asia-northeast3-a
+    python -m automation_tests.retry_executor --max-attempts 6 --stats -- kubectl apply -f app.yaml
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional, Callable, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT = "transient"
+PERMANENT = "permanent"
+
+SAFE = "safe"
+CREATE = "create"
+DELETE = "delete"
+UNSAFE = "unsafe"
+
+# 먼저 검사: 재시도해도 결과가 바뀌지 않는 오류 (권한, 잘못된 인자, 할당량 자체 부족 등)
+PERMANENT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"PERMISSION_DENIED", r"\bforbidden\b", r"\bunauthorized", r"AccessDenied", r"INVALID_ARGUMENT",
+    r"invalid (value|argument|choice)", r"unrecognized arguments?", r"unknown (command|flag|shorthand flag)",
+    r"insufficient [\w ]{0,40}quota", r"billing", r"ValidationError",
+    r"the server doesn't have a resource type", r"error: the path .* does not exist",
+)]
+
+# 일시적 오류: 쿼터/속도 제한, 진행 중인 작업, 서버/네트워크 일시 장애
+TRANSIENT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"RESOURCE_EXHAUSTED", r"quota exceeded", r"rate ?limit", r"too many requests", r"\b429\b",
+    r"operation .{0,120}in progress", r"incompatible operation", r"try again",
+    r"\bUNAVAILABLE\b", r"service ?unavailable", r"\b50[234]\b", r"internal ?error", r"backend error",
+    r"DEADLINE_EXCEEDED", r"i/o timeout", r"TLS handshake timeout", r"connection (reset|refused)",
+    r"unable to connect to the server", r"the server is currently unable", r"etcdserver: (request timed out|leader)",
+    r"Throttl", r"RequestLimitExceeded", r"TooManyRequests", r"RequestTimeout", r"unexpected EOF",
+)]
+
+# 명령 실행 불가(126/127), 사용법 오류(2), 사용자 중단(130), aws 구문/설정 오류(252/253)
+PERMANENT_EXIT_CODES = {2, 126, 127, 130, 252, 253}
+
+ALREADY_EXISTS = re.compile(r"already exists|AlreadyExists|ALREADY_EXISTS|EntityAlreadyExists", re.IGNORECASE)
+NOT_FOUND = re.compile(r"not ?found|NOT_FOUND|does not exist|NoSuch\w+", re.IGNORECASE)
+
+_SAFE_VERBS = {
+    "kubectl": {"get", "describe", "apply", "logs", "top", "wait", "rollout", "version", "cluster-info", "config",
+                "api-resources", "api-versions", "label", "annotate", "scale", "patch", "set", "explain", "auth"},
+    "gcloud": {"list", "describe", "get-credentials", "get-value", "set", "update", "resize", "enable", "disable",
+               "print-access-token", "config-helper", "get-iam-policy", "add-iam-policy-binding"},
+    "eksctl": {"get", "utils", "upgrade", "scale", "version"},
+    "helm": {"list", "status", "get", "repo", "upgrade", "template", "version", "dependency"},
+    "docker": {"build", "pull", "push", "tag", "images", "ps", "inspect", "info", "version", "login"},
+}
+_CREATE_VERBS = {"create", "expose", "autoscale", "install", "insert"}
+_DELETE_VERBS = {"delete", "uninstall", "rm", "rmi", "remove"}
+# 값을 받는 전역 플래그 ("aws --region X ec2 ...", "gcloud --project P ..."에서 값을 동사로 보지 않도록)
+_VALUE_FLAGS = {
+    "aws": {"--region", "--profile", "--output", "--endpoint-url", "--query", "--color", "--ca-bundle",
+            "--cli-read-timeout", "--cli-connect-timeout", "--cli-binary-format"},
+    "gcloud": {"--project", "--account", "--configuration", "--format", "--verbosity", "--billing-project",
+               "--impersonate-service-account", "--flags-file", "--trace-token", "--filter", "--limit",
+               "--page-size", "--sort-by", "--zone", "--region", "--location", "--cluster"},
+    "kubectl": {"-n", "--namespace", "--context", "--cluster", "--user", "--kubeconfig", "-s", "--server",
+                "--token", "--as", "--request-timeout", "-l", "--selector", "-o", "--output", "-f", "--filename",
+                "-c", "--container", "--field-selector"},
+    "eksctl": {"-r", "--region", "-p", "--profile", "-f", "--config-file", "--name", "--cluster"},
+    "helm": {"-n", "--namespace", "--kube-context", "--kubeconfig", "-f", "--values", "--version"},
+    "docker": {"-H", "--host", "--context", "--config", "-l", "--log-level"},
+}
+
+
+# "already exists"를 성공으로 받기 전에 상태를 확인하는 gcloud 자원 (실패한 생성이 ERROR/PROVISIONING으로 남을 수 있음)
+_STATUS_CHECKED = {("container", "clusters"), ("container", "node-pools")}
+_STATUS_FLAGS = {"--zone", "--region", "--location", "--project", "--cluster"}
+READY_STATUS = "RUNNING"
+STATUS_TIMEOUT = 60.0
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    # 재시도 대기만 합산한 상한 (초과하면 남은 시도를 포기)
+    max_total_delay: float = 600.0
+
+
+@dataclass
+class RetryStats:
+    """재시도 통계 (과정 실행 결과에 기록)"""
+    commands: int = 0
+    retried_commands: int = 0
+    retries: int = 0
+    time_lost: float = 0.0
+    guarded: int = 0
+    by_tool: Dict[str, int] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["time_lost"] = round(self.time_lost, 3)
+        return result
+
+    def summary(self) -> str:
+        return (f"명령 {self.commands}개 중 {self.retried_commands}개 재시도 (총 {self.retries}회), "
+                f"재시도로 잃은 시간 {self.time_lost:.1f}초")
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
+
+def classify_failure(returncode: Optional[int], output: str) -> Tuple[str, str]:
+    """
+    실패 분류
+
+    Args:
+        returncode: 종료 코드 (None이면 시간 초과)
+        output: stderr (와 stdout) 텍스트
+
+    Returns:
+        (TRANSIENT 또는 PERMANENT, 판단 근거)
+    """
+    if returncode is None:
+        return TRANSIENT, "timeout"
+    for pattern in PERMANENT_PATTERNS:
+        match = pattern.search(output)
+        if match:
+            return PERMANENT, match.group(0)
+    if returncode in PERMANENT_EXIT_CODES:
+        return PERMANENT, f"exit {returncode}"
+    for pattern in TRANSIENT_PATTERNS:
+        match = pattern.search(output)
+        if match:
+            return TRANSIENT, match.group(0)
+    if returncode < 0:
+        # 시그널로 종료 (OOM kill 등)
+        return TRANSIENT, f"signal {-returncode}"
+    # 알 수 없는 오류는 재시도하지 않음 (같은 실패를 반복하며 시간을 쓰지 않도록)
+    return PERMANENT, f"exit {returncode}"
+
+
+def command_words(command: Sequence[str]) -> List[str]:
+    """도구 이름 뒤의 위치 인자 (플래그와 플래그 값, "--" 이후 인자 제외)"""
+    tool = os.path.basename(command[0]) if command else ""
+    value_flags = _VALUE_FLAGS.get(tool, set())
+    words = []
+    args = iter(command[1:])
+    for arg in args:
+        if arg == "--":
+            break
+        if arg.startswith("-"):
+            if "=" not in arg and arg in value_flags:
+                next(args, None)
+            continue
+        words.append(arg)
+    return words
+
+
+def idempotency(command: Sequence[str]) -> str:
+    """
+    명령의 재시도 안전성
+
+    Returns:
+        SAFE (반복 실행해도 같은 결과), CREATE/DELETE (이미 존재/없음 응답을 성공으로 간주), UNSAFE (재시도 안 함)
+    """
+    if not command:
+        return UNSAFE
+    tool = os.path.basename(command[0])
+    words = command_words(command)
+    if tool == "aws":
+        verb = words[1] if len(words) > 1 else ""
+        if verb.startswith(("describe-", "list-", "get-", "put-", "update-", "modify-", "tag-")) or verb == "wait":
+            return SAFE
+        if verb.startswith("create-"):
+            return CREATE
+        if verb.startswith(("delete-", "deregister-")):
+            return DELETE
+        return UNSAFE
+    if tool == "eksctl":
+        # 실패한 CloudFormation 스택이 남으면 "already exists"가 성공을 뜻하지 않으므로 create는 재시도하지 않음
+        verb = words[0] if words else ""
+        return SAFE if verb in _SAFE_VERBS["eksctl"] else DELETE if verb == "delete" else UNSAFE
+    # "gcloud container clusters create NAME", "kubectl -n prod get pods"처럼 동사 위치가 고정되지 않으므로
+    # 처음 나오는 알려진 동사 사용
+    for verb in words:
+        if verb in _SAFE_VERBS.get(tool, ()):
+            return SAFE
+        if verb in _CREATE_VERBS:
+            return CREATE
+        if verb in _DELETE_VERBS:
+            return DELETE
+    return UNSAFE
+
+
+def status_command(command: Sequence[str]) -> Optional[List[str]]:
+    """
+    "already exists"를 성공으로 받기 전에 실행할 상태 조회 명령
+
+    Returns:
+        gcloud 클러스터/노드 풀 create면 같은 자원의 describe 명령, 상태 확인이 필요 없으면 None
+    """
+    words = command_words(command)
+    if (not command or os.path.basename(command[0]) != "gcloud" or len(words) < 4
+            or tuple(words[:2]) not in _STATUS_CHECKED or words[2] != "create"):
+        return None
+    described = [command[0], words[0], words[1], "describe", words[3]]
+    args = iter(command[1:])
+    for arg in args:
+        if arg == "--":
+            break
+        if arg.split("=", 1)[0] in _STATUS_FLAGS:
+            described += [arg] if "=" in arg else [arg, next(args, "")]
+    return described + ["--format", "value(status)"]
+
+
+def tee_stderr(command: Sequence[str], capture_output: bool = False, text: bool = True, check: bool = False,
+               timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+    """
+    stderr를 터미널에 바로 보여주면서 분류용으로 마지막 부분만 수집하는 실행기 (CLI 래퍼, 미캡처 명령용)
+    stdout은 그대로 상속하므로 클러스터 생성처럼 오래 걸리는 명령의 진행 상황이 보입니다.
+    timeout이 지나면 subprocess.run처럼 프로세스를 종료하고 TimeoutExpired를 발생시킵니다.
+    """
+    process = subprocess.Popen(list(command), stderr=subprocess.PIPE, text=True, **kwargs)
+    tail = deque(maxlen=200)
+
+    def pump():
+        for line in process.stderr:
+            sys.stderr.write(line)
+            tail.append(line)
+
+    # stderr EOF를 기다리지 않고 종료 시한을 적용하도록 별도 스레드에서 읽기
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        reader.join(timeout=1)
+        raise subprocess.TimeoutExpired(list(command), timeout, stderr="".join(tail))
+    reader.join()
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, list(command), None, "".join(tail))
+    return subprocess.CompletedProcess(list(command), returncode, None, "".join(tail))
+
+
+class RetryExecutor:
+    """일시적 오류를 재시도하는 subprocess.run 호환 실행기"""
+
+    def __init__(self, runner: Callable = subprocess.run, policy: Optional[RetryPolicy] = None, metrics=None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep,
+                 rng: Optional[random.Random] = None, stream_runner: Optional[Callable] = None):
+        """
+        Args:
+            runner: 실제 명령 실행 함수 (subprocess.run 호환)
+            policy: 재시도 정책 (없으면 기본값)
+            metrics: AutomationMetrics (있으면 재시도 횟수/잃은 시간 기록)
+            stream_runner: 캡처하지 않는 호출을 출력 스트리밍으로 실행하는 함수 (tee_stderr 호환,
+                           없으면 runner가 subprocess.run일 때 tee_stderr, 그 외에는 끝난 뒤 한 번에 출력)
+        """
+        self.runner = runner
+        self.stream_runner = stream_runner or (tee_stderr if runner is subprocess.run else None)
+        self.policy = policy or RetryPolicy()
+        self.metrics = metrics
+        self.clock = clock
+        self.sleep = sleep
+        self.rng = rng or random.Random()
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (상한의 절반 + 0~절반 지터, 동시 실행 간 재시도가 몰리지 않도록)"""
+        cap = min(self.policy.max_delay, self.policy.base_delay * (2 ** (attempt - 1)))
+        return cap / 2 + self.rng.uniform(0, cap / 2)
+
+    def _record(self, tool: str, command: Sequence[str], attempt: int, reason: str, delay: float, lost: float):
+        with self._lock:
+            self.stats.retries += 1
+            self.stats.time_lost += lost
+            self.stats.by_tool[tool] = self.stats.by_tool.get(tool, 0) + 1
+            self.stats.events.append({"command": " ".join(command), "attempt": attempt, "reason": reason,
+                                      "delay": round(delay, 3)})
+        if self.metrics:
+            self.metrics.record_retry(tool, lost)
+
+    def _existing_status(self, command: Sequence[str], text: bool, kwargs: Dict[str, Any]) -> Optional[str]:
+        """"already exists" 응답을 받은 자원의 상태 (확인 대상이 아니면 None, 조회 실패는 빈 문자열)"""
+        described = status_command(command)
+        if described is None:
+            return None
+        try:
+            result = self.runner(described, capture_output=True, text=text, check=False, timeout=STATUS_TIMEOUT,
+                                 **kwargs)
+        except subprocess.TimeoutExpired:
+            return ""
+        return _text(result.stdout).strip() if result.returncode == 0 else ""
+
+    def __call__(self, command: Sequence[str], capture_output: bool = False, text: bool = True, check: bool = False,
+                 timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+        command = list(command)
+        tool = os.path.basename(command[0]) if command else "unknown"
+        safety = idempotency(command)
+        delays = 0.0
+        attempt = 0
+        # 캡처하지 않는 호출은 실행 중 출력을 바로 보여주고 분류용 stderr 끝부분만 받음
+        streaming = not capture_output and self.stream_runner is not None
+        run = self.stream_runner if streaming else self.runner
+        with self._lock:
+            self.stats.commands += 1
+        while True:
+            attempt += 1
+            started = self.clock()
+            try:
+                result = run(command, capture_output=not streaming, text=text, check=False, timeout=timeout,
+                             **kwargs)
+                returncode, output = result.returncode, _text(result.stderr) + _text(result.stdout)
+            except subprocess.TimeoutExpired:
+                result, returncode, output = None, None, ""
+            if returncode == 0:
+                break
+
+            if attempt > 1 and (safety == CREATE and ALREADY_EXISTS.search(output)
+                                or safety == DELETE and NOT_FOUND.search(output)):
+                # 이전 시도가 응답 전에 실제로 적용된 경우 (상태를 확인할 수 있는 자원은 준비된 경우만)
+                status = self._existing_status(command, text, kwargs)
+                if status is not None and status != READY_STATUS:
+                    logger.warning(f"⚠️ 이미 존재하지만 준비되지 않은 상태({status or '알 수 없음'})라 "
+                                   f"성공으로 간주하지 않음: {' '.join(command)}")
+                    break
+                logger.warning(f"⚠️ 이전 시도가 적용된 것으로 간주: {' '.join(command)}")
+                with self._lock:
+                    self.stats.guarded += 1
+                result = subprocess.CompletedProcess(command, 0, _text(result.stdout), "")
+                break
+
+            kind, reason = classify_failure(returncode, output)
+            delay = self.backoff(attempt)
+            # 시간 초과된 create/delete는 아직 진행 중일 수 있어 다시 실행하면 "already exists"를 성공으로 오인
+            unsafe = safety == UNSAFE or (returncode is None and safety != SAFE)
+            if (kind == PERMANENT or unsafe or attempt >= self.policy.max_attempts
+                    or delays + delay > self.policy.max_total_delay):
+                if kind == TRANSIENT and unsafe and returncode is None:
+                    logger.warning(f"⚠️ 시간 초과된 작업이 아직 진행 중일 수 있어 재시도하지 않음: {' '.join(command)}")
+                elif kind == TRANSIENT and unsafe:
+                    logger.warning(f"⚠️ 재시도하면 결과가 누적될 수 있어 재시도하지 않음: {' '.join(command)}")
+                if result is None:
+                    raise subprocess.TimeoutExpired(command, timeout)
+                break
+
+            logger.warning(f"🔁 일시적 오류 ({reason}), {delay:.1f}초 후 재시도 "
+                           f"[{attempt + 1}/{self.policy.max_attempts}]: {' '.join(command)}")
+            # 잃은 시간 = 실패한 시도의 실행 시간 + 재시도 대기
+            self._record(tool, command, attempt, reason, delay, self.clock() - started + delay)
+            self.sleep(delay)
+            delays += delay
+
+        if attempt > 1:
+            with self._lock:
+                self.stats.retried_commands += 1
+        if not capture_output and not streaming:
+            # 캡처를 요청하지 않은 호출은 원래처럼 터미널로 출력
+            if result.stdout:
+                sys.stdout.write(_text(result.stdout))
+            if result.stderr:
+                sys.stderr.write(_text(result.stderr))
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(result.returncode, command, result.stdout, result.stderr)
+        if not capture_output:
+            return subprocess.CompletedProcess(command, result.returncode, None, None)
+        return result
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="클라우드 CLI 일시적 오류 재시도 실행기")
+    parser.add_argument("--max-attempts", type=int, default=RetryPolicy.max_attempts, help="최대 시도 횟수")
+    parser.add_argument("--base-delay", type=float, default=RetryPolicy.base_delay, help="첫 재시도 대기 기준 (초)")
+    parser.add_argument("--max-delay", type=float, default=RetryPolicy.max_delay, help="재시도 대기 상한 (초)")
+    parser.add_argument("--stats", action="store_true", help="재시도 통계를 JSON으로 stderr에 출력")
+    parser.add_argument("command", nargs=argparse.REMAINDER, help="실행할 명령 (-- 뒤에)")
+    args = parser.parse_args(argv)
+
+    command = args.command[1:] if args.command[:1] == ["--"] else args.command
+    if not command:
+        parser.error("실행할 명령이 필요합니다")
+    executor = RetryExecutor(tee_stderr, RetryPolicy(args.max_attempts, args.base_delay, args.max_delay))
+    try:
+        # tee_stderr가 이미 출력했으므로 캡처 모드로 실행
+        result = executor(command, capture_output=True)
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.error(f"❌ 명령 실행 실패: {e}")
+        return 127 if isinstance(e, FileNotFoundError) else 1
+    if executor.stats.retries:
+        logger.info(f"🔁 {executor.stats.summary()}")
+    if args.stats:
+        sys.stderr.write(json.dumps(executor.stats.to_dict(), ensure_ascii=False) + "\n")
+    return result.returncode
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
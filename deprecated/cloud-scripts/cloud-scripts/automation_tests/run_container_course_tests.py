@@ -1,40 +1,290 @@
 #!/usr/bin/env python3
 """
 Container 과정 자동화 테스트 실행 스크립트
+
+- 출력 스트리밍: pytest 출력을 실행 중에 바로 표시
+- 샤딩: 테스트를 여러 워커 프로세스에 나누어 실행 (이전 실행 소요 시간 기준으로 균등 분배)
+- 영향 분석: 변경된 소스 파일을 import하는 테스트만 선택 실행
+- 소요 시간 리포트: 테스트별 소요 시간을 기록하고 느린 테스트 표시
+
+사용 예:
+    python run_container_course_tests.py                       # 전체 실행
+    python run_container_course_tests.py -n 4                  # 4개 샤드로 병렬 실행
+    python run_container_course_tests.py --changed improved_container_automation.py
+    python run_container_course_tests.py --since origin/main   # git 변경 파일 기준
 """
 
-import subprocess
+import ast
 import sys
+import json
+import argparse
+import tempfile
+import threading
+import subprocess
+import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Dict, List, Set, Optional
+
+TEST_DIR = Path(__file__).resolve().parent
+PACKAGE_NAME = TEST_DIR.name
+DURATIONS_FILE = TEST_DIR / ".test_durations.json"
+# .py가 아닌 입력 파일 디렉터리 -> 이를 읽는 모듈 (이 모듈에 의존하는 테스트를 선택)
+DATA_INPUTS = {"templates": "script_generator"}
+# 실행하지 않는 테스트 파일 (없는 container_course_automation 모듈을 import해 수집 단계에서 실패)
+EXCLUDED_TESTS = {"test_container_course_automation.py"}
+
+_print_lock = threading.Lock()
+
+
+def discover_test_files() -> List[Path]:
+    """테스트 파일 목록"""
+    return sorted(path for path in TEST_DIR.glob("test_*.py") if path.name not in EXCLUDED_TESTS)
+
+
+def module_imports(path: Path, local_modules: Set[str]) -> Set[str]:
+    """파일이 import하는 같은 패키지 모듈 이름"""
+    try:
+        tree = ast.parse(path.read_text(encoding='utf-8'))
+    except SyntaxError:
+        return set()
+    imported = set()
+    for node in ast.walk(tree):
+        names = []
+        if isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level:
+                # from .x import y / from . import x
+                names = [module.split(".")[0]] if module else [alias.name for alias in node.names]
+            elif module.startswith(f"{PACKAGE_NAME}."):
+                names = [module.split(".")[1]]
+            else:
+                names = [module.split(".")[0]]
+        elif isinstance(node, ast.Import):
+            names = [alias.name.split(".")[-1] if alias.name.startswith(f"{PACKAGE_NAME}.")
+                     else alias.name.split(".")[0] for alias in node.names]
+        imported.update(name for name in names if name in local_modules)
+    return imported
+
+
+def build_dependency_graph() -> Dict[str, Set[str]]:
+    """모듈 -> 직접 import하는 같은 패키지 모듈"""
+    modules = {path.stem: path for path in TEST_DIR.glob("*.py")}
+    local = set(modules)
+    return {name: module_imports(path, local) for name, path in modules.items()}
+
+
+def impacted_tests(changed: List[str]) -> Optional[List[Path]]:
+    """
+    변경 파일에 영향을 받는 테스트 파일
+
+    Returns:
+        선택된 테스트 파일 목록 (영향 범위를 알 수 없는 변경이 있으면 None = 전체 실행)
+    """
+    graph = build_dependency_graph()
+    changed_modules = set()
+    for item in changed:
+        parts = Path(item).parts
+        if PACKAGE_NAME in parts:
+            # git diff 결과처럼 저장소 루트 기준 경로
+            parts = parts[len(parts) - parts[::-1].index(PACKAGE_NAME):]
+        elif Path(item).is_absolute() or parts[:1] == ("..",):
+            continue
+        if not parts:
+            continue
+        path = Path(*parts)
+        if path.suffix == ".py" and len(parts) == 1:
+            if path.stem in graph:
+                changed_modules.add(path.stem)
+            continue
+        if path.name == "README.md" or path.name == DURATIONS_FILE.name:
+            continue
+        if parts[0] in DATA_INPUTS and len(parts) > 1:
+            changed_modules.add(DATA_INPUTS[parts[0]])
+            continue
+        # 영향 범위를 알 수 없는 설정/데이터 파일 변경이면 전체 실행
+        return None
+
+    selected = []
+    for test_file in discover_test_files():
+        # 테스트가 (간접적으로라도) 의존하는 모듈 전체
+        seen, stack = set(), [test_file.stem]
+        while stack:
+            module = stack.pop()
+            if module in seen:
+                continue
+            seen.add(module)
+            stack.extend(graph.get(module, ()))
+        if seen & changed_modules:
+            selected.append(test_file)
+    return selected
+
+
+def git_changed_files(since: str) -> List[str]:
+    """git 기준 커밋 이후 변경된 파일 (작업 트리 포함)"""
+    result = subprocess.run(["git", "diff", "--name-only", since, "--", "."],
+                            cwd=TEST_DIR, capture_output=True, text=True, check=True)
+    return [line for line in result.stdout.splitlines() if line.strip()]
+
+
+def collect_node_ids(test_files: List[Path]) -> List[str]:
+    """pytest 수집으로 테스트 노드 ID 목록 생성 (수집 실패 파일은 파일 단위로 포함)"""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *map(str, test_files)],
+        cwd=TEST_DIR, capture_output=True, text=True
+    )
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+    collected_files = {node.split("::")[0] for node in node_ids}
+    for test_file in test_files:
+        if not any(Path(f).name == test_file.name for f in collected_files):
+            # 수집 오류를 숨기지 않도록 파일 자체를 실행 대상으로 포함
+            node_ids.append(str(test_file))
+    return node_ids
+
+
+def load_durations() -> Dict[str, float]:
+    if DURATIONS_FILE.exists():
+        try:
+            return json.loads(DURATIONS_FILE.read_text(encoding='utf-8'))
+        except ValueError:
+            return {}
+    return {}
 
-def run_tests():
+
+def split_shards(node_ids: List[str], shards: int, durations: Dict[str, float]) -> List[List[str]]:
+    """이전 소요 시간 기준 LPT(가장 긴 작업 먼저) 방식으로 샤드 분배"""
+    shards = max(1, min(shards, len(node_ids)))
+    default = (sum(durations.values()) / len(durations)) if durations else 1.0
+    buckets = [[] for _ in range(shards)]
+    loads = [0.0] * shards
+    for node in sorted(node_ids, key=lambda n: -durations.get(_duration_key(n), default)):
+        target = loads.index(min(loads))
+        buckets[target].append(node)
+        loads[target] += durations.get(_duration_key(node), default)
+    return [bucket for bucket in buckets if bucket]
+
+
+def _duration_key(node_id: str) -> str:
+    """경로 표기와 무관한 테스트 키 (파일명::테스트)"""
+    path, _, rest = node_id.partition("::")
+    return f"{Path(path).name}::{rest}" if rest else Path(path).name
+
+
+def _stream(process: subprocess.Popen, prefix: str):
+    for line in process.stdout:
+        with _print_lock:
+            sys.stdout.write(f"{prefix}{line}")
+            sys.stdout.flush()
+
+
+def run_shards(shards: List[List[str]], junit_dir: Path, extra_args: List[str]) -> List[int]:
+    """샤드별 pytest 프로세스를 동시에 실행하며 출력 스트리밍"""
+    processes = []
+    threads = []
+    for index, nodes in enumerate(shards):
+        cmd = [
+            sys.executable, "-m", "pytest", *nodes,
+            "-v", "--tb=short", "--color=yes",
+            f"--junitxml={junit_dir / f'shard-{index}.xml'}",
+            *extra_args
+        ]
+        process = subprocess.Popen(cmd, cwd=TEST_DIR, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                                   bufsize=1)
+        prefix = f"[shard {index + 1}/{len(shards)}] " if len(shards) > 1 else ""
+        thread = threading.Thread(target=_stream, args=(process, prefix), daemon=True)
+        thread.start()
+        processes.append(process)
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return [process.wait() for process in processes]
+
+
+def read_durations(junit_dir: Path) -> Dict[str, float]:
+    """JUnit XML 결과에서 테스트별 소요 시간 추출"""
+    durations = {}
+    for xml_file in junit_dir.glob("shard-*.xml"):
+        for case in ET.parse(xml_file).getroot().iter("testcase"):
+            classname = case.get("classname", "")
+            parts = classname.split(".")
+            # classname: automation_tests.test_x.TestClass -> test_x.py::TestClass::name
+            module_index = next((i for i, p in enumerate(parts) if p.startswith("test_")), None)
+            if module_index is None:
+                continue
+            key = "::".join([f"{parts[module_index]}.py", *parts[module_index + 1:], case.get("name", "")])
+            durations[key] = float(case.get("time", 0.0))
+    return durations
+
+
+def print_slowest(durations: Dict[str, float], top: int):
+    if not durations or top <= 0:
+        return
+    print(f"\n느린 테스트 상위 {top}개:")
+    for key, seconds in sorted(durations.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {seconds:8.3f}s  {key}")
+
+
+def run_tests(shards: int = 1, changed: Optional[List[str]] = None, top: int = 10,
+              extra_args: Optional[List[str]] = None) -> bool:
     """테스트 실행"""
     print("Container 과정 자동화 테스트 시작...")
-    
-    # 테스트 파일 경로
-    test_file = Path(__file__).parent / "test_container_course_automation.py"
-    
-    # pytest 실행
-    cmd = [
-        sys.executable, "-m", "pytest",
-        str(test_file),
-        "-v",
-        "--tb=short",
-        "--color=yes"
-    ]
-    
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("테스트 결과:")
-        print(result.stdout)
+
+    test_files = discover_test_files()
+    if changed is not None:
+        selected = impacted_tests(changed)
+        if selected is None:
+            print("영향 범위를 알 수 없는 변경이 있어 전체 테스트를 실행합니다.")
+        elif not selected:
+            print("변경 사항에 영향을 받는 테스트가 없습니다.")
+            return True
+        else:
+            test_files = selected
+            print(f"영향 받는 테스트 파일 {len(test_files)}개: {', '.join(f.name for f in test_files)}")
+
+    durations = load_durations()
+    if shards > 1:
+        node_ids = collect_node_ids(test_files)
+        plan = split_shards(node_ids, shards, durations)
+    else:
+        plan = [[str(f) for f in test_files]]
+    print(f"{len(plan)}개 샤드로 실행합니다.")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        junit_dir = Path(tmp)
+        codes = run_shards(plan, junit_dir, extra_args or [])
+        measured = read_durations(junit_dir)
+
+    durations.update(measured)
+    DURATIONS_FILE.write_text(json.dumps(durations, ensure_ascii=False, indent=2, sort_keys=True),
+                              encoding='utf-8')
+    print_slowest(measured, top)
+
+    # pytest 종료 코드 5 = 선택된 테스트 없음
+    if all(code in (0, 5) for code in codes):
         print("모든 테스트가 성공적으로 완료되었습니다!")
         return True
-    except subprocess.CalledProcessError as e:
-        print("테스트 실패:")
-        print(e.stdout)
-        print(e.stderr)
-        return False
+    print("테스트 실패:")
+    for index, code in enumerate(codes):
+        if code not in (0, 5):
+            print(f"  샤드 {index + 1}: 종료 코드 {code}")
+    return False
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Container 과정 자동화 테스트 실행")
+    parser.add_argument("-n", "--shards", type=int, default=1, help="병렬 샤드(워커 프로세스) 수")
+    parser.add_argument("--changed", nargs="+", help="변경된 파일 (영향 받는 테스트만 실행)")
+    parser.add_argument("--since", help="git 기준 커밋 (변경 파일을 자동으로 계산)")
+    parser.add_argument("--durations", type=int, default=10, help="표시할 느린 테스트 수")
+    parser.add_argument("pytest_args", nargs="*", help="pytest에 전달할 추가 인자 (-- 뒤에 지정)")
+    args = parser.parse_args(argv)
+
+    changed = args.changed
+    if args.since:
+        changed = (changed or []) + git_changed_files(args.since)
+    success = run_tests(shards=args.shards, changed=changed, top=args.durations, extra_args=args.pytest_args)
+    return 0 if success else 1
+
 
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(main())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+과정 샘플 매니페스트
+과정 자동화(ContainerCourseAutomation)와 오프라인 검증(manifest_validator)이 함께 쓰는 매니페스트 정의
+import 시 로깅 설정 등 부수 효과가 없어야 합니다.
+"""
+
+
+def sample_app_manifest() -> dict:
+    """1일차 샘플 앱(Nginx) Deployment 매니페스트"""
+    return {
+        'apiVersion': 'apps/v1',
+        'kind': 'Deployment',
+        'metadata': {'name': 'nginx-deployment'},
+        'spec': {
+            'replicas': 2,
+            'selector': {'matchLabels': {'app': 'nginx'}},
+            'template': {
+                'metadata': {'labels': {'app': 'nginx'}},
+                'spec': {'containers': [{'name': 'nginx', 'image': 'nginx:latest', 'ports': [{'containerPort': 80}]}]}
+            }
+        }
+    }
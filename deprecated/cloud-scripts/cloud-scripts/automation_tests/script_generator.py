@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Container 과정 실습 스크립트 생성기
+templates/ 아래의 Day 1/Day 2 템플릿을 한 번에 렌더링하고, 내용이 바뀐 파일만 씁니다.
+
+- 템플릿 변수는 @@name@@ 형식 (Bash의 $, Helm의 {{ }} 와 충돌하지 않음)
+- 변경 여부는 내용 해시로 판단하며, 바뀌지 않은 파일은 쓰지 않아 mtime이 유지됩니다
+- 출력 디렉토리의 .generated.json 에 해시/크기/mtime을 기록해 재실행 시 파일을 다시 읽지 않습니다
+
+사용 예:
+    python -m automation_tests.script_generator --output ../automation
+    python -m automation_tests.script_generator --output /tmp/out --set zone=asia-northeast3-a
+    python -m automation_tests.script_generator --count 300 --work-root tenants
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import logging
+import argparse
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from .tenant_specs import TenantSpec, build_tenants, load_tenant_file
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+TEMPLATE_SUFFIX = ".tmpl"
+MANIFEST_NAME = ".generated.json"
+SCRIPT_MODE = 0o755
+
+# 기본값으로 렌더링하면 automation/ 아래의 기존 스크립트와 동일한 내용이 생성됨
+DEFAULT_CONTEXT = {
+    "cluster_name": "container-course-cluster",
+    "zone": "us-central1-a",
+    "aws_region": "us-west-2",
+    "namespace": "container-course",
+}
+
+_VARIABLE = re.compile(r'@@([a-z_][a-z0-9_]*)@@')
+
+
+class ScriptTemplate:
+    """미리 분할해 둔 템플릿 (렌더링 시 정규식을 다시 실행하지 않음)"""
+
+    def __init__(self, name: str, source: str):
+        self.name = name
+        # 짝수 인덱스: 리터럴, 홀수 인덱스: 변수 이름
+        self.parts = _VARIABLE.split(source)
+        self.variables = set(self.parts[1::2])
+
+    def render(self, context: Dict[str, str]) -> str:
+        missing = self.variables - context.keys()
+        if missing:
+            raise KeyError(f"템플릿 {self.name}에 필요한 변수가 없습니다: {', '.join(sorted(missing))}")
+        parts = self.parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = str(context[parts[i]])
+        return "".join(parts)
+
+
+@dataclass
+class GenerationResult:
+    """스크립트 생성 결과"""
+    output_dir: Path
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.written)
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class ScriptGenerator:
+    """템플릿 기반 증분 스크립트 생성기"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, defaults: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            template_dir: 템플릿 루트 (하위 경로가 그대로 출력 경로가 됨)
+            defaults: 기본 템플릿 변수
+        """
+        self.template_dir = Path(template_dir)
+        self.defaults = dict(DEFAULT_CONTEXT if defaults is None else defaults)
+        self.templates = self._load_templates()
+
+    def _load_templates(self) -> Dict[str, ScriptTemplate]:
+        templates = {}
+        for path in sorted(self.template_dir.rglob(f"*{TEMPLATE_SUFFIX}")):
+            relative = path.relative_to(self.template_dir).as_posix()[:-len(TEMPLATE_SUFFIX)]
+            # 줄바꿈(CRLF/LF)을 그대로 유지해야 기존 스크립트와 같은 바이트가 생성됨
+            templates[relative] = ScriptTemplate(relative, path.read_bytes().decode('utf-8'))
+        if not templates:
+            raise FileNotFoundError(f"템플릿이 없습니다: {self.template_dir}")
+        return templates
+
+    def render_all(self, context: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """모든 템플릿 렌더링 (상대 경로 -> 내용)"""
+        merged = {**self.defaults, **(context or {})}
+        return {name: template.render(merged) for name, template in self.templates.items()}
+
+    def generate(self, output_dir: Path, context: Optional[Dict[str, str]] = None,
+                 only: Optional[List[str]] = None, dry_run: bool = False) -> GenerationResult:
+        """
+        스크립트 생성 (내용이 바뀐 파일만 쓰기)
+
+        Args:
+            output_dir: 출력 디렉토리 (예: automation/)
+            context: 템플릿 변수 (기본값 위에 덮어씀)
+            only: 생성할 상대 경로 목록 (None이면 전체)
+            dry_run: 파일을 쓰지 않고 변경 대상만 계산
+        """
+        output_dir = Path(output_dir)
+        rendered = self.render_all(context)
+        if only is not None:
+            rendered = {name: rendered[name] for name in only}
+
+        manifest_path = output_dir / MANIFEST_NAME
+        manifest = self._load_manifest(manifest_path)
+        result = GenerationResult(output_dir=output_dir)
+        dirty = False
+
+        for name, content in rendered.items():
+            data = content.encode('utf-8')
+            digest = _digest(data)
+            target = output_dir / name
+            if self._is_current(target, manifest.get(name), digest, data):
+                result.unchanged.append(name)
+                if name not in manifest:
+                    manifest[name] = self._stat_entry(target, digest)
+                    dirty = True
+                continue
+
+            result.written.append(name)
+            if dry_run:
+                continue
+            self._write_atomic(target, data)
+            manifest[name] = self._stat_entry(target, digest)
+            dirty = True
+
+        if dirty and not dry_run:
+            self._save_manifest(manifest_path, manifest)
+        return result
+
+    @staticmethod
+    def _is_current(target: Path, entry: Optional[Dict[str, Any]], digest: str, data: bytes) -> bool:
+        try:
+            stat = target.stat()
+        except FileNotFoundError:
+            return False
+        if stat.st_mode & 0o777 != SCRIPT_MODE:
+            return False
+        # 매니페스트와 크기/mtime이 같으면 파일을 읽지 않고 기록된 해시로 비교
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"] == digest
+        if stat.st_size != len(data):
+            return False
+        return _digest(target.read_bytes()) == digest
+
+    @staticmethod
+    def _stat_entry(target: Path, digest: str) -> Dict[str, Any]:
+        stat = target.stat()
+        return {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    @staticmethod
+    def _write_atomic(target: Path, data: bytes):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_name, SCRIPT_MODE)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    @staticmethod
+    def _load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_manifest(path: Path, manifest: Dict[str, Dict[str, Any]]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    def tenant_context(self, tenant: TenantSpec) -> Dict[str, str]:
+        """테넌트별 템플릿 변수"""
+        context = {
+            "cluster_name": tenant.cluster_name,
+            "namespace": f"{self.defaults.get('namespace', 'container-course')}-{tenant.name}",
+        }
+        if tenant.zone:
+            context["zone"] = tenant.zone
+        return context
+
+    def generate_tenants(self, tenants: List[TenantSpec], dry_run: bool = False) -> Dict[str, GenerationResult]:
+        """테넌트별 스크립트 일괄 생성 (각 테넌트 작업 디렉토리의 automation/ 아래)"""
+        return {
+            tenant.name: self.generate(tenant.work_dir / "automation", self.tenant_context(tenant), dry_run=dry_run)
+            for tenant in tenants
+        }
+
+
+def _parse_assignments(values: List[str]) -> Dict[str, str]:
+    context = {}
+    for value in values:
+        key, sep, item = value.partition("=")
+        if not sep:
+            raise ValueError(f"key=value 형식이 아닙니다: {value}")
+        context[key] = item
+    return context
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Container 과정 실습 스크립트 생성")
+    parser.add_argument("--output", type=Path, help="출력 디렉토리 (단일 생성)")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="템플릿 변수 지정")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--tenants", type=Path, help="테넌트 목록 JSON 파일 (테넌트별 생성)")
+    group.add_argument("--count", type=int, help="생성할 테넌트 수")
+    parser.add_argument("--prefix", default="student", help="--count 사용 시 테넌트 이름 접두사")
+    parser.add_argument("--work-root", type=Path, default=Path(__file__).parent / "tenants",
+                        help="테넌트 작업 디렉토리 루트")
+    parser.add_argument("--dry-run", action="store_true", help="변경 대상만 출력")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        overrides = _parse_assignments(args.set)
+    except ValueError as e:
+        parser.error(str(e))
+    generator = ScriptGenerator(defaults={**DEFAULT_CONTEXT, **overrides})
+
+    start = time.perf_counter()
+    if args.tenants or args.count:
+        if args.tenants:
+            zones = load_tenant_file(args.tenants)
+            names = list(zones)
+        else:
+            names = [f"{args.prefix}{i:02d}" for i in range(1, args.count + 1)]
+            zones = {}
+        tenants = build_tenants(names, generator.defaults["cluster_name"], args.work_root, zones)
+        results = list(generator.generate_tenants(tenants, dry_run=args.dry_run).values())
+    elif args.output:
+        results = [generator.generate(args.output, dry_run=args.dry_run)]
+    else:
+        parser.error("--output, --tenants, --count 중 하나를 지정하세요.")
+
+    written = sum(len(r.written) for r in results)
+    unchanged = sum(len(r.unchanged) for r in results)
+    for result in results:
+        for name in result.written:
+            logger.info(f"{'변경 예정' if args.dry_run else '생성'}: {result.output_dir / name}")
+    logger.info(f"스크립트 {written}개 {'변경 예정' if args.dry_run else '생성'}, {unchanged}개 변경 없음 "
+                f"({time.perf_counter() - start:.3f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Cloud Container 과정 멀티 테넌트 팬아웃 실행기
+여러 학생/클러스터에 대해 동일한 과정을 격리된 환경에서 동시에 실행합니다.
+
+테넌트별 격리 항목:
+- 클러스터 이름 (기본 클러스터 이름 + 테넌트 이름)
+- kubeconfig (KUBECONFIG 환경 변수로 테넌트 작업 디렉토리에 분리)
+- 작업 디렉토리 (생성되는 매니페스트 파일)
+
+사용 예:
+    python -m automation_tests.tenant_fanout --count 30 --prefix student --max-workers 8
+    python -m automation_tests.tenant_fanout --tenants tenants.json
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from functools import partial
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Callable
+
+from .rate_limiter import shared_limiter
+from .tenant_specs import TenantSpec, GKE_CLUSTER_NAME_MAX, sanitize_cluster_name, build_tenants, load_tenant_file
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class TenantResult:
+    """테넌트 실행 결과"""
+    name: str
+    cluster_name: str
+    status: str = "pending"
+    duration_seconds: float = 0.0
+    error: Optional[str] = None
+    created_resources: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class TenantFanout:
+    """테넌트별 과정 실행을 제한된 동시성으로 팬아웃하는 클래스"""
+
+    def __init__(self, base_config: dict, tenants: List[TenantSpec], max_workers: int = 8,
+                 automation_factory: Optional[Callable[..., Any]] = None):
+        """
+        Args:
+            base_config: 모든 테넌트가 공유하는 설정 (프로젝트, 리전, 존)
+            tenants: 테넌트 목록
+            max_workers: 동시에 실행할 최대 테넌트 수 (API 쿼터에 맞게 조정)
+            automation_factory: 테넌트 실행 객체 생성 함수 (없으면 ContainerCourseAutomation, 테스트용 교체 지점)
+        """
+        self.base_config = dict(base_config)
+        self.tenants = tenants
+        self.max_workers = max(1, max_workers)
+        if automation_factory is None:
+            # 과정 자동화 모듈은 import 시 로깅(FileHandler)을 설정하므로 실제로 실행할 때만 import
+            from .cloud_container_course_automation import ContainerCourseAutomation
+            automation_factory = ContainerCourseAutomation
+        self.automation_factory = automation_factory
+        self.results: Dict[str, TenantResult] = {}
+        self._lock = threading.Lock()
+        self._finished = 0
+
+    def tenant_config(self, tenant: TenantSpec) -> dict:
+        """테넌트별 클러스터 설정 생성"""
+        config = dict(self.base_config)
+        config["cluster_name"] = tenant.cluster_name
+        if tenant.zone:
+            config["gcp_zone"] = tenant.zone
+        return config
+
+    def tenant_env(self, tenant: TenantSpec) -> dict:
+        """테넌트별 격리된 실행 환경 변수 생성"""
+        env = os.environ.copy()
+        env["KUBECONFIG"] = str(tenant.kubeconfig)
+        return env
+
+    def _run_tenant(self, tenant: TenantSpec) -> TenantResult:
+        result = TenantResult(name=tenant.name, cluster_name=tenant.cluster_name, status="in_progress")
+        start = time.monotonic()
+        try:
+            tenant.work_dir.mkdir(parents=True, exist_ok=True)
+            automation = self.automation_factory(
+                tenant.work_dir,
+                config=self.tenant_config(tenant),
+                env=self.tenant_env(tenant)
+            )
+            success = automation.run_course()
+            result.status = "completed" if success else "failed"
+            result.created_resources = list(automation.created_resources.get("gcp", []))
+        except Exception as e:
+            result.status = "failed"
+            result.error = str(e)
+            logger.error(f"❌ 테넌트 실행 오류: {tenant.name} - {e}")
+        result.duration_seconds = round(time.monotonic() - start, 3)
+        return result
+
+    def _record(self, result: TenantResult):
+        with self._lock:
+            self.results[result.name] = result
+            self._finished += 1
+            finished = self._finished
+        icon = "✅" if result.status == "completed" else "❌"
+        logger.info(f"{icon} [{finished}/{len(self.tenants)}] {result.name} ({result.cluster_name}): "
+                    f"{result.status}, {result.duration_seconds:.1f}s")
+
+    def run(self) -> Dict[str, Any]:
+        """모든 테넌트 실행 후 통합 리포트 반환"""
+        logger.info(f"🚀 테넌트 팬아웃 시작: {len(self.tenants)}개 테넌트, 동시 실행 {self.max_workers}")
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tenant") as executor:
+            futures = [executor.submit(self._run_tenant, tenant) for tenant in self.tenants]
+            for future in as_completed(futures):
+                self._record(future.result())
+        wall_seconds = time.monotonic() - start
+
+        report = self.build_report(wall_seconds)
+        summary = report["summary"]
+        logger.info(f"🎉 테넌트 팬아웃 완료: 성공 {summary['completed']}/{summary['total']}, "
+                    f"소요 {summary['wall_seconds']:.1f}s (순차 실행 대비 {summary['speedup']:.1f}배)")
+        return report
+
+    def build_report(self, wall_seconds: float) -> Dict[str, Any]:
+        """테넌트 결과를 하나의 리포트로 통합"""
+        ordered = [self.results[t.name] for t in self.tenants if t.name in self.results]
+        serial_seconds = sum(r.duration_seconds for r in ordered)
+        completed = sum(1 for r in ordered if r.status == "completed")
+        return {
+            "summary": {
+                "total": len(self.tenants),
+                "completed": completed,
+                "failed": len(ordered) - completed,
+                "max_workers": self.max_workers,
+                "wall_seconds": round(wall_seconds, 3),
+                "serial_seconds": round(serial_seconds, 3),
+                "speedup": round(serial_seconds / wall_seconds, 2) if wall_seconds > 0 else 0.0
+            },
+            "tenants": [asdict(r) for r in ordered]
+        }
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Cloud Container 과정 멀티 테넌트 팬아웃 실행")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--tenants", type=Path, help="테넌트 목록 JSON 파일")
+    group.add_argument("--count", type=int, help="생성할 테넌트 수")
+    parser.add_argument("--prefix", default="student", help="--count 사용 시 테넌트 이름 접두사")
+    parser.add_argument("--max-workers", type=int, default=8, help="최대 동시 실행 테넌트 수")
+    parser.add_argument("--work-root", type=Path, default=Path(__file__).parent / "tenants",
+                        help="테넌트 작업 디렉토리 루트")
+    parser.add_argument("--report", type=Path, help="통합 리포트 저장 경로")
+    args = parser.parse_args(argv)
+
+    if args.tenants:
+        zones = load_tenant_file(args.tenants)
+        names = list(zones)
+    else:
+        names = [f"{args.prefix}{i:02d}" for i in range(1, args.count + 1)]
+        zones = {}
+
+    from .cloud_container_course_automation import ContainerCourseAutomation
+
+    # 모든 테넌트가 API 할당량을 함께 쓰므로 같은 제한기 공유 (다른 프로세스와도 공유)
+    factory = partial(ContainerCourseAutomation, rate_limiter=shared_limiter())
+
+    # 공통 설정은 한 번만 로드
+    base_config = factory(args.work_root).config
+    tenants = build_tenants(names, base_config["cluster_name"], args.work_root, zones)
+
+    fanout = TenantFanout(base_config, tenants, max_workers=args.max_workers, automation_factory=factory)
+    report = fanout.run()
+
+    report_path = args.report or args.work_root / "fanout_results.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    logger.info(f"통합 리포트가 {report_path}에 저장되었습니다.")
+
+    return 0 if report["summary"]["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+테넌트 설정
+테넌트 팬아웃(tenant_fanout)과 스크립트 생성기(script_generator)가 함께 쓰는 테넌트 정의와 이름 규칙
+import 시 로깅 설정 등 부수 효과가 없어야 합니다.
+"""
+
+import re
+import json
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# GKE 클러스터 이름 제약: 소문자로 시작, 소문자/숫자/하이픈, 최대 40자
+GKE_CLUSTER_NAME_MAX = 40
+NAME_HASH_LENGTH = 6
+
+
+def sanitize_cluster_name(name: str) -> str:
+    """
+    GKE 클러스터 이름 규칙에 맞게 이름 정리
+    대소문자/문자 치환/길이 자르기로 이름이 바뀌면 서로 다른 이름이 같은 클러스터 이름이 되지 않도록
+    원래 이름의 짧은 해시를 붙입니다 (student_01 -> student-01-<해시>, Student-01 -> student-01-<해시>).
+    """
+    cleaned = re.sub(r'[^a-z0-9-]', '-', name.lower()).strip('-')
+    if not cleaned or not cleaned[0].isalpha():
+        cleaned = f"t-{cleaned}"
+    if cleaned == name and len(cleaned) <= GKE_CLUSTER_NAME_MAX:
+        return cleaned
+    digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:NAME_HASH_LENGTH]
+    return f"{cleaned[:GKE_CLUSTER_NAME_MAX - NAME_HASH_LENGTH - 1].rstrip('-')}-{digest}"
+
+
+@dataclass
+class TenantSpec:
+    """테넌트 실행 설정"""
+    name: str
+    cluster_name: str
+    work_dir: Path
+    zone: Optional[str] = None
+
+    @property
+    def kubeconfig(self) -> Path:
+        return self.work_dir / "kubeconfig"
+
+
+def build_tenants(names: List[str], base_cluster_name: str, work_root: Path,
+                  zones: Optional[Dict[str, str]] = None) -> List[TenantSpec]:
+    """
+    테넌트 이름 목록으로 테넌트 설정 생성
+
+    Raises:
+        ValueError: 테넌트 이름 또는 정리한 클러스터 이름이 중복됨
+            (두 작업자가 같은 GKE 클러스터를 만들거나 삭제하지 않도록)
+    """
+    zones = zones or {}
+    tenants = []
+    owners: Dict[str, str] = {}
+    for name in names:
+        cluster_name = sanitize_cluster_name(f"{base_cluster_name}-{name}")
+        if cluster_name in owners:
+            raise ValueError(f"테넌트 {owners[cluster_name]!r}와(과) {name!r}의 클러스터 이름이 같습니다: {cluster_name}")
+        owners[cluster_name] = name
+        tenants.append(TenantSpec(
+            name=name,
+            cluster_name=cluster_name,
+            work_dir=work_root / name,
+            zone=zones.get(name)
+        ))
+    return tenants
+
+
+def load_tenant_file(path: Path) -> Dict[str, Optional[str]]:
+    """테넌트 파일 로드 (["student01", ...] 또는 [{"name": ..., "zone": ...}, ...])"""
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    tenants = {}
+    for entry in entries:
+        if isinstance(entry, str):
+            tenants[entry] = None
+        else:
+            tenants[entry["name"]] = entry.get("zone")
+    return tenants
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+명령 녹화/재생 카세트 테스트
+"""
+
+import os
+import time
+import subprocess
+import pytest
+from pathlib import Path
+
+from .cassette import Cassette, CassetteMissError, install_shims, run_shim
+from .cloud_container_course_automation import ContainerCourseAutomation
+
+
+def fake_cloud(command, capture_output=False, text=True, check=False, cwd=None, env=None, timeout=None):
+    """느린 클라우드 CLI를 흉내 내는 실행기"""
+    time.sleep(0.05)
+    if command[:4] == ["gcloud", "config", "get-value", "project"]:
+        return subprocess.CompletedProcess(command, 0, "mcp-project\n", "")
+    if command[:2] == ["kubectl", "create"]:
+        return subprocess.CompletedProcess(command, 1, "", "AlreadyExists\n")
+    return subprocess.CompletedProcess(command, 0, f"ok: {' '.join(command)}\n", "")
+
+
+class TestCassette:
+    """카세트 테스트 클래스"""
+
+    def test_record_then_replay(self, tmp_path):
+        """녹화한 결과가 그대로 재생되는지 테스트"""
+        path = tmp_path / "c.jsonl"
+        recorder = Cassette(path, mode="record", runner=fake_cloud)
+        recorded = recorder.run(["kubectl", "get", "nodes"], capture_output=True)
+        recorder.run(["kubectl", "create", "namespace", "x"], capture_output=True)
+
+        player = Cassette(path, mode="replay")
+        replayed = player.run(["kubectl", "get", "nodes"], capture_output=True)
+        assert replayed.stdout == recorded.stdout
+        with pytest.raises(subprocess.CalledProcessError) as exc:
+            player.run(["kubectl", "create", "namespace", "x"], capture_output=True, check=True)
+        assert "AlreadyExists" in exc.value.stderr
+        with pytest.raises(CassetteMissError):
+            player.run(["kubectl", "delete", "nodes"], capture_output=True)
+
+    def test_replay_latency(self, tmp_path):
+        """기록된 지연 재현 테스트"""
+        path = tmp_path / "c.jsonl"
+        Cassette(path, mode="record", runner=fake_cloud).run(["gcloud", "version"], capture_output=True)
+
+        start = time.monotonic()
+        Cassette(path, mode="replay").run(["gcloud", "version"], capture_output=True)
+        fast = time.monotonic() - start
+        start = time.monotonic()
+        Cassette(path, mode="replay", latency=True).run(["gcloud", "version"], capture_output=True)
+        slow = time.monotonic() - start
+        assert fast < 0.05 <= slow
+
+    def test_whole_course_offline(self, tmp_path):
+        """전체 과정을 녹화 후 오프라인으로 재생하는 회귀 테스트"""
+        path = tmp_path / "course.jsonl"
+        record_dir = tmp_path / "record"
+        record_dir.mkdir()
+        recorder = Cassette(path, mode="record", runner=fake_cloud,
+                            substitutions={"<base_path>": str(record_dir)})
+        assert ContainerCourseAutomation(record_dir, runner=recorder.run).run_course() is True
+
+        replay_dir = tmp_path / "replay"
+        replay_dir.mkdir()
+        player = Cassette(path, mode="replay", substitutions={"<base_path>": str(replay_dir)})
+        start = time.monotonic()
+        automation = ContainerCourseAutomation(replay_dir, runner=player.run)
+        assert automation.run_course() is True
+        assert time.monotonic() - start < 0.2
+        assert automation.config["gcp_project_id"] == "mcp-project"
+
+    def test_path_shim(self, tmp_path):
+        """Bash 스크립트용 PATH shim 녹화/재생 테스트"""
+        real_bin = tmp_path / "real-bin"
+        real_bin.mkdir()
+        tool = real_bin / "kubectl"
+        tool.write_text("#!/bin/sh\necho \"real kubectl $*\"\nexit 3\n")
+        tool.chmod(0o755)
+
+        cassette_path = tmp_path / "shim.jsonl"
+        env = dict(os.environ, PATH=f"{real_bin}{os.pathsep}{os.environ['PATH']}")
+        old_path = os.environ["PATH"]
+        os.environ["PATH"] = env["PATH"]
+        try:
+            shim_dir = install_shims(tmp_path / "shims", cassette_path, mode="record", tools=["kubectl"])
+        finally:
+            os.environ["PATH"] = old_path
+        env["PATH"] = f"{shim_dir}{os.pathsep}{env['PATH']}"
+        recorded = subprocess.run(["sh", "-c", "kubectl get pods"], capture_output=True, text=True, env=env)
+        assert recorded.returncode == 3
+        assert recorded.stdout == "real kubectl get pods\n"
+
+        tool.unlink()
+        install_shims(tmp_path / "shims", cassette_path, mode="replay", tools=["kubectl"])
+        replayed = subprocess.run(["sh", "-c", "kubectl get pods"], capture_output=True, text=True, env=env)
+        assert replayed.returncode == 3
+        assert replayed.stdout == "real kubectl get pods\n"
+
+    def test_shim_without_real_tool(self, tmp_path, capsys):
+        """실제 도구가 없으면 PATH의 shim을 다시 실행하지 않고 명확한 오류로 끝나는지 테스트"""
+        cassette_path = tmp_path / "missing.jsonl"
+        assert run_shim(cassette_path, "record", "kubectl", "", ["get", "pods"]) == 127
+        assert "실제 kubectl 실행 파일을 찾을 수 없습니다" in capsys.readouterr().err
+        assert not cassette_path.exists() or not cassette_path.read_text().strip()
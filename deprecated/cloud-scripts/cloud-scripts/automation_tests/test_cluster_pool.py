@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+웜 클러스터 풀 테스트
+"""
+
+import json
+import time
+import sqlite3
+import threading
+import subprocess
+import pytest
+
+from .cluster_pool import (ClusterPool, PoolExhaustedError, LeaseNotFoundError, STATE_READY, STATE_BROKEN,
+                           STATE_PROVISIONING, STATE_RESETTING)
+from .cloud_container_course_automation import ContainerCourseAutomation
+
+BASE_CRDS = ["backendconfigs.cloud.google.com"]
+
+
+class FakeGke:
+    """클러스터별 네임스페이스/CRD/HPA 상태를 흉내 내는 CLI"""
+
+    def __init__(self, create_delay=0.0, fail_create=()):
+        self.create_delay = create_delay
+        self.fail_create = set(fail_create)
+        self.clusters = {}
+        self.statuses = {}
+        self.commands = []
+        self._lock = threading.Lock()
+
+    def _cluster(self, env):
+        return env["KUBECONFIG"].rsplit("/", 1)[-1].replace(".kubeconfig", "")
+
+    def __call__(self, command, env=None):
+        with self._lock:
+            self.commands.append(command)
+        if command[:4] == ["gcloud", "container", "clusters", "create"]:
+            time.sleep(self.create_delay)
+            name = command[4]
+            if name in self.fail_create:
+                raise subprocess.CalledProcessError(1, command, stderr="quota exceeded")
+            self.clusters[name] = {"namespaces": {"default", "kube-system", "gmp-system"},
+                                   "crds": set(BASE_CRDS), "hpas": 0}
+            return ""
+        if command[:4] == ["gcloud", "container", "clusters", "delete"]:
+            self.clusters.pop(command[4], None)
+            return ""
+        if command[:4] == ["gcloud", "container", "clusters", "get-credentials"]:
+            return ""
+        if command[:4] == ["gcloud", "container", "clusters", "describe"]:
+            name = command[4]
+            if name not in self.clusters:
+                raise subprocess.CalledProcessError(1, command, stderr=f"ERROR: (gcloud.container.clusters.describe) "
+                                                                       f"ResponseError: code=404, message=Not found: {name}. NOT_FOUND")
+            return self.statuses.get(name, "RUNNING") + "\n"
+        state = self.clusters[self._cluster(env)]
+        if command[:3] == ["kubectl", "get", "namespaces"]:
+            if "json" in command:
+                return json.dumps({"items": [{"metadata": {"name": ns}} for ns in sorted(state["namespaces"])]})
+            return " ".join(sorted(state["namespaces"]))
+        if command[:3] == ["kubectl", "get", "crd"]:
+            return " ".join(sorted(state["crds"]))
+        if command[:2] == ["kubectl", "get"] and command[2].startswith("crd/"):
+            name = command[2][4:]
+            return json.dumps({"kind": "CustomResourceDefinition", "metadata": {"name": name}}) \
+                if name in state["crds"] else ""
+        if command[:3] == ["kubectl", "delete", "namespace"]:
+            state["namespaces"] -= set(command[3:])
+        elif command[:3] == ["kubectl", "delete", "crd"]:
+            state["crds"] -= set(command[3:])
+        elif command[:2] == ["kubectl", "delete"] and command[2].startswith("crd/"):
+            state["crds"].discard(command[2][4:])
+        elif command[:3] == ["kubectl", "delete", "hpa"]:
+            state["hpas"] = 0
+        return ""
+
+
+class TestClusterPool:
+    """클러스터 풀 테스트 클래스"""
+
+    @pytest.fixture
+    def fake(self):
+        return FakeGke()
+
+    def test_warm_lease_release(self, tmp_path, fake):
+        """웜 풀 생성, 임대, 반납 시 초기화 테스트"""
+        pool = ClusterPool(tmp_path, size=2, runner=fake)
+        summary = pool.ensure_warm()
+        assert summary["created"] == ["mcp-pool-01", "mcp-pool-02"]
+        assert pool.ensure_warm()["created"] == []
+
+        first = pool.lease("student01")
+        second = pool.lease("student02")
+        assert {first.cluster_name, second.cluster_name} == {"mcp-pool-01", "mcp-pool-02"}
+        with pytest.raises(PoolExhaustedError):
+            pool.lease("student03")
+
+        # 실습 중 생성된 리소스
+        state = fake.clusters[first.cluster_name]
+        state["namespaces"] |= {"monitoring", "student01"}
+        state["crds"].add("prometheuses.monitoring.coreos.com")
+        state["hpas"] = 2
+
+        assert pool.release(first.lease_id) is True
+        assert state["namespaces"] == {"default", "kube-system", "gmp-system"}
+        assert state["crds"] == set(BASE_CRDS)
+        assert state["hpas"] == 0
+        assert not any(c[:4] == ["gcloud", "container", "clusters", "delete"] for c in fake.commands)
+        with pytest.raises(LeaseNotFoundError):
+            pool.release(first.lease_id)
+
+        start = time.monotonic()
+        again = pool.lease("student03")
+        assert time.monotonic() - start < 1.0
+        assert again.cluster_name == first.cluster_name
+
+    def test_expired_lease_is_reclaimed(self, tmp_path, fake):
+        """만료된 임대 회수 테스트"""
+        now = [1000.0]
+        pool = ClusterPool(tmp_path, size=1, runner=fake, clock=lambda: now[0])
+        pool.ensure_warm()
+        lease = pool.lease("student01", ttl=60)
+        fake.clusters[lease.cluster_name]["namespaces"].add("leftover")
+
+        now[0] += 30
+        assert pool.renew(lease.lease_id, ttl=60) == 1090.0
+        now[0] += 100
+        reclaimed = pool.lease("student02")
+        assert reclaimed.cluster_name == lease.cluster_name
+        assert "leftover" not in fake.clusters[lease.cluster_name]["namespaces"]
+
+    def test_broken_cluster_is_replaced(self, tmp_path):
+        """생성 실패한 클러스터 교체 테스트"""
+        fake = FakeGke(fail_create={"mcp-pool-02"})
+        pool = ClusterPool(tmp_path, size=2, runner=fake)
+        summary = pool.ensure_warm()
+        assert list(summary["failed"]) == ["mcp-pool-02"]
+        assert {c["name"]: c["state"] for c in pool.clusters()} == {
+            "mcp-pool-01": STATE_READY, "mcp-pool-02": STATE_BROKEN}
+
+        fake.fail_create.clear()
+        summary = pool.ensure_warm()
+        assert summary["replaced"] == ["mcp-pool-02"]
+        assert [c["state"] for c in pool.clusters()] == [STATE_READY, STATE_READY]
+
+    def test_course_uses_pool(self, tmp_path, fake):
+        """과정 실행 시 클러스터를 생성하지 않고 임대/반납하는지 테스트"""
+        pool = ClusterPool(tmp_path / "pool", size=1, runner=fake)
+        pool.ensure_warm()
+        fake.commands.clear()
+
+        commands = []
+
+        def course_runner(command, **kwargs):
+            commands.append(command)
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        config = {"gcp_project_id": "p", "gcp_region": "asia-northeast3",
+                  "gcp_zone": "asia-northeast3-a", "cluster_name": "mcp-container-cluster"}
+        automation = ContainerCourseAutomation(tmp_path, config=config, runner=course_runner, cluster_pool=pool)
+        assert automation.run_course() is True
+
+        assert not any(c[:4] == ["gcloud", "container", "clusters", "create"] for c in commands + fake.commands)
+        assert ["gcloud", "container", "clusters", "get-credentials", "mcp-pool-01",
+                "--zone", "asia-northeast3-a"] in commands
+        assert [c["state"] for c in pool.clusters()] == [STATE_READY]
+
+    def test_stale_in_progress_clusters_are_recovered(self, tmp_path, fake):
+        """생성/초기화 중 중단된 클러스터를 타임아웃 후 gcloud 상태에 따라 풀로 되돌리거나 삭제하는지 테스트"""
+        now = [1000.0]
+        pool = ClusterPool(tmp_path, size=4, runner=fake, clock=lambda: now[0], stale_timeout=600)
+        pool.ensure_warm()
+        lease = pool.lease("student01")
+        resetting = lease.cluster_name
+        fake.clusters[resetting]["namespaces"].add("leftover")
+        created, missing, failed = [c["name"] for c in pool.clusters() if c["name"] != resetting]
+
+        # 프로세스 중단 흉내: 반납 초기화 중, 생성 완료 직후, 생성 요청 전, GKE에서 ERROR
+        pool._set_state(resetting, STATE_RESETTING)
+        pool._set_state(created, STATE_PROVISIONING)
+        pool._set_state(missing, STATE_PROVISIONING)
+        fake.clusters.pop(missing)
+        pool._set_state(failed, STATE_PROVISIONING)
+        fake.statuses[failed] = "ERROR"
+
+        # 타임아웃 전에는 진행 중인 작업으로 보고 건드리지 않음
+        now[0] += 300
+        assert pool.recover_stale() == {"returned": [], "deleted": []}
+        with pytest.raises(PoolExhaustedError):
+            pool.lease("student02")
+
+        now[0] += 400
+        summary = pool.ensure_warm()
+        assert {key: sorted(value) for key, value in summary["recovered"].items()} == {
+            "returned": sorted([resetting, created]), "deleted": sorted([missing, failed])}
+        assert "leftover" not in fake.clusters[resetting]["namespaces"]
+        deletes = [c[4] for c in fake.commands if c[:4] == ["gcloud", "container", "clusters", "delete"]]
+        assert deletes == [failed]
+        # 삭제한 자리는 같은 호출에서 새로 생성
+        assert sorted(summary["created"]) == sorted([missing, failed])
+        assert [c["state"] for c in pool.clusters()] == [STATE_READY] * 4
+
+    def test_stale_recovery_failure_marks_broken(self, tmp_path, fake):
+        """상태 확인이 실패하면 broken 처리되어 다음 ensure_warm에서 교체되는지 테스트"""
+        now = [1000.0]
+        pool = ClusterPool(tmp_path, size=1, runner=fake, clock=lambda: now[0], stale_timeout=60)
+        pool.ensure_warm()
+        pool._set_state("mcp-pool-01", STATE_PROVISIONING)
+        original = fake.__call__
+
+        def flaky(command, env=None):
+            if command[:4] == ["gcloud", "container", "clusters", "describe"]:
+                raise subprocess.CalledProcessError(1, command, stderr="ERROR: network unreachable")
+            return original(command, env=env)
+
+        pool.runner = flaky
+        now[0] += 120
+        assert pool.recover_stale() == {"returned": [], "deleted": []}
+        assert [c["state"] for c in pool.clusters()] == [STATE_BROKEN]
+
+        pool.runner = fake
+        assert pool.ensure_warm()["replaced"] == ["mcp-pool-01"]
+        assert [c["state"] for c in pool.clusters()] == [STATE_READY]
+
+    def test_old_pool_db_is_migrated(self, tmp_path, fake):
+        """state_since 열이 없는 이전 풀 DB를 열면 열을 추가하고 기존 시각으로 타임아웃 판단"""
+        conn = sqlite3.connect(str(tmp_path / "pool.db"))
+        conn.executescript("""
+            CREATE TABLE clusters (name TEXT PRIMARY KEY, zone TEXT NOT NULL, state TEXT NOT NULL,
+                lease_id TEXT UNIQUE, holder TEXT, leased_at REAL, expires_at REAL, created_at REAL NOT NULL,
+                reset_at REAL, baseline_crds TEXT NOT NULL DEFAULT '[]', error TEXT);
+            INSERT INTO clusters (name, zone, state, created_at) VALUES ('mcp-pool-01', 'asia-northeast3-a',
+                'provisioning', 100.0);
+        """)
+        conn.close()
+        pool = ClusterPool(tmp_path, size=1, runner=fake, clock=lambda: 1000.0, stale_timeout=600)
+        # 이미 갱신된 DB를 다시 열어도 오류 없음
+        ClusterPool(tmp_path, size=1, runner=fake).close()
+        assert pool.recover_stale() == {"returned": [], "deleted": ["mcp-pool-01"]}
+        assert pool.clusters() == []
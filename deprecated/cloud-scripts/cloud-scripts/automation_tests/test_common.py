@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+자동화 공용 도우미 테스트
+"""
+
+from contextlib import contextmanager
+
+import pytest
+
+from .common import profile_step
+
+
+class RecordingProfiler:
+    """profile(name) 컨텍스트 매니저만 가진 프로파일러 (scripts/step_profiler.StepProfiler와 같은 인터페이스)"""
+
+    def __init__(self):
+        self.steps = []
+
+    @contextmanager
+    def profile(self, name):
+        self.steps.append((name, "start"))
+        try:
+            yield
+        finally:
+            self.steps.append((name, "end"))
+
+
+class Automation:
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+
+    @profile_step("deploy")
+    def deploy(self, value):
+        """앱 배포"""
+        if value is None:
+            raise RuntimeError("deploy failed")
+        return value
+
+
+class TestCommon:
+    """공용 도우미 테스트 클래스"""
+
+    def test_profile_step(self):
+        """self.profiler가 있을 때만 단계로 감싸고, 실패한 단계도 닫히는지 테스트"""
+        assert Automation().deploy("ok") == "ok"
+        assert Automation.deploy.__doc__ == "앱 배포"
+
+        profiler = RecordingProfiler()
+        automation = Automation(profiler)
+        assert automation.deploy("ok") == "ok"
+        with pytest.raises(RuntimeError):
+            automation.deploy(None)
+        assert profiler.steps == [("deploy", "start"), ("deploy", "end")] * 2
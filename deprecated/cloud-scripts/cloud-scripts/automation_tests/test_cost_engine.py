@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+리소스 비용 추정 엔진 테스트
+"""
+
+import time
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from .cost_engine import CostEngine
+
+PRICING = {
+    "hours_per_month": 730,
+    "gcp": {
+        "cluster_fee": {"gke": 0.10, "default": 0.10},
+        "node": {"e2-medium": 0.05, "default": 0.10},
+        "disk": {"pd-standard": 0.073, "default": 0.073},
+        "load_balancer": {"forwarding_rule": 0.025, "default": 0.025}
+    },
+    "aws": {"cluster_fee": {"default": 0.10}, "node": {"default": 0.05},
+            "disk": {"default": 0.073}, "load_balancer": {"default": 0.02}}
+}
+
+NOW = datetime(2024, 9, 25, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeInventory:
+    """고정된 스냅샷을 반환하는 인벤토리"""
+
+    def __init__(self, items):
+        self.items = items
+
+    def query(self, resource_type, **kwargs):
+        return self.items.get(resource_type, [])
+
+
+class TestCostEngine:
+    """비용 엔진 테스트 클래스"""
+
+    @pytest.fixture
+    def engine(self):
+        return CostEngine(PRICING)
+
+    def test_vectorized_costs(self, engine):
+        """리소스별 시간당/누적 비용 계산 테스트"""
+        engine.upsert("node-pool", "gcp", "node", "e2-medium", quantity=3, uptime_hours=10)
+        engine.upsert("disk", "gcp", "disk", "pd-standard", quantity=100, uptime_hours=730)
+
+        hourly = engine.hourly_costs()
+        assert hourly[0] == pytest.approx(0.15)
+        # 디스크는 GB-월 요금을 시간 단위로 환산
+        assert hourly[1] == pytest.approx(100 * 0.073 / 730)
+        assert engine.accrued_costs()[1] == pytest.approx(7.3)
+
+    def test_incremental_update_and_remove(self, engine):
+        """리소스 변경/삭제 시 해당 행만 갱신되는지 테스트"""
+        engine.upsert("a", "gcp", "node", "e2-medium", quantity=1)
+        engine.upsert("b", "gcp", "node", "e2-medium", quantity=1)
+        engine.upsert("a", "gcp", "node", "e2-medium", quantity=4)
+        assert engine.report()["hourly"] == pytest.approx(0.25)
+
+        engine.remove("a")
+        assert engine.report()["hourly"] == pytest.approx(0.05)
+        # 삭제된 행은 재사용
+        engine.upsert("c", "gcp", "node", "e2-medium")
+        assert engine.size == 2
+
+    def test_tenant_totals(self, engine):
+        """테넌트별 비용 집계 테스트"""
+        engine.upsert("c1", "gcp", "cluster_fee", "gke", name="mcp-container-cluster-student01")
+        engine.upsert("c2", "gcp", "cluster_fee", "gke", name="mcp-container-cluster-student02")
+        engine.upsert("c3", "gcp", "cluster_fee", "gke", name="instructor-cluster")
+
+        totals = engine.tenant_totals()
+        assert set(totals) == {"student01", "student02", "shared"}
+        assert totals["student01"]["monthly"] == pytest.approx(73.0)
+
+    def test_idle_expensive(self, engine):
+        """유휴 고비용 리소스 감지 테스트"""
+        engine.upsert("orphan", "gcp", "disk", "pd-standard", quantity=500, utilization=0.0)
+        engine.upsert("tiny-orphan", "gcp", "disk", "pd-standard", quantity=1, utilization=0.0)
+        engine.upsert("busy", "gcp", "disk", "pd-standard", quantity=500)
+
+        idle = engine.idle_expensive(min_hourly=0.01)
+        assert [item["resource_id"] for item in idle] == ["orphan"]
+
+    def test_sync_inventory(self, engine):
+        """인벤토리 동기화 테스트"""
+        created = (NOW - timedelta(hours=2)).isoformat()
+        inventory = FakeInventory({
+            "gke_cluster": [{"resource_id": "gke/c1", "name": "c1", "status": "RUNNING", "attrs": {
+                "created": created, "node_count": 3,
+                "node_pools": [{"name": "default-pool", "machine_type": "e2-medium"}]}}],
+            "gce_disk": [{"resource_id": "disk/d1", "name": "d1", "status": "UNATTACHED",
+                          "attrs": {"size_gb": 200, "disk_type": "pd-standard", "created": created}}],
+        })
+        result = engine.sync_inventory(inventory, now=NOW)
+        assert result == {"added": 3, "updated": 0, "removed": 0}
+
+        report = engine.report()
+        assert report["accrued"] == pytest.approx(2 * (0.10 + 0.15 + 0.02), rel=1e-3)
+        assert report["idle_expensive"][0]["resource_id"] == "disk/d1"
+
+        inventory.items["gce_disk"] = []
+        assert engine.sync_inventory(inventory, now=NOW)["removed"] == 1
+
+    def test_thousands_of_resources(self, engine):
+        """대량 리소스 계산 성능 테스트"""
+        rows = [{"resource_id": f"node-{i}", "provider": "gcp", "kind": "node", "sku": "e2-medium",
+                 "quantity": 1 + i % 5, "uptime_hours": i % 100, "name": f"cluster-student{i % 30:02d}"}
+                for i in range(10000)]
+        engine.upsert_many(rows)
+
+        start = time.perf_counter()
+        report = engine.report()
+        assert time.perf_counter() - start < 0.5
+        assert report["resources"] == 10000
+        assert len(report["tenants"]) == 30
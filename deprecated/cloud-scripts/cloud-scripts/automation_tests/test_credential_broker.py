@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+자격 증명 브로커 테스트
+"""
+
+import json
+import stat
+import time
+import subprocess
+from datetime import datetime, timezone
+
+import yaml
+
+from .credential_broker import CredentialBroker, context_name
+from .cloud_container_course_automation import ContainerCourseAutomation
+
+CONFIG = {"gcp_project_id": "p", "gcp_region": "asia-northeast3",
+          "gcp_zone": "asia-northeast3-a", "cluster_name": "mcp-container-cluster"}
+
+
+class FakeGcloud:
+    """gcloud describe / config-helper 응답 (토큰 수명 lifetime초)"""
+
+    def __init__(self, clock, lifetime=3600.0):
+        self.clock = clock
+        self.lifetime = lifetime
+        self.calls = []
+
+    def __call__(self, command, env=None):
+        self.calls.append(command)
+        if command[:3] == ["gcloud", "config", "config-helper"]:
+            expiry = datetime.fromtimestamp(self.clock() + self.lifetime, tz=timezone.utc)
+            return json.dumps({"credential": {"access_token": f"token-{len(self.calls)}",
+                                              "token_expiry": expiry.strftime("%Y-%m-%dT%H:%M:%SZ")}})
+        if command[:4] == ["gcloud", "container", "clusters", "describe"]:
+            return json.dumps({"endpoint": "34.64.1.2", "masterAuth": {"clusterCaCertificate": "Q0E="}})
+        raise AssertionError(command)
+
+    def count(self, word):
+        return sum(1 for command in self.calls if word in command)
+
+
+class Clock:
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestCredentialBroker:
+    """자격 증명 브로커 테스트 클래스"""
+
+    def test_cached_kubeconfig(self, tmp_path):
+        """kubeconfig 작성 및 메모리/디스크 캐시 테스트"""
+        clock = Clock()
+        gcloud = FakeGcloud(clock)
+        broker = CredentialBroker(tmp_path, runner=gcloud, clock=clock)
+
+        path = broker.kubeconfig("c1", "asia-northeast3-a", "p")
+        for _ in range(5):
+            broker.credentials("c1", "asia-northeast3-a", "p")
+        assert gcloud.count("describe") == 1 and gcloud.count("config-helper") == 1
+        assert "--zone" in gcloud.calls[0]
+
+        config = yaml.safe_load(path.read_text())
+        assert config["current-context"] == context_name("c1", "asia-northeast3-a", "p")
+        assert config["clusters"][0]["cluster"]["server"] == "https://34.64.1.2"
+        assert config["users"][0]["user"] == {"token": "token-2"}
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+        # 새 프로세스(브로커)는 디스크 캐시 사용, 리전 클러스터는 --region
+        other = FakeGcloud(clock)
+        CredentialBroker(tmp_path, runner=other, clock=clock).credentials("c1", "asia-northeast3-a", "p")
+        assert other.calls == []
+        CredentialBroker(tmp_path, runner=other, clock=clock).credentials("ha", "asia-northeast3", "p")
+        assert other.calls[0][5:7] == ["--region", "asia-northeast3"]
+
+    def test_refresh_ahead_of_expiry(self, tmp_path):
+        """만료 전 선제 갱신 및 kubeconfig 재작성 테스트"""
+        clock = Clock()
+        gcloud = FakeGcloud(clock)
+        broker = CredentialBroker(tmp_path, refresh_margin=300, runner=gcloud, clock=clock)
+        path = broker.kubeconfig("c1", "asia-northeast3-a")
+        exec_path = broker.kubeconfig("c2", "asia-northeast3-a", exec_mode=True)
+
+        clock.now += 3000
+        assert broker.refresh_due() is False
+        assert broker.next_refresh_in() == 300
+
+        clock.now += 301
+        assert broker.refresh_due() is True
+        assert gcloud.count("config-helper") == 2
+        assert yaml.safe_load(path.read_text())["users"][0]["user"]["token"] == broker.token()["access_token"]
+        # exec 방식 kubeconfig는 토큰을 담지 않으므로 그대로
+        exec_user = yaml.safe_load(exec_path.read_text())["users"][0]["user"]
+        assert exec_user["exec"]["args"][-1] == "exec-credential"
+        assert broker.exec_credential()["status"]["token"] == broker.token()["access_token"]
+
+        broker.invalidate("c1", "asia-northeast3-a")
+        assert not path.exists()
+        broker.credentials("c1", "asia-northeast3-a")
+        assert gcloud.count("describe") == 3
+
+    def test_background_refresh(self, tmp_path):
+        """백그라운드 스레드 토큰 갱신 테스트"""
+        gcloud = FakeGcloud(time.time, lifetime=2.2)
+        broker = CredentialBroker(tmp_path, refresh_margin=2.0, runner=gcloud)
+        broker.credentials("c1", "asia-northeast3-a")
+        broker.start()
+        try:
+            deadline = time.time() + 5
+            while gcloud.count("config-helper") < 3 and time.time() < deadline:
+                time.sleep(0.05)
+        finally:
+            broker.stop()
+        assert gcloud.count("config-helper") >= 3
+
+    def test_course_uses_broker(self, tmp_path):
+        """과정 자동화가 get-credentials 대신 브로커 kubeconfig 사용 테스트"""
+        clock = Clock()
+        gcloud = FakeGcloud(clock)
+        broker = CredentialBroker(tmp_path / "credentials", runner=gcloud, clock=clock)
+        commands = []
+
+        def runner(command, **kwargs):
+            commands.append((command, (kwargs.get("env") or {}).get("KUBECONFIG")))
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        automation = ContainerCourseAutomation(tmp_path, config=CONFIG, runner=runner, credential_broker=broker)
+        assert automation.run_day1() is True
+
+        assert not any("get-credentials" in command for command, _ in commands)
+        kubeconfig = str(broker.kubeconfig_path(context_name("mcp-container-cluster", "asia-northeast3-a", "p")))
+        assert {env for command, env in commands if command[0] == "kubectl"} == {kubeconfig}
+
+        automation.cleanup_resources()
+        assert not broker.kubeconfig_path(context_name("mcp-container-cluster", "asia-northeast3-a", "p")).exists()
+
+    def test_course_token_expires_mid_run(self, tmp_path):
+        """실습 도중 토큰이 만료되어도 kubectl이 갱신된 토큰을 받는지 테스트"""
+        clock = Clock()
+        gcloud = FakeGcloud(clock, lifetime=600.0)
+        broker = CredentialBroker(tmp_path / "credentials", refresh_margin=60, runner=gcloud, clock=clock)
+        tokens = []
+
+        def runner(command, **kwargs):
+            if command[0] == "kubectl":
+                # kubectl은 kubeconfig의 exec 자격 증명 도우미(별도 프로세스)로 토큰을 받음
+                user = yaml.safe_load(open(kwargs["env"]["KUBECONFIG"]))["users"][0]["user"]
+                cache_dir = user["exec"]["args"][user["exec"]["args"].index("--cache-dir") + 1]
+                credential = CredentialBroker(cache_dir, refresh_margin=60, runner=gcloud, clock=clock).exec_credential()
+                expiry = datetime.strptime(credential["status"]["expirationTimestamp"], "%Y-%m-%dT%H:%M:%SZ")
+                tokens.append((credential["status"]["token"], expiry.replace(tzinfo=timezone.utc).timestamp(), clock.now))
+                # 명령마다 토큰 수명보다 오래 걸림
+                clock.now += 900
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        automation = ContainerCourseAutomation(tmp_path, config=CONFIG, runner=runner, credential_broker=broker)
+        assert automation.run_day1() is True
+        assert automation.run_day2() is True
+
+        assert len(tokens) >= 3
+        assert len({token for token, _, _ in tokens}) == len(tokens)
+        # 모든 kubectl 명령이 사용 시점에 유효한 토큰을 받음
+        assert all(expiry > used_at for _, expiry, used_at in tokens)
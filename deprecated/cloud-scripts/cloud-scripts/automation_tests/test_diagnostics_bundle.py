@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+클러스터 진단 번들 동시 수집 테스트
+"""
+
+import json
+import time
+import tarfile
+import threading
+import subprocess
+
+import pytest
+
+from .diagnostics_bundle import DiagnosticsCollector, CLUSTER_ITEMS, parse_size, main
+
+
+def _pod(namespace, name, ready=True, restarts=0, phase="Running"):
+    return {"metadata": {"namespace": namespace, "name": name},
+            "spec": {"containers": [{"name": "app"}]},
+            "status": {"phase": phase,
+                       "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+                       "containerStatuses": [{"name": "app", "restartCount": restarts}]}}
+
+
+class FakeKubectl:
+    """명령마다 latency초 걸리는 kubectl 대체 (노드 node_count개, 네임스페이스별 Pod)"""
+
+    def __init__(self, node_count=200, pods=(), latency=0.0, log_bytes=100):
+        self.latency = latency
+        self.log_bytes = log_bytes
+        self.nodes = [{"metadata": {"name": f"node-{i}"},
+                       "status": {"conditions": [{"type": "Ready", "status": "False" if i == 7 else "True"}]}}
+                      for i in range(node_count)]
+        self.pods = list(pods)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, command, env=None):
+        assert command[0] == "kubectl"
+        time.sleep(self.latency)
+        with self.lock:
+            self.calls.append(command[1:])
+        args = command[1:]
+        if args[:2] == ["get", "componentstatuses"]:
+            raise subprocess.CalledProcessError(1, command, stderr="Warning: v1 ComponentStatus is deprecated\n"
+                                                                   "error: the server doesn't have a resource type")
+        if args[:2] == ["get", "nodes"]:
+            return json.dumps({"items": self.nodes})
+        if args[:2] == ["get", "pods"]:
+            return json.dumps({"items": self.pods})
+        if args[:2] == ["get", "events"]:
+            return json.dumps({"items": [{"type": "Warning"}, {"type": "Normal"}, {"type": "Warning"}]})
+        if args[0] == "logs":
+            previous = "--previous" in args
+            return ("x" * self.log_bytes) + ("PREVIOUS-END" if previous else "LOG-END")
+        return f"{' '.join(args)}\n"
+
+
+def read_bundle(path):
+    with tarfile.open(path, "r:gz") as tar:
+        return {member.name: tar.extractfile(member).read() for member in tar.getmembers()}
+
+
+class TestDiagnosticsCollector:
+    """진단 번들 수집 테스트 클래스"""
+
+    def test_parse_size(self):
+        """크기 문자열 파싱 테스트"""
+        assert [parse_size(text) for text in ("200M", "4Mi", "1g", "512k", "1048576")] == [
+            200 * 1024 ** 2, 4 * 1024 ** 2, 1024 ** 3, 512 * 1024, 1048576]
+
+    def test_bundle_contents_and_index(self, tmp_path):
+        """클러스터 범위 항목, 네임스페이스별 describe, 문제 Pod 로그와 인덱스 테스트"""
+        pods = [_pod("web", "ok"), _pod("web", "crashing", ready=False, restarts=3),
+                _pod("batch", "done", ready=False, phase="Succeeded"), _pod("api", "flaky", restarts=1),
+                _pod("kube-system", "dns")]
+        kubectl = FakeKubectl(node_count=200, pods=pods)
+        report = DiagnosticsCollector(kubectl, max_workers=8).collect(tmp_path / "diag.tar.gz")
+
+        files = read_bundle(tmp_path / "diag.tar.gz")
+        index = json.loads(files["index.json"])
+        assert set(files) == {path for path, _ in CLUSTER_ITEMS if path != "cluster/componentstatuses.json"} | {
+            "namespaces/api/pods.describe.txt", "namespaces/batch/pods.describe.txt",
+            "namespaces/kube-system/pods.describe.txt", "namespaces/web/pods.describe.txt",
+            "namespaces/web/logs/crashing/app.log", "namespaces/web/logs/crashing/app.previous.log",
+            "namespaces/api/logs/flaky/app.log", "namespaces/api/logs/flaky/app.previous.log",
+            "index.json"}
+        assert ["logs", "-n", "web", "crashing", "-c", "app", "--tail=200", "--previous"] in kubectl.calls
+
+        assert index["summary"] == {"pods": 5, "unhealthy_pods": 1, "namespaces": 4, "logs": 4, "logs_omitted": 0,
+                                    "nodes": 200, "not_ready_nodes": ["node-7"], "warning_events": 2}
+        errors = [entry for entry in index["entries"] if entry["error"]]
+        assert [entry["path"] for entry in errors] == ["cluster/componentstatuses.json"]
+        assert "doesn't have a resource type" in errors[0]["error"]
+        assert len(report.entries) == len(index["entries"]) == 16
+        assert report.bytes_written == (tmp_path / "diag.tar.gz").stat().st_size
+
+    def test_concurrent_collection(self, tmp_path):
+        """명령을 동시에 실행해 순차 실행보다 훨씬 빠른지 테스트"""
+        pods = [_pod(f"ns-{i % 20}", f"pod-{i}", ready=i % 10 != 0) for i in range(400)]
+        kubectl = FakeKubectl(pods=pods, latency=0.05)
+
+        started = time.monotonic()
+        report = DiagnosticsCollector(kubectl, max_workers=32).collect(tmp_path / "diag.tar.gz")
+        elapsed = time.monotonic() - started
+
+        # 8(클러스터) + 20(describe) + 40(로그) = 68개 명령, 순차 실행이면 3.4초
+        assert len(kubectl.calls) == 68 and not report.skipped
+        assert elapsed < 1.0
+
+    def test_size_caps(self, tmp_path):
+        """항목 크기 제한(로그는 뒷부분 유지)과 번들 전체 크기 제한 테스트"""
+        pods = [_pod("web", f"bad-{i}", ready=False) for i in range(10)]
+        kubectl = FakeKubectl(node_count=3, pods=pods, log_bytes=5000)
+        collector = DiagnosticsCollector(kubectl, namespaces=["web"], max_entry_bytes=1000, max_bytes=6000,
+                                         max_logs=6, max_workers=1)
+        report = collector.collect(tmp_path / "diag.tar.gz")
+
+        files = read_bundle(tmp_path / "diag.tar.gz")
+        logs = [name for name in files if name.endswith(".log")]
+        assert logs and all(files[name].endswith(b"LOG-END") and len(files[name]) == 1000 for name in logs)
+        assert report.skipped and sum(len(data) for name, data in files.items() if name != "index.json") <= 6000
+        index = json.loads(files["index.json"])
+        assert index["summary"]["logs_omitted"] == 4
+        assert all(entry["truncated"] for entry in index["entries"] if entry["path"].endswith(".log"))
+
+    def test_cli_reports_unreachable_cluster(self, tmp_path, monkeypatch):
+        """클러스터에 전혀 연결할 수 없으면 실패 코드 반환 테스트"""
+        def unreachable(command, **kwargs):
+            raise subprocess.CalledProcessError(1, command, stderr="Unable to connect to the server")
+        monkeypatch.setattr(subprocess, "run", unreachable)
+
+        assert main(["-o", str(tmp_path / "diag.tar.gz")]) == 1
+        assert "index.json" in read_bundle(tmp_path / "diag.tar.gz")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+라벨 기반 Docker 리소스 일괄 정리 테스트
+"""
+
+import json
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+from .docker_cleanup import DockerCleanup, EngineClient, EngineError, course_labels, label_args, format_bytes
+
+
+class FakeEngine:
+    """prune/목록/kill 엔드포인트만 구현한 Docker Engine API 대체 (유닉스 소켓)"""
+
+    def __init__(self, api_version="1.43"):
+        self.api_version = api_version
+        self.objects = {"containers": [], "images": [], "volumes": [], "networks": []}
+        self.requests = []
+        self.connections = 0
+
+    def add(self, kind, name, labels, size=0, running=False, in_use=False):
+        self.objects[kind].append({"Id": name, "Labels": labels, "Size": size,
+                                   "State": "running" if running else "exited", "InUse": in_use})
+
+    @staticmethod
+    def _matches(item, filters):
+        labels = item["Labels"]
+        return all(labels.get(key) == value for key, _, value in
+                   (label.partition("=") for label in filters.get("label", [])))
+
+    def _prune(self, kind, filters):
+        removed, kept = [], []
+        for item in self.objects[kind]:
+            busy = item["State"] == "running" or item["InUse"]
+            if kind == "volumes" and filters.get("all") != ["true"] and not item["Id"].startswith("anon"):
+                busy = True
+            (kept if busy or not self._matches(item, filters) else removed).append(item)
+        self.objects[kind] = kept
+        return removed
+
+    def handle(self, method, path, query):
+        self.requests.append((method, path))
+        filters = json.loads(query.get("filters", ["{}"])[0])
+        if path == "/version":
+            return 200, {"ApiVersion": self.api_version}
+        prefix = f"/v{self.api_version}"
+        assert path.startswith(prefix), path
+        path = path[len(prefix):]
+        if path == "/containers/json":
+            states = filters.get("status", ["running"])
+            return 200, [{"Id": c["Id"]} for c in self.objects["containers"]
+                         if c["State"] in states and self._matches(c, filters)]
+        if path.startswith("/containers/") and path.endswith("/kill"):
+            container = next((c for c in self.objects["containers"] if c["Id"] == path.split("/")[2]), None)
+            if container is None:
+                return 404, {"message": "No such container"}
+            container["State"] = "exited"
+            return 204, None
+        kind = path.split("/")[1]
+        if kind == "volumes" and "until" in filters:
+            return 400, {"message": "invalid filter 'until'"}
+        removed = self._prune(kind, filters)
+        key = {"containers": "ContainersDeleted", "images": "ImagesDeleted",
+               "volumes": "VolumesDeleted", "networks": "NetworksDeleted"}[kind]
+        if kind == "images":
+            deleted = [entry for item in removed for entry in ({"Untagged": item["Id"]}, {"Deleted": item["Id"]})]
+        else:
+            deleted = [item["Id"] for item in removed]
+        result = {key: deleted}
+        if kind != "networks":
+            result["SpaceReclaimed"] = sum(item["Size"] for item in removed)
+        return 200, result
+
+
+@pytest.fixture
+def engine(tmp_path):
+    fake = FakeEngine()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            fake.connections += 1
+
+        def _respond(self):
+            url = urlparse(self.path)
+            status, body = fake.handle(self.command, url.path, parse_qs(url.query))
+            data = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = _respond
+
+        def log_message(self, format, *args):
+            pass
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    socket_path = tmp_path / "docker.sock"
+    server = Server(str(socket_path), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fake.url = f"unix://{socket_path}"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+class TestDockerCleanup:
+    """Docker 일괄 정리 테스트 클래스"""
+
+    def test_labels(self):
+        """생성 시점에 붙일 과정 라벨 테스트"""
+        assert course_labels("container", 1) == {"mcp.course": "container", "mcp.day": "1"}
+        assert label_args("container") == ["--label", "mcp.course=container"]
+        assert [format_bytes(n) for n in (512, 1536, 5 * 1024 ** 3)] == ["512B", "1.5KiB", "5.0GiB"]
+
+    def test_bulk_prune_over_single_connection(self, engine):
+        """수천 개 객체를 라벨 필터 prune 몇 번으로 정리하고, 한 연결만 쓰는지 테스트"""
+        day1 = {"mcp.course": "container", "mcp.day": "1"}
+        for i in range(2000):
+            engine.add("containers", f"c{i}", day1, size=1024, running=i < 3)
+        for i in range(500):
+            engine.add("images", f"img{i}", day1, size=1024 ** 2)
+        engine.add("volumes", "data", day1, size=4096)
+        engine.add("volumes", "anon1", day1, size=4096)
+        engine.add("networks", "course-net", day1)
+        # 다른 과정/다른 일차/라벨 없는 객체는 남아야 함
+        engine.add("containers", "other", {"mcp.course": "master"})
+        engine.add("images", "day2", {"mcp.course": "container", "mcp.day": "2"}, size=10)
+        engine.add("volumes", "unlabeled", {}, size=10)
+
+        client = EngineClient(engine.url)
+        report = DockerCleanup("container", 1, client=client, kill_running=True).run()
+
+        assert report.ok, report.errors
+        assert report.killed == 3
+        assert report.removed == {"containers": 2000, "networks": 1, "volumes": 2, "images": 500}
+        assert report.bytes_reclaimed == 2000 * 1024 + 500 * 1024 ** 2 + 2 * 4096
+        assert [item["Id"] for kind in ("containers", "images", "volumes") for item in engine.objects[kind]] == [
+            "other", "day2", "unlabeled"]
+        # 버전 확인 1 + 실행 중 목록 1 + kill 3 + prune 4
+        assert report.requests == 9 and engine.connections == 1 and client.connections == 1
+        assert "회수 502.0MiB" in report.summary()
+
+    def test_options_and_errors(self, engine):
+        """기본값으로 실행 중 컨테이너 유지, 이전 API 버전, 단계별 오류 보고 테스트"""
+        engine.api_version = "1.41"
+        labels = {"mcp.course": "container"}
+        engine.add("containers", "running", labels, running=True)
+        engine.add("volumes", "named", labels, size=10)
+        engine.add("volumes", "anon1", labels, size=10)
+
+        report = DockerCleanup("container", client=EngineClient(engine.url), until="24h").run()
+        assert report.killed == 0 and engine.objects["containers"][0]["Id"] == "running"
+        assert ("GET", "/v1.41/containers/json") not in engine.requests
+        # until은 볼륨 prune에 넘기지 않고, 1.42 미만에서는 all 필터 없이 익명 볼륨만 삭제
+        assert report.removed["volumes"] == 1 and report.ok
+
+        with pytest.raises(EngineError) as error:
+            EngineClient(engine.url).request("POST", "/containers/missing/kill")
+        assert error.value.status == 404
+
+    def test_daemon_unreachable(self, tmp_path):
+        """Docker 데몬에 연결할 수 없으면 한 번만 보고하는지 테스트"""
+        report = DockerCleanup("container", client=EngineClient(f"unix://{tmp_path}/missing.sock")).run()
+        assert not report.ok and len(report.errors) == 1
+        assert report.errors[0].startswith("Docker 데몬 연결 실패")
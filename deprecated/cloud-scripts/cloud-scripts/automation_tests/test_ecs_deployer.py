@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+ECS 태스크 정의 내용 주소 등록 및 서비스 동시 롤아웃 테스트
+"""
+
+import copy
+import time
+import threading
+
+import pytest
+
+from .ecs_deployer import (EcsDeployer, ServiceSpec, SteadyStateWatcher, DIGEST_TAG, normalize_task_definition,
+                           task_definition_digest)
+
+TASK_DEFINITION = {
+    "family": "container-course-task",
+    "networkMode": "awsvpc",
+    "requiresCompatibilities": ["FARGATE"],
+    "cpu": "256",
+    "memory": "512",
+    "containerDefinitions": [{
+        "name": "nginx",
+        "image": "nginx:1.21",
+        "portMappings": [{"containerPort": 80, "protocol": "tcp"}],
+        "environment": [{"name": "B", "value": "2"}, {"name": "A", "value": "1"}],
+        "essential": True,
+    }],
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeEcs:
+    """테스트에 필요한 ECS API만 구현한 메모리 대체 (조회할 때마다 롤아웃이 한 단계씩 진행)"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.revisions = []   # (arn, 정의, 태그)
+        self.services = {}
+        self.writes = []
+
+    def _write(self, name):
+        time.sleep(self.latency)
+        with self.lock:
+            self.writes.append(name)
+
+    def register_task_definition(self, tags=(), **definition):
+        self._write("register_task_definition")
+        with self.lock:
+            revision = sum(1 for arn, _, _ in self.revisions if f"/{definition['family']}:" in arn) + 1
+            arn = f"arn:aws:ecs:ap-northeast-2:123:task-definition/{definition['family']}:{revision}"
+            self.revisions.append((arn, definition, list(tags)))
+        return {"taskDefinition": {**definition, "taskDefinitionArn": arn, "revision": revision}}
+
+    def list_task_definitions(self, familyPrefix, status, sort, nextToken=None):
+        arns = [arn for arn, _, _ in reversed(self.revisions)
+                if arn.rsplit("/", 1)[-1].startswith(familyPrefix)]
+        return {"taskDefinitionArns": arns}
+
+    def describe_task_definition(self, taskDefinition, include=()):
+        arn, definition, tags = next(item for item in self.revisions if item[0] == taskDefinition)
+        return {"taskDefinition": {**definition, "taskDefinitionArn": arn}, "tags": tags if "TAGS" in include else []}
+
+    def create_service(self, cluster, serviceName, taskDefinition, desiredCount, launchType, networkConfiguration):
+        self._write("create_service")
+        self.services[serviceName] = {"serviceName": serviceName, "status": "ACTIVE", "taskDefinition": taskDefinition,
+                                      "desiredCount": desiredCount, "runningCount": 0,
+                                      "deployments": [{"status": "PRIMARY", "rolloutState": "IN_PROGRESS"}]}
+
+    def update_service(self, cluster, service, taskDefinition, desiredCount=None):
+        self._write(f"update_service:{service}")
+        current = self.services[service]
+        current["taskDefinition"] = taskDefinition
+        if desiredCount is not None:
+            current["desiredCount"] = desiredCount
+        current["deployments"] = [{"status": "PRIMARY", "rolloutState": "IN_PROGRESS"}, {"status": "ACTIVE"}]
+        current["runningCount"] = 0
+
+    def describe_services(self, cluster, services):
+        found, failures = [], []
+        for name in services:
+            service = self.services.get(name)
+            if service is None:
+                failures.append({"arn": f"arn:aws:ecs:ap-northeast-2:123:service/{cluster}/{name}",
+                                 "reason": "MISSING"})
+                continue
+            found.append(copy.deepcopy(service))
+            # 다음 조회 때는 태스크 하나가 더 떠 있고, 다 뜨면 이전 배포가 정리됨
+            if service["runningCount"] < service["desiredCount"]:
+                service["runningCount"] += 1
+            else:
+                service["deployments"] = service["deployments"][:1]
+                service["deployments"][0]["rolloutState"] = "COMPLETED"
+        return {"services": found, "failures": failures}
+
+    def add_service(self, name, task_definition, desired_count=2):
+        self.services[name] = {"serviceName": name, "status": "ACTIVE", "taskDefinition": task_definition,
+                               "desiredCount": desired_count, "runningCount": desired_count,
+                               "deployments": [{"status": "PRIMARY", "rolloutState": "COMPLETED"}]}
+
+
+def deployer(client, clock=None, **kwargs):
+    clock = clock or Clock()
+    watcher = SteadyStateWatcher(client, "course", initial_delay=1.0, max_delay=8.0, clock=clock, sleep=clock.sleep)
+    return EcsDeployer("course", client=client, watcher=watcher, **kwargs)
+
+
+class TestTaskDefinitionDigest:
+    """태스크 정의 정규화 및 해시 테스트 클래스"""
+
+    def test_equivalent_definitions_share_digest(self):
+        """필드/목록 순서, 숫자 표기, 응답 전용 필드가 달라도 같은 해시인지 테스트"""
+        reordered = copy.deepcopy(TASK_DEFINITION)
+        reordered["cpu"], reordered["memory"] = 256, 512
+        container = reordered["containerDefinitions"][0]
+        container["environment"].reverse()
+        container["portMappings"] = [{"containerPort": 80}]
+        container["mountPoints"] = []
+        described = {**reordered, "taskDefinitionArn": "arn:...:7", "revision": 7, "status": "ACTIVE",
+                     "compatibilities": ["EC2", "FARGATE"]}
+
+        assert task_definition_digest(reordered) == task_definition_digest(TASK_DEFINITION)
+        assert task_definition_digest(described) == task_definition_digest(TASK_DEFINITION)
+        assert normalize_task_definition(reordered)["containerDefinitions"][0]["environment"][0]["name"] == "A"
+
+    def test_meaningful_changes_change_digest(self):
+        """이미지나 명령 순서가 바뀌면 다른 해시인지 테스트"""
+        changed = copy.deepcopy(TASK_DEFINITION)
+        changed["containerDefinitions"][0]["image"] = "nginx:1.25"
+        assert task_definition_digest(changed) != task_definition_digest(TASK_DEFINITION)
+
+        first, second = copy.deepcopy(TASK_DEFINITION), copy.deepcopy(TASK_DEFINITION)
+        first["containerDefinitions"][0]["command"] = ["nginx", "-g", "daemon off;"]
+        second["containerDefinitions"][0]["command"] = ["-g", "nginx", "daemon off;"]
+        assert task_definition_digest(first) != task_definition_digest(second)
+
+
+class TestEcsDeployer:
+    """ECS 배포 엔진 테스트 클래스"""
+
+    def test_register_reuses_matching_revision(self):
+        """같은 내용이면 리비전을 재사용하고, 바뀌면 새로 등록하는지 테스트"""
+        client = FakeEcs()
+        engine = deployer(client)
+
+        arn, digest, reused = engine.register(TASK_DEFINITION)
+        assert arn.endswith(":1") and not reused
+        assert client.revisions[0][2] == [{"key": DIGEST_TAG, "value": digest}]
+        assert engine.register(copy.deepcopy(TASK_DEFINITION)) == (arn, digest, True)
+
+        changed = copy.deepcopy(TASK_DEFINITION)
+        changed["containerDefinitions"][0]["image"] = "nginx:1.25"
+        assert engine.register(changed)[0].endswith(":2")
+        # 이전 내용으로 되돌리면 최신이 아닌 리비전도 재사용
+        assert engine.register(TASK_DEFINITION)[0] == arn
+        assert client.writes.count("register_task_definition") == 2
+
+    def test_unchanged_services_are_not_redeployed(self):
+        """이미 같은 리비전으로 실행 중인 서비스는 업데이트하지 않는지 테스트"""
+        client = FakeEcs()
+        engine = deployer(client)
+        arn = engine.register(TASK_DEFINITION)[0]
+        client.add_service("web", arn)
+
+        report = engine.deploy(TASK_DEFINITION, [ServiceSpec("web", desired_count=2)])
+        assert report.ok and report.reused
+        assert report.services["web"].action == "unchanged"
+        assert client.writes == ["register_task_definition"]
+
+    def test_parallel_rollout_waits_for_steady_state(self):
+        """여러 서비스 동시 업데이트, 백오프 감시로 안정 상태 대기 테스트"""
+        client = FakeEcs(latency=0.2)
+        clock = Clock()
+        engine = deployer(client, clock)
+        old = engine.register({**TASK_DEFINITION, "memory": "1024"})[0]
+        for name in ("api", "web", "worker", "admin"):
+            client.add_service(name, old)
+
+        started = time.monotonic()
+        report = engine.deploy(TASK_DEFINITION, [ServiceSpec(name, 3) for name in ("api", "web", "worker", "admin")]
+                               + [ServiceSpec("batch", 1, subnets=("subnet-1",), security_groups=("sg-1",))])
+        elapsed = time.monotonic() - started
+
+        # 쓰기 호출 6번(등록 1 + 업데이트 4 + 생성 1)이 순차였다면 1.2초 이상
+        assert elapsed < 0.9
+        assert report.ok and not report.reused
+        assert {name: result.action for name, result in report.services.items()} == {
+            "api": "updated", "web": "updated", "worker": "updated", "admin": "updated", "batch": "created"}
+        assert all(service["taskDefinition"] == report.task_definition for service in client.services.values())
+        # 태스크 수가 늘어나는 동안에는 짧은 간격 유지
+        assert clock.sleeps[:3] == [1.0, 1.0, 1.0]
+        assert report.services["api"].seconds == 4.0
+
+    def test_failures_are_reported_per_service(self):
+        """생성 정보가 없는 서비스, 롤아웃 실패, 시간 초과가 서비스별로 보고되는지 테스트"""
+        client = FakeEcs()
+        clock = Clock()
+        engine = deployer(client, clock)
+        engine.watcher.timeout = 20.0
+        arn = engine.register(TASK_DEFINITION)[0]
+        client.add_service("stuck", arn, desired_count=2)
+        client.services["stuck"]["runningCount"] = 0
+        client.services["stuck"]["desiredCount"] = 2
+        client.add_service("broken", "old")
+        # 태스크가 계속 뜨지 않는 서비스
+        original = client.describe_services
+
+        def describe_services(cluster, services):
+            client.services["stuck"]["runningCount"] = 0
+            response = original(cluster, services)
+            for service in response["services"]:
+                if service["serviceName"] == "broken" and service["taskDefinition"] == arn:
+                    service["deployments"][0]["rolloutState"] = "FAILED"
+            return response
+        client.describe_services = describe_services
+
+        report = engine.deploy(TASK_DEFINITION, [ServiceSpec("missing"), ServiceSpec("stuck"), ServiceSpec("broken")])
+        assert not report.ok
+        assert "서브넷" in report.services["missing"].error
+        assert report.services["broken"].error == "안정 상태 도달 실패: failed"
+        assert report.services["stuck"].error == "안정 상태 도달 실패: timeout"
+        # 변화가 없으면 간격이 늘어나되 상한과 남은 시간을 넘지 않음
+        assert clock.sleeps == [1.0, 1.5, 2.25, 3.375, 5.0625, 6.8125]
+        assert report.summary().startswith("container-course-task:1 (재사용)")
+
+
+def test_against_moto():
+    """moto ECS 대체 환경에서 등록 재사용과 서비스 생성/업데이트 테스트"""
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    mock = getattr(moto, "mock_aws", None) or getattr(moto, "mock_ecs")
+
+    with mock():
+        client = boto3.client("ecs", region_name="ap-northeast-2")
+        client.create_cluster(clusterName="course")
+        engine = EcsDeployer("course", client=client)
+        spec = ServiceSpec("web", 1, subnets=("subnet-1",), security_groups=("sg-1",))
+
+        first = engine.deploy(TASK_DEFINITION, [spec], wait=False)
+        second = engine.deploy(copy.deepcopy(TASK_DEFINITION), [spec], wait=False)
+        assert first.ok and not first.reused and first.services["web"].action == "created"
+        assert second.reused and second.task_definition == first.task_definition
+        assert second.services["web"].action == "unchanged"
+        revisions = client.list_task_definitions(familyPrefix="container-course-task")["taskDefinitionArns"]
+        assert len(revisions) == 1
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+kubectl 스트리밍 파서 및 상태 집계 테스트
+"""
+
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from .kubectl_stream import (stream_items, select, project, kubectl_items, KubectlError, PodAggregate,
+                             NodeAggregate)
+
+
+def make_pod(i, namespace=None, ready=True, phase="Running", restarts=0):
+    return {
+        "apiVersion": "v1", "kind": "Pod",
+        "metadata": {"name": f"web-{i}", "namespace": namespace or f"ns-{i % 3}",
+                     "labels": {"app": "web"}, "annotations": {"note": "x" * 200}},
+        "spec": {"containers": [{"name": "web", "image": "nginx:1.25"}, {"name": "sidecar", "image": "envoy"}]},
+        "status": {"phase": phase,
+                   "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+                   "containerStatuses": [{"name": "web", "restartCount": restarts},
+                                         {"name": "sidecar", "restartCount": 0}]},
+    }
+
+
+def pod_list(pods):
+    return json.dumps({"apiVersion": "v1", "kind": "List", "items": pods,
+                       "metadata": {"resourceVersion": "123"}}, indent=2)
+
+
+class LazyListing(io.RawIOBase):
+    """Pod 목록 JSON을 미리 만들지 않고 읽는 만큼 생성하는 스트림"""
+
+    def __init__(self, count):
+        self.parts = self._parts(count)
+        self.pending = ""
+
+    @staticmethod
+    def _parts(count):
+        yield '{"apiVersion": "v1", "items": ['
+        for i in range(count):
+            yield ("," if i else "") + json.dumps(make_pod(i, ready=i % 50 != 0, restarts=i % 997))
+        yield '], "kind": "List", "metadata": {"resourceVersion": ""}}'
+
+    def read(self, size=-1):
+        while len(self.pending) < size:
+            part = next(self.parts, None)
+            if part is None:
+                break
+            self.pending += part
+        chunk, self.pending = self.pending[:size], self.pending[size:]
+        return chunk
+
+
+class FakePopen:
+    """subprocess.Popen 대체 (stdout 문자열과 종료 코드)"""
+
+    def __init__(self, output, returncode=0, error=""):
+        self.output, self.returncode, self.error = output, returncode, error
+        self.commands = []
+
+    def __call__(self, command, stdout=None, stderr=None, text=None, env=None):
+        self.commands.append(command)
+        stderr.write(self.error.encode())
+        self.stdout = io.StringIO(self.output)
+        return self
+
+    def wait(self):
+        return self.returncode
+
+
+class TestStreamItems:
+    """스트리밍 파서 테스트 클래스"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_matches_json_loads(self, chunk_size):
+        """청크 경계와 무관하게 json.loads와 같은 객체 생성 테스트"""
+        pods = [make_pod(i, restarts=i * 1234567) for i in range(40)]
+        pods.append({"kind": "Pod", "metadata": {"name": "unicode-é", "uid": 12.5e3}, "spec": None,
+                     "status": {"flag": False, "list": [[], {}, "a\"]}"]}})
+        text = pod_list(pods)
+
+        assert list(stream_items(io.StringIO(text), chunk_size)) == pods
+        # 단일 객체, 빈 목록, 이어 붙은 watch 출력
+        assert list(stream_items(io.StringIO(json.dumps(pods[0])), chunk_size)) == [pods[0]]
+        assert list(stream_items(io.StringIO('{"items": [], "kind": "List"}'), chunk_size)) == []
+        watch = json.dumps(pods[1]) + "\n" + json.dumps(pods[2])
+        assert list(stream_items(io.StringIO(watch), chunk_size)) == pods[1:3]
+
+        with pytest.raises(ValueError):
+            list(stream_items(io.StringIO(text[:-30]), chunk_size))
+
+    def test_constant_memory(self):
+        """수 MB 목록을 목록 크기와 무관한 메모리로 집계 테스트"""
+        tracemalloc.start()
+        try:
+            aggregate = PodAggregate(top=5).consume(stream_items(LazyListing(5000)))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert aggregate.total == 5000 and aggregate.not_ready == 100
+        assert peak < 1024 * 1024
+        assert [restarts for _, restarts in aggregate.hot_spots] == [996] * 5
+        assert aggregate.hot_spots[0][0] == "ns-0/web-996:web"
+
+    def test_select_and_project(self):
+        """필드 선택 경로 테스트"""
+        pod = make_pod(1, restarts=3)
+        assert select(pod, "metadata.name") == "web-1"
+        assert select(pod, "status.containerStatuses[*].restartCount") == [3, 0]
+        assert select(pod, "spec.containers[1].image") == "envoy"
+        assert select(pod, "spec.containers[5].image") is None
+        assert select(pod, "status.missing.field") is None
+
+        rows = list(project(stream_items(io.StringIO(pod_list([pod]))), ["metadata.namespace", "status.phase"]))
+        assert rows == [{"metadata.namespace": "ns-1", "status.phase": "Running"}]
+
+
+class TestAggregates:
+    """상태 집계 테스트 클래스"""
+
+    def test_pod_aggregate(self):
+        """네임스페이스별 준비 상태, 완료 Job, 재시작 상위 집계 테스트"""
+        pods = [make_pod(1, "prod"), make_pod(2, "prod", ready=False, phase="Pending"),
+                make_pod(3, "prod", restarts=7), make_pod(4, "batch", ready=False, phase="Succeeded"),
+                make_pod(5, "batch", ready=False, phase="Running", restarts=2)]
+        aggregate = PodAggregate(top=2).consume(pods)
+        result = aggregate.to_dict()
+
+        assert result["namespaces"]["prod"] == {"ready": 2, "not_ready": 1, "completed": 0, "restarts": 7,
+                                                "phases": {"Running": 2, "Pending": 1}}
+        assert result["namespaces"]["batch"]["completed"] == 1
+        assert aggregate.not_ready == 2
+        assert aggregate.not_ready_samples == ["prod/web-2 (Pending)", "batch/web-5 (Running)"]
+        assert aggregate.hot_spots == [("prod/web-3:web", 7), ("batch/web-5:web", 2)]
+        assert "batch" in aggregate.report().splitlines()[1]
+
+    def test_node_aggregate_and_kubectl(self):
+        """kubectl 실행 및 노드 집계, 실패 종료 코드 테스트"""
+        nodes = [{"metadata": {"name": f"n{i}"}, "spec": {"unschedulable": i == 2},
+                  "status": {"conditions": [{"type": "Ready", "status": "True" if i else "Unknown"},
+                                            {"type": "MemoryPressure", "status": "True" if i == 1 else "False"}]}}
+                 for i in range(3)]
+        popen = FakePopen(pod_list(nodes))
+        aggregate = NodeAggregate().consume(kubectl_items("nodes", popen=popen))
+
+        assert popen.commands == [["kubectl", "get", "nodes", "-o", "json"]]
+        assert aggregate.to_dict() == {"ready": 2, "not_ready": ["n0"], "unschedulable": 1,
+                                       "pressure": {"MemoryPressure": 1}}
+
+        list(kubectl_items("pods", namespace="prod", selector="app=web", popen=popen))
+        assert popen.commands[-1][4:] == ["json", "-n", "prod", "-l", "app=web"]
+
+        failing = FakePopen("", returncode=1, error="error: You must be logged in to the server")
+        with pytest.raises(KubectlError, match="logged in"):
+            list(kubectl_items("pods", all_namespaces=True, popen=failing))
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+API 서버 및 클러스터 내부 지연 시간 측정 테스트
+"""
+
+import io
+import json
+import time
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from .latency_probe import (LatencyHistogram, ControlPlaneProbe, InClusterProbe, ProbeError, kubectl_proxy,
+                            parse_probe_output, probe_script)
+
+
+@pytest.fixture
+def api_server():
+    """discovery/list는 지연 후 응답, watch는 헤더만 보내고 스트림 유지하는 API 서버 대체"""
+    state = {"connections": 0, "requests": [], "delay": {"/apis": 0.01, "/api/v1": 0.03}}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK 대기 방지
+
+        def setup(self):
+            super().setup()
+            state["connections"] += 1
+
+        def do_GET(self):
+            state["requests"].append(self.path)
+            if "watch=1" in self.path:
+                self.send_response(200)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                self.wfile.flush()
+                time.sleep(0.2)  # 이벤트 스트림 (측정은 헤더까지만)
+                return
+            if self.path.startswith("/forbidden"):
+                self.send_error(403)
+                return
+            time.sleep(next(delay for prefix, delay in state["delay"].items() if self.path.startswith(prefix)))
+            body = json.dumps({"items": []}).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestLatencyHistogram:
+    """지연 시간 히스토그램 테스트 클래스"""
+
+    def test_percentiles_and_buckets(self):
+        """백분위수, 버킷 집계, 텍스트 렌더링 테스트"""
+        histogram = LatencyHistogram("list")
+        for ms in [1] * 50 + [8] * 40 + [45] * 9 + [7000]:
+            histogram.observe(ms / 1000)
+        histogram.error()
+
+        stats = histogram.to_dict()
+        assert (stats["p50_ms"], stats["p90_ms"], stats["p99_ms"], stats["max_ms"]) == (1.0, 8.0, 45.0, 7000.0)
+        assert stats["buckets_ms"]["<=1"] == 50 and stats["buckets_ms"]["<=10"] == 40
+        assert stats["buckets_ms"]["<=50"] == 9 and stats["buckets_ms"]["+Inf"] == 1
+        assert stats["errors"] == 1
+
+        lines = histogram.render(width=10).splitlines()
+        assert lines[0].startswith("list: n=100 오류=1 p50=1.0ms")
+        assert lines[1].split() == ["<=1ms", "50", "█" * 10]
+        assert lines[-1].split() == [">5000ms", "1", "█"]
+        assert LatencyHistogram("empty").render() == "empty: n=0 오류=0 p50=0.0ms p90=0.0ms p99=0.0ms max=0.0ms"
+
+
+class TestControlPlaneProbe:
+    """컨트롤 플레인 측정 테스트 클래스"""
+
+    def test_discovery_list_watch(self, api_server):
+        """항목별 샘플 수, 지연 분포, watch 수립 시간(스트림 대기 제외), 연결 재사용 테스트"""
+        probe = ControlPlaneProbe(api_server["url"], samples=12, concurrency=3)
+        histograms = probe.run()
+
+        assert {name: len(h.samples) for name, h in histograms.items()} == {"discovery": 12, "list": 12, "watch": 12}
+        assert 0.01 <= histograms["discovery"].percentile(0.5) < 0.03
+        assert 0.03 <= histograms["list"].percentile(0.5) < 0.1
+        # 서버는 watch 스트림을 0.2초 유지하지만 측정은 응답 헤더까지
+        assert histograms["watch"].percentile(0.99) < 0.1
+        # discovery/list는 스레드별 keep-alive (항목마다 스레드 3개), watch는 샘플마다 새 연결
+        assert api_server["connections"] == 3 + 3 + 12
+
+    def test_errors_are_counted(self, api_server):
+        """HTTP 오류와 연결 실패가 샘플 대신 오류로 집계되는지 테스트"""
+        probe = ControlPlaneProbe(api_server["url"], samples=4, concurrency=2)
+        histograms = probe.run([("forbidden", "/forbidden", False)])
+        assert histograms["forbidden"].errors == 4 and not histograms["forbidden"].samples
+
+        closed = ControlPlaneProbe("http://127.0.0.1:9", samples=2, concurrency=1, timeout=1)
+        assert closed.run([("discovery", "/apis", False)])["discovery"].errors == 2
+
+    def test_kubectl_proxy(self):
+        """kubectl proxy 출력에서 주소를 읽고 종료 시 정리하는지 테스트"""
+        class FakeProcess:
+            def __init__(self, line):
+                self.stdout = io.StringIO(line)
+                self.terminated = False
+
+            def terminate(self):
+                self.terminated = True
+
+            def wait(self, timeout=None):
+                return 0
+
+        process = FakeProcess("Starting to serve on 127.0.0.1:43211\n")
+        with kubectl_proxy(popen=lambda command, **kwargs: process) as base_url:
+            assert base_url == "http://127.0.0.1:43211"
+        assert process.terminated
+
+        failed = FakeProcess("error: unable to load kubeconfig\n")
+        with pytest.raises(ProbeError, match="unable to load kubeconfig"):
+            with kubectl_proxy(popen=lambda command, **kwargs: failed):
+                pass
+        assert failed.terminated
+
+
+class TestInClusterProbe:
+    """클러스터 내부 측정 테스트 클래스"""
+
+    def test_probe_pod_lifecycle_and_parsing(self):
+        """프로브 Pod 실행/대기/로그/삭제 순서와 DNS/연결/요청 히스토그램 테스트"""
+        calls = []
+        output = "\n".join(["OK 0.004 0.005 0.012"] * 9 + ["ERR 0.000 0.000 10.001", "OK 0.1 0.1 0.1"])
+
+        def runner(command, env=None):
+            calls.append(command)
+            return output if command[3] == "logs" else ""
+
+        probe = InClusterProbe(runner, namespace="diag", samples=10, concurrency=4)
+        histograms = probe.run()
+
+        assert [command[3] for command in calls] == ["run", "wait", "logs", "delete"]
+        assert calls[0][:5] == ["kubectl", "-n", "diag", "run", probe.pod]
+        assert calls[0][-1] == probe_script(probe.url, 10, 4)
+        assert {name: (len(h.samples), h.errors) for name, h in histograms.items()} == {
+            "dns": (9, 1), "service_connect": (9, 1), "service_request": (9, 1)}
+        assert histograms["dns"].percentile(0.5) == pytest.approx(0.004)
+        assert histograms["service_connect"].percentile(0.5) == pytest.approx(0.001)
+        assert histograms["service_request"].percentile(0.5) == pytest.approx(0.008)
+
+    def test_probe_pod_failure_still_deletes(self):
+        """프로브 Pod가 완료되지 않아도 삭제하고 ProbeError를 내는지 테스트"""
+        calls = []
+
+        def runner(command, env=None):
+            calls.append(command[3])
+            if command[3] == "wait":
+                raise subprocess.CalledProcessError(1, command, stderr="error: timed out waiting for the condition")
+            return ""
+
+        with pytest.raises(ProbeError, match="timed out"):
+            InClusterProbe(runner).run()
+        assert calls == ["run", "wait", "delete"]
+
+    def test_probe_script(self):
+        """워커별 샘플 수와 URL 인용 테스트"""
+        script = probe_script("http://web.prod.svc/healthz?x=1&y=2", samples=10, concurrency=4)
+        assert "while [ $i -lt 3 ]" in script and "for w in $(seq 4)" in script
+        assert "'http://web.prod.svc/healthz?x=1&y=2'" in script
+        assert len(parse_probe_output("OK 1 2 3\n" * 12, limit=10)["dns"].samples) == 10
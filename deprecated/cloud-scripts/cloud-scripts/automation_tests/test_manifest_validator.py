@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+매니페스트 오프라인 스키마 검증 테스트
+"""
+
+import json
+import multiprocessing
+import pytest
+
+from .manifest_validator import (SchemaRegistry, ManifestSource, load_registry, validate_source, validate_all,
+                                 extract_heredocs, course_manifests)
+from .sample_manifests import sample_app_manifest
+
+META = "io.k8s.apimachinery.pkg.apis.meta.v1."
+CORE = "io.k8s.api.core.v1."
+APPS = "io.k8s.api.apps.v1."
+
+
+def ref(name):
+    return {"$ref": f"#/definitions/{name}"}
+
+
+# 실제 swagger.json과 같은 구조의 축약 스키마
+DEFINITIONS = {
+    META + "ObjectMeta": {"type": "object", "properties": {
+        "name": {"type": "string"}, "namespace": {"type": "string"},
+        "labels": {"type": "object", "additionalProperties": {"type": "string"}}}},
+    META + "LabelSelector": {"type": "object", "properties": {
+        "matchLabels": {"type": "object", "additionalProperties": {"type": "string"}}}},
+    "io.k8s.apimachinery.pkg.api.resource.Quantity": {"type": "string"},
+    "io.k8s.apimachinery.pkg.util.intstr.IntOrString": {"type": "string", "format": "int-or-string"},
+    CORE + "ContainerPort": {"type": "object", "required": ["containerPort"], "properties": {
+        "containerPort": {"type": "integer"}, "protocol": {"type": "string", "enum": ["TCP", "UDP", "SCTP"]}}},
+    CORE + "ResourceRequirements": {"type": "object", "properties": {
+        "limits": {"type": "object", "additionalProperties": ref("io.k8s.apimachinery.pkg.api.resource.Quantity")},
+        "requests": {"type": "object", "additionalProperties": ref("io.k8s.apimachinery.pkg.api.resource.Quantity")}}},
+    CORE + "Container": {"type": "object", "required": ["name"], "properties": {
+        "name": {"type": "string"}, "image": {"type": "string"},
+        "ports": {"type": "array", "items": ref(CORE + "ContainerPort")},
+        "resources": ref(CORE + "ResourceRequirements")}},
+    CORE + "PodSpec": {"type": "object", "required": ["containers"], "properties": {
+        "containers": {"type": "array", "items": ref(CORE + "Container")}}},
+    CORE + "PodTemplateSpec": {"type": "object", "properties": {
+        "metadata": ref(META + "ObjectMeta"), "spec": ref(CORE + "PodSpec")}},
+    APPS + "DeploymentSpec": {"type": "object", "required": ["selector", "template"], "properties": {
+        "replicas": {"type": "integer"}, "selector": ref(META + "LabelSelector"),
+        "template": ref(CORE + "PodTemplateSpec")}},
+    APPS + "Deployment": {
+        "type": "object",
+        "properties": {"apiVersion": {"type": "string"}, "kind": {"type": "string"},
+                       "metadata": ref(META + "ObjectMeta"), "spec": ref(APPS + "DeploymentSpec")},
+        "x-kubernetes-group-version-kind": [{"group": "apps", "kind": "Deployment", "version": "v1"}]},
+    CORE + "ServicePort": {"type": "object", "required": ["port"], "properties": {
+        "port": {"type": "integer"}, "targetPort": ref("io.k8s.apimachinery.pkg.util.intstr.IntOrString")}},
+    CORE + "Service": {
+        "type": "object",
+        "properties": {"apiVersion": {"type": "string"}, "kind": {"type": "string"},
+                       "metadata": ref(META + "ObjectMeta"),
+                       "spec": {"type": "object", "properties": {
+                           "ports": {"type": "array", "items": ref(CORE + "ServicePort")},
+                           "selector": {"type": "object", "additionalProperties": {"type": "string"}}}}},
+        "x-kubernetes-group-version-kind": [{"group": "", "kind": "Service", "version": "v1"}]},
+    "com.example.v1.Tree": {
+        "type": "object",
+        "properties": {"apiVersion": {"type": "string"}, "kind": {"type": "string"},
+                       "value": {"type": "integer"},
+                       "children": {"type": "array", "items": ref("com.example.v1.Tree")}},
+        "x-kubernetes-group-version-kind": [{"group": "example.com", "kind": "Tree", "version": "v1"}]},
+}
+
+BROKEN = """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+  labels:
+    canary: true
+spec:
+  replicas: three
+  selector:
+    matchLabels:
+      app: web
+  template:
+    spec:
+      containers:
+      - name: web
+        image: nginx
+        ports:
+        - protocol: HTTP
+        resources:
+          requests:
+            cpu: lots
+      contaners: []
+"""
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    path = tmp_path / "swagger.json"
+    path.write_text(json.dumps({"swagger": "2.0", "definitions": DEFINITIONS}), encoding="utf-8")
+    return path
+
+
+class TestManifestValidator:
+    """매니페스트 검증 테스트 클래스"""
+
+    def test_valid_manifests(self, schema_file):
+        """run_day1 샘플 앱과 int-or-string/재귀 스키마 검증 테스트"""
+        registry = load_registry(schema_file)
+        assert load_registry(schema_file) is registry
+
+        sample = validate_source(ManifestSource("day1", json.dumps(sample_app_manifest())),
+                                 registry)
+        assert sample.documents == 1 and sample.valid
+
+        text = ("apiVersion: v1\nkind: Service\nmetadata: {name: s}\nspec:\n  ports:\n"
+                "  - {port: 80, targetPort: http}\n  - {port: 81, targetPort: 8081}\n---\n"
+                "apiVersion: example.com/v1\nkind: Tree\nchildren:\n- value: 1\n  children:\n  - value: 2\n")
+        report = validate_source(ManifestSource("ok.yaml", text), registry)
+        assert report.documents == 2 and report.valid
+
+        nested = "apiVersion: example.com/v1\nkind: Tree\nchildren:\n- children:\n  - value: deep\n"
+        issues = validate_source(ManifestSource("tree.yaml", nested), registry).issues
+        assert [issue.path for issue in issues] == ["children[0].children[0].value"]
+
+    def test_field_paths_and_lines(self, schema_file):
+        """오류 필드 경로와 줄 번호 보고 테스트"""
+        report = validate_source(ManifestSource("broken.yaml", BROKEN), SchemaRegistry.from_file(schema_file))
+        found = {issue.path: (issue.line, issue.message) for issue in report.issues}
+
+        assert found["metadata.labels.canary"] == (6, 'expected string, got boolean')
+        assert found["spec.replicas"] == (8, 'expected integer, got string "three"')
+        assert found["spec.template.spec.containers[0].ports[0].containerPort"][1] == "required field is missing"
+        assert "unsupported value 'HTTP'" in found["spec.template.spec.containers[0].ports[0].protocol"][1]
+        assert found["spec.template.spec.containers[0].resources.requests.cpu"][0] == 21
+        assert found["spec.template.spec.contaners"] == (22, "unknown field")
+        assert str(report.issues[0]).startswith("broken.yaml:")
+
+        relaxed = validate_source(ManifestSource("broken.yaml", BROKEN),
+                                  SchemaRegistry.from_file(schema_file, strict=False))
+        assert "spec.template.spec.contaners" not in {issue.path for issue in relaxed.issues}
+
+    def test_heredoc_extraction(self, tmp_path, schema_file):
+        """스크립트 heredoc 추출 및 변수 치환 테스트"""
+        script = tmp_path / "deploy.sh"
+        script.write_text(
+            '#!/bin/bash\nAPP_NAME="web"\nREPLICAS=3\nPORT=8080\n'
+            'cat > state.json << EOF\n{"done": true}\nEOF\n'
+            'create_deployment() {\n'
+            '    cat <<EOF | kubectl apply -f -\n'
+            'apiVersion: apps/v1\nkind: Deployment\nmetadata:\n  name: $APP_NAME\n'
+            '  namespace: ${NAMESPACE:-production}\nspec:\n  replicas: $REPLICAS\n'
+            '  selector:\n    matchLabels: {app: $APP_NAME}\n  template:\n    spec:\n      containers:\n'
+            '      - name: $APP_NAME\n        image: "$IMAGE:$(git rev-parse HEAD)"\n'
+            '        ports:\n        - containerPort: ${PORT}x\n'
+            'EOF\n}\n', encoding="utf-8")
+
+        sources = extract_heredocs(script)
+        assert len(sources) == 1
+        assert sources[0].line == 10
+        assert "replicas: 3" in sources[0].text and "namespace: production" in sources[0].text
+        assert 'image: "placeholder:placeholder"' in sources[0].text
+
+        issues = validate_source(sources[0], SchemaRegistry.from_file(schema_file)).issues
+        assert [(issue.path, issue.line) for issue in issues] == [
+            ("spec.template.spec.containers[0].ports[0].containerPort", 25)]
+
+        # 과정 스크립트의 day2 VPA(내장 CRD 스키마)와 run_day1 매니페스트 포함
+        course = course_manifests()
+        assert any("kind: VerticalPodAutoscaler" in source.text for source in course)
+        assert course[0].name.startswith("ContainerCourseAutomation.run_day1")
+
+    def test_parallel_matches_serial(self, schema_file):
+        """프로세스 병렬 검증과 순차 검증 결과 일치 테스트"""
+        registry = load_registry(schema_file)
+        sources = [ManifestSource(f"m{i}.yaml", BROKEN if i % 10 == 0 else
+                                  "apiVersion: apps/v1\nkind: Deployment\nmetadata: {name: a}\n"
+                                  "spec: {selector: {}, template: {spec: {containers: [{name: a}]}}}\n"
+                                  "---\napiVersion: policy/v1beta1\nkind: PodSecurityPolicy\nmetadata: {name: p}\n")
+                   for i in range(120)]
+
+        serial = validate_all(sources, registry, parallel_threshold=10 ** 6)
+        parallel = validate_all(sources, registry, schema_file=schema_file, max_workers=2, parallel_threshold=1)
+
+        assert parallel.documents == serial.documents == 12 + 108 * 2
+        assert [str(i) for i in parallel.issues] == [str(i) for i in serial.issues]
+        assert len(serial.skipped) == 108
+        assert "policy/v1beta1/PodSecurityPolicy" in serial.skipped[0]
+
+    def test_spawn_workers_keep_registered_crds(self, schema_file):
+        """spawn 방식 작업자도 부모에서 등록한 CRD 스키마로 검증하는지 테스트"""
+        registry = load_registry(schema_file)
+        registry.register_crd({
+            "kind": "CustomResourceDefinition",
+            "spec": {"group": "stable.example.com", "names": {"kind": "CronTab"}, "versions": [{
+                "name": "v1", "schema": {"openAPIV3Schema": {"type": "object", "properties": {
+                    "apiVersion": {"type": "string"}, "kind": {"type": "string"},
+                    "spec": {"type": "object", "properties": {"replicas": {"type": "integer"}}}}}}}]}})
+        sources = [ManifestSource(f"c{i}.yaml", f"apiVersion: stable.example.com/v1\nkind: CronTab\n"
+                                                f"spec: {{replicas: {'many' if i == 3 else i}}}\n")
+                   for i in range(8)]
+
+        report = validate_all(sources, registry, schema_file=schema_file, max_workers=2, parallel_threshold=1,
+                              mp_context=multiprocessing.get_context("spawn"))
+
+        assert report.documents == 8 and not report.skipped
+        assert [(issue.source, issue.path) for issue in report.issues] == [("c3.yaml", "spec.replicas")]
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+자동화 메트릭 엔드포인트 테스트
+"""
+
+import time
+import subprocess
+import logging
+import urllib.request
+import pytest
+
+from . import metrics_exporter
+from .metrics_exporter import AutomationMetrics, MetricsServer, metrics_from_env, METRICS_PORT_ENV
+from .cloud_container_course_automation import ContainerCourseAutomation
+
+CONFIG = {"gcp_project_id": "p", "gcp_region": "asia-northeast3",
+          "gcp_zone": "asia-northeast3-a", "cluster_name": "mcp-container-cluster"}
+
+
+def fake_runner(command, **kwargs):
+    if command[:2] == ["kubectl", "expose"]:
+        raise subprocess.CalledProcessError(1, command, stderr="AlreadyExists")
+    return subprocess.CompletedProcess(command, 0, "", "")
+
+
+class TestMetricsExporter:
+    """메트릭 엔드포인트 테스트 클래스"""
+
+    def test_course_metrics(self, tmp_path):
+        """과정 실행 중 명령/단계/리소스 메트릭 기록 테스트"""
+        metrics = AutomationMetrics()
+        automation = ContainerCourseAutomation(tmp_path, config=CONFIG, runner=fake_runner, metrics=metrics)
+        assert automation.run_course() is False
+
+        assert metrics.commands.value("gcloud", "container clusters create", "ok") == 1
+        assert metrics.commands.value("kubectl", "expose", "error") == 1
+        assert metrics.command_duration.count("kubectl", "apply") == 1
+        assert metrics.step_duration.count("day1") == 1
+        assert metrics.step_failures.value("day1") == 1
+        # 실패 후 정리되었으므로 살아 있는 클러스터 없음
+        assert metrics.resources_alive.value("gcp", "gke_cluster") == 0
+
+    def test_exposition_format(self):
+        """Prometheus 텍스트 형식 출력 테스트"""
+        metrics = AutomationMetrics()
+        metrics.command_duration.observe(0.3, "kubectl", "apply")
+        metrics.command_duration.observe(0.5, "kubectl", "apply")
+        metrics.resource_created("gcp", "gke_cluster")
+        text = metrics.render()
+
+        assert '# TYPE mcp_automation_command_duration_seconds histogram' in text
+        assert 'mcp_automation_command_duration_seconds_bucket{tool="kubectl",subcommand="apply",le="0.25"} 0' in text
+        assert 'mcp_automation_command_duration_seconds_bucket{tool="kubectl",subcommand="apply",le="0.5"} 2' in text
+        assert 'mcp_automation_command_duration_seconds_bucket{tool="kubectl",subcommand="apply",le="+Inf"} 2' in text
+        assert 'mcp_automation_command_duration_seconds_count{tool="kubectl",subcommand="apply"} 2' in text
+        assert 'mcp_automation_resources_alive{provider="gcp",type="gke_cluster"} 1' in text
+
+    @pytest.mark.parametrize("command,expected", [
+        (["gcloud", "container", "clusters", "create", "demo"], ("gcloud", "container clusters create")),
+        (["gcloud", "--project", "p", "container", "clusters", "list"], ("gcloud", "container clusters list")),
+        (["aws", "--region", "ap-northeast-2", "eks", "list-clusters"], ("aws", "eks list-clusters")),
+        (["kubectl", "-n", "prod", "get", "pods"], ("kubectl", "get")),
+        (["/usr/bin/helm", "--kube-context", "lab", "upgrade", "app", "chart"], ("helm", "upgrade")),
+        ([], ("unknown", "")),
+    ])
+    def test_command_labels_skip_flag_values(self, command, expected):
+        """전역 플래그 값이 하위 명령 레이블에 섞이지 않는지 테스트"""
+        assert AutomationMetrics.command_labels(command) == expected
+
+    def test_http_endpoint(self):
+        """HTTP /metrics 스크레이프 테스트"""
+        metrics = AutomationMetrics()
+        metrics.record_retry("gcloud")
+        server = MetricsServer(metrics, port=0, host="127.0.0.1").start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain")
+                body = response.read().decode("utf-8")
+        finally:
+            server.stop()
+        assert 'mcp_automation_retries_total{tool="gcloud"} 1' in body
+
+    def test_hot_path_overhead(self):
+        """계측 오버헤드 테스트"""
+        metrics = AutomationMetrics()
+        runner = metrics.instrument(lambda command, **kwargs: None)
+        command = ["kubectl", "get", "pods", "-n", "default"]
+
+        start = time.perf_counter()
+        for _ in range(10000):
+            runner(command)
+        per_call = (time.perf_counter() - start) / 10000
+        assert per_call < 50e-6
+        assert metrics.commands.value("kubectl", "get", "ok") == pytest.approx(10000)
+
+    @pytest.mark.parametrize("value", ["abc", "9464x", "70000", "-1"])
+    def test_invalid_port_disables_metrics(self, monkeypatch, caplog, value):
+        """MCP_METRICS_PORT가 잘못되면 예외 대신 경고 후 비활성화"""
+        monkeypatch.setattr(metrics_exporter, "_default", None)
+        monkeypatch.setenv(METRICS_PORT_ENV, value)
+        with caplog.at_level(logging.WARNING, logger=metrics_exporter.__name__):
+            assert metrics_from_env() is None
+        assert "올바른 포트가 아니어서" in caplog.text and metrics_exporter._default is None
+
+        monkeypatch.delenv(METRICS_PORT_ENV)
+        assert metrics_from_env() is None
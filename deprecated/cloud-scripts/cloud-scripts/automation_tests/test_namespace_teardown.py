@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+네임스페이스 동시 정리 테스트
+"""
+
+import json
+import time
+import threading
+import subprocess
+
+import pytest
+
+from .namespace_teardown import NamespaceTeardown, TeardownError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeCluster:
+    """삭제 요청 후 delay초 뒤 사라지는 네임스페이스/클러스터 리소스 (stuck은 finalizer로 남음)"""
+
+    def __init__(self, clock, namespaces, refs=(), delay=3.0, stuck=(), call_latency=0.0):
+        self.clock = clock
+        self.delay = delay
+        self.stuck = set(stuck)
+        self.call_latency = call_latency
+        self.namespaces = {ns: None for ns in ["default", "kube-system", "gmp-system", *namespaces]}
+        self.refs = {ref: None for ref in refs}
+        self.deletes = []
+        self._lock = threading.Lock()
+
+    def _alive(self, store, key):
+        deleted_at = store.get(key, "missing")
+        if deleted_at == "missing":
+            return False
+        return deleted_at is None or key in self.stuck or self.clock() < deleted_at + self.delay
+
+    def __call__(self, command, env=None):
+        assert env == {"KUBECONFIG": "/tmp/kc"}
+        if command[1] == "delete":
+            time.sleep(self.call_latency)
+            with self._lock:
+                self.deletes.append(command[2:])
+            if command[2] == "namespace":
+                self.namespaces[command[3]] = self.clock()
+            elif command[2] in self.refs:
+                self.refs[command[2]] = self.clock()
+            else:
+                raise subprocess.CalledProcessError(1, command, stderr='error: the server doesn\'t have a resource type')
+            return ""
+        if command[1:3] == ["get", "namespaces"]:
+            items = []
+            for ns in self.namespaces:
+                if not self._alive(self.namespaces, ns):
+                    continue
+                item = {"metadata": {"name": ns}, "spec": {"finalizers": ["kubernetes"]}, "status": {"phase": "Active"}}
+                if self.namespaces[ns] is not None:
+                    item["status"] = {"phase": "Terminating", "conditions": [
+                        {"type": "NamespaceFinalizersRemaining", "status": "True" if ns in self.stuck else "False",
+                         "message": "Some content in the namespace has finalizers remaining: "
+                                    "kubernetes.io/pvc-protection in 1 resource instances"}]}
+                items.append(item)
+            return json.dumps({"kind": "List", "items": items})
+        if command[1] == "api-resources":
+            return "pods\npersistentvolumeclaims\n"
+        if command[1] == "get" and "-n" in command:
+            ns = command[command.index("-n") + 1]
+            return json.dumps({"items": [{"kind": "PersistentVolumeClaim",
+                                          "metadata": {"name": "data", "finalizers": ["kubernetes.io/pvc-protection"]}},
+                                         {"kind": "Pod", "metadata": {"name": "web"}}] if ns in self.stuck else []})
+        if command[1] == "get":
+            ref = command[2]
+            if not self._alive(self.refs, ref):
+                return ""
+            finalizers = ["customresourcecleanup.apiextensions.k8s.io"] if ref in self.stuck else []
+            return json.dumps({"kind": "CustomResourceDefinition",
+                               "metadata": {"name": ref.split("/", 1)[1], "finalizers": finalizers}})
+        raise AssertionError(command)
+
+
+ENV = {"KUBECONFIG": "/tmp/kc"}
+
+
+class TestNamespaceTeardown:
+    """네임스페이스 정리 테스트 클래스"""
+
+    def test_concurrent_delete_and_wait(self):
+        """삭제 요청 동시 실행, 시스템 네임스페이스 보호, 완료 대기 테스트"""
+        clock = Clock()
+        namespaces = [f"student{i:02d}" for i in range(8)]
+        cluster = FakeCluster(clock, namespaces, refs=["crd/widgets.example.com"], call_latency=0.1)
+        teardown = NamespaceTeardown(cluster, env=ENV, deadline=30, poll_interval=1.0, clock=clock,
+                                     sleep=clock.sleep)
+
+        started = time.monotonic()
+        report = teardown.teardown(refs=["crd/widgets.example.com"])
+        assert time.monotonic() - started < 0.5
+
+        assert report.ok
+        assert sorted(report.deleted) == sorted([f"namespace/{ns}" for ns in namespaces] + ["crd/widgets.example.com"])
+        assert ["namespace", "kube-system", "--wait=false", "--ignore-not-found"] not in cluster.deletes
+        assert not any("gmp-system" in command for command in cluster.deletes)
+        # delay(3초) 동안 폴링 후 완료
+        assert report.elapsed == 3.0
+        assert teardown.teardown().deleted == []
+
+    def test_blocked_finalizers_reported(self, caplog):
+        """finalizer에 막힌 객체 보고 및 마감 시간 준수 테스트"""
+        clock = Clock()
+        cluster = FakeCluster(clock, ["prod", "monitoring"], refs=["crd/stuck.example.com", "crd/ok.example.com"],
+                              stuck={"prod", "crd/stuck.example.com"})
+        teardown = NamespaceTeardown(cluster, env=ENV, deadline=10, poll_interval=4.0, clock=clock,
+                                     sleep=clock.sleep)
+
+        report = teardown.teardown(["prod", "monitoring", "kube-system"],
+                                   refs=["crd/stuck.example.com", "crd/ok.example.com", "widgets/unknown"])
+        assert not report.ok
+        assert clock.now == 10.0
+        assert sorted(report.deleted) == ["crd/ok.example.com", "namespace/monitoring"]
+        assert report.remaining == ["namespace/prod", "crd/stuck.example.com"]
+        assert "widgets/unknown" in report.errors
+        assert [str(b) for b in report.blocked] == [
+            "prod/persistentvolumeclaim/data (finalizers: kubernetes.io/pvc-protection)",
+            "crd/stuck.example.com (finalizers: customresourcecleanup.apiextensions.k8s.io)"]
+        assert sum(record.levelname == "WARNING" and "finalizer 대기" in record.message
+                   for record in caplog.records) == 1
+
+        with pytest.raises(TeardownError, match="pvc-protection"):
+            NamespaceTeardown(cluster, env=ENV, deadline=2, clock=clock, sleep=clock.sleep).teardown(
+                ["prod"], raise_on_blocked=True)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+API 할당량 공유 토큰 버킷 제한기 테스트
+"""
+
+import os
+import time
+import shutil
+import subprocess
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from .rate_limiter import RateLimiter, Limit, api_family, parse_limits
+from .cloud_container_course_automation import ContainerCourseAutomation
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _worker(db_path, count):
+    """별도 프로세스에서 토큰을 확보하고 실행 허가 시각 기록"""
+    limiter = RateLimiter(db_path, limits={"gcp:compute": Limit(40.0, 4)})
+    granted = []
+    for _ in range(count):
+        limiter.acquire(["gcloud", "compute", "disks", "delete", "d"])
+        granted.append(time.time())
+    return granted
+
+
+class TestRateLimiter:
+    """토큰 버킷 제한기 테스트 클래스"""
+
+    @pytest.mark.parametrize("command,expected", [
+        (["gcloud", "container", "clusters", "create", "demo"], "gcp:container"),
+        (["gcloud", "--quiet", "beta", "compute", "disks", "list"], "gcp:compute"),
+        (["gcloud", "config", "get-value", "project"], None),
+        (["gcloud", "--project", "my-proj", "container", "clusters", "list"], "gcp:container"),
+        (["gcloud", "--account=a@b.c", "--format", "json", "sql", "instances", "list"], "gcp:sql"),
+        (["aws", "ec2", "delete-vpc", "--vpc-id", "vpc-1"], "aws:ec2"),
+        (["aws", "configure", "list"], None),
+        (["aws", "--region", "ap-northeast-2", "--output", "json", "eks", "list-clusters"], "aws:eks"),
+        (["eksctl", "delete", "cluster", "--name", "demo"], "aws:eks"),
+        (["kubectl", "get", "pods"], None),
+    ])
+    def test_api_family(self, command, expected):
+        """명령별 API 계열 판단 테스트"""
+        assert api_family(command) == expected
+
+    def test_parse_limits(self):
+        """환경 변수 제한 형식 파싱 테스트"""
+        assert parse_limits("gcp:container=1/5, aws=10") == {"gcp:container": Limit(1.0, 5.0), "aws": Limit(10.0, 10.0)}
+        assert parse_limits("") == {}
+        with pytest.raises(ValueError, match="잘못된 제한 형식"):
+            parse_limits("gcp:container")
+
+    def test_bucket_refill_and_reservation(self, tmp_path):
+        """버스트 소진 후 예약 순서대로 대기, 시간 경과에 따른 보충 테스트"""
+        clock = Clock()
+        limiter = RateLimiter(tmp_path / "limits.db", limits={"aws:ec2": Limit(2.0, 3)}, clock=clock,
+                              sleep=lambda seconds: None)
+
+        waits = [limiter.reserve("aws:ec2") for _ in range(6)]
+        assert waits == [0.0, 0.0, 0.0, 0.5, 1.0, 1.5]
+        assert limiter.status() == [{"family": "aws:ec2", "rate": 2.0, "burst": 3, "tokens": -3.0}]
+
+        clock.now += 60
+        assert limiter.reserve("aws:ec2") == 0.0
+        # 다른 계열과 같은 파일을 쓰는 다른 인스턴스는 같은 버킷을 공유
+        other = RateLimiter(tmp_path / "limits.db", limits={"aws:ec2": Limit(2.0, 3)}, clock=clock)
+        assert other.status()[0]["tokens"] == 2.0
+        assert other.acquire(["aws", "s3", "ls"]) == 0.0 and other.acquire(["kubectl", "get", "pods"]) == 0.0
+        # 제한이 따로 없는 aws:s3는 상위 aws 버킷 사용
+        assert [row["family"] for row in other.status()] == ["aws", "aws:ec2"]
+
+    def test_unknown_family_shares_parent_bucket(self, tmp_path):
+        """DEFAULT_LIMITS에 없는 하위 계열이 별도 버스트 없이 상위 계열 할당량을 함께 소진하는지 테스트"""
+        clock = Clock()
+        limiter = RateLimiter(tmp_path / "limits.db", limits={"gcp": Limit(1.0, 2)}, clock=clock,
+                              sleep=clock.sleep)
+        assert limiter.bucket_for("gcp:sql") == "gcp" and limiter.bucket_for("gcp:container") == "gcp:container"
+        assert limiter.limit_for("gcp:sql") == Limit(1.0, 2)
+
+        waits = [limiter.acquire(command) for command in (
+            ["gcloud", "sql", "instances", "list"], ["gcloud", "iam", "roles", "list"],
+            ["gcloud", "sql", "instances", "delete", "db"])]
+        assert waits == [0.0, 0.0, 1.0]
+        assert limiter.waited == {"gcp": 1.0}
+        assert [row["family"] for row in limiter.status()] == ["gcp"]
+
+    def test_shared_across_processes(self, tmp_path):
+        """여러 프로세스의 합산 실행 속도가 제한 이하로 유지되는지 테스트"""
+        db_path = tmp_path / "limits.db"
+        RateLimiter(db_path)
+        with multiprocessing.get_context("fork").Pool(4) as pool:
+            granted = sorted(t for times in pool.starmap(_worker, [(db_path, 6)] * 4) for t in times)
+
+        assert len(granted) == 24
+        start = granted[0]
+        for i, t in enumerate(granted):
+            # 버스트 4개 이후에는 초당 40개를 넘지 않음 (프로세스 시작 시차 허용)
+            assert t - start >= (i - 4) / 40.0 - 0.02
+
+    @pytest.mark.skipif(shutil.which("bash") is None, reason="bash 없음")
+    def test_cleanup_scripts_run_command_when_limiter_fails(self, tmp_path):
+        """정리 스크립트의 limited()가 제한기 실패(상태 파일 쓰기 불가, import 오류) 시에도 명령을 실행하는지 테스트"""
+        script_dir = Path(__file__).resolve().parent.parent
+        blocked = tmp_path / "blocked"
+        blocked.write_text("")
+
+        def limited(db_path, source_dir):
+            env = {**os.environ, "MCP_RATE_LIMIT_DB": str(db_path), "SCRIPT_DIR": str(source_dir)}
+            script = f'source "{script_dir}/automation-helpers.sh"; limited sh -c "echo deleted; exit 3"'
+            return subprocess.run(["bash", "-c", script], env=env, capture_output=True, text=True)
+
+        # 정상: 토큰 확보 후 명령 실행, 명령의 종료 코드 그대로
+        result = limited(tmp_path / "limits.db", script_dir)
+        assert (result.returncode, result.stdout) == (3, "deleted\n")
+        assert "WARNING" not in result.stderr
+
+        # 상태 파일 경로가 파일 아래 (쓰기 불가) / automation_tests를 찾을 수 없음
+        for db_path, source_dir in ((blocked / "limits.db", script_dir), (tmp_path / "limits.db", tmp_path)):
+            result = limited(db_path, source_dir)
+            assert (result.returncode, result.stdout) == (3, "deleted\n")
+            assert "WARNING" in result.stderr
+
+    def test_course_runner_consults_limiter(self, tmp_path):
+        """과정 자동화 명령 실행 전 토큰 확보 테스트"""
+        clock = Clock()
+        limiter = RateLimiter(tmp_path / "limits.db", limits={"gcp:container": Limit(0.5, 1)}, clock=clock,
+                              sleep=clock.sleep)
+        commands = []
+
+        def runner(command, **kwargs):
+            commands.append((command[:4], clock.now))
+            return subprocess.CompletedProcess(command, 0, "", "")
+
+        config = {"gcp_project_id": "p", "gcp_region": "asia-northeast3",
+                  "gcp_zone": "asia-northeast3-a", "cluster_name": "mcp-container-cluster"}
+        automation = ContainerCourseAutomation(tmp_path, config=config, runner=runner, rate_limiter=limiter)
+        assert automation.run_day1() is True
+
+        assert commands[0] == (["gcloud", "container", "clusters", "create"], 1000.0)
+        assert commands[1] == (["gcloud", "container", "clusters", "get-credentials"], 1002.0)
+        assert limiter.waited == {"gcp:container": 2.0}
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+클라우드 리소스 인벤토리 엔진 테스트
+"""
+
+import json
+import threading
+import pytest
+
+from .resource_inventory import ResourceInventory
+
+FAKE_OUTPUTS = {
+    ("gcloud", "container", "clusters"): [
+        {"name": "mcp-container-cluster", "location": "asia-northeast3-a", "status": "RUNNING",
+         "currentNodeCount": 3, "nodePools": [{"name": "default-pool", "config": {"machineType": "e2-medium"}}]}
+    ],
+    ("gcloud", "compute", "disks"): [
+        {"name": "orphan-disk", "zone": "https://x/zones/asia-northeast3-a", "sizeGb": "100"},
+        {"name": "node-disk", "zone": "https://x/zones/asia-northeast3-a", "sizeGb": "50", "users": ["vm"]}
+    ],
+    ("gcloud", "compute", "firewall-rules"): [{"name": "cloud-master-allow-ssh"}, {"name": "default-allow-icmp"}],
+    ("gcloud", "compute", "forwarding-rules"): [],
+    ("aws", "eks", "list-clusters"): {"clusters": ["eks-a"]},
+    ("aws", "eks", "describe-cluster"): {"cluster": {"name": "eks-a", "status": "ACTIVE", "version": "1.28"}},
+    ("aws", "eks", "list-nodegroups"): {"nodegroups": ["ng-1"]},
+    ("aws", "ec2", "describe-vpcs"): {"Vpcs": [{"VpcId": "vpc-1", "Tags": [{"Key": "Name", "Value": "cloud-master-vpc"}]}]},
+    ("aws", "ec2", "describe-security-groups"): {"SecurityGroups": [{"GroupId": "sg-1", "GroupName": "default"}]},
+    ("aws", "ec2", "describe-volumes"): {"Volumes": []},
+    ("aws", "elbv2", "describe-load-balancers"): {"LoadBalancers": []},
+}
+
+
+class FakeRunner:
+    """CLI 호출을 기록하고 고정된 JSON을 반환하는 실행기"""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, command):
+        with self.lock:
+            self.calls.append(command)
+        return json.dumps(FAKE_OUTPUTS[tuple(command[:3])])
+
+
+class TestResourceInventory:
+    """리소스 인벤토리 테스트 클래스"""
+
+    @pytest.fixture
+    def runner(self):
+        return FakeRunner()
+
+    @pytest.fixture
+    def inventory(self, tmp_path, runner):
+        inv = ResourceInventory(tmp_path / "inventory.db", ttl_seconds=300, runner=runner)
+        yield inv
+        inv.close()
+
+    def test_refresh_all_types(self, inventory, runner):
+        """전체 리소스 유형 갱신 테스트"""
+        summary = inventory.refresh()
+        assert not summary["failed"]
+        assert len(summary["refreshed"]) == 9
+
+        clusters = inventory.query("gke_cluster", refresh=False)
+        assert clusters[0]["name"] == "mcp-container-cluster"
+        assert clusters[0]["attrs"]["node_pools"][0]["machine_type"] == "e2-medium"
+
+    def test_snapshot_reused_within_ttl(self, inventory, runner):
+        """TTL 내에서는 클라우드를 다시 조회하지 않는지 테스트"""
+        inventory.query("gce_disk")
+        calls = len(runner.calls)
+        inventory.query("gce_disk")
+        assert len(runner.calls) == calls
+
+        inventory.invalidate(["gce_disk"])
+        inventory.query("gce_disk")
+        assert len(runner.calls) == calls + 1
+
+    def test_query_filters(self, inventory):
+        """상태/이름/리전 필터 테스트"""
+        unattached = inventory.query("gce_disk", status="UNATTACHED")
+        assert [d["name"] for d in unattached] == ["orphan-disk"]
+
+        rules = inventory.query("gce_firewall_rule", name_glob="*cloud-master*")
+        assert [r["name"] for r in rules] == ["cloud-master-allow-ssh"]
+
+        disks = inventory.query("gce_disk", region="asia-northeast3")
+        assert len(disks) == 2
+
+    def test_forget_removes_deleted_resource(self, inventory):
+        """삭제된 리소스 제거 테스트"""
+        inventory.query("eks_cluster")
+        inventory.forget("eks_cluster", "eks-a")
+        assert inventory.query("eks_cluster") == []
+
+    def test_failed_scope_is_reported(self, tmp_path):
+        """조회 실패 범위 보고 테스트"""
+        def failing_runner(command):
+            raise RuntimeError("quota exceeded")
+
+        inv = ResourceInventory(tmp_path / "inventory.db", runner=failing_runner)
+        summary = inv.refresh(["vpc"])
+        assert "vpc@ap-northeast-2" in summary["failed"]
+        # 실패한 범위는 다음 조회 때 다시 시도
+        assert inv.stale_scopes(["vpc"])
+        inv.close()
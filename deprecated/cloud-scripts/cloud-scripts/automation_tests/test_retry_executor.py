@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+클라우드 CLI 재시도 실행기 테스트
+"""
+
+import sys
+import time
+import random
+import subprocess
+
+import pytest
+
+from .retry_executor import (RetryExecutor, RetryPolicy, classify_failure, idempotency, status_command, tee_stderr,
+                             TRANSIENT, PERMANENT, SAFE, CREATE, DELETE, UNSAFE)
+from .metrics_exporter import AutomationMetrics
+from .cloud_container_course_automation import ContainerCourseAutomation
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ScriptedRunner:
+    """명령별로 정해 둔 (종료 코드, stderr[, stdout]) 응답을 차례로 돌려주는 실행기"""
+
+    def __init__(self, clock, responses, latency=1.0):
+        self.clock = clock
+        self.responses = {key: list(value) for key, value in responses.items()}
+        self.latency = latency
+        self.calls = []
+
+    def __call__(self, command, **kwargs):
+        assert kwargs["capture_output"] is True and kwargs["check"] is False
+        self.calls.append(command)
+        self.clock.now += self.latency
+        queue = self.responses.get(command[1], [])
+        returncode, stderr, *stdout = queue.pop(0) if queue else (0, "")
+        if returncode is None:
+            raise subprocess.TimeoutExpired(command, kwargs["timeout"])
+        stdout = stdout[0] if stdout else "ok\n" if returncode == 0 else ""
+        return subprocess.CompletedProcess(command, returncode, stdout, stderr)
+
+
+def executor(runner, clock, **kwargs):
+    return RetryExecutor(runner, RetryPolicy(**kwargs), clock=clock, sleep=clock.sleep, rng=random.Random(7))
+
+
+class TestClassification:
+    """실패 분류 및 멱등성 판단 테스트 클래스"""
+
+    @pytest.mark.parametrize("returncode,stderr,expected", [
+        (1, "ERROR: (gcloud.container.clusters.create) ResponseError: code=429, message=RESOURCE_EXHAUSTED", TRANSIENT),
+        (1, "ERROR: Operation operation-123 is currently creating cluster demo. Please wait and try again.", TRANSIENT),
+        (1, "FAILED_PRECONDITION: Cluster is running incompatible operation operation-1", TRANSIENT),
+        (1, "Unable to connect to the server: net/http: TLS handshake timeout", TRANSIENT),
+        (255, "An error occurred (RequestLimitExceeded) when calling the CreateVpc operation", TRANSIENT),
+        (1, "ERROR: (gcloud) PERMISSION_DENIED: Required 'container.clusters.create' permission", PERMANENT),
+        (1, "Insufficient regional quota to satisfy request: resource \"CPUS\"", PERMANENT),
+        (1, "Error from server (NotFound): deployments.apps \"web\" not found", PERMANENT),
+        (127, "gcloud: command not found", PERMANENT),
+        (-9, "", TRANSIENT),
+        (None, "", TRANSIENT),
+    ])
+    def test_classify_failure(self, returncode, stderr, expected):
+        """종료 코드와 stderr 패턴으로 일시적/영구적 분류 테스트"""
+        assert classify_failure(returncode, stderr)[0] == expected
+
+    @pytest.mark.parametrize("command,expected", [
+        (["kubectl", "apply", "-f", "app.yaml"], SAFE),
+        (["kubectl", "-n", "prod", "get", "pods"], SAFE),
+        (["kubectl", "expose", "deployment", "web"], CREATE),
+        (["kubectl", "exec", "web", "--", "touch", "x"], UNSAFE),
+        (["gcloud", "container", "clusters", "create", "demo", "--zone", "z"], CREATE),
+        (["gcloud", "container", "clusters", "get-credentials", "demo"], SAFE),
+        (["gcloud", "container", "clusters", "delete", "demo", "--quiet"], DELETE),
+        (["aws", "ec2", "create-vpc", "--cidr-block", "10.0.0.0/16"], CREATE),
+        (["aws", "ec2", "run-instances", "--image-id", "ami-1"], UNSAFE),
+        (["aws", "eks", "describe-cluster", "--name", "demo"], SAFE),
+        (["eksctl", "create", "cluster", "--name", "demo"], UNSAFE),
+        (["eksctl", "delete", "cluster", "--name", "demo"], DELETE),
+        (["aws", "--region", "us-east-1", "ec2", "create-vpc", "--cidr-block", "10.0.0.0/16"], CREATE),
+        (["aws", "--profile", "lab", "--output=json", "eks", "describe-cluster", "--name", "demo"], SAFE),
+        (["eksctl", "--region", "us-east-1", "delete", "cluster", "--name", "demo"], DELETE),
+        (["kubectl", "--context", "lab", "-n", "create", "get", "pods"], SAFE),
+    ])
+    def test_idempotency(self, command, expected):
+        """명령별 재시도 안전성 테스트"""
+        assert idempotency(command) == expected
+
+    @pytest.mark.parametrize("command,expected", [
+        (["gcloud", "container", "clusters", "create", "demo", "--zone", "z", "--num-nodes", "1"],
+         ["gcloud", "container", "clusters", "describe", "demo", "--zone", "z", "--format", "value(status)"]),
+        (["gcloud", "--project=p", "container", "node-pools", "create", "pool", "--cluster", "demo", "--region", "r"],
+         ["gcloud", "container", "node-pools", "describe", "pool", "--project=p", "--cluster", "demo",
+          "--region", "r", "--format", "value(status)"]),
+        (["gcloud", "compute", "networks", "create", "vpc"], None),
+        (["kubectl", "create", "namespace", "demo"], None),
+    ])
+    def test_status_command(self, command, expected):
+        """"already exists"를 받기 전에 확인할 상태 조회 명령 테스트"""
+        assert status_command(command) == expected
+
+
+class TestRetryExecutor:
+    """재시도 실행기 테스트 클래스"""
+
+    def test_transient_retried_with_backoff(self):
+        """일시적 오류 재시도, 지수 백오프, 재시도 통계/메트릭 기록 테스트"""
+        clock = Clock()
+        runner = ScriptedRunner(clock, {"apply": [(1, "Error from server: etcdserver: request timed out"),
+                                                  (1, "error: unexpected EOF"), (0, "")]})
+        metrics = AutomationMetrics()
+        retry = RetryExecutor(runner, RetryPolicy(base_delay=2.0), metrics=metrics, clock=clock,
+                              sleep=clock.sleep, rng=random.Random(7))
+
+        result = retry(["kubectl", "apply", "-f", "app.yaml"], capture_output=True, check=True, timeout=60)
+        assert result.returncode == 0 and result.stdout == "ok\n"
+        assert len(runner.calls) == 3
+        # 상한의 절반 ~ 상한 사이 지터 (2초, 4초 상한)
+        assert 1.0 <= clock.sleeps[0] <= 2.0 and 2.0 <= clock.sleeps[1] <= 4.0
+        assert retry.stats.retries == 2 and retry.stats.retried_commands == 1
+        assert retry.stats.time_lost == pytest.approx(2 * 1.0 + sum(clock.sleeps))
+        assert [event["reason"] for event in retry.stats.events] == ["etcdserver: request timed out",
+                                                                    "unexpected EOF"]
+        assert metrics.retries.value("kubectl") == 2
+        assert metrics.retry_seconds.value("kubectl") == pytest.approx(retry.stats.time_lost)
+
+    def test_permanent_and_unsafe_not_retried(self):
+        """영구적 오류와 결과가 누적되는 명령은 재시도하지 않는지 테스트"""
+        clock = Clock()
+        runner = ScriptedRunner(clock, {"container": [(1, "PERMISSION_DENIED: caller does not have permission")],
+                                        "ec2": [(255, "Throttling: Rate exceeded")]})
+        retry = executor(runner, clock)
+
+        with pytest.raises(subprocess.CalledProcessError) as error:
+            retry(["gcloud", "container", "clusters", "create", "demo"], capture_output=True, check=True)
+        assert "PERMISSION_DENIED" in error.value.stderr
+        result = retry(["aws", "ec2", "run-instances", "--image-id", "ami-1"], capture_output=True)
+        assert result.returncode == 255
+        assert len(runner.calls) == 2 and clock.sleeps == []
+        assert retry.stats.retries == 0
+
+    def test_idempotency_guard_and_limits(self, capsys):
+        """이전 시도가 적용된 create/delete 성공 처리, 시도 횟수 제한, 미캡처 출력 테스트"""
+        clock = Clock()
+        runner = ScriptedRunner(clock, {
+            "container": [(1, "ERROR: (gcloud.container.clusters.create) code=503, message=Backend Error"),
+                          (1, "ERROR: ALREADY_EXISTS: Already exists: projects/p/clusters/demo"),
+                          (0, "", "RUNNING\n")],
+            "delete": [(1, "Error from server: the server is currently unable to handle the request"),
+                       (1, 'Error from server (NotFound): namespaces "monitoring" not found')],
+            "get": [(1, "Service Unavailable")] * 5,
+        })
+        retry = executor(runner, clock, max_attempts=3)
+
+        result = retry(["gcloud", "container", "clusters", "create", "demo"], timeout=900)
+        assert result.returncode == 0 and retry.stats.events[0]["reason"] == "503"
+        assert runner.calls[2][:5] == ["gcloud", "container", "clusters", "describe", "demo"]
+        retry(["kubectl", "delete", "namespace", "monitoring"], check=True)
+        assert retry.stats.guarded == 2
+        assert "not found" not in capsys.readouterr().err
+
+        result = retry(["kubectl", "get", "pods"])
+        assert result.returncode == 1 and result.stderr is None
+        assert "Service Unavailable" in capsys.readouterr().err
+        assert retry.stats.to_dict()["by_tool"] == {"gcloud": 1, "kubectl": 3}
+        assert retry.stats.commands == 3 and retry.stats.retried_commands == 3
+
+    @pytest.mark.parametrize("status", ["ERROR\n", "PROVISIONING\n", None])
+    def test_already_exists_requires_ready_cluster(self, status):
+        """이전 시도가 남긴 클러스터가 준비되지 않았으면(또는 상태 조회 실패) 성공으로 간주하지 않는지 테스트"""
+        clock = Clock()
+        describe = (0, "", status) if status else (1, "ERROR: NOT_FOUND")
+        runner = ScriptedRunner(clock, {"container": [
+            (1, "ERROR: code=503, message=Backend Error"),
+            (1, "ERROR: ALREADY_EXISTS: Already exists: projects/p/clusters/demo"), describe]})
+        retry = executor(runner, clock)
+
+        with pytest.raises(subprocess.CalledProcessError) as error:
+            retry(["gcloud", "container", "clusters", "create", "demo", "--zone", "z"], check=True)
+        assert "ALREADY_EXISTS" in error.value.stderr
+        assert len(runner.calls) == 3 and runner.calls[2][3] == "describe"
+        assert retry.stats.guarded == 0 and retry.stats.retries == 1
+
+    def test_timeout_retried_only_for_safe_commands(self):
+        """시간 초과된 create는 아직 진행 중일 수 있으므로 재시도하지 않고, 조회 명령만 재시도하는지 테스트"""
+        clock = Clock()
+        runner = ScriptedRunner(clock, {"container": [(None, "")], "get": [(None, "")]})
+        retry = executor(runner, clock)
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            retry(["gcloud", "container", "clusters", "create", "demo"], timeout=900)
+        assert len(runner.calls) == 1 and retry.stats.guarded == 0
+
+        assert retry(["kubectl", "get", "pods"], capture_output=True, timeout=30).returncode == 0
+        assert len(runner.calls) == 3 and retry.stats.events[0]["reason"] == "timeout"
+
+    def test_uncaptured_commands_stream_output(self, capfd):
+        """캡처하지 않는 호출은 실행 중 출력을 바로 보여주고(중복 출력 없음) 실패 분류는 그대로인지 테스트"""
+        clock = Clock()
+        retry = RetryExecutor(policy=RetryPolicy(base_delay=0.0), clock=clock, sleep=clock.sleep)
+        script = "echo creating; echo 'Creating cluster demo...' >&2; exit 0"
+        result = retry(["sh", "-c", script], check=True)
+        assert result.stdout is None and result.stderr is None
+        out, err = capfd.readouterr()
+        assert out == "creating\n" and err == "Creating cluster demo...\n"
+
+        with pytest.raises(subprocess.CalledProcessError) as error:
+            retry(["sh", "-c", "echo 'PERMISSION_DENIED: no access' >&2; exit 1"], check=True)
+        assert "PERMISSION_DENIED" in error.value.stderr
+        assert capfd.readouterr().err.count("PERMISSION_DENIED") == 1
+
+    def test_tee_stderr_enforces_timeout(self):
+        """stderr가 열려 있어도 시한이 지나면 종료되는지 테스트"""
+        started = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as error:
+            tee_stderr([sys.executable, "-c", "import sys, time; print('waiting', file=sys.stderr, flush=True); "
+                                              "time.sleep(30)"], timeout=0.5)
+        assert time.monotonic() - started < 5
+        assert "waiting" in error.value.stderr
+
+    def test_course_survives_quota_blip(self, tmp_path):
+        """클러스터 생성 중 일시적 쿼터 오류에도 과정이 끝까지 실행되고 결과에 재시도가 기록되는지 테스트"""
+        clock = Clock()
+        runner = ScriptedRunner(clock, {"container": [(1, "ERROR: code=429, message=RESOURCE_EXHAUSTED")]},
+                                latency=0.0)
+        config = {"gcp_project_id": "p", "gcp_region": "asia-northeast3",
+                  "gcp_zone": "asia-northeast3-a", "cluster_name": "mcp-container-cluster"}
+        automation = ContainerCourseAutomation(tmp_path, config=config, runner=runner)
+        automation.retry.sleep = clock.sleep
+
+        assert automation.run_course() is True
+        assert runner.calls.count(["gcloud", "container", "clusters", "create", "mcp-container-cluster",
+                                   "--zone", "asia-northeast3-a", "--num-nodes", "1"]) == 2
+        assert automation.results["status"] == "completed"
+        assert automation.results["retries"]["retries"] == 1
+        assert automation.results["retries"]["time_lost"] == pytest.approx(clock.sleeps[0], abs=1e-3)
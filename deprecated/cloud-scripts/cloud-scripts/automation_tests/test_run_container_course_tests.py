@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+테스트 실행 스크립트(영향 분석, 샤딩, 소요 시간 리포트) 테스트
+"""
+
+import pytest
+
+from . import run_container_course_tests as runner
+from .run_container_course_tests import impacted_tests, split_shards, read_durations
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """가짜 테스트 패키지 (b -> a 의존, script_generator는 templates/를 읽음)"""
+    root = tmp_path / "automation_tests"
+    (root / "templates").mkdir(parents=True)
+    files = {
+        "a.py": "VALUE = 1\n",
+        "b.py": "from .a import VALUE\n",
+        "script_generator.py": "",
+        "test_a.py": "from .a import VALUE\n",
+        "test_b.py": "from automation_tests.b import VALUE\n",
+        "test_generator.py": "from . import script_generator\n",
+        "test_container_course_automation.py": "from .a import VALUE\nfrom .container_course_automation import X\n",
+    }
+    for name, content in files.items():
+        (root / name).write_text(content)
+    monkeypatch.setattr(runner, "TEST_DIR", root)
+    monkeypatch.setattr(runner, "PACKAGE_NAME", root.name)
+    return root
+
+
+class TestRunContainerCourseTests:
+    """테스트 실행 스크립트 테스트 클래스"""
+
+    @pytest.mark.parametrize("changed,expected", [
+        (["a.py"], ["test_a.py", "test_b.py"]),
+        (["deprecated/cloud-scripts/automation_tests/b.py"], ["test_b.py"]),
+        (["templates/day2/monitoring.sh"], ["test_generator.py"]),
+        (["test_generator.py"], ["test_generator.py"]),
+        (["README.md", "../outside.py"], []),
+        (["requirements.txt"], None),
+    ])
+    def test_impacted_tests(self, package, changed, expected):
+        """변경 파일 -> (간접 의존 포함) 영향 받는 테스트 선택, 알 수 없는 변경은 전체 실행, 제외 파일은 선택 안 함"""
+        selected = impacted_tests(changed)
+        assert (None if selected is None else [path.name for path in selected]) == expected
+
+    def test_split_shards(self):
+        """이전 소요 시간 기준 LPT 분배 및 기록 없는 테스트의 평균 시간 사용 테스트"""
+        durations = {"test_a.py::t1": 5.0, "test_a.py::t2": 3.0, "test_b.py::t3": 2.0, "test_b.py::t4": 2.0}
+        nodes = ["automation_tests/test_a.py::t1", "test_a.py::t2", "test_b.py::t3", "test_b.py::t4"]
+        assert split_shards(nodes, 2, durations) == [["automation_tests/test_a.py::t1", "test_b.py::t4"],
+                                                     ["test_a.py::t2", "test_b.py::t3"]]
+        # 기록 없는 테스트(평균 3초)는 가장 덜 찬 샤드로, 샤드 수는 테스트 수 이하
+        assert split_shards(nodes + ["test_c.py::new"], 3, durations) == [
+            ["automation_tests/test_a.py::t1"], ["test_a.py::t2", "test_b.py::t3"], ["test_c.py::new", "test_b.py::t4"]]
+        assert split_shards(["test_a.py::t1"], 4, {}) == [["test_a.py::t1"]]
+
+    def test_read_durations(self, tmp_path):
+        """JUnit XML classname -> 파일명::클래스::테스트 키 변환 테스트"""
+        (tmp_path / "shard-0.xml").write_text(
+            '<testsuites><testsuite name="pytest">'
+            '<testcase classname="automation_tests.test_a.TestA" name="test_one" time="1.5"/>'
+            '<testcase classname="test_b" name="test_two[x-1]" time="0.25"/>'
+            '<testcase classname="conftest" name="setup" time="9"/>'
+            '</testsuite></testsuites>')
+        (tmp_path / "shard-1.xml").write_text(
+            '<testsuite><testcase classname="automation_tests.test_c.TestC.TestNested" name="test_three"/></testsuite>')
+        (tmp_path / "other.xml").write_text('<testsuite><testcase classname="test_d" name="ignored" time="1"/></testsuite>')
+
+        assert read_durations(tmp_path) == {"test_a.py::TestA::test_one": 1.5,
+                                            "test_b.py::test_two[x-1]": 0.25,
+                                            "test_c.py::TestC::TestNested::test_three": 0.0}
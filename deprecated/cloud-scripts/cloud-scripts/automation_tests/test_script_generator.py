@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+템플릿 기반 스크립트 생성기 테스트
+"""
+
+import os
+import time
+from pathlib import Path
+
+from .script_generator import ScriptGenerator, SCRIPT_MODE
+from .tenant_specs import build_tenants
+from .container_course_day2_scripts import create_monitoring_script
+
+AUTOMATION_DIR = Path(__file__).parent.parent / "automation"
+
+
+class TestScriptGenerator:
+    """스크립트 생성기 테스트 클래스"""
+
+    def test_defaults_match_existing_scripts(self):
+        """기본값 렌더링 결과가 기존 스크립트와 (줄바꿈까지) 같은 바이트인지 테스트"""
+        rendered = ScriptGenerator().render_all()
+        assert len(rendered) == 7
+        for name, content in rendered.items():
+            assert content.encode('utf-8') == (AUTOMATION_DIR / name).read_bytes(), name
+
+    def test_only_changed_files_are_written(self, tmp_path):
+        """변경된 파일만 쓰고 나머지는 mtime을 유지하는지 테스트"""
+        generator = ScriptGenerator()
+        first = generator.generate(tmp_path)
+        assert len(first.written) == 7
+        assert os.stat(tmp_path / "day1/gke_cluster.sh").st_mode & 0o777 == SCRIPT_MODE
+
+        mtimes = {name: (tmp_path / name).stat().st_mtime_ns for name in first.written}
+        second = generator.generate(tmp_path)
+        assert second.written == []
+        assert {name: (tmp_path / name).stat().st_mtime_ns for name in mtimes} == mtimes
+
+        third = generator.generate(tmp_path, {"zone": "asia-northeast3-a"})
+        assert third.written == ["day1/gke_cluster.sh"]
+        assert "--zone=asia-northeast3-a" in (tmp_path / "day1/gke_cluster.sh").read_text(encoding='utf-8')
+        assert (tmp_path / "day2/monitoring.sh").stat().st_mtime_ns == mtimes["day2/monitoring.sh"]
+
+        # 외부에서 수정된 파일은 다시 생성
+        (tmp_path / "day2/monitoring.sh").write_text("edited\n", encoding='utf-8')
+        assert generator.generate(tmp_path, {"zone": "asia-northeast3-a"}).written == ["day2/monitoring.sh"]
+
+    def test_day2_module_uses_generator(self, tmp_path):
+        """Day 2 생성 함수가 변경 없는 파일을 다시 쓰지 않는지 테스트"""
+        create_monitoring_script(tmp_path)
+        script = tmp_path / "automation" / "day2" / "monitoring.sh"
+        mtime = script.stat().st_mtime_ns
+        create_monitoring_script(tmp_path)
+        assert script.stat().st_mtime_ns == mtime
+
+    def test_hundreds_of_tenants(self, tmp_path):
+        """테넌트 변형 대량 생성 성능 테스트"""
+        generator = ScriptGenerator()
+        tenants = build_tenants([f"student{i:03d}" for i in range(300)], "mcp-container-cluster", tmp_path)
+        generator.generate_tenants(tenants)
+
+        start = time.perf_counter()
+        results = generator.generate_tenants(tenants)
+        assert time.perf_counter() - start < 1.0
+        assert all(not r.written for r in results.values())
+
+        gke = (tmp_path / "student007" / "automation" / "day1" / "gke_cluster.sh").read_text(encoding='utf-8')
+        assert "mcp-container-cluster-student007" in gke
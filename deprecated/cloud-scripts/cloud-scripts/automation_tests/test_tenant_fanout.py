@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+멀티 테넌트 팬아웃 실행기 테스트
+"""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+
+from .tenant_fanout import TenantFanout, build_tenants, sanitize_cluster_name, GKE_CLUSTER_NAME_MAX
+
+
+class FakeAutomation:
+    """실제 명령을 실행하지 않는 테넌트 실행 객체"""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, base_path: Path, config: dict = None, env: dict = None):
+        self.base_path = base_path
+        self.config = config
+        self.env = env
+        self.created_resources = {"gcp": []}
+
+    def run_course(self):
+        with FakeAutomation.lock:
+            FakeAutomation.active += 1
+            FakeAutomation.peak = max(FakeAutomation.peak, FakeAutomation.active)
+        time.sleep(0.02)
+        with FakeAutomation.lock:
+            FakeAutomation.active -= 1
+        if self.config["cluster_name"].endswith("broken"):
+            return False
+        self.created_resources["gcp"].append({"type": "gke_cluster", "name": self.config["cluster_name"]})
+        return True
+
+
+class TestTenantFanout:
+    """팬아웃 실행기 테스트 클래스"""
+
+    @pytest.fixture(autouse=True)
+    def reset_counters(self):
+        FakeAutomation.active = 0
+        FakeAutomation.peak = 0
+
+    def test_sanitize_cluster_name(self):
+        """클러스터 이름 정리 테스트"""
+        assert sanitize_cluster_name("mcp-cluster-student01") == "mcp-cluster-student01"
+        assert sanitize_cluster_name("MCP_Cluster-Student01").startswith("mcp-cluster-student01-")
+        assert sanitize_cluster_name("01-student").startswith("t-01-student-")
+        assert len(sanitize_cluster_name("x" * 80)) <= GKE_CLUSTER_NAME_MAX
+
+    def test_lossy_names_do_not_collide(self, tmp_path):
+        """정리 과정에서 같아지는 이름(대소문자, 치환, 길이 자르기)이 서로 다른 클러스터 이름이 되는지 테스트"""
+        names = ["student-01", "student_01", "Student-01", "student" + "a" * 40 + "1", "student" + "a" * 40 + "2"]
+        clusters = [tenant.cluster_name for tenant in build_tenants(names, "mcp", tmp_path)]
+        assert len(set(clusters)) == len(names)
+        assert clusters[0] == "mcp-student-01"
+        assert all(len(name) <= GKE_CLUSTER_NAME_MAX and name[0].isalpha() for name in clusters)
+
+        with pytest.raises(ValueError, match="클러스터 이름이 같습니다"):
+            build_tenants(["student01", "student01"], "mcp", tmp_path)
+
+    def test_tenant_isolation(self, tmp_path):
+        """테넌트별 클러스터, kubeconfig, 작업 디렉토리 격리 테스트"""
+        tenants = build_tenants(["student01", "student02"], "mcp-container-cluster", tmp_path)
+        fanout = TenantFanout({"cluster_name": "mcp-container-cluster", "gcp_zone": "asia-northeast3-a"},
+                              tenants, automation_factory=FakeAutomation)
+
+        configs = [fanout.tenant_config(t) for t in tenants]
+        envs = [fanout.tenant_env(t) for t in tenants]
+        assert configs[0]["cluster_name"] == "mcp-container-cluster-student01"
+        assert configs[0]["cluster_name"] != configs[1]["cluster_name"]
+        assert envs[0]["KUBECONFIG"] == str(tmp_path / "student01" / "kubeconfig")
+        assert envs[0]["KUBECONFIG"] != envs[1]["KUBECONFIG"]
+
+    def test_bounded_concurrency_and_report(self, tmp_path):
+        """동시 실행 제한 및 통합 리포트 테스트"""
+        names = [f"student{i:02d}" for i in range(1, 11)] + ["broken"]
+        tenants = build_tenants(names, "mcp", tmp_path)
+        fanout = TenantFanout({"cluster_name": "mcp"}, tenants, max_workers=3,
+                              automation_factory=FakeAutomation)
+
+        report = fanout.run()
+
+        assert FakeAutomation.peak <= 3
+        assert report["summary"]["total"] == 11
+        assert report["summary"]["completed"] == 10
+        assert report["summary"]["failed"] == 1
+        assert [t["name"] for t in report["tenants"]] == names
+        assert all((tmp_path / name).is_dir() for name in names)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+EKS 네트워크 동시 프로비저닝 테스트
+"""
+
+import time
+import itertools
+import threading
+
+import pytest
+
+from .vpc_provisioner import ProvisioningGraph, ProvisioningError, NetworkSpec, VpcProvisioner
+
+
+class FakeEc2:
+    """테스트에 필요한 EC2 API만 구현한 메모리 대체 (호출마다 latency초 지연)"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.vpcs, self.igws, self.subnets, self.tables = {}, {}, {}, {}
+        self.writes = []
+
+    def _call(self, name, write=True):
+        time.sleep(self.latency)
+        if write:
+            with self.lock:
+                self.writes.append(name)
+
+    def _new(self, prefix):
+        with self.lock:
+            return f"{prefix}-{next(self.ids):04d}"
+
+    @staticmethod
+    def _tags(spec):
+        return [tag for tags in spec for tag in tags["Tags"]]
+
+    @staticmethod
+    def _match(item, filters):
+        tags = {tag["Key"]: tag["Value"] for tag in item.get("Tags", [])}
+        for f in filters or []:
+            if f["Name"].startswith("tag:"):
+                value = tags.get(f["Name"][4:])
+            else:
+                value = item.get({"vpc-id": "VpcId"}[f["Name"]])
+            if value not in f["Values"]:
+                return False
+        return True
+
+    def _describe(self, store, key, ids=None, Filters=None):
+        self._call("describe", write=False)
+        items = [item for item_id, item in store.items() if (ids is None or item_id in ids)]
+        return {key: [item for item in items if self._match(item, Filters)]}
+
+    def describe_vpcs(self, Filters=None):
+        return self._describe(self.vpcs, "Vpcs", Filters=Filters)
+
+    def create_vpc(self, CidrBlock, TagSpecifications):
+        self._call("create_vpc")
+        vpc = {"VpcId": self._new("vpc"), "CidrBlock": CidrBlock, "Tags": self._tags(TagSpecifications)}
+        self.vpcs[vpc["VpcId"]] = vpc
+        return {"Vpc": vpc}
+
+    def modify_vpc_attribute(self, VpcId, **attribute):
+        self._call("modify_vpc_attribute")
+        self.vpcs[VpcId].update(attribute)
+
+    def delete_vpc(self, VpcId):
+        self._call("delete_vpc")
+        assert not any(s["VpcId"] == VpcId for s in self.subnets.values())
+        del self.vpcs[VpcId]
+
+    def describe_internet_gateways(self, InternetGatewayIds=None, Filters=None):
+        return self._describe(self.igws, "InternetGateways", InternetGatewayIds, Filters)
+
+    def create_internet_gateway(self, TagSpecifications):
+        self._call("create_internet_gateway")
+        igw = {"InternetGatewayId": self._new("igw"), "Attachments": [], "Tags": self._tags(TagSpecifications)}
+        self.igws[igw["InternetGatewayId"]] = igw
+        return {"InternetGateway": igw}
+
+    def attach_internet_gateway(self, InternetGatewayId, VpcId):
+        self._call("attach_internet_gateway")
+        assert VpcId in self.vpcs
+        self.igws[InternetGatewayId]["Attachments"].append({"VpcId": VpcId, "State": "available"})
+
+    def detach_internet_gateway(self, InternetGatewayId, VpcId):
+        self._call("detach_internet_gateway")
+        self.igws[InternetGatewayId]["Attachments"] = []
+
+    def delete_internet_gateway(self, InternetGatewayId):
+        self._call("delete_internet_gateway")
+        assert not self.igws[InternetGatewayId]["Attachments"]
+        del self.igws[InternetGatewayId]
+
+    def describe_subnets(self, Filters=None):
+        return self._describe(self.subnets, "Subnets", Filters=Filters)
+
+    def create_subnet(self, VpcId, CidrBlock, AvailabilityZone, TagSpecifications):
+        self._call("create_subnet")
+        subnet = {"SubnetId": self._new("subnet"), "VpcId": VpcId, "CidrBlock": CidrBlock,
+                  "AvailabilityZone": AvailabilityZone, "Tags": self._tags(TagSpecifications)}
+        self.subnets[subnet["SubnetId"]] = subnet
+        return {"Subnet": subnet}
+
+    def modify_subnet_attribute(self, SubnetId, MapPublicIpOnLaunch):
+        self._call("modify_subnet_attribute")
+        self.subnets[SubnetId]["MapPublicIpOnLaunch"] = MapPublicIpOnLaunch["Value"]
+
+    def delete_subnet(self, SubnetId):
+        self._call("delete_subnet")
+        assert not any(a["SubnetId"] == SubnetId for t in self.tables.values() for a in t["Associations"])
+        del self.subnets[SubnetId]
+
+    def describe_route_tables(self, RouteTableIds=None, Filters=None):
+        return self._describe(self.tables, "RouteTables", RouteTableIds, Filters)
+
+    def create_route_table(self, VpcId, TagSpecifications):
+        self._call("create_route_table")
+        table = {"RouteTableId": self._new("rtb"), "VpcId": VpcId, "Routes": [], "Associations": [],
+                 "Tags": self._tags(TagSpecifications)}
+        self.tables[table["RouteTableId"]] = table
+        return {"RouteTable": table}
+
+    def create_route(self, RouteTableId, DestinationCidrBlock, GatewayId):
+        self._call("create_route")
+        assert self.igws[GatewayId]["Attachments"], "게이트웨이가 VPC에 연결되지 않음"
+        self.tables[RouteTableId]["Routes"].append({"DestinationCidrBlock": DestinationCidrBlock,
+                                                    "GatewayId": GatewayId})
+
+    def associate_route_table(self, RouteTableId, SubnetId):
+        self._call("associate_route_table")
+        association_id = self._new("rtbassoc")
+        self.tables[RouteTableId]["Associations"].append({"RouteTableAssociationId": association_id,
+                                                          "SubnetId": SubnetId, "Main": False})
+        return {"AssociationId": association_id}
+
+    def disassociate_route_table(self, AssociationId):
+        self._call("disassociate_route_table")
+        for table in self.tables.values():
+            table["Associations"] = [a for a in table["Associations"]
+                                     if a["RouteTableAssociationId"] != AssociationId]
+
+    def delete_route_table(self, RouteTableId):
+        self._call("delete_route_table")
+        assert not self.tables[RouteTableId]["Associations"]
+        del self.tables[RouteTableId]
+
+
+class TestProvisioningGraph:
+    """의존성 그래프 실행기 테스트 클래스"""
+
+    def test_elapsed_follows_depth(self):
+        """독립 작업 동시 실행 (소요 시간 ≈ 깊이 × 작업 시간) 테스트"""
+        def step(_):
+            time.sleep(0.1)
+            return True
+
+        graph = ProvisioningGraph().add("root", step)
+        for i in range(6):
+            graph.add(f"mid-{i}", step, ("root",))
+        graph.add("leaf", step, tuple(f"mid-{i}" for i in range(6)))
+
+        run = graph.run(max_workers=8)
+        assert run.depth == 3 and len(run.results) == 8
+        assert run.elapsed < 0.6
+        assert run.timings["leaf"][0] >= max(run.timings[f"mid-{i}"][1] for i in range(6))
+
+    def test_failure_and_validation(self):
+        """실패 시 후속 작업 건너뜀, 순환/누락 의존성 검사 테스트"""
+        def fail(_):
+            raise RuntimeError("boom")
+
+        graph = (ProvisioningGraph().add("a", lambda _: 1).add("b", fail, ("a",))
+                 .add("c", lambda inputs: inputs["a"] + 1, ("a",)).add("d", lambda _: 4, ("b",)))
+        with pytest.raises(ProvisioningError) as error:
+            graph.run()
+        assert set(error.value.failed) == {"b"}
+        assert error.value.skipped == ["d"]
+        assert error.value.results["a"] == 1
+
+        with pytest.raises(ValueError, match="순환"):
+            ProvisioningGraph().add("x", lambda _: 1, ("y",)).add("y", lambda _: 1, ("x",)).levels()
+        with pytest.raises(ValueError, match="알 수 없는"):
+            ProvisioningGraph().add("x", lambda _: 1, ("missing",)).levels()
+
+
+class TestVpcProvisioner:
+    """VPC 프로비저닝 테스트 클래스"""
+
+    def test_concurrent_idempotent_provisioning(self):
+        """동시 생성, 태그 기반 재사용, 역순 삭제 테스트"""
+        ec2 = FakeEc2(latency=0.05)
+        provisioner = VpcProvisioner(NetworkSpec(), client=ec2)
+
+        result = provisioner.provision()
+        assert result.depth == 3
+        # 쓰기 13회 + 조회 호출이 모두 순차였다면 1초 이상
+        assert len(ec2.writes) == 13 and result.elapsed < 0.6
+        assert [ec2.subnets[s]["AvailabilityZone"] for s in result.subnet_ids] == ["ap-northeast-2a",
+                                                                                  "ap-northeast-2c"]
+        assert all(ec2.subnets[s]["MapPublicIpOnLaunch"] for s in result.subnet_ids)
+        table = ec2.tables[result.route_table_id]
+        assert table["Routes"] == [{"DestinationCidrBlock": "0.0.0.0/0", "GatewayId": result.internet_gateway_id}]
+        assert {a["SubnetId"] for a in table["Associations"]} == set(result.subnet_ids)
+        assert {"Key": "mcp:stack", "Value": "cloud-master-eks-cluster"} in ec2.vpcs[result.vpc_id]["Tags"]
+        assert "export SUBNET_2_ID=" + result.subnet_ids[1] in result.shell_exports()
+
+        # 재실행 시 새 리소스를 만들지 않고 속성 보장 호출만 반복
+        writes = len(ec2.writes)
+        again = VpcProvisioner(NetworkSpec(), client=ec2).provision()
+        assert (again.vpc_id, again.subnet_ids, again.route_table_id) == (
+            result.vpc_id, result.subnet_ids, result.route_table_id)
+        assert set(ec2.writes[writes:]) == {"modify_vpc_attribute", "modify_subnet_attribute"}
+
+        deleted = provisioner.destroy()["deleted"]
+        assert len(deleted) == 5
+        assert not (ec2.vpcs or ec2.igws or ec2.subnets or ec2.tables)
+        assert provisioner.destroy()["deleted"] == []
+
+    def test_with_moto(self):
+        """moto 로컬 AWS 대체 환경 프로비저닝 테스트"""
+        moto = pytest.importorskip("moto")
+        boto3 = pytest.importorskip("boto3")
+
+        with moto.mock_aws():
+            ec2 = boto3.client("ec2", region_name="ap-northeast-2")
+            result = VpcProvisioner(NetworkSpec(), client=ec2).provision()
+            again = VpcProvisioner(NetworkSpec(), client=ec2).provision()
+            assert again.vpc_id == result.vpc_id and again.subnet_ids == result.subnet_ids
+            subnets = ec2.describe_subnets(SubnetIds=result.subnet_ids)["Subnets"]
+            assert all(subnet["MapPublicIpOnLaunch"] for subnet in subnets)
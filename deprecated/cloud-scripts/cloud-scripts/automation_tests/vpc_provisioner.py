@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+EKS용 AWS 네트워크 동시 프로비저닝
+eks-cluster-create.sh의 create_vpc가 순차 aws ec2 호출로 만들던 VPC, 서브넷, 인터넷 게이트웨이,
+라우트 테이블을 의존성 그래프로 모델링하고, 선행 리소스가 준비된 작업부터 동시에 실행합니다.
+전체 소요 시간은 작업 수가 아니라 그래프 깊이(기본 구성 3단계)에 비례합니다.
+
+모든 작업은 Name 태그로 기존 리소스를 먼저 조회하므로 여러 번 실행해도 결과가 같습니다(멱등).
+새로 만드는 리소스에는 mcp:stack 태그를 붙입니다.
+
+기본 그래프:
+    vpc ──────┬─ vpc_dns
+              ├─ subnet-1 ─┬─ subnet-1-public-ip
+              │            └─ subnet-1-route ─┐
+              ├─ subnet-2 ─ ...                │
+              ├─ route_table ──────────────────┴─ default_route
+    igw ──────┴─ igw_attach ───────────────────┘
+
+사용 예:
+    eval "$(python -m automation_tests.vpc_provisioner --region ap-northeast-2 up)"
+    echo $VPC_ID $SUBNET_1_ID $SUBNET_2_ID
+    python -m automation_tests.vpc_provisioner --region ap-northeast-2 down
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+STACK_TAG = "mcp:stack"
+
+
+class ProvisioningError(RuntimeError):
+    """그래프 실행 실패 (완료된 작업 결과 포함)"""
+
+    def __init__(self, message: str, failed: Dict[str, BaseException], results: Dict[str, Any],
+                 skipped: List[str]):
+        super().__init__(message)
+        self.failed = failed
+        self.results = results
+        self.skipped = skipped
+
+
+@dataclass
+class Task:
+    name: str
+    action: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+
+
+@dataclass
+class GraphRun:
+    """그래프 실행 결과"""
+    results: Dict[str, Any]
+    timings: Dict[str, Tuple[float, float]]
+    elapsed: float
+    depth: int
+
+
+class ProvisioningGraph:
+    """의존성 그래프 동시 실행기 (선행 작업이 모두 끝난 작업부터 스레드 풀에 제출)"""
+
+    def __init__(self):
+        self.tasks: Dict[str, Task] = {}
+
+    def add(self, name: str, action: Callable[[Dict[str, Any]], Any], deps: Tuple[str, ...] = ()):
+        """
+        작업 추가
+
+        Args:
+            action: 선행 작업 결과(이름 -> 결과)를 받아 이 작업의 결과를 반환하는 함수
+            deps: 선행 작업 이름
+        """
+        if name in self.tasks:
+            raise ValueError(f"중복된 작업: {name}")
+        self.tasks[name] = Task(name, action, tuple(deps))
+        return self
+
+    def levels(self) -> List[List[str]]:
+        """위상 정렬 단계 (순환/누락 의존성 검사 포함)"""
+        for task in self.tasks.values():
+            missing = [dep for dep in task.deps if dep not in self.tasks]
+            if missing:
+                raise ValueError(f"{task.name}: 알 수 없는 선행 작업 {missing}")
+        remaining = {name: set(task.deps) for name, task in self.tasks.items()}
+        levels = []
+        while remaining:
+            ready = sorted(name for name, deps in remaining.items() if not deps)
+            if not ready:
+                raise ValueError(f"순환 의존성: {sorted(remaining)}")
+            levels.append(ready)
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return levels
+
+    def run(self, max_workers: int = 8) -> GraphRun:
+        """
+        그래프 실행
+
+        Raises:
+            ProvisioningError: 작업 실패 (실패 작업의 후속 작업은 실행하지 않고, 진행 중인 작업은 끝까지 기다림)
+        """
+        depth = len(self.levels())
+        dependents: Dict[str, List[str]] = {name: [] for name in self.tasks}
+        waiting = {name: len(task.deps) for name, task in self.tasks.items()}
+        for task in self.tasks.values():
+            for dep in task.deps:
+                dependents[dep].append(task.name)
+
+        results: Dict[str, Any] = {}
+        timings: Dict[str, Tuple[float, float]] = {}
+        failed: Dict[str, BaseException] = {}
+        lock = threading.Lock()
+        start = time.perf_counter()
+
+        def execute(task: Task):
+            with lock:
+                inputs = {dep: results[dep] for dep in task.deps}
+            began = time.perf_counter() - start
+            result = task.action(inputs)
+            timings[task.name] = (began, time.perf_counter() - start)
+            return result
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provision") as executor:
+            running = {executor.submit(execute, self.tasks[name]): name
+                       for name, count in waiting.items() if count == 0}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ {name} 실패: {e}")
+                        failed[name] = e
+                        continue
+                    with lock:
+                        results[name] = result
+                    logger.info(f"✅ {name}: {result}")
+                    if failed:
+                        continue
+                    for dependent in dependents[name]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            running[executor.submit(execute, self.tasks[dependent])] = dependent
+
+        if failed:
+            skipped = sorted(name for name in self.tasks if name not in results and name not in failed)
+            raise ProvisioningError(f"작업 실패: {', '.join(sorted(failed))}", failed, results, skipped)
+        return GraphRun(results, timings, time.perf_counter() - start, depth)
+
+
+@dataclass
+class NetworkSpec:
+    """EKS 네트워크 구성 (기본값은 eks-cluster-create.sh와 동일)"""
+    region: str = "ap-northeast-2"
+    stack: str = "cloud-master-eks-cluster"
+    name_prefix: str = "cloud-master-eks"
+    vpc_cidr: str = "10.0.0.0/16"
+    # (AZ 접미사, CIDR)
+    subnets: Tuple[Tuple[str, str], ...] = (("a", "10.0.1.0/24"), ("c", "10.0.2.0/24"))
+    extra_tags: Dict[str, str] = field(default_factory=dict)
+
+    def name(self, suffix: str) -> str:
+        return f"{self.name_prefix}-{suffix}"
+
+
+@dataclass
+class NetworkResult:
+    vpc_id: str
+    subnet_ids: List[str]
+    internet_gateway_id: str
+    route_table_id: str
+    elapsed: float
+    depth: int
+    timings: Dict[str, Tuple[float, float]]
+
+    def shell_exports(self) -> str:
+        """eks-cluster-create.sh 변수 이름으로 export (eval용)"""
+        lines = [f"export VPC_ID={self.vpc_id}", f"export IGW_ID={self.internet_gateway_id}",
+                 f"export RT_ID={self.route_table_id}"]
+        lines += [f"export SUBNET_{i}_ID={subnet}" for i, subnet in enumerate(self.subnet_ids, 1)]
+        return "\n".join(lines)
+
+
+def ec2_client(region: str):
+    """재시도 설정이 적용된 EC2 클라이언트 (boto3 클라이언트는 스레드 간 공유 가능)"""
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client("ec2", region_name=region,
+                        config=Config(retries={"max_attempts": 10, "mode": "adaptive"}, max_pool_connections=32))
+
+
+class VpcProvisioner:
+    """EKS용 VPC 네트워크 멱등 프로비저닝"""
+
+    def __init__(self, spec: NetworkSpec, client=None, max_workers: int = 8):
+        """
+        Args:
+            spec: 네트워크 구성
+            client: boto3 EC2 클라이언트 (moto 등 로컬 대체 가능, 없으면 spec.region으로 생성)
+            max_workers: 동시 실행 작업 수
+        """
+        self.spec = spec
+        self.ec2 = client or ec2_client(spec.region)
+        self.max_workers = max_workers
+
+    # --- 공통 ---------------------------------------------------------------
+
+    def _tags(self, resource_type: str, name: str) -> List[Dict[str, Any]]:
+        tags = [{"Key": "Name", "Value": name}, {"Key": STACK_TAG, "Value": self.spec.stack}]
+        tags += [{"Key": k, "Value": v} for k, v in self.spec.extra_tags.items()]
+        return [{"ResourceType": resource_type, "Tags": tags}]
+
+    @staticmethod
+    def _filters(name: str, **extra: str) -> List[Dict[str, Any]]:
+        filters = [{"Name": "tag:Name", "Values": [name]}]
+        filters += [{"Name": key.replace("_", "-"), "Values": [value]} for key, value in extra.items()]
+        return filters
+
+    # --- 작업 ---------------------------------------------------------------
+
+    def _vpc(self, _) -> str:
+        name = self.spec.name("vpc")
+        found = self.ec2.describe_vpcs(Filters=self._filters(name))["Vpcs"]
+        if found:
+            return found[0]["VpcId"]
+        vpc = self.ec2.create_vpc(CidrBlock=self.spec.vpc_cidr, TagSpecifications=self._tags("vpc", name))["Vpc"]
+        return vpc["VpcId"]
+
+    def _vpc_dns(self, inputs) -> bool:
+        # EKS 노드 등록에 필요 (수정 API 자체가 멱등)
+        self.ec2.modify_vpc_attribute(VpcId=inputs["vpc"], EnableDnsSupport={"Value": True})
+        self.ec2.modify_vpc_attribute(VpcId=inputs["vpc"], EnableDnsHostnames={"Value": True})
+        return True
+
+    def _internet_gateway(self, _) -> str:
+        name = self.spec.name("igw")
+        found = self.ec2.describe_internet_gateways(Filters=self._filters(name))["InternetGateways"]
+        if found:
+            return found[0]["InternetGatewayId"]
+        igw = self.ec2.create_internet_gateway(TagSpecifications=self._tags("internet-gateway", name))
+        return igw["InternetGateway"]["InternetGatewayId"]
+
+    def _attach_internet_gateway(self, inputs) -> str:
+        igw_id, vpc_id = inputs["igw"], inputs["vpc"]
+        igw = self.ec2.describe_internet_gateways(InternetGatewayIds=[igw_id])["InternetGateways"][0]
+        attached = [a["VpcId"] for a in igw.get("Attachments", [])]
+        if vpc_id not in attached:
+            if attached:
+                raise RuntimeError(f"{igw_id}가 다른 VPC({attached[0]})에 연결되어 있습니다")
+            self.ec2.attach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
+        return vpc_id
+
+    def _subnet(self, index: int, zone_suffix: str, cidr: str) -> Callable[[Dict[str, Any]], str]:
+        def create(inputs) -> str:
+            name = self.spec.name(f"subnet-{index}")
+            found = self.ec2.describe_subnets(Filters=self._filters(name, vpc_id=inputs["vpc"]))["Subnets"]
+            if found:
+                return found[0]["SubnetId"]
+            tags = self._tags("subnet", name)
+            # 퍼블릭 로드 밸런서 배치용 EKS 서브넷 태그
+            tags[0]["Tags"].append({"Key": "kubernetes.io/role/elb", "Value": "1"})
+            subnet = self.ec2.create_subnet(VpcId=inputs["vpc"], CidrBlock=cidr,
+                                            AvailabilityZone=f"{self.spec.region}{zone_suffix}",
+                                            TagSpecifications=tags)["Subnet"]
+            return subnet["SubnetId"]
+        return create
+
+    def _public_ip(self, index: int) -> Callable[[Dict[str, Any]], bool]:
+        def modify(inputs) -> bool:
+            self.ec2.modify_subnet_attribute(SubnetId=inputs[f"subnet-{index}"], MapPublicIpOnLaunch={"Value": True})
+            return True
+        return modify
+
+    def _route_table(self, inputs) -> str:
+        name = self.spec.name("rt")
+        found = self.ec2.describe_route_tables(Filters=self._filters(name, vpc_id=inputs["vpc"]))["RouteTables"]
+        if found:
+            return found[0]["RouteTableId"]
+        table = self.ec2.create_route_table(VpcId=inputs["vpc"], TagSpecifications=self._tags("route-table", name))
+        return table["RouteTable"]["RouteTableId"]
+
+    def _default_route(self, inputs) -> str:
+        table_id, igw_id = inputs["route_table"], inputs["igw"]
+        table = self.ec2.describe_route_tables(RouteTableIds=[table_id])["RouteTables"][0]
+        if not any(route.get("DestinationCidrBlock") == "0.0.0.0/0" for route in table.get("Routes", [])):
+            self.ec2.create_route(RouteTableId=table_id, DestinationCidrBlock="0.0.0.0/0", GatewayId=igw_id)
+        return "0.0.0.0/0"
+
+    def _associate(self, index: int) -> Callable[[Dict[str, Any]], str]:
+        def associate(inputs) -> str:
+            table_id, subnet_id = inputs["route_table"], inputs[f"subnet-{index}"]
+            table = self.ec2.describe_route_tables(RouteTableIds=[table_id])["RouteTables"][0]
+            for association in table.get("Associations", []):
+                if association.get("SubnetId") == subnet_id:
+                    return association["RouteTableAssociationId"]
+            return self.ec2.associate_route_table(RouteTableId=table_id, SubnetId=subnet_id)["AssociationId"]
+        return associate
+
+    # --- 실행 ---------------------------------------------------------------
+
+    def graph(self) -> ProvisioningGraph:
+        graph = ProvisioningGraph()
+        graph.add("vpc", self._vpc)
+        graph.add("igw", self._internet_gateway)
+        graph.add("vpc_dns", self._vpc_dns, ("vpc",))
+        graph.add("igw_attach", self._attach_internet_gateway, ("vpc", "igw"))
+        graph.add("route_table", self._route_table, ("vpc",))
+        graph.add("default_route", self._default_route, ("route_table", "igw", "igw_attach"))
+        for index, (zone_suffix, cidr) in enumerate(self.spec.subnets, 1):
+            graph.add(f"subnet-{index}", self._subnet(index, zone_suffix, cidr), ("vpc",))
+            graph.add(f"subnet-{index}-public-ip", self._public_ip(index), (f"subnet-{index}",))
+            graph.add(f"subnet-{index}-route", self._associate(index), ("route_table", f"subnet-{index}"))
+        return graph
+
+    def provision(self) -> NetworkResult:
+        """네트워크 생성 또는 기존 리소스 재사용"""
+        run = self.graph().run(self.max_workers)
+        logger.info(f"🌐 VPC 네트워크 준비 완료: 작업 {len(run.results)}개, 깊이 {run.depth}, {run.elapsed:.1f}초")
+        return NetworkResult(
+            vpc_id=run.results["vpc"],
+            subnet_ids=[run.results[f"subnet-{i}"] for i in range(1, len(self.spec.subnets) + 1)],
+            internet_gateway_id=run.results["igw"], route_table_id=run.results["route_table"],
+            elapsed=run.elapsed, depth=run.depth, timings=run.timings)
+
+    def destroy(self) -> Dict[str, Any]:
+        """태그로 찾은 네트워크 리소스 삭제 (생성의 역순 그래프, 없는 리소스는 건너뜀)"""
+        vpcs = self.ec2.describe_vpcs(Filters=self._filters(self.spec.name("vpc")))["Vpcs"]
+        igws = self.ec2.describe_internet_gateways(Filters=self._filters(self.spec.name("igw")))["InternetGateways"]
+        vpc_id = vpcs[0]["VpcId"] if vpcs else None
+        subnets = self.ec2.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])["Subnets"] \
+            if vpc_id else []
+        tables = self.ec2.describe_route_tables(Filters=self._filters(self.spec.name("rt"), vpc_id=vpc_id))[
+            "RouteTables"] if vpc_id else []
+
+        graph = ProvisioningGraph()
+        table_tasks = []
+        for table in tables:
+            def delete_table(_, table=table):
+                for association in table.get("Associations", []):
+                    if not association.get("Main"):
+                        self.ec2.disassociate_route_table(AssociationId=association["RouteTableAssociationId"])
+                self.ec2.delete_route_table(RouteTableId=table["RouteTableId"])
+                return table["RouteTableId"]
+            graph.add(f"route_table:{table['RouteTableId']}", delete_table)
+            table_tasks.append(f"route_table:{table['RouteTableId']}")
+        igw_tasks = []
+        for igw in igws:
+            def delete_igw(_, igw=igw):
+                for attachment in igw.get("Attachments", []):
+                    self.ec2.detach_internet_gateway(InternetGatewayId=igw["InternetGatewayId"],
+                                                     VpcId=attachment["VpcId"])
+                self.ec2.delete_internet_gateway(InternetGatewayId=igw["InternetGatewayId"])
+                return igw["InternetGatewayId"]
+            graph.add(f"igw:{igw['InternetGatewayId']}", delete_igw, tuple(table_tasks))
+            igw_tasks.append(f"igw:{igw['InternetGatewayId']}")
+        subnet_tasks = []
+        for subnet in subnets:
+            def delete_subnet(_, subnet_id=subnet["SubnetId"]):
+                self.ec2.delete_subnet(SubnetId=subnet_id)
+                return subnet_id
+            graph.add(f"subnet:{subnet['SubnetId']}", delete_subnet, tuple(table_tasks))
+            subnet_tasks.append(f"subnet:{subnet['SubnetId']}")
+        if vpc_id:
+            def delete_vpc(_):
+                self.ec2.delete_vpc(VpcId=vpc_id)
+                return vpc_id
+            graph.add(f"vpc:{vpc_id}", delete_vpc, tuple(table_tasks + igw_tasks + subnet_tasks))
+        run = graph.run(self.max_workers)
+        logger.info(f"🧹 VPC 네트워크 삭제 완료: {len(run.results)}개 리소스, {run.elapsed:.1f}초")
+        return {"deleted": sorted(run.results), "elapsed": run.elapsed}
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="EKS용 AWS 네트워크 동시 프로비저닝")
+    parser.add_argument("--region", default=NetworkSpec.region, help="AWS 리전")
+    parser.add_argument("--stack", default=NetworkSpec.stack, help="스택(클러스터) 이름 태그")
+    parser.add_argument("--name-prefix", default=NetworkSpec.name_prefix, help="리소스 Name 태그 접두사")
+    parser.add_argument("--vpc-cidr", default=NetworkSpec.vpc_cidr)
+    parser.add_argument("--subnet", action="append", metavar="AZ:CIDR",
+                        help="AZ 접미사와 CIDR (예: a:10.0.1.0/24, 반복 가능)")
+    parser.add_argument("--max-workers", type=int, default=8, help="동시 실행 작업 수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력 (기본: export 문)")
+    parser.add_argument("action", choices=["up", "down"], help="up: 생성/재사용, down: 삭제")
+    args = parser.parse_args(argv)
+
+    spec = NetworkSpec(region=args.region, stack=args.stack, name_prefix=args.name_prefix, vpc_cidr=args.vpc_cidr)
+    if args.subnet:
+        spec.subnets = tuple(tuple(value.split(":", 1)) for value in args.subnet)
+    provisioner = VpcProvisioner(spec, max_workers=args.max_workers)
+    try:
+        if args.action == "down":
+            print(json.dumps(provisioner.destroy(), ensure_ascii=False, indent=2))
+            return 0
+        result = provisioner.provision()
+    except ProvisioningError as e:
+        logger.error(f"❌ {e} (건너뜀: {', '.join(e.skipped) or '-'})")
+        return 1
+    if args.json:
+        print(json.dumps(result.__dict__, ensure_ascii=False, indent=2))
+    else:
+        print(result.shell_exports())
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
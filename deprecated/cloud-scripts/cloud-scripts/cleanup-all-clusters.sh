@@ -24,6 +24,11 @@ AWS_REGION="ap-northeast-2"
 FORCE_DELETE=false
 GCP_ONLY=false
 AWS_ONLY=false
+USE_INVENTORY=false
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# 인벤토리 조회(inventory), API 할당량 공유 실행(limited)
+source "$SCRIPT_DIR/automation-helpers.sh"
 
 # 도움말 함수
 show_help() {
@@ -37,6 +42,7 @@ show_help() {
     --project-id ID     GCP 프로젝트 ID 지정
     --zone ZONE         GCP 존 지정 (기본값: asia-northeast3-a)
     --region REGION     AWS 리전 지정 (기본값: ap-northeast-2)
+    --use-inventory     리소스 목록을 로컬 인벤토리 스냅샷에서 조회 (TTL 내 재조회 없음)
     --help              이 도움말 표시
 
 예시:
@@ -76,6 +82,10 @@ parse_arguments() {
                 AWS_REGION="$2"
                 shift 2
                 ;;
+            --use-inventory)
+                USE_INVENTORY=true
+                shift
+                ;;
             --help)
                 show_help
                 exit 0
@@ -140,7 +150,12 @@ delete_gcp_clusters() {
     log_info "현재 GCP 프로젝트: $current_project"
     
     # 모든 클러스터 목록 가져오기
-    local clusters=$(gcloud container clusters list --format="value(name,zone)" 2>/dev/null)
+    local clusters
+    if [ "$USE_INVENTORY" = true ]; then
+        clusters=$(inventory list gke_cluster --fields name,region 2>/dev/null)
+    else
+        clusters=$(gcloud container clusters list --format="value(name,zone)" 2>/dev/null)
+    fi
     
     if [ -z "$clusters" ]; then
         log_info "삭제할 GCP 클러스터가 없습니다."
@@ -165,10 +180,11 @@ delete_gcp_clusters() {
     # 클러스터 삭제
     echo "$clusters" | while read name zone; do
         log_info "클러스터 삭제 중: $name ($zone)"
-        gcloud container clusters delete "$name" --zone="$zone" --quiet
+        limited gcloud container clusters delete "$name" --zone="$zone" --quiet
         
         if [ $? -eq 0 ]; then
             log_success "✅ 클러스터 삭제 완료: $name"
+            [ "$USE_INVENTORY" = true ] && inventory forget gke_cluster "$name"
         else
             log_error "❌ 클러스터 삭제 실패: $name"
         fi
@@ -182,7 +198,12 @@ delete_aws_clusters() {
     log_info "AWS EKS 클러스터 삭제 시작..."
     
     # 모든 클러스터 목록 가져오기 (더 안전한 방법)
-    local cluster_json=$(eksctl get cluster --region "$AWS_REGION" --output json 2>/dev/null)
+    local cluster_json
+    if [ "$USE_INVENTORY" = true ]; then
+        cluster_json=$(inventory list eks_cluster --region "$AWS_REGION" --json 2>/dev/null)
+    else
+        cluster_json=$(eksctl get cluster --region "$AWS_REGION" --output json 2>/dev/null)
+    fi
     
     # JSON이 유효한지 확인
     if ! echo "$cluster_json" | jq empty 2>/dev/null; then
@@ -222,10 +243,11 @@ delete_aws_clusters() {
         # null 값이나 빈 값 건너뛰기
         if [ -n "$name" ] && [ "$name" != "null" ]; then
             log_info "클러스터 삭제 중: $name"
-            eksctl delete cluster --name "$name" --region "$AWS_REGION" --wait
+            limited eksctl delete cluster --name "$name" --region "$AWS_REGION" --wait
             
             if [ $? -eq 0 ]; then
                 log_success "✅ 클러스터 삭제 완료: $name"
+                [ "$USE_INVENTORY" = true ] && inventory forget eks_cluster "$name"
             else
                 log_error "❌ 클러스터 삭제 실패: $name"
             fi
@@ -244,7 +266,12 @@ cleanup_additional_resources() {
         log_info "GCP 추가 리소스 정리 중..."
         
         # 사용하지 않는 디스크 정리
-        local unused_disks=$(gcloud compute disks list --filter="status:UNATTACHED" --format="value(name,zone)" 2>/dev/null)
+        local unused_disks
+        if [ "$USE_INVENTORY" = true ]; then
+            unused_disks=$(inventory list gce_disk --status UNATTACHED --fields name,region 2>/dev/null)
+        else
+            unused_disks=$(gcloud compute disks list --filter="status:UNATTACHED" --format="value(name,zone)" 2>/dev/null)
+        fi
         if [ -n "$unused_disks" ]; then
             log_info "사용하지 않는 디스크 발견:"
             echo "$unused_disks" | while read name zone; do
@@ -253,14 +280,19 @@ cleanup_additional_resources() {
             
             if [ "$FORCE_DELETE" = true ]; then
                 echo "$unused_disks" | while read name zone; do
-                    gcloud compute disks delete "$name" --zone="$zone" --quiet
+                    limited gcloud compute disks delete "$name" --zone="$zone" --quiet
                     log_success "디스크 삭제 완료: $name"
                 done
             fi
         fi
         
         # 사용하지 않는 방화벽 규칙 정리
-        local firewall_rules=$(gcloud compute firewall-rules list --filter="name~cloud-master" --format="value(name)" 2>/dev/null)
+        local firewall_rules
+        if [ "$USE_INVENTORY" = true ]; then
+            firewall_rules=$(inventory list gce_firewall_rule --name '*cloud-master*' --fields name 2>/dev/null)
+        else
+            firewall_rules=$(gcloud compute firewall-rules list --filter="name~cloud-master" --format="value(name)" 2>/dev/null)
+        fi
         if [ -n "$firewall_rules" ]; then
             log_info "Cloud Master 관련 방화벽 규칙 발견:"
             echo "$firewall_rules" | while read name; do
@@ -269,7 +301,7 @@ cleanup_additional_resources() {
             
             if [ "$FORCE_DELETE" = true ]; then
                 echo "$firewall_rules" | while read name; do
-                    gcloud compute firewall-rules delete "$name" --quiet
+                    limited gcloud compute firewall-rules delete "$name" --quiet
                     log_success "방화벽 규칙 삭제 완료: $name"
                 done
             fi
@@ -281,7 +313,12 @@ cleanup_additional_resources() {
         log_info "AWS 추가 리소스 정리 중..."
         
         # Cloud Master 관련 VPC 정리
-        local vpcs=$(aws ec2 describe-vpcs --filters "Name=tag:Name,Values=*cloud-master*" --query 'Vpcs[*].VpcId' --output text 2>/dev/null)
+        local vpcs
+        if [ "$USE_INVENTORY" = true ]; then
+            vpcs=$(inventory list vpc --region "$AWS_REGION" --name '*cloud-master*' --fields resource_id 2>/dev/null)
+        else
+            vpcs=$(aws ec2 describe-vpcs --filters "Name=tag:Name,Values=*cloud-master*" --query 'Vpcs[*].VpcId' --output text 2>/dev/null)
+        fi
         if [ -n "$vpcs" ]; then
             log_info "Cloud Master 관련 VPC 발견:"
             echo "$vpcs" | while read vpc; do
@@ -290,14 +327,19 @@ cleanup_additional_resources() {
             
             if [ "$FORCE_DELETE" = true ]; then
                 echo "$vpcs" | while read vpc; do
-                    aws ec2 delete-vpc --vpc-id "$vpc"
+                    limited aws ec2 delete-vpc --vpc-id "$vpc"
                     log_success "VPC 삭제 완료: $vpc"
                 done
             fi
         fi
         
         # Cloud Master 관련 보안 그룹 정리
-        local security_groups=$(aws ec2 describe-security-groups --filters "Name=group-name,Values=*cloud-master*" --query 'SecurityGroups[*].GroupId' --output text 2>/dev/null)
+        local security_groups
+        if [ "$USE_INVENTORY" = true ]; then
+            security_groups=$(inventory list security_group --region "$AWS_REGION" --name '*cloud-master*' --fields resource_id 2>/dev/null)
+        else
+            security_groups=$(aws ec2 describe-security-groups --filters "Name=group-name,Values=*cloud-master*" --query 'SecurityGroups[*].GroupId' --output text 2>/dev/null)
+        fi
         if [ -n "$security_groups" ]; then
             log_info "Cloud Master 관련 보안 그룹 발견:"
             echo "$security_groups" | while read sg; do
@@ -306,7 +348,7 @@ cleanup_additional_resources() {
             
             if [ "$FORCE_DELETE" = true ]; then
                 echo "$security_groups" | while read sg; do
-                    aws ec2 delete-security-group --group-id "$sg"
+                    limited aws ec2 delete-security-group --group-id "$sg"
                     log_success "보안 그룹 삭제 완료: $sg"
                 done
             fi
@@ -320,6 +362,13 @@ cleanup_additional_resources() {
 check_costs() {
     log_info "비용 확인 중..."
     
+    # 인벤토리 스냅샷 기반 비용 추정 (리소스별/테넌트별, 유휴 리소스 경고)
+    if [ "$USE_INVENTORY" = true ]; then
+        log_info "남은 리소스 예상 비용:"
+        PYTHONPATH="$SCRIPT_DIR" python3 -m automation_tests.cost_engine --aws-region "$AWS_REGION" \
+            || log_warning "인벤토리 기반 비용 추정에 실패했습니다."
+    fi
+    
     # GCP 비용 확인
     if [ "$AWS_ONLY" = false ]; then
         log_info "GCP 비용 확인:"
@@ -348,6 +397,12 @@ main() {
     # 환경 체크
     check_environment
     
+    # 인벤토리 스냅샷 갱신 (모든 리소스 유형을 동시에 한 번만 조회)
+    if [ "$USE_INVENTORY" = true ]; then
+        log_info "리소스 인벤토리 스냅샷 갱신 중..."
+        inventory refresh > /dev/null || log_warning "일부 리소스 유형의 인벤토리 조회에 실패했습니다."
+    fi
+    
     # GCP 클러스터 삭제
     if [ "$AWS_ONLY" = false ]; then
         delete_gcp_clusters
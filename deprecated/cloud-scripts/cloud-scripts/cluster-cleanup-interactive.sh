@@ -28,6 +28,13 @@ AWS_REGION="ap-northeast-2"
 GCP_PROJECT="cloud-deployment-471606"
 GCP_ZONE="asia-northeast3-a"
 
+# 목록 메뉴를 로컬 인벤토리 스냅샷에서 조회 (USE_INVENTORY=true ./cluster-cleanup-interactive.sh)
+USE_INVENTORY="${USE_INVENTORY:-false}"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# 인벤토리 조회(inventory), API 할당량 공유 실행(limited)
+source "$SCRIPT_DIR/automation-helpers.sh"
+
 # 체크포인트 파일
 CHECKPOINT_FILE="cluster-cleanup-checkpoint.json"
 
@@ -116,6 +123,24 @@ check_gcp_credentials() {
 list_eks_clusters() {
     log_info "EKS 클러스터 목록 조회 중..."
     
+    if [ "$USE_INVENTORY" = true ]; then
+        local rows=$(inventory list eks_cluster --region "$AWS_REGION" --fields name,status,version,created 2>/dev/null)
+        if [ -z "$rows" ]; then
+            log_warning "EKS 클러스터가 없습니다."
+            return 1
+        fi
+        echo ""
+        log_info "=== EKS 클러스터 목록 (인벤토리 스냅샷) ==="
+        while IFS=$'\t' read -r cluster status version created; do
+            echo "  📦 $cluster"
+            echo "     상태: $status"
+            echo "     버전: $version"
+            echo "     생성일: $created"
+            echo ""
+        done <<< "$rows"
+        return 0
+    fi
+    
     local clusters=$(aws eks list-clusters --region "$AWS_REGION" --query 'clusters[]' --output text 2>/dev/null)
     
     if [ -z "$clusters" ]; then
@@ -155,8 +180,9 @@ delete_eks_cluster() {
     
     log_info "EKS 클러스터 삭제 중: $cluster_name"
     
-    if eksctl delete cluster --name "$cluster_name" --region "$AWS_REGION" --wait; then
+    if limited eksctl delete cluster --name "$cluster_name" --region "$AWS_REGION" --wait; then
         log_success "EKS 클러스터 삭제 완료: $cluster_name"
+        [ "$USE_INVENTORY" = true ] && inventory forget eks_cluster "$cluster_name"
         return 0
     else
         log_error "EKS 클러스터 삭제 실패: $cluster_name"
@@ -172,6 +198,24 @@ delete_eks_cluster() {
 list_gke_clusters() {
     log_info "GKE 클러스터 목록 조회 중..."
     
+    if [ "$USE_INVENTORY" = true ]; then
+        local rows=$(inventory list gke_cluster --fields name,status,version,node_count 2>/dev/null)
+        if [ -z "$rows" ]; then
+            log_warning "GKE 클러스터가 없습니다."
+            return 1
+        fi
+        echo ""
+        log_info "=== GKE 클러스터 목록 (인벤토리 스냅샷) ==="
+        while IFS=$'\t' read -r cluster status version node_count; do
+            echo "  📦 $cluster"
+            echo "     상태: $status"
+            echo "     버전: $version"
+            echo "     노드 수: $node_count"
+            echo ""
+        done <<< "$rows"
+        return 0
+    fi
+    
     local clusters=$(gcloud container clusters list --format="value(name)" 2>/dev/null)
     
     if [ -z "$clusters" ]; then
@@ -211,8 +255,9 @@ delete_gke_cluster() {
     
     log_info "GKE 클러스터 삭제 중: $cluster_name"
     
-    if gcloud container clusters delete "$cluster_name" --zone="$GCP_ZONE" --quiet; then
+    if limited gcloud container clusters delete "$cluster_name" --zone="$GCP_ZONE" --quiet; then
         log_success "GKE 클러스터 삭제 완료: $cluster_name"
+        [ "$USE_INVENTORY" = true ] && inventory forget gke_cluster "$cluster_name"
         return 0
     else
         log_error "GKE 클러스터 삭제 실패: $cluster_name"
@@ -338,7 +383,7 @@ full_cleanup_menu() {
     if [ -n "$eks_clusters" ]; then
         for cluster in $eks_clusters; do
             log_info "EKS 클러스터 삭제: $cluster"
-            eksctl delete cluster --name "$cluster" --region "$AWS_REGION" --wait
+            limited eksctl delete cluster --name "$cluster" --region "$AWS_REGION" --wait
         done
     else
         log_info "삭제할 EKS 클러스터가 없습니다."
@@ -350,7 +395,7 @@ full_cleanup_menu() {
     if [ -n "$gke_clusters" ]; then
         for cluster in $gke_clusters; do
             log_info "GKE 클러스터 삭제: $cluster"
-            gcloud container clusters delete "$cluster" --zone="$GCP_ZONE" --quiet
+            limited gcloud container clusters delete "$cluster" --zone="$GCP_ZONE" --quiet
         done
     else
         log_info "삭제할 GKE 클러스터가 없습니다."
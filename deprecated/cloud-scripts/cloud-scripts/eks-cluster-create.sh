@@ -30,6 +30,9 @@ VERSION="1.28"
 # 체크포인트 파일
 CHECKPOINT_FILE="eks-cluster-checkpoint.json"
 
+# Python 자동화 모듈 경로 (automation_tests)
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
 # 체크포인트 로드
 load_checkpoint() {
     if [ -f "$CHECKPOINT_FILE" ]; then
@@ -180,6 +183,23 @@ create_vpc() {
     
     log_info "새 VPC 및 서브넷 생성 중..."
     
+    # boto3가 있으면 의존성 그래프 기반 동시 프로비저닝 (없으면 아래 순차 방식)
+    if python3 -c "import boto3" 2>/dev/null; then
+        local exports
+        if exports=$(PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" \
+            python3 -m automation_tests.vpc_provisioner --region "$REGION" --stack "$CLUSTER_NAME" up); then
+            eval "$exports"
+            VPC_CREATED="true"
+            log_success "VPC 및 서브넷 생성 완료 (동시 프로비저닝)"
+            log_info "VPC ID: $VPC_ID"
+            log_info "서브넷 1 ID: $SUBNET_1_ID"
+            log_info "서브넷 2 ID: $SUBNET_2_ID"
+            return 0
+        fi
+        log_error "VPC 프로비저닝 실패 (다시 실행하면 태그로 생성된 리소스를 재사용해 이어서 진행합니다)"
+        exit 1
+    fi
+    
     # VPC 생성
     VPC_ID=$(aws ec2 create-vpc \
         --cidr-block 10.0.0.0/16 \
@@ -468,6 +488,14 @@ check_cluster_status() {
     log_info "시스템 Pod 상태:"
     kubectl get pods -n kube-system
     
+    # 전체 노드/Pod 준비 상태 집계 (대규모 목록도 스트리밍으로 처리)
+    if command -v python3 &> /dev/null; then
+        log_info "준비 상태 요약:"
+        PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.kubectl_stream nodes
+        PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.kubectl_stream pods -A --top 5 \
+            || log_warning "Pod 상태 집계 실패"
+    fi
+    
     # 네임스페이스 확인
     log_info "네임스페이스:"
     kubectl get namespaces
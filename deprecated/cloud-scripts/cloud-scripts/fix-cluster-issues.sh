@@ -17,6 +17,10 @@ log_success() { echo -e "${GREEN}[SUCCESS]${NC} $1"; }
 log_warning() { echo -e "${YELLOW}[WARNING]${NC} $1"; }
 log_error() { echo -e "${RED}[ERROR]${NC} $1"; }
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# false면 마지막 진단 번들 수집 생략
+COLLECT_DIAGNOSTICS="${COLLECT_DIAGNOSTICS:-true}"
+
 echo "=== 클러스터 문제 해결 통합 스크립트 ==="
 echo ""
 
@@ -211,3 +215,15 @@ else
     log_info "상세 오류 정보:"
     kubectl get nodes 2>&1 | head -5
 fi
+
+# 진단 번들 수집 (노드/이벤트/컴포넌트 상태/Pod describe/문제 Pod 로그를 동시에 조회해 tar.gz 하나로 저장)
+if [ "$COLLECT_DIAGNOSTICS" = "true" ] && command -v python3 &> /dev/null; then
+    echo ""
+    log_info "진단 번들 수집 중..."
+    if BUNDLE=$(PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.diagnostics_bundle \
+        -o "cluster-diagnostics-$(date +%Y%m%d-%H%M%S).tar.gz"); then
+        log_success "✅ 진단 번들: $BUNDLE (목차: tar -xOzf $BUNDLE index.json)"
+    else
+        log_warning "⚠️ 클러스터에 연결할 수 없어 진단 번들을 수집하지 못했습니다"
+    fi
+fi
@@ -29,6 +29,18 @@ TARGET_PORT=3000
 # 체크포인트 파일
 CHECKPOINT_FILE="k8s-app-deploy-checkpoint.json"
 
+# 캐시/다이제스트 기반 이미지 빌더 (scripts/image_builder.py)
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+IMAGE_BUILDER="${IMAGE_BUILDER:-$SCRIPT_DIR/../../../scripts/image_builder.py}"
+STARTUP_PROFILER="${STARTUP_PROFILER:-$SCRIPT_DIR/../../../scripts/pod_startup_profiler.py}"
+# 과정에서 만드는 Docker 객체 라벨 (automation_tests/docker_cleanup.py가 라벨 필터로 일괄 삭제)
+COURSE_LABEL="mcp.course=${MCP_COURSE:-container}"
+DAY_LABEL="mcp.day=${MCP_DAY:-2}"
+# true면 Deployment 생성 전에 모든 노드에 이미지 미리 받기
+PREPULL_IMAGES="${PREPULL_IMAGES:-false}"
+# true면 Deployment 생성 후 rollout 완료를 기다려 Pod 기동 구간 분석 (실행 이력 저장소에 기록)
+PROFILE_STARTUP="${PROFILE_STARTUP:-false}"
+
 # 체크포인트 로드
 load_checkpoint() {
     if [ -f "$CHECKPOINT_FILE" ]; then
@@ -83,8 +95,14 @@ build_docker_image() {
         create_default_dockerfile
     fi
     
-    # Docker 이미지 빌드
-    docker build -t "$IMAGE_NAME:$IMAGE_TAG" .
+    # Docker 이미지 빌드 (buildx 사용 가능 시 로컬 BuildKit 캐시 재사용, 변경 없으면 생략)
+    if [ -f "$IMAGE_BUILDER" ] && docker buildx version &> /dev/null; then
+        python3 "$IMAGE_BUILDER" --name "$IMAGE_NAME" --tag "$IMAGE_TAG" --context . \
+            --no-push --cache local --cache-dir "${BUILDX_CACHE_DIR:-$HOME/.cache/mcp_cloud/buildx}" \
+            --label "$COURSE_LABEL" --label "$DAY_LABEL"
+    else
+        docker build --label "$COURSE_LABEL" --label "$DAY_LABEL" -t "$IMAGE_NAME:$IMAGE_TAG" .
+    fi
     
     if [ $? -eq 0 ]; then
         log_success "Docker 이미지 빌드 완료: $IMAGE_NAME:$IMAGE_TAG"
@@ -211,6 +229,11 @@ create_deployment() {
     
     log_info "Deployment 생성 중..."
     
+    if [ "$PREPULL_IMAGES" = "true" ] && command -v python3 &> /dev/null; then
+        python3 "$STARTUP_PROFILER" prepull --image "$IMAGE_NAME:$IMAGE_TAG" \
+            || log_warning "이미지 미리 받기 실패 (배포는 계속 진행)"
+    fi
+    
     cat <<EOF | kubectl apply -f -
 apiVersion: apps/v1
 kind: Deployment
@@ -274,6 +297,12 @@ EOF
     if [ $? -eq 0 ]; then
         DEPLOYMENT_CREATED="true"
         log_success "Deployment 생성 완료"
+        
+        # Pod 기동 구간 분석 (스케줄링/이미지 풀/컨테이너 시작/Ready)
+        if [ "$PROFILE_STARTUP" = "true" ] && command -v python3 &> /dev/null && \
+            kubectl rollout status deployment/"$APP_NAME" -n "$NAMESPACE" --timeout=300s; then
+            python3 "$STARTUP_PROFILER" profile -n "$NAMESPACE" -l app="$APP_NAME" --record
+        fi
     else
         log_error "Deployment 생성 실패"
         exit 1
@@ -413,6 +442,11 @@ check_deployment_status() {
     log_info "Pod 상태:"
     kubectl get pods -l app="$APP_NAME" -n "$NAMESPACE" -o wide
     
+    if command -v python3 &> /dev/null && ! PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m automation_tests.kubectl_stream pods -n "$NAMESPACE" -l app="$APP_NAME" --fail-on-not-ready; then
+        log_warning "준비되지 않은 Pod가 있습니다."
+    fi
+    
     # Service 상태 확인
     log_info "Service 상태:"
     kubectl get service "$APP_NAME-service" -n "$NAMESPACE" -o wide
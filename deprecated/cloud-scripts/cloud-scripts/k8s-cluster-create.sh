@@ -29,6 +29,18 @@ NODE_POOL_NAME="default-pool"
 # 체크포인트 파일
 CHECKPOINT_FILE="k8s-cluster-checkpoint.json"
 
+# Python 자동화 모듈 경로 (automation_tests)
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# 쿼터 초과/진행 중인 작업 등 일시적 오류는 백오프 후 재시도 (python3가 없으면 그대로 실행)
+retry_cli() {
+    if command -v python3 &> /dev/null; then
+        PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.retry_executor -- "$@"
+    else
+        "$@"
+    fi
+}
+
 # 체크포인트 로드
 load_checkpoint() {
     if [ -f "$CHECKPOINT_FILE" ]; then
@@ -179,7 +191,7 @@ create_cluster() {
     log_info "Kubernetes 클러스터 생성 중..."
     
     # GKE 클러스터 생성 (containerd 런타임 사용)
-    gcloud container clusters create "$CLUSTER_NAME" \
+    retry_cli gcloud container clusters create "$CLUSTER_NAME" \
         --zone="$ZONE" \
         --num-nodes="$NODE_COUNT" \
         --machine-type="$MACHINE_TYPE" \
@@ -323,6 +335,14 @@ check_cluster_status() {
     log_info "시스템 Pod 상태:"
     kubectl get pods -n kube-system
     
+    # 전체 노드/Pod 준비 상태 집계 (대규모 목록도 스트리밍으로 처리)
+    if command -v python3 &> /dev/null; then
+        log_info "준비 상태 요약:"
+        PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.kubectl_stream nodes
+        PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.kubectl_stream pods -A --top 5 \
+            || log_warning "Pod 상태 집계 실패"
+    fi
+    
     # 네임스페이스 확인
     log_info "네임스페이스:"
     kubectl get namespaces
@@ -16,6 +16,16 @@ log_success() { echo -e "${GREEN}[SUCCESS]${NC} $1"; }
 log_warning() { echo -e "${YELLOW}[WARNING]${NC} $1"; }
 log_error() { echo -e "${RED}[ERROR]${NC} $1"; }
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# true면 마지막에 진단 번들(tar.gz) 수집
+COLLECT_DIAGNOSTICS="${COLLECT_DIAGNOSTICS:-false}"
+# API 서버 지연 시간 측정 (읽기 전용, kubectl proxy 경유)
+MEASURE_LATENCY="${MEASURE_LATENCY:-true}"
+LATENCY_SAMPLES="${LATENCY_SAMPLES:-20}"
+LATENCY_CONCURRENCY="${LATENCY_CONCURRENCY:-4}"
+# true면 default 네임스페이스에 curl 프로브 Pod를 띄워 클러스터 내부 DNS/서비스 지연도 측정 (이미지 풀 필요)
+LATENCY_IN_CLUSTER="${LATENCY_IN_CLUSTER:-false}"
+
 echo "=== 클러스터 연결 테스트 ==="
 echo ""
 
@@ -71,4 +81,22 @@ log_info "시스템 Pod 상태:"
 kubectl get pods -n kube-system 2>/dev/null || log_warning "Pod 정보를 가져올 수 없습니다"
 echo ""
 
+# 7. 지연 시간 측정
+if [ "$MEASURE_LATENCY" = "true" ] && command -v python3 &> /dev/null; then
+    log_info "지연 시간 측정 중 (샘플 ${LATENCY_SAMPLES}개, 동시 ${LATENCY_CONCURRENCY}개)..."
+    LATENCY_ARGS=(--samples "$LATENCY_SAMPLES" --concurrency "$LATENCY_CONCURRENCY")
+    [ "$LATENCY_IN_CLUSTER" = "true" ] || LATENCY_ARGS+=(--skip-in-cluster)
+    PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.latency_probe \
+        "${LATENCY_ARGS[@]}" || log_warning "지연 시간 측정 중 일부 항목이 실패했습니다"
+    echo ""
+fi
+
+# 8. 진단 번들 (선택)
+if [ "$COLLECT_DIAGNOSTICS" = "true" ] && command -v python3 &> /dev/null; then
+    log_info "진단 번들 수집 중..."
+    PYTHONPATH="$SCRIPT_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.diagnostics_bundle \
+        -o "cluster-diagnostics-$(date +%Y%m%d-%H%M%S).tar.gz" || log_warning "진단 번들을 수집하지 못했습니다"
+    echo ""
+fi
+
 log_success "=== 테스트 완료 ==="
@@ -19,6 +19,13 @@ log_warning() { echo -e "${YELLOW}[WARNING]${NC} $1"; }
 log_error() { echo -e "${RED}[ERROR]${NC} $1"; }
 log_header() { echo -e "${PURPLE}=== $1 ===${NC}"; }
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# docker_cleanup 등 Python 자동화 모듈 위치
+AUTOMATION_DIR="${AUTOMATION_DIR:-$SCRIPT_DIR/../deprecated/cloud-scripts/cloud-scripts}"
+# 과정에서 만드는 Docker 객체 라벨 (정리 시 라벨 필터로 일괄 삭제)
+COURSE_LABEL="mcp.course=${MCP_COURSE:-container}"
+DAY_LABEL="mcp.day=${MCP_DAY:-1}"
+
 # 환경 체크 함수들
 check_kubectl() {
     if command -v kubectl &> /dev/null; then
@@ -181,7 +188,18 @@ build_and_push_image() {
     log_info "Docker 이미지 빌드 중..."
     log_info "이미지명: $FULL_IMAGE_NAME"
     
-    docker build -t "$FULL_IMAGE_NAME" -f "$DOCKERFILE_PATH" .
+    # buildx 사용 가능 시: BuildKit 레지스트리 캐시 + 콘텐츠 다이제스트 비교로 변경 없는 이미지는 빌드/푸시 생략
+    if command -v python3 &> /dev/null && docker buildx version &> /dev/null; then
+        if python3 "$SCRIPT_DIR/image_builder.py" --name "gcr.io/$PROJECT_ID/$IMAGE_NAME" --tag "$TAG" \
+            --context . --dockerfile "$DOCKERFILE_PATH" --label "$COURSE_LABEL" --label "$DAY_LABEL"; then
+            log_success "이미지 빌드/푸시 완료: $FULL_IMAGE_NAME"
+        else
+            log_error "Docker 이미지 빌드 실패"
+        fi
+        return
+    fi
+    
+    docker build --label "$COURSE_LABEL" --label "$DAY_LABEL" -t "$FULL_IMAGE_NAME" -f "$DOCKERFILE_PATH" .
     
     if [ $? -eq 0 ]; then
         log_success "Docker 이미지 빌드 완료"
@@ -351,6 +369,15 @@ cleanup_cluster() {
     else
         log_info "클러스터 삭제 취소됨"
     fi
+
+    # 로컬 Docker 객체는 과정 라벨 필터로 한 번에 정리 (Engine API prune)
+    if command -v python3 &> /dev/null && command -v docker &> /dev/null; then
+        read -p "과정 라벨($COURSE_LABEL, $DAY_LABEL)이 붙은 로컬 Docker 리소스도 정리하시겠습니까? (y/N): " CONFIRM
+        if [[ "$CONFIRM" =~ ^[Yy]$ ]]; then
+            PYTHONPATH="$AUTOMATION_DIR${PYTHONPATH:+:$PYTHONPATH}" python3 -m automation_tests.docker_cleanup \
+                --course "${COURSE_LABEL#mcp.course=}" --day "${DAY_LABEL#mcp.day=}" || log_warning "일부 Docker 리소스 정리 실패"
+        fi
+    fi
 }
 
 # 메인 메뉴
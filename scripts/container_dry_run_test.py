@@ -8,10 +8,14 @@ import os
 import sys
 import json
 import logging
+import argparse
 from pathlib import Path
 from typing import Dict, Any
 from unittest.mock import Mock, patch, MagicMock
 
+from run_store import RunRecorder, record_safely
+from step_profiler import add_profile_arguments, profiler_from_args
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -26,7 +30,12 @@ logger = logging.getLogger(__name__)
 class ContainerDryRunTest:
     """Container 과정 Dry-Run 테스트 클래스"""
     
-    def __init__(self):
+    def __init__(self, profiler=None):
+        """
+        Args:
+            profiler: StepProfiler (있으면 단계마다 프로파일링)
+        """
+        self.profiler = profiler
         self.test_results = {
             "bash_scripts": {},
             "python_scripts": {},
@@ -272,6 +281,8 @@ class ContainerDryRunTest:
         """모든 테스트 실행"""
         logger.info("🚀 Cloud Container 자동화 스크립트 Dry-Run 테스트 시작")
         
+        run = RunRecorder(kind="dry_run", profiler=self.profiler)
+
         # 1. Bash 스크립트 구문 검사
         logger.info("\n📋 1. Bash 스크립트 구문 검사")
         bash_scripts = [
@@ -280,9 +291,12 @@ class ContainerDryRunTest:
             "cloud-container-helper.sh"
         ]
         
-        for script in bash_scripts:
-            script_path = script
-            self.test_results["bash_scripts"][script] = self.test_bash_script_syntax(script_path)
+        with run.step("bash_scripts") as step:
+            for script in bash_scripts:
+                script_path = script
+                self.test_results["bash_scripts"][script] = self.test_bash_script_syntax(script_path)
+            if not all(r["syntax_valid"] for r in self.test_results["bash_scripts"].values()):
+                step.status = "failed"
         
         # 2. Python 스크립트 구문 검사
         logger.info("\n📋 2. Python 스크립트 구문 검사")
@@ -292,24 +306,31 @@ class ContainerDryRunTest:
             "../deprecated/cloud-scripts/cloud-scripts/automation_tests/test_container_course_automation.py"
         ]
         
-        for script in python_scripts:
-            self.test_results["python_scripts"][script] = self.test_python_script_syntax(script)
+        with run.step("python_scripts") as step:
+            for script in python_scripts:
+                self.test_results["python_scripts"][script] = self.test_python_script_syntax(script)
+            if not all(r["syntax_valid"] for r in self.test_results["python_scripts"].values()):
+                step.status = "failed"
         
         # 3. Kubernetes 명령어 테스트
         logger.info("\n📋 3. Kubernetes 명령어 테스트")
-        self.test_results["kubernetes_commands"] = self.test_kubernetes_commands()
+        with run.step("kubernetes_commands"):
+            self.test_results["kubernetes_commands"] = self.test_kubernetes_commands()
         
         # 4. Docker 명령어 테스트
         logger.info("\n📋 4. Docker 명령어 테스트")
-        self.test_results["docker_commands"] = self.test_docker_commands()
+        with run.step("docker_commands"):
+            self.test_results["docker_commands"] = self.test_docker_commands()
         
         # 5. GCP Container 명령어 테스트
         logger.info("\n📋 5. GCP Container 명령어 테스트")
-        self.test_results["gcp_commands"] = self.test_gcp_container_commands()
+        with run.step("gcp_commands"):
+            self.test_results["gcp_commands"] = self.test_gcp_container_commands()
         
         # 6. 의존성 테스트
         logger.info("\n📋 6. Container 과정 의존성 테스트")
-        self.test_results["dependencies"] = self.test_container_dependencies()
+        with run.step("dependencies"):
+            self.test_results["dependencies"] = self.test_container_dependencies()
         
         # 7. 전체 결과 요약
         self.test_results["overall_status"] = "completed"
@@ -317,6 +338,10 @@ class ContainerDryRunTest:
         # 결과 저장
         with open('container_dry_run_test_results.json', 'w', encoding='utf-8') as f:
             json.dump(self.test_results, f, ensure_ascii=False, indent=2)
+        # 결과 파일은 매번 덮어쓰므로 단계별 소요 시간은 실행 이력 저장소에 누적
+        record_safely("dry_run", run)
+        if self.profiler:
+            self.profiler.finish()
         
         logger.info("\n🎉 Container 과정 Dry-Run 테스트 완료!")
         logger.info("결과가 container_dry_run_test_results.json에 저장되었습니다.")
@@ -325,7 +350,11 @@ class ContainerDryRunTest:
 
 def main():
     """메인 함수"""
-    test = ContainerDryRunTest()
+    parser = argparse.ArgumentParser(description="Cloud Container 과정 자동화 스크립트 Dry-Run 테스트")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    test = ContainerDryRunTest(profiler=profiler_from_args(args, "dry_run"))
     results = test.run_all_tests()
     
     # 결과 요약 출력
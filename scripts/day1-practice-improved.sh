@@ -24,6 +24,11 @@ export CLUSTER_NAME="cloud-container-day1-cluster"
 export REGION="asia-northeast3"
 export PROJECT_ID=$(gcloud config get-value project 2>/dev/null)
 export NAMESPACE="default"
+# true면 샘플 앱 배포 전에 모든 노드에 이미지 미리 받기 (pre-pull DaemonSet)
+export PREPULL_IMAGES="${PREPULL_IMAGES:-false}"
+# true면 샘플 앱 배포 후 rollout 완료를 기다려 Pod 기동 구간 분석 (실행 이력 저장소에 기록)
+export PROFILE_STARTUP="${PROFILE_STARTUP:-false}"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # 환경 체크
 check_prerequisites() {
@@ -206,12 +211,24 @@ spec:
   type: LoadBalancer
 EOF
     
+    if [ "$PREPULL_IMAGES" = "true" ] && command -v python3 &> /dev/null; then
+        log_info "노드에 이미지 미리 받는 중..."
+        python3 "$SCRIPT_DIR/pod_startup_profiler.py" prepull --manifest sample-app-deployment.yaml \
+            || log_warning "이미지 미리 받기 실패 (배포는 계속 진행)"
+    fi
+    
     log_info "샘플 애플리케이션 배포 중..."
     kubectl apply -f sample-app-deployment.yaml
     
     if [ $? -eq 0 ]; then
         log_success "샘플 애플리케이션 배포 완료"
         
+        # Pod 기동 구간 분석 (스케줄링/이미지 풀/컨테이너 시작/Ready, cold/warm 비교)
+        if [ "$PROFILE_STARTUP" = "true" ] && command -v python3 &> /dev/null && \
+            kubectl rollout status deployment/sample-app --timeout=300s; then
+            python3 "$SCRIPT_DIR/pod_startup_profiler.py" profile -n "$NAMESPACE" -l app=sample-app --record
+        fi
+        
         log_info "배포 상태 확인 중..."
         kubectl get deployments
         kubectl get services
@@ -24,6 +24,19 @@ export HA_CLUSTER_NAME="cloud-container-ha-cluster"
 export REGION="asia-northeast3"
 export PROJECT_ID=$(gcloud config get-value project 2>/dev/null)
 export NAMESPACE="production"
+# HA 클러스터 노드 구성 (존당 노드 수, placement_simulator.py 사이징에도 사용)
+export HA_MACHINE_TYPE="${HA_MACHINE_TYPE:-e2-medium}"
+export HA_NODE_LOCATIONS="${HA_NODE_LOCATIONS:-asia-northeast3-a,asia-northeast3-b,asia-northeast3-c}"
+export HA_NUM_NODES="${HA_NUM_NODES:-2}"
+export HA_MIN_NODES="${HA_MIN_NODES:-1}"
+export HA_MAX_NODES="${HA_MAX_NODES:-10}"
+# VPA 업데이트 모드 (Off로 두고 rightsizing 추천값을 직접 적용할 수도 있음)
+export VPA_UPDATE_MODE="${VPA_UPDATE_MODE:-Auto}"
+# 사용량 수집 시간(초), 0이면 적정화 분석 생략
+export RIGHTSIZING_DURATION="${RIGHTSIZING_DURATION:-120}"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+# kubectl_stream 등 Python 자동화 모듈 위치
+AUTOMATION_DIR="${AUTOMATION_DIR:-$SCRIPT_DIR/../deprecated/cloud-scripts/cloud-scripts}"
 
 # Multi-AZ 클러스터 생성
 create_ha_cluster() {
@@ -36,12 +49,12 @@ create_ha_cluster() {
     
     gcloud container clusters create "$HA_CLUSTER_NAME" \
         --region="$REGION" \
-        --num-nodes=2 \
-        --machine-type=e2-medium \
+        --num-nodes="$HA_NUM_NODES" \
+        --machine-type="$HA_MACHINE_TYPE" \
         --enable-autoscaling \
-        --min-nodes=1 \
-        --max-nodes=10 \
-        --node-locations=asia-northeast3-a,asia-northeast3-b,asia-northeast3-c \
+        --min-nodes="$HA_MIN_NODES" \
+        --max-nodes="$HA_MAX_NODES" \
+        --node-locations="$HA_NODE_LOCATIONS" \
         --enable-autorepair \
         --enable-autoupgrade \
         --disk-size=20GB \
@@ -164,6 +177,16 @@ spec:
   type: LoadBalancer
 EOF
     
+    # 배포 전 오프라인 배치 시뮬레이션 (Pending 예상 시 경고만 출력)
+    if command -v python3 >/dev/null 2>&1; then
+        log_info "Pod 배치 시뮬레이션 중..."
+        if ! python3 "$SCRIPT_DIR/placement_simulator.py" anti-affinity-deployment.yaml --size \
+            --machine-type "$HA_MACHINE_TYPE" --zones "$HA_NODE_LOCATIONS" \
+            --min-nodes "$HA_MIN_NODES" --max-nodes "$HA_MAX_NODES"; then
+            log_warning "현재 노드 구성으로는 일부 Pod가 Pending 상태로 남을 것으로 예상됩니다"
+        fi
+    fi
+    
     log_info "Anti-Affinity 배포 생성 중..."
     kubectl apply -f anti-affinity-deployment.yaml
     
@@ -374,6 +397,27 @@ EOF
 }
 
 # 성능 최적화 설정
+# 사용량 기반 리소스 적정화 분석 (추천값만 출력, 적용은 선택)
+analyze_rightsizing() {
+    if [ "$RIGHTSIZING_DURATION" -le 0 ] || ! command -v python3 &> /dev/null; then
+        return 0
+    fi
+
+    log_info "리소스 사용량 수집 중 (${RIGHTSIZING_DURATION}초)..."
+    python3 "$SCRIPT_DIR/rightsizing.py" collect --namespace "$NAMESPACE" \
+        --duration "$RIGHTSIZING_DURATION" --interval 15 --output rightsizing-samples.jsonl
+
+    local manifest_args=()
+    if [ -f anti-affinity-deployment.yaml ]; then
+        manifest_args=(--manifest anti-affinity-deployment.yaml)
+    fi
+
+    log_info "requests/limits 추천 (현재 매니페스트 대비):"
+    if ! python3 "$SCRIPT_DIR/rightsizing.py" recommend rightsizing-samples.jsonl "${manifest_args[@]}"; then
+        log_warning "적정화 분석 실패 (샘플 부족 또는 metrics-server 미준비)"
+    fi
+}
+
 setup_performance_optimization() {
     log_header "성능 최적화 설정"
     
@@ -394,7 +438,7 @@ spec:
     kind: Deployment
     name: ha-app
   updatePolicy:
-    updateMode: "Auto"
+    updateMode: "$VPA_UPDATE_MODE"
   resourcePolicy:
     containerPolicies:
     - containerName: ha-app
@@ -465,6 +509,8 @@ EOF
         log_info "자동 스케일링 리소스 확인:"
         kubectl get vpa -n "$NAMESPACE"
         kubectl get hpa -n "$NAMESPACE"
+
+        analyze_rightsizing
     else
         log_error "성능 최적화 설정 실패"
         return 1
@@ -560,6 +606,10 @@ run_integration_test() {
     log_info "1. 클러스터 상태 확인"
     kubectl get nodes -o wide
     kubectl get pods -n "$NAMESPACE" -o wide
+    if command -v python3 &> /dev/null && ! PYTHONPATH="$AUTOMATION_DIR${PYTHONPATH:+:$PYTHONPATH}" \
+        python3 -m automation_tests.kubectl_stream pods -A --top 5 --fail-on-not-ready; then
+        log_warning "준비되지 않은 Pod가 있습니다"
+    fi
     
     log_info "2. 서비스 상태 확인"
     kubectl get services -n "$NAMESPACE"
@@ -591,21 +641,33 @@ cleanup() {
     if [[ "$confirm" =~ ^[Yy]$ ]]; then
         log_info "리소스 정리 중..."
         
-        # 애플리케이션 삭제
-        kubectl delete -f anti-affinity-deployment.yaml 2>/dev/null
-        kubectl delete -f network-policy.yaml 2>/dev/null
-        kubectl delete -f pod-security-policy.yaml 2>/dev/null
-        kubectl delete -f rbac.yaml 2>/dev/null
-        kubectl delete -f vpa.yaml 2>/dev/null
-        kubectl delete -f hpa.yaml 2>/dev/null
-        kubectl delete -f servicemonitor.yaml 2>/dev/null
-        
         # 모니터링 스택 삭제
         helm uninstall prometheus -n monitoring 2>/dev/null
-        kubectl delete namespace monitoring 2>/dev/null
         
-        # 네임스페이스 삭제
-        kubectl delete namespace "$NAMESPACE" 2>/dev/null
+        # 네임스페이스/클러스터 범위 리소스 동시 삭제 (finalizer에 막힌 객체 보고, 최대 120초)
+        # PodSecurityPolicy는 Kubernetes 1.25에서 제거되었으므로 API가 있을 때만 포함
+        local teardown_refs=()
+        if kubectl api-resources --api-group=policy -o name 2>/dev/null | grep -qx "podsecuritypolicies.policy"; then
+            teardown_refs+=(--ref podsecuritypolicy/ha-app-psp)
+        fi
+        if ! command -v python3 &> /dev/null || ! PYTHONPATH="$AUTOMATION_DIR${PYTHONPATH:+:$PYTHONPATH}" \
+            python3 -m automation_tests.namespace_teardown "$NAMESPACE" monitoring \
+            "${teardown_refs[@]}" --deadline 120; then
+            log_warning "일괄 정리 실패 또는 미완료, 개별 삭제로 진행합니다"
+            
+            # 애플리케이션 삭제
+            kubectl delete -f anti-affinity-deployment.yaml 2>/dev/null
+            kubectl delete -f network-policy.yaml 2>/dev/null
+            kubectl delete -f pod-security-policy.yaml 2>/dev/null
+            kubectl delete -f rbac.yaml 2>/dev/null
+            kubectl delete -f vpa.yaml 2>/dev/null
+            kubectl delete -f hpa.yaml 2>/dev/null
+            kubectl delete -f servicemonitor.yaml 2>/dev/null
+            
+            # 네임스페이스 삭제
+            kubectl delete namespace monitoring 2>/dev/null
+            kubectl delete namespace "$NAMESPACE" 2>/dev/null
+        fi
         
         # 클러스터 삭제
         gcloud container clusters delete "$HA_CLUSTER_NAME" --region="$REGION" --quiet
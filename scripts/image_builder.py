@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Cloud Container 과정 멀티 이미지 빌드 오케스트레이터
+여러 Docker 이미지를 BuildKit 캐시(import/export)로 동시에 빌드하고,
+빌드 컨텍스트의 콘텐츠 다이제스트가 레지스트리에 이미 있으면 빌드와 푸시를 건너뜁니다.
+
+- 콘텐츠 다이제스트: Dockerfile + 빌드 인자 + 라벨 + 컨텍스트 파일(.dockerignore 반영)의 SHA-256
+- 다이제스트 태그(ctx-<digest>)가 레지스트리에 있으면 요청한 태그만 서버 측에서 연결
+- 캐시: registry(<이미지>:buildcache) 또는 local(디렉토리) 모드
+  (기본 docker 드라이버는 캐시 내보내기를 지원하지 않으므로 캐시 없이 빌드)
+
+사용 예:
+    python image_builder.py --config images.json --max-workers 4
+    python image_builder.py --name gcr.io/my-project/app --tag v1 --context . --dockerfile Dockerfile
+
+로컬 레지스트리로 테스트:
+    docker run -d -p 5000:5000 --name registry registry:2
+    docker buildx create --name mcp-builder --driver-opt network=host --use
+    python image_builder.py --name localhost:5000/app --tag dev --context ./app
+"""
+
+import os
+import sys
+import json
+import time
+import fnmatch
+import hashlib
+import logging
+import argparse
+import subprocess
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+DIGEST_LABEL = "mcp.content-digest"
+DIGEST_TAG_PREFIX = "ctx-"
+CACHE_TAG = "buildcache"
+HASH_CHUNK = 1024 * 1024
+# --cache-to type=local/registry를 지원하는 buildx 드라이버 (기본 docker 드라이버는 미지원)
+CACHE_EXPORT_DRIVERS = {"docker-container", "kubernetes", "remote"}
+
+
+@dataclass
+class ImageSpec:
+    """빌드할 이미지 설정"""
+    name: str
+    tag: str = "latest"
+    context: str = "."
+    dockerfile: str = "Dockerfile"
+    build_args: Dict[str, str] = field(default_factory=dict)
+    labels: Dict[str, str] = field(default_factory=dict)
+    platform: Optional[str] = None
+
+    @property
+    def dockerfile_path(self) -> Path:
+        path = Path(self.dockerfile)
+        return path if path.is_absolute() else Path(self.context) / path
+
+    @property
+    def reference(self) -> str:
+        return f"{self.name}:{self.tag}"
+
+
+@dataclass
+class BuildResult:
+    """이미지 빌드 결과"""
+    name: str
+    tag: str
+    status: str = "pending"
+    digest: Optional[str] = None
+    hash_seconds: float = 0.0
+    build_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def run_docker(command: List[str]) -> subprocess.CompletedProcess:
+    """docker 명령 실행 (출력 캡처, 실패해도 예외를 던지지 않음)"""
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def load_dockerignore(context: Path) -> List[str]:
+    """.dockerignore 패턴 로드"""
+    ignore_file = context / ".dockerignore"
+    if not ignore_file.exists():
+        return []
+    patterns = []
+    for line in ignore_file.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            patterns.append(line.rstrip("/"))
+    return patterns
+
+
+def is_ignored(relative: str, patterns: List[str]) -> bool:
+    """.dockerignore 규칙 적용 (마지막으로 일치한 패턴 우선, ! 는 예외)"""
+    ignored = False
+    for pattern in patterns:
+        negate = pattern.startswith("!")
+        pattern = pattern[1:] if negate else pattern
+        if pattern.startswith("./"):
+            pattern = pattern[2:]
+        pattern = pattern.lstrip("/")
+        if fnmatch.fnmatch(relative, pattern) or fnmatch.fnmatch(relative, f"{pattern}/*") \
+                or fnmatch.fnmatch(relative, pattern.replace("**/", "*")):
+            ignored = not negate
+    return ignored
+
+
+def content_digest(spec: ImageSpec) -> str:
+    """빌드 결과를 결정하는 입력 전체의 SHA-256 다이제스트"""
+    digest = hashlib.sha256()
+    digest.update(spec.dockerfile_path.read_bytes())
+    digest.update(json.dumps({"build_args": spec.build_args, "labels": spec.labels, "platform": spec.platform},
+                             sort_keys=True).encode("utf-8"))
+
+    context = Path(spec.context)
+    patterns = load_dockerignore(context)
+    has_exceptions = any(p.startswith("!") for p in patterns)
+    files = []
+    for root, dirs, names in os.walk(context):
+        rel_root = Path(root).relative_to(context)
+        # 무시 대상 디렉토리는 내려가지 않음 (예외 패턴이 있으면 하위까지 확인)
+        if not has_exceptions:
+            dirs[:] = [d for d in dirs if not is_ignored((rel_root / d).as_posix(), patterns)]
+        for name in names:
+            relative = (rel_root / name).as_posix()
+            if not is_ignored(relative, patterns):
+                files.append(relative)
+
+    for relative in sorted(files):
+        path = context / relative
+        digest.update(relative.encode("utf-8"))
+        digest.update(b"\x00x" if os.access(path, os.X_OK) else b"\x00-")
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageBuildOrchestrator:
+    """여러 이미지를 캐시 재사용과 다이제스트 비교로 동시에 빌드하는 클래스"""
+
+    def __init__(self, images: List[ImageSpec], max_workers: int = 4, push: bool = True,
+                 cache_mode: str = "registry", cache_dir: Path = Path(".buildx-cache"),
+                 builder: Optional[str] = None, runner: Callable[[List[str]], subprocess.CompletedProcess] = run_docker):
+        """
+        Args:
+            images: 빌드할 이미지 목록
+            max_workers: 동시에 빌드할 최대 이미지 수
+            push: 레지스트리 푸시 여부 (False면 로컬 docker에 로드)
+            cache_mode: "registry" (<이미지>:buildcache), "local" (cache_dir), "none"
+            cache_dir: local 캐시 디렉토리
+            builder: 사용할 buildx 빌더 이름
+            runner: docker 명령 실행 함수 (테스트용 교체 지점)
+        """
+        self.images = images
+        self.max_workers = max(1, max_workers)
+        self.push = push
+        self.cache_mode = cache_mode
+        self.cache_dir = cache_dir
+        self.builder = builder
+        self.runner = runner
+        # 빌더 드라이버 (run()에서 한 번 조회, 캐시 내보내기 지원 여부 판단)
+        self.driver: Optional[str] = None
+
+    def _buildx(self, *args: str) -> List[str]:
+        command = ["docker", "buildx"]
+        if self.builder:
+            command += ["--builder", self.builder]
+        return command + list(args)
+
+    def builder_driver(self) -> Optional[str]:
+        """사용할 buildx 빌더의 드라이버 (docker, docker-container 등, 조회 실패 시 None)"""
+        inspected = self.runner(self._buildx("inspect"))
+        if inspected.returncode != 0:
+            return None
+        for line in inspected.stdout.splitlines():
+            key, _, value = line.partition(":")
+            if key.strip() == "Driver":
+                return value.strip()
+        return None
+
+    def registry_has(self, reference: str) -> bool:
+        """레지스트리에 이미지가 있는지 확인 (레이어를 받지 않고 매니페스트만 조회)"""
+        return self.runner(self._buildx("imagetools", "inspect", "--raw", reference)).returncode == 0
+
+    def local_digest(self, reference: str) -> Optional[str]:
+        """로컬 docker 이미지에 기록된 콘텐츠 다이제스트 라벨"""
+        inspected = self.runner(["docker", "image", "inspect", "--format",
+                                 f'{{{{ index .Config.Labels "{DIGEST_LABEL}" }}}}', reference])
+        return inspected.stdout.strip() if inspected.returncode == 0 else None
+
+    def cache_args(self, spec: ImageSpec) -> List[str]:
+        """BuildKit 캐시 import/export 인자"""
+        if self.driver is not None and self.driver not in CACHE_EXPORT_DRIVERS:
+            return []
+        if self.cache_mode == "registry":
+            ref = f"{spec.name}:{CACHE_TAG}"
+            return ["--cache-from", f"type=registry,ref={ref}",
+                    "--cache-to", f"type=registry,ref={ref},mode=max"]
+        if self.cache_mode == "local":
+            local = self.cache_dir / spec.name.replace("/", "_").replace(":", "_")
+            args = ["--cache-to", f"type=local,dest={local},mode=max"]
+            if (local / "index.json").exists():
+                args = ["--cache-from", f"type=local,src={local}"] + args
+            return args
+        return []
+
+    def build_command(self, spec: ImageSpec, digest: str) -> List[str]:
+        """buildx 빌드 명령 생성"""
+        digest_ref = f"{spec.name}:{DIGEST_TAG_PREFIX}{digest[:16]}"
+        command = self._buildx("build", "--file", str(spec.dockerfile_path),
+                               "--tag", spec.reference, "--tag", digest_ref,
+                               "--label", f"{DIGEST_LABEL}={digest}")
+        for key, value in sorted(spec.labels.items()):
+            command += ["--label", f"{key}={value}"]
+        for key, value in sorted(spec.build_args.items()):
+            command += ["--build-arg", f"{key}={value}"]
+        if spec.platform:
+            command += ["--platform", spec.platform]
+        command += self.cache_args(spec)
+        command += ["--push" if self.push else "--load", spec.context]
+        return command
+
+    def build_one(self, spec: ImageSpec) -> BuildResult:
+        """이미지 하나 빌드 (변경이 없으면 건너뜀)"""
+        result = BuildResult(name=spec.name, tag=spec.tag)
+        try:
+            start = time.monotonic()
+            digest = content_digest(spec)
+            result.digest = digest
+            result.hash_seconds = round(time.monotonic() - start, 3)
+            digest_ref = f"{spec.name}:{DIGEST_TAG_PREFIX}{digest[:16]}"
+
+            start = time.monotonic()
+            if self.push and self.registry_has(digest_ref):
+                # 같은 콘텐츠가 이미 레지스트리에 있음: 요청한 태그만 서버 측에서 연결
+                tagged = self.runner(self._buildx("imagetools", "create", "--tag", spec.reference, digest_ref))
+                if tagged.returncode != 0:
+                    raise RuntimeError(tagged.stderr.strip() or "태그 연결 실패")
+                result.status = "skipped"
+                logger.info(f"⏭️ 변경 없음, 빌드/푸시 생략: {spec.reference} ({digest[:12]})")
+            elif not self.push and self.local_digest(spec.reference) == digest:
+                result.status = "skipped"
+                logger.info(f"⏭️ 변경 없음, 로컬 빌드 생략: {spec.reference} ({digest[:12]})")
+            else:
+                built = self.runner(self.build_command(spec, digest))
+                if built.returncode != 0:
+                    raise RuntimeError(built.stderr.strip()[-2000:] or "빌드 실패")
+                result.status = "built"
+                logger.info(f"✅ 이미지 빌드 완료: {spec.reference} ({digest[:12]})")
+            result.build_seconds = round(time.monotonic() - start, 3)
+        except Exception as e:
+            result.status = "failed"
+            result.error = str(e)
+            logger.error(f"❌ 이미지 빌드 실패: {spec.reference} - {e}")
+        return result
+
+    def run(self) -> Dict[str, Any]:
+        """모든 이미지 빌드 후 결과 요약 반환"""
+        logger.info(f"🚀 이미지 빌드 시작: {len(self.images)}개, 동시 빌드 {self.max_workers}")
+        if self.cache_mode != "none":
+            self.driver = self.builder_driver()
+            if self.driver is not None and self.driver not in CACHE_EXPORT_DRIVERS:
+                logger.warning(f"⚠️ buildx 드라이버 '{self.driver}'는 캐시 내보내기를 지원하지 않아 캐시 없이 빌드합니다 "
+                               f"(docker buildx create --driver docker-container --use 로 캐시 사용 가능)")
+        start = time.monotonic()
+        results: Dict[str, BuildResult] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.build_one, spec): spec for spec in self.images}
+            for future in as_completed(futures):
+                spec = futures[future]
+                results[spec.reference] = future.result()
+
+        ordered = [results[spec.reference] for spec in self.images]
+        summary = {
+            "total": len(ordered),
+            "built": sum(1 for r in ordered if r.status == "built"),
+            "skipped": sum(1 for r in ordered if r.status == "skipped"),
+            "failed": sum(1 for r in ordered if r.status == "failed"),
+            "wall_seconds": round(time.monotonic() - start, 3)
+        }
+        logger.info(f"🎉 이미지 빌드 완료: 빌드 {summary['built']}, 생략 {summary['skipped']}, "
+                    f"실패 {summary['failed']} ({summary['wall_seconds']}s)")
+        return {"summary": summary, "images": [asdict(r) for r in ordered]}
+
+
+def load_specs(path: Path) -> List[ImageSpec]:
+    """이미지 설정 파일 로드 ([{"name": ..., "tag": ..., "context": ..., ...}])"""
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    base = path.parent
+    specs = []
+    for entry in entries:
+        spec = ImageSpec(**entry)
+        if not Path(spec.context).is_absolute():
+            spec.context = str(base / spec.context)
+        specs.append(spec)
+    return specs
+
+
+def main(argv=None):
+    """메인 함수"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description="캐시/다이제스트 기반 멀티 이미지 빌드")
+    parser.add_argument("--config", type=Path, help="이미지 설정 JSON 파일")
+    parser.add_argument("--name", help="이미지 이름 (예: gcr.io/my-project/app)")
+    parser.add_argument("--tag", default="latest")
+    parser.add_argument("--context", default=".")
+    parser.add_argument("--dockerfile", default="Dockerfile")
+    parser.add_argument("--build-arg", action="append", default=[], help="KEY=VALUE (반복 가능)")
+    parser.add_argument("--label", action="append", default=[], help="KEY=VALUE (반복 가능)")
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--no-push", action="store_true", help="푸시하지 않고 로컬 docker에 로드")
+    parser.add_argument("--cache", choices=["registry", "local", "none"], default="registry")
+    parser.add_argument("--cache-dir", type=Path, default=Path(".buildx-cache"))
+    parser.add_argument("--builder", help="buildx 빌더 이름")
+    parser.add_argument("--results", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    if args.config:
+        specs = load_specs(args.config)
+    elif args.name:
+        specs = [ImageSpec(name=args.name, tag=args.tag, context=args.context, dockerfile=args.dockerfile,
+                           build_args=dict(a.split("=", 1) for a in args.build_arg),
+                           labels=dict(a.split("=", 1) for a in args.label))]
+    else:
+        parser.error("--config 또는 --name 중 하나가 필요합니다")
+
+    orchestrator = ImageBuildOrchestrator(specs, max_workers=args.max_workers, push=not args.no_push,
+                                          cache_mode=args.cache, cache_dir=args.cache_dir, builder=args.builder)
+    report = orchestrator.run()
+    if args.results:
+        with open(args.results, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0 if report["summary"]["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,9 +8,13 @@ import os
 import sys
 import subprocess
 import logging
+import argparse
 from pathlib import Path
 from typing import Dict, Any, List
 
+from run_store import RunRecorder, record_safely
+from step_profiler import add_profile_arguments, profiler_from_args
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -25,7 +29,12 @@ logger = logging.getLogger(__name__)
 class ContainerDependencyInstaller:
     """Container 과정 의존성 설치 클래스"""
     
-    def __init__(self):
+    def __init__(self, profiler=None):
+        """
+        Args:
+            profiler: StepProfiler (있으면 단계마다 프로파일링)
+        """
+        self.profiler = profiler
         self.required_packages = {
             "kubernetes": "Kubernetes Python 클라이언트",
             "docker": "Docker Python SDK",
@@ -283,11 +292,16 @@ echo "helm version"
         """전체 설치 프로세스 실행"""
         logger.info("🚀 Cloud Container 과정 의존성 설치 시작")
         
+        run = RunRecorder(kind="dependency_install", profiler=self.profiler)
+
         # 1. Python 패키지 설치
         logger.info("\n📦 1. Python 패키지 설치")
         for package, description in self.required_packages.items():
             if not self.check_python_package(package):
-                result = self.install_python_package(package, description)
+                with run.step(f"pip:{package}") as step:
+                    result = self.install_python_package(package, description)
+                    if not result["installed"]:
+                        step.status = "failed"
                 self.installation_results["python_packages"][package] = result
             else:
                 logger.info(f"✅ {package} 이미 설치됨")
@@ -300,17 +314,20 @@ echo "helm version"
         
         # 2. CLI 도구 확인 및 가이드 제공
         logger.info("\n🔧 2. CLI 도구 확인")
-        for tool, description in self.optional_packages.items():
-            result = self.install_cli_tool_guide(tool, description)
-            self.installation_results["cli_tools"][tool] = result
+        with run.step("cli_tools"):
+            for tool, description in self.optional_packages.items():
+                result = self.install_cli_tool_guide(tool, description)
+                self.installation_results["cli_tools"][tool] = result
         
         # 3. requirements.txt 생성
         logger.info("\n📄 3. requirements.txt 파일 생성")
-        self.create_requirements_txt()
+        with run.step("requirements_txt"):
+            self.create_requirements_txt()
         
         # 4. 설치 스크립트 생성
         logger.info("\n📜 4. 설치 스크립트 생성")
-        self.create_install_script()
+        with run.step("install_script"):
+            self.create_install_script()
         
         # 5. 결과 요약
         self.installation_results["overall_status"] = "completed"
@@ -319,6 +336,9 @@ echo "helm version"
         import json
         with open('container_dependency_installation_results.json', 'w', encoding='utf-8') as f:
             json.dump(self.installation_results, f, ensure_ascii=False, indent=2)
+        record_safely("dependency_install", run)
+        if self.profiler:
+            self.profiler.finish()
         
         logger.info("\n🎉 Container 과정 의존성 설치 완료!")
         logger.info("결과가 container_dependency_installation_results.json에 저장되었습니다.")
@@ -327,7 +347,11 @@ echo "helm version"
 
 def main():
     """메인 함수"""
-    installer = ContainerDependencyInstaller()
+    parser = argparse.ArgumentParser(description="Cloud Container 과정 의존성 설치")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    installer = ContainerDependencyInstaller(profiler=profiler_from_args(args, "dependency_install"))
     results = installer.run_installation()
     
     # 결과 요약 출력
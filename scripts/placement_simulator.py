@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+"""
+Cloud Container 과정 Pod 배치 시뮬레이터
+노드 풀/존 구성과 Deployment 매니페스트(requests, nodeSelector, nodeAffinity, Pod (Anti-)Affinity,
+topologySpreadConstraints)로 kube-scheduler의 필터/점수 단계를 오프라인에서 재현합니다.
+클러스터를 만들기 전에 Pod 배치, Pending Pod와 그 원인, 전부 스케줄되는 최소 노드 수를 예측합니다.
+
+워크로드는 한 번만 컴파일(선택자 매칭 행렬)하고 시나리오마다 노드 배열만 새로 만들기 때문에
+초당 수천 개 시나리오를 평가할 수 있습니다.
+
+단순화한 부분:
+- 우선순위/선점, taint/toleration, 포트 충돌은 고려하지 않음
+- 점수 동점이면 앞쪽 노드 선택 (실제 스케줄러는 무작위)
+- 노드 할당 가능 용량은 GKE 머신 유형별 근삿값
+
+사용 예:
+    # create_ha_cluster 구성 (3개 존, 존당 2노드)으로 배치 예측
+    python placement_simulator.py anti-affinity-deployment.yaml --nodes-per-zone 2
+
+    # 존당 1~10노드 범위에서 최소 노드 수, 머신 유형별 비교
+    python placement_simulator.py anti-affinity-deployment.yaml --size --machine-type e2-medium --machine-type e2-standard-2
+
+    # 레플리카 수별 최소 노드 수
+    python placement_simulator.py anti-affinity-deployment.yaml --size --replicas 3,6,9,12
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+import numpy as np
+import yaml
+
+from rightsizing import parse_cpu, parse_memory, format_cpu, format_memory
+
+logger = logging.getLogger(__name__)
+
+# create_ha_cluster 기본 구성
+HA_ZONES = ("asia-northeast3-a", "asia-northeast3-b", "asia-northeast3-c")
+HA_MACHINE_TYPE = "e2-medium"
+
+# GKE 노드 할당 가능 용량 근삿값 (밀리코어, 바이트)
+MACHINE_TYPES = {
+    "e2-small": (940.0, 1.2 * 1024 ** 3),
+    "e2-medium": (940.0, 2.8 * 1024 ** 3),
+    "e2-standard-2": (1930.0, 5.5 * 1024 ** 3),
+    "e2-standard-4": (3920.0, 13.0 * 1024 ** 3),
+    "e2-standard-8": (7910.0, 28.5 * 1024 ** 3),
+    "n2-standard-2": (1930.0, 5.5 * 1024 ** 3),
+    "n2-standard-4": (3920.0, 13.0 * 1024 ** 3),
+}
+
+HOSTNAME_KEY = "kubernetes.io/hostname"
+ZONE_KEY = "topology.kubernetes.io/zone"
+REGION_KEY = "topology.kubernetes.io/region"
+LEGACY_ZONE_KEY = "failure-domain.beta.kubernetes.io/zone"
+
+WORKLOAD_KINDS = ("Deployment", "StatefulSet", "ReplicaSet")
+
+
+def selector_matches(selector: Optional[Dict[str, Any]], labels: Dict[str, str]) -> bool:
+    """레이블 선택자(matchLabels/matchExpressions) 매칭 (null 선택자는 아무것도 선택하지 않음)"""
+    if selector is None:
+        return False
+    for key, value in (selector.get("matchLabels") or {}).items():
+        if labels.get(key) != str(value):
+            return False
+    for expression in selector.get("matchExpressions") or []:
+        key, operator = expression["key"], expression["operator"]
+        values = [str(v) for v in expression.get("values") or []]
+        if operator == "In":
+            matched = key in labels and labels[key] in values
+        elif operator == "NotIn":
+            matched = labels.get(key) not in values
+        elif operator == "Exists":
+            matched = key in labels
+        elif operator == "DoesNotExist":
+            matched = key not in labels
+        elif operator in ("Gt", "Lt"):
+            try:
+                number = int(labels[key])
+            except (KeyError, ValueError):
+                return False
+            matched = number > int(values[0]) if operator == "Gt" else number < int(values[0])
+        else:
+            raise ValueError(f"지원하지 않는 연산자: {operator}")
+        if not matched:
+            return False
+    return True
+
+
+@dataclass
+class NodePool:
+    """노드 풀 (GKE 리전 클러스터처럼 존마다 같은 수의 노드)"""
+    name: str = "default-pool"
+    machine_type: str = HA_MACHINE_TYPE
+    zones: Tuple[str, ...] = HA_ZONES
+    nodes_per_zone: int = 2
+    min_nodes: int = 1
+    max_nodes: int = 10
+    labels: Dict[str, str] = field(default_factory=dict)
+    cpu: Optional[float] = None
+    memory: Optional[float] = None
+
+    def capacity(self) -> Tuple[float, float]:
+        if self.cpu is not None and self.memory is not None:
+            return self.cpu, self.memory
+        if self.machine_type not in MACHINE_TYPES:
+            raise ValueError(f"알 수 없는 머신 유형: {self.machine_type} (--node-cpu/--node-memory로 지정)")
+        return MACHINE_TYPES[self.machine_type]
+
+
+@dataclass
+class Term:
+    """선택자 + 토폴로지 키 (affinity 항목 또는 topology spread 제약)"""
+    selector: Optional[Dict[str, Any]]
+    topology_key: str
+    namespaces: Tuple[str, ...]
+    weight: int = 0
+    max_skew: int = 1
+
+
+@dataclass
+class Workload:
+    """스케줄 대상 워크로드 (Pod 템플릿 기준)"""
+    namespace: str
+    name: str
+    replicas: int
+    labels: Dict[str, str]
+    cpu: float = 0.0
+    memory: float = 0.0
+    node_selector: Dict[str, str] = field(default_factory=dict)
+    node_affinity: List[Dict[str, Any]] = field(default_factory=list)
+    anti_required: List[Term] = field(default_factory=list)
+    anti_preferred: List[Term] = field(default_factory=list)
+    affinity_required: List[Term] = field(default_factory=list)
+    spread_hard: List[Term] = field(default_factory=list)
+    spread_soft: List[Term] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.namespace}/{self.name}"
+
+
+def _pod_requests(pod_spec: Dict[str, Any]) -> Tuple[float, float]:
+    """Pod 요청량 (컨테이너 합계와 init 컨테이너 최댓값 중 큰 값)"""
+    def total(containers):
+        cpu = memory = 0.0
+        for container in containers or []:
+            requests = (container.get("resources") or {}).get("requests") or {}
+            cpu += parse_cpu(requests.get("cpu", 0))
+            memory += parse_memory(requests.get("memory", 0))
+        return cpu, memory
+
+    cpu, memory = total(pod_spec.get("containers"))
+    for init in pod_spec.get("initContainers") or []:
+        init_cpu, init_memory = total([init])
+        cpu, memory = max(cpu, init_cpu), max(memory, init_memory)
+    return cpu, memory
+
+
+def _affinity_terms(entries: Iterable[Dict[str, Any]], namespace: str, weighted: bool) -> List[Term]:
+    terms = []
+    for entry in entries or []:
+        term = entry["podAffinityTerm"] if weighted else entry
+        terms.append(Term(selector=term.get("labelSelector"), topology_key=term["topologyKey"],
+                          namespaces=tuple(term.get("namespaces") or [namespace]),
+                          weight=int(entry.get("weight", 1)) if weighted else 0))
+    return terms
+
+
+def workload_from_manifest(doc: Dict[str, Any]) -> Workload:
+    """Deployment/StatefulSet/ReplicaSet 매니페스트를 Workload로 변환"""
+    metadata = doc.get("metadata") or {}
+    namespace = metadata.get("namespace", "default")
+    spec = doc.get("spec") or {}
+    template = spec.get("template") or {}
+    pod_spec = template.get("spec") or {}
+    affinity = pod_spec.get("affinity") or {}
+    anti = affinity.get("podAntiAffinity") or {}
+    pod_affinity = affinity.get("podAffinity") or {}
+    node_affinity = ((affinity.get("nodeAffinity") or {})
+                     .get("requiredDuringSchedulingIgnoredDuringExecution") or {})
+    cpu, memory = _pod_requests(pod_spec)
+
+    workload = Workload(
+        namespace=namespace, name=metadata["name"], replicas=int(spec.get("replicas", 1)),
+        labels={k: str(v) for k, v in ((template.get("metadata") or {}).get("labels") or {}).items()},
+        cpu=cpu, memory=memory,
+        node_selector={k: str(v) for k, v in (pod_spec.get("nodeSelector") or {}).items()},
+        node_affinity=node_affinity.get("nodeSelectorTerms") or [],
+        anti_required=_affinity_terms(anti.get("requiredDuringSchedulingIgnoredDuringExecution"), namespace, False),
+        anti_preferred=_affinity_terms(anti.get("preferredDuringSchedulingIgnoredDuringExecution"), namespace, True),
+        affinity_required=_affinity_terms(
+            pod_affinity.get("requiredDuringSchedulingIgnoredDuringExecution"), namespace, False))
+    for constraint in pod_spec.get("topologySpreadConstraints") or []:
+        term = Term(selector=constraint.get("labelSelector"), topology_key=constraint["topologyKey"],
+                    namespaces=(namespace,), max_skew=int(constraint.get("maxSkew", 1)))
+        if constraint.get("whenUnsatisfiable", "DoNotSchedule") == "DoNotSchedule":
+            workload.spread_hard.append(term)
+        else:
+            workload.spread_soft.append(term)
+    return workload
+
+
+def load_workloads(paths: Iterable[Path]) -> Tuple[List[Workload], Tuple[float, float]]:
+    """
+    매니페스트 파일에서 워크로드 로드
+
+    Returns:
+        (워크로드 목록, DaemonSet이 노드마다 차지하는 (CPU, 메모리))
+    """
+    workloads = []
+    daemon_cpu = daemon_memory = 0.0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            documents = list(yaml.safe_load_all(f))
+        for doc in documents:
+            if not isinstance(doc, dict):
+                continue
+            if doc.get("kind") in WORKLOAD_KINDS:
+                workloads.append(workload_from_manifest(doc))
+            elif doc.get("kind") == "DaemonSet":
+                cpu, memory = _pod_requests(((doc.get("spec") or {}).get("template") or {}).get("spec") or {})
+                daemon_cpu += cpu
+                daemon_memory += memory
+    return workloads, (daemon_cpu, daemon_memory)
+
+
+class CompiledWorkloads:
+    """
+    시나리오와 무관한 워크로드 정보를 미리 계산
+    모든 선택자 항목을 번호로 모으고, 워크로드 x 항목 매칭 행렬을 만듭니다.
+    """
+
+    def __init__(self, workloads: List[Workload]):
+        self.workloads = workloads
+        self.terms: List[Term] = []
+        self.owners: List[int] = []
+        index = {}
+
+        def register(owner: int, terms: List[Term]) -> List[int]:
+            ids = []
+            for term in terms:
+                key = (owner, json.dumps(term.selector, sort_keys=True), term.topology_key, term.namespaces)
+                if key not in index:
+                    index[key] = len(self.terms)
+                    self.terms.append(term)
+                    self.owners.append(owner)
+                ids.append(index[key])
+            return ids
+
+        self.anti_required = [register(i, w.anti_required) for i, w in enumerate(workloads)]
+        self.anti_preferred = [register(i, w.anti_preferred) for i, w in enumerate(workloads)]
+        self.affinity_required = [register(i, w.affinity_required) for i, w in enumerate(workloads)]
+        self.spread_hard = [register(i, w.spread_hard) for i, w in enumerate(workloads)]
+        self.spread_soft = [register(i, w.spread_soft) for i, w in enumerate(workloads)]
+
+        # matches[w, t]: 워크로드 w의 Pod가 항목 t의 선택자/네임스페이스에 해당
+        self.matches = np.array([[w.namespace in t.namespaces and selector_matches(t.selector, w.labels)
+                                  for t in self.terms] for w in workloads], dtype=bool).reshape(
+                                      len(workloads), len(self.terms))
+        self.matched_terms = [np.flatnonzero(row).tolist() for row in self.matches]
+        owned_anti = set(t for ids in self.anti_required for t in ids)
+        self.owned_anti = [[t for t in ids if t in owned_anti] for ids in self.anti_required]
+        # 대칭성: 이미 배치된 다른 워크로드의 required anti-affinity가 이 Pod를 밀어내는 경우
+        self.symmetric_anti = [[t for t in sorted(owned_anti) if self.matches[w, t] and self.owners[t] != w]
+                               for w in range(len(workloads))]
+        self.topology_keys = sorted({t.topology_key for t in self.terms})
+
+    def with_replicas(self, replicas: int) -> "CompiledWorkloads":
+        """모든 워크로드의 레플리카 수를 바꾼 복사본 (매칭 행렬 재사용)"""
+        clone = object.__new__(CompiledWorkloads)
+        clone.__dict__.update(self.__dict__)
+        clone.workloads = [Workload(**{**w.__dict__, "replicas": replicas}) for w in self.workloads]
+        return clone
+
+
+@dataclass
+class PendingPod:
+    workload: str
+    replica: int
+    reason: str
+
+
+@dataclass
+class SimulationResult:
+    """시나리오 하나의 배치 결과"""
+    nodes: List[str]
+    node_zones: List[str]
+    node_cpu: List[float]
+    node_memory: List[float]
+    cpu_used: List[float]
+    memory_used: List[float]
+    placements: Dict[str, List[Optional[str]]]
+    pending: List[PendingPod]
+
+    @property
+    def schedulable(self) -> bool:
+        return not self.pending
+
+    def zone_distribution(self, workload: str) -> Dict[str, int]:
+        zones = dict(zip(self.nodes, self.node_zones))
+        distribution: Dict[str, int] = {}
+        for node in self.placements.get(workload, []):
+            if node is not None:
+                distribution[zones[node]] = distribution.get(zones[node], 0) + 1
+        return distribution
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "nodes": len(self.nodes),
+            "scheduled": sum(1 for nodes in self.placements.values() for n in nodes if n is not None),
+            "pending": len(self.pending),
+            "cpu_utilization": round(sum(self.cpu_used) / sum(self.node_cpu), 3) if self.nodes else 0.0,
+            "memory_utilization": round(sum(self.memory_used) / sum(self.node_memory), 3) if self.nodes else 0.0,
+            "zones": {key: self.zone_distribution(key) for key in self.placements},
+            "pending_reasons": sorted({p.reason for p in self.pending}),
+        }
+
+
+class _Nodes:
+    """시나리오별 노드 배열 (용량, 토폴로지 도메인 인덱스)"""
+
+    def __init__(self, pools: List[NodePool], topology_keys: List[str], overhead: Tuple[float, float]):
+        self.names, self.zones, self.labels = [], [], []
+        cpu, memory = [], []
+        for pool in pools:
+            pool_cpu, pool_memory = pool.capacity()
+            region = pool.zones[0].rsplit("-", 1)[0] if pool.zones else ""
+            for zone in pool.zones:
+                for i in range(pool.nodes_per_zone):
+                    name = f"gke-{pool.name}-{zone.rsplit('-', 1)[-1]}-{i}"
+                    self.names.append(name)
+                    self.zones.append(zone)
+                    self.labels.append({
+                        HOSTNAME_KEY: name, ZONE_KEY: zone, LEGACY_ZONE_KEY: zone, REGION_KEY: region,
+                        "cloud.google.com/gke-nodepool": pool.name,
+                        "node.kubernetes.io/instance-type": pool.machine_type, **pool.labels})
+                    cpu.append(pool_cpu)
+                    memory.append(pool_memory)
+        self.cpu = np.array(cpu, dtype=np.float64)
+        self.memory = np.array(memory, dtype=np.float64)
+        self.free_cpu = self.cpu - overhead[0]
+        self.free_memory = self.memory - overhead[1]
+
+        # 토폴로지 키별 도메인 인덱스 (키가 없는 노드는 항상 0인 마지막 칸을 가리킴)
+        self.domains: Dict[str, np.ndarray] = {}
+        self.domain_counts: Dict[str, int] = {}
+        for key in topology_keys:
+            values: Dict[str, int] = {}
+            index = [values.setdefault(labels[key], len(values)) if key in labels else -1
+                     for labels in self.labels]
+            self.domain_counts[key] = len(values)
+            self.domains[key] = np.array([len(values) if i < 0 else i for i in index], dtype=np.int64)
+
+    def node_mask(self, workload: Workload) -> np.ndarray:
+        """nodeSelector / required nodeAffinity 필터"""
+        mask = np.ones(len(self.names), dtype=bool)
+        if not workload.node_selector and not workload.node_affinity:
+            return mask
+        for i, labels in enumerate(self.labels):
+            if any(labels.get(k) != v for k, v in workload.node_selector.items()):
+                mask[i] = False
+            elif workload.node_affinity and not any(
+                    selector_matches({"matchExpressions": term.get("matchExpressions") or []}, labels)
+                    for term in workload.node_affinity):
+                mask[i] = False
+        return mask
+
+
+def _normalize(values: np.ndarray) -> np.ndarray:
+    low, high = values.min(), values.max()
+    return (values - low) / (high - low) * 100.0 if high > low else np.zeros_like(values)
+
+
+def simulate(compiled: CompiledWorkloads, pools: List[NodePool],
+             overhead: Tuple[float, float] = (0.0, 0.0)) -> SimulationResult:
+    """
+    워크로드를 순서대로 스케줄 (필터 -> 점수 -> 최고 점수 노드)
+
+    Args:
+        compiled: 컴파일된 워크로드
+        pools: 노드 풀 구성
+        overhead: 노드마다 DaemonSet/시스템 Pod가 차지하는 (CPU 밀리코어, 메모리 바이트)
+    """
+    nodes = _Nodes(pools, compiled.topology_keys, overhead)
+    terms = compiled.terms
+    # 항목별 도메인당 매칭 Pod 수 / 항목 소유 워크로드 Pod 수
+    term_domains = [nodes.domains[t.topology_key] for t in terms]
+    term_limits = [nodes.domain_counts[t.topology_key] for t in terms]
+    counts = [np.zeros(limit + 1) for limit in term_limits]
+    owner_counts = [np.zeros(limit + 1) for limit in term_limits]
+    total_matched = np.zeros(len(terms))
+    placements: Dict[str, List[Optional[str]]] = {}
+    pending: List[PendingPod] = []
+
+    for w, workload in enumerate(compiled.workloads):
+        static_mask = nodes.node_mask(workload)
+        slots: List[Optional[str]] = placements.setdefault(workload.key, [])
+        for replica in range(workload.replicas):
+            stages = [("node(s) didn't match Pod's node affinity/selector", static_mask),
+                      ("Insufficient cpu", nodes.free_cpu >= workload.cpu),
+                      ("Insufficient memory", nodes.free_memory >= workload.memory)]
+
+            if compiled.anti_required[w] or compiled.symmetric_anti[w]:
+                anti_ok = np.ones(len(nodes.names), dtype=bool)
+                for t in compiled.anti_required[w]:
+                    anti_ok &= counts[t][term_domains[t]] == 0
+                for t in compiled.symmetric_anti[w]:
+                    anti_ok &= owner_counts[t][term_domains[t]] == 0
+                stages.append(("node(s) didn't match pod anti-affinity rules", anti_ok))
+
+            if compiled.affinity_required[w]:
+                affinity_ok = np.ones(len(nodes.names), dtype=bool)
+                for t in compiled.affinity_required[w]:
+                    # 클러스터에 매칭 Pod가 하나도 없고 자기 자신이 매칭되면 첫 Pod는 허용
+                    if total_matched[t] == 0 and compiled.matches[w, t]:
+                        continue
+                    affinity_ok &= (counts[t][term_domains[t]] > 0) & (term_domains[t] < term_limits[t])
+                stages.append(("node(s) didn't match pod affinity rules", affinity_ok))
+
+            if compiled.spread_hard[w]:
+                spread_ok = np.ones(len(nodes.names), dtype=bool)
+                for t in compiled.spread_hard[w]:
+                    domains = term_domains[t]
+                    has_key = domains < term_limits[t]
+                    eligible = static_mask & has_key
+                    if not eligible.any():
+                        spread_ok[:] = False
+                        continue
+                    minimum = counts[t][domains[eligible]].min()
+                    self_match = 1 if compiled.matches[w, t] else 0
+                    spread_ok &= has_key & (counts[t][domains] + self_match - minimum <= terms[t].max_skew)
+                stages.append(("node(s) didn't match pod topology spread constraints", spread_ok))
+
+            mask = stages[0][1].copy()
+            for _, stage in stages[1:]:
+                mask &= stage
+            candidates = np.flatnonzero(mask)
+            if candidates.size == 0:
+                remaining = np.ones(len(nodes.names), dtype=bool)
+                reasons = []
+                for reason, stage in stages:
+                    failed = int((remaining & ~stage).sum())
+                    if failed:
+                        reasons.append(f"{failed} {reason}")
+                    remaining &= stage
+                pending.append(PendingPod(workload.key, replica,
+                                          f"0/{len(nodes.names)} nodes are available: " + ", ".join(reasons)))
+                slots.append(None)
+                continue
+
+            # 점수: 여유 자원이 많은 노드(LeastAllocated) + preferred anti-affinity + soft spread(가중치 2)
+            score = ((nodes.free_cpu[candidates] - workload.cpu) / nodes.cpu[candidates]
+                     + (nodes.free_memory[candidates] - workload.memory) / nodes.memory[candidates]) * 50.0
+            if compiled.anti_preferred[w] and candidates.size > 1:
+                penalty = np.zeros(candidates.size)
+                for t in compiled.anti_preferred[w]:
+                    penalty += terms[t].weight * counts[t][term_domains[t][candidates]]
+                score += _normalize(-penalty)
+            if compiled.spread_soft[w] and candidates.size > 1:
+                penalty = np.zeros(candidates.size)
+                for t in compiled.spread_soft[w]:
+                    penalty += counts[t][term_domains[t][candidates]]
+                score += 2.0 * _normalize(-penalty)
+            node = int(candidates[np.argmax(score)])
+
+            nodes.free_cpu[node] -= workload.cpu
+            nodes.free_memory[node] -= workload.memory
+            for t in compiled.matched_terms[w]:
+                domain = term_domains[t][node]
+                if domain < term_limits[t]:
+                    counts[t][domain] += 1
+                total_matched[t] += 1
+            for t in compiled.owned_anti[w]:
+                domain = term_domains[t][node]
+                if domain < term_limits[t]:
+                    owner_counts[t][domain] += 1
+            slots.append(nodes.names[node])
+
+    return SimulationResult(
+        nodes=nodes.names, node_zones=nodes.zones,
+        node_cpu=nodes.cpu.tolist(), node_memory=nodes.memory.tolist(),
+        cpu_used=(nodes.cpu - nodes.free_cpu).tolist(), memory_used=(nodes.memory - nodes.free_memory).tolist(),
+        placements=placements, pending=pending)
+
+
+@dataclass
+class SizingResult:
+    """최소 노드 수 탐색 결과"""
+    machine_type: str
+    nodes_per_zone: Optional[int]
+    total_nodes: Optional[int]
+    result: SimulationResult
+    scenarios: int
+
+
+def minimum_nodes(compiled: CompiledWorkloads, pools: List[NodePool],
+                  overhead: Tuple[float, float] = (0.0, 0.0)) -> SizingResult:
+    """
+    모든 Pod가 스케줄되는 최소 존당 노드 수 탐색
+    풀마다 min_nodes~max_nodes 범위에서 같은 존당 노드 수를 적용합니다 (autoscaler 범위와 동일).
+    최대 노드 수에서도 Pending이 남으면 nodes_per_zone은 None입니다.
+    """
+    low = min(pool.min_nodes for pool in pools)
+    high = max(pool.max_nodes for pool in pools)
+    scenarios = 0
+    result = None
+    for count in range(max(low, 0), high + 1):
+        sized = [NodePool(**{**pool.__dict__, "nodes_per_zone": min(max(count, pool.min_nodes), pool.max_nodes)})
+                 for pool in pools]
+        result = simulate(compiled, sized, overhead)
+        scenarios += 1
+        if result.schedulable:
+            return SizingResult(pools[0].machine_type, count, len(result.nodes), result, scenarios)
+    return SizingResult(pools[0].machine_type, None, None, result, scenarios)
+
+
+def _print_placement(result: SimulationResult):
+    for workload, nodes in result.placements.items():
+        distribution = ", ".join(f"{zone}={count}" for zone, count in sorted(result.zone_distribution(workload).items()))
+        print(f"📦 {workload}: {sum(1 for n in nodes if n)}/{len(nodes)} 배치 ({distribution or '-'})")
+        for replica, node in enumerate(nodes):
+            print(f"    #{replica}: {node or 'Pending'}")
+    print()
+    print(f"{'NODE':<32} {'ZONE':<20} {'CPU':>14} {'MEMORY':>16}")
+    for i, name in enumerate(result.nodes):
+        print(f"{name:<32} {result.node_zones[i]:<20} "
+              f"{format_cpu(result.cpu_used[i]):>6}/{format_cpu(result.node_cpu[i]):<7} "
+              f"{format_memory(result.memory_used[i]):>7}/{format_memory(result.node_memory[i]):<8}")
+    for pod in result.pending:
+        print(f"⚠️ Pending {pod.workload} #{pod.replica}: {pod.reason}")
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Pod 배치 시뮬레이터 (HA 클러스터 사이징)")
+    parser.add_argument("manifests", nargs="+", type=Path, help="Deployment/StatefulSet 매니페스트")
+    parser.add_argument("--machine-type", action="append", help=f"머신 유형 (반복 가능, 기본 {HA_MACHINE_TYPE})")
+    parser.add_argument("--zones", default=",".join(HA_ZONES), help="쉼표로 구분한 존 목록")
+    parser.add_argument("--nodes-per-zone", type=int, default=2, help="존당 노드 수 (--num-nodes)")
+    parser.add_argument("--min-nodes", type=int, default=1, help="존당 최소 노드 수 (--size)")
+    parser.add_argument("--max-nodes", type=int, default=10, help="존당 최대 노드 수 (--size)")
+    parser.add_argument("--node-cpu", help="노드 할당 가능 CPU (머신 유형 대신)")
+    parser.add_argument("--node-memory", help="노드 할당 가능 메모리 (머신 유형 대신)")
+    parser.add_argument("--replicas", help="모든 워크로드에 적용할 레플리카 수 (쉼표로 여러 값)")
+    parser.add_argument("--size", action="store_true", help="최소 노드 수 탐색")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    workloads, overhead = load_workloads(args.manifests)
+    if not workloads:
+        logger.error("❌ 스케줄할 워크로드가 없습니다")
+        return 2
+    compiled = CompiledWorkloads(workloads)
+    zones = tuple(zone.strip() for zone in args.zones.split(",") if zone.strip())
+    custom = (parse_cpu(args.node_cpu), parse_memory(args.node_memory)) if args.node_cpu and args.node_memory else (None, None)
+    replica_options = [int(value) for value in args.replicas.split(",")] if args.replicas else [None]
+
+    start = time.perf_counter()
+    scenarios = 0
+    rows = []
+    failed = False
+    for machine_type in args.machine_type or [HA_MACHINE_TYPE]:
+        pool = NodePool(machine_type=machine_type, zones=zones, nodes_per_zone=args.nodes_per_zone,
+                        min_nodes=args.min_nodes, max_nodes=args.max_nodes, cpu=custom[0], memory=custom[1])
+        for replicas in replica_options:
+            scenario = compiled.with_replicas(replicas) if replicas is not None else compiled
+            if args.size:
+                sizing = minimum_nodes(scenario, [pool], overhead)
+                scenarios += sizing.scenarios
+                failed |= sizing.nodes_per_zone is None
+                rows.append({"machine_type": machine_type, "replicas": replicas,
+                             "nodes_per_zone": sizing.nodes_per_zone, "total_nodes": sizing.total_nodes,
+                             **sizing.result.summary()})
+            else:
+                result = simulate(scenario, [pool], overhead)
+                scenarios += 1
+                failed |= not result.schedulable
+                rows.append({"machine_type": machine_type, "replicas": replicas, **result.summary(),
+                             "placements": result.placements})
+                if not args.json:
+                    print(f"=== {machine_type} x {len(result.nodes)} 노드 ({len(zones)}개 존) ===")
+                    _print_placement(result)
+                    print()
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+    elif args.size:
+        for row in rows:
+            label = f"{row['machine_type']}" + (f" (replicas={row['replicas']})" if row["replicas"] else "")
+            if row["nodes_per_zone"] is None:
+                print(f"❌ {label}: 존당 {args.max_nodes}노드에서도 Pending {row['pending']}개")
+                for reason in row["pending_reasons"]:
+                    print(f"    {reason}")
+            else:
+                print(f"✅ {label}: 존당 {row['nodes_per_zone']}노드 (총 {row['total_nodes']}노드), "
+                      f"CPU {row['cpu_utilization']:.0%} / 메모리 {row['memory_utilization']:.0%}")
+    logger.info(f"{scenarios}개 시나리오 평가 ({scenarios / elapsed:.0f}/s)" if elapsed > 0 else "")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
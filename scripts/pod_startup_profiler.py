@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Cloud Container 과정 Pod 콜드 스타트 구간 분석기
+Pod 상태(조건/컨테이너 시작 시각)와 이벤트(Pulling/Pulled) 타임스탬프로 각 Pod의 기동 시간을
+스케줄링 → 이미지 풀 → 컨테이너 시작 → Ready 구간으로 나누고, 이미지를 새로 받은 Pod(cold)와
+노드에 이미 있던 Pod(warm)의 지연 시간을 비교합니다.
+
+실습 전에 과정 이미지를 모든 노드에 미리 받아 두는 pre-pull DaemonSet 모드도 제공합니다.
+
+참고:
+- 조건 타임스탬프는 초 단위이므로 구간 값도 초 단위 정밀도입니다 (이미지 풀은 Pulled 메시지의 소요 시간 사용)
+- 이벤트는 기본 1시간 후 만료되므로 배포 직후 분석해야 합니다
+
+사용 예:
+    # 과정 이미지 미리 받기 (매니페스트의 이미지 또는 --image)
+    python pod_startup_profiler.py prepull --manifest sample-app-deployment.yaml
+
+    # 배포 후 구간 분석 (--record: 실행 이력 저장소에 cold/warm 중앙값 기록)
+    python pod_startup_profiler.py profile -n default -l app=sample-app --record
+"""
+
+import re
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import subprocess
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Callable
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("scheduling", "image_pull", "container_start", "readiness", "total")
+PREPULL_NAME = "course-image-prepull"
+PAUSE_IMAGE = "registry.k8s.io/pause:3.9"
+
+_GO_DURATION = re.compile(r'([0-9.]+)(h|ms|us|µs|ns|m|s)')
+_GO_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 1e-3, "us": 1e-6, "µs": 1e-6, "ns": 1e-9}
+# Successfully pulled image "nginx:1.25" in 2.345s (2.345s including waiting)
+_PULLED = re.compile(r' in ([0-9.hmsuµn]+)')
+_PULL_ERRORS = ("ErrImagePull", "ImagePullBackOff", "InvalidImageName")
+
+
+def run_kubectl(command: List[str], input: Optional[str] = None) -> str:
+    return subprocess.run(command, input=input, capture_output=True, text=True, check=True, timeout=120).stdout
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """RFC3339 시각을 epoch 초로 변환"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def parse_go_duration(value: str) -> Optional[float]:
+    """Go duration 문자열(1m2.5s, 850ms)을 초로 변환"""
+    parts = _GO_DURATION.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _GO_UNITS[unit] for number, unit in parts)
+
+
+def _event_time(event: Dict[str, Any]) -> Optional[float]:
+    return parse_time(event.get("eventTime") or event.get("firstTimestamp") or event.get("lastTimestamp"))
+
+
+@dataclass
+class PodStartup:
+    """Pod 기동 구간 (초, 아직 도달하지 않은 구간은 None)"""
+    namespace: str
+    name: str
+    node: Optional[str]
+    cold: bool
+    scheduling: Optional[float] = None
+    image_pull: Optional[float] = None
+    container_start: Optional[float] = None
+    readiness: Optional[float] = None
+    total: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.total is not None
+
+
+def profile_pod(pod: Dict[str, Any], events: Iterable[Dict[str, Any]]) -> PodStartup:
+    """Pod 상태와 해당 Pod 이벤트로 기동 구간 계산"""
+    metadata, status = pod["metadata"], pod.get("status", {})
+    conditions = {c["type"]: parse_time(c.get("lastTransitionTime"))
+                  for c in status.get("conditions") or [] if c.get("status") == "True"}
+    created = parse_time(metadata.get("creationTimestamp"))
+    scheduled = conditions.get("PodScheduled")
+    ready = conditions.get("Ready")
+    started = [parse_time(c["state"]["running"].get("startedAt"))
+               for c in status.get("containerStatuses") or [] if "running" in (c.get("state") or {})]
+
+    pulling, pulled, pull_seconds, cold = [], [], 0.0, False
+    for event in events:
+        reason, at = event.get("reason"), _event_time(event)
+        if reason == "Pulling" and at is not None:
+            pulling.append(at)
+        elif reason == "Pulled":
+            message = event.get("message", "")
+            if "already present on machine" in message:
+                continue
+            cold = True
+            if at is not None:
+                pulled.append(at)
+            match = _PULLED.search(message)
+            duration = parse_go_duration(match.group(1)) if match else None
+            pull_seconds += duration if duration is not None else 0.0
+    if pulled and not pull_seconds and pulling:
+        pull_seconds = max(pulled) - min(pulling)
+
+    result = PodStartup(metadata.get("namespace", "default"), metadata["name"], pod.get("spec", {}).get("nodeName"),
+                        cold=cold)
+    if created is not None and scheduled is not None:
+        result.scheduling = max(0.0, scheduled - created)
+        result.image_pull = pull_seconds
+    if scheduled is not None and started and None not in started:
+        result.container_start = max(0.0, max(started) - scheduled - pull_seconds)
+        if ready is not None:
+            result.readiness = max(0.0, ready - max(started))
+    if created is not None and ready is not None and result.readiness is not None:
+        result.total = max(0.0, ready - created)
+    return result
+
+
+def collect(namespace: str, selector: Optional[str], runner: Callable[..., str] = run_kubectl) -> List[PodStartup]:
+    """셀렉터에 해당하는 Pod의 기동 구간 수집 (Pod/이벤트 조회 각 1회)"""
+    pod_command = ["kubectl", "get", "pods", "-n", namespace, "-o", "json"]
+    if selector:
+        pod_command += ["-l", selector]
+    pods = json.loads(runner(pod_command)).get("items", [])
+    events = json.loads(runner(["kubectl", "get", "events", "-n", namespace, "-o", "json",
+                                "--field-selector", "involvedObject.kind=Pod"])).get("items", [])
+    by_pod: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        by_pod.setdefault(event.get("involvedObject", {}).get("name"), []).append(event)
+    return [profile_pod(pod, by_pod.get(pod["metadata"]["name"], [])) for pod in pods]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """최근접 순위 백분위수"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def summarize(startups: List[PodStartup]) -> Dict[str, Any]:
+    """cold/warm별 구간 백분위수 (p50, p90, 최댓값)"""
+    summary: Dict[str, Any] = {"pods": len(startups), "not_ready": sum(1 for s in startups if not s.ready)}
+    for label, cold in (("cold", True), ("warm", False)):
+        group = [s for s in startups if s.ready and s.cold == cold]
+        summary[label] = {"pods": len(group)}
+        for phase in PHASES:
+            values = [getattr(s, phase) for s in group]
+            if values:
+                summary[label][phase] = {"p50": _percentile(values, 0.5), "p90": _percentile(values, 0.9),
+                                         "max": max(values)}
+    cold_total, warm_total = summary["cold"].get("total"), summary["warm"].get("total")
+    if cold_total and warm_total:
+        summary["warm_speedup_p50"] = cold_total["p50"] - warm_total["p50"]
+    return summary
+
+
+def record_summary(summary: Dict[str, Any]):
+    """cold/warm 중앙값을 실행 이력 저장소에 기록 (pod_startup_cold, pod_startup_warm)"""
+    from run_store import RunRecorder, record_safely
+
+    for label in ("cold", "warm"):
+        if not summary[label]["pods"]:
+            continue
+        run = RunRecorder(kind=f"pod_startup_{label}", meta={"pods": summary[label]["pods"]})
+        for phase in PHASES:
+            run.add(phase, summary[label][phase]["p50"])
+        record_safely(run.kind, run, status="success")
+
+
+def images_from_manifests(paths: Iterable[Path]) -> List[str]:
+    """매니페스트의 컨테이너/초기화 컨테이너 이미지 (등장 순서, 중복 제거)"""
+    images: List[str] = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for document in yaml.safe_load_all(f):
+                if not isinstance(document, dict):
+                    continue
+                spec = document.get("spec") or {}
+                pod_spec = (spec.get("jobTemplate", {}).get("spec", {}).get("template", {}).get("spec")
+                            or spec.get("template", {}).get("spec") or spec)
+                for container in (pod_spec.get("initContainers") or []) + (pod_spec.get("containers") or []):
+                    if container.get("image") and container["image"] not in images:
+                        images.append(container["image"])
+    return images
+
+
+def prepull_daemonset(images: List[str], namespace: str, name: str = PREPULL_NAME,
+                      pause_image: str = PAUSE_IMAGE) -> Dict[str, Any]:
+    """
+    모든 노드에서 이미지를 받는 DaemonSet
+
+    이미지마다 초기화 컨테이너를 하나씩 두어 kubelet이 이미지를 받게 합니다.
+    셸이 없는 이미지는 초기화 컨테이너가 실패하지만 이미지는 이미 받아졌으므로 완료 판정은 imageID로 합니다.
+    """
+    labels = {"app": name}
+    return {
+        "apiVersion": "apps/v1", "kind": "DaemonSet",
+        "metadata": {"name": name, "namespace": namespace, "labels": labels},
+        "spec": {
+            "selector": {"matchLabels": labels},
+            "template": {
+                "metadata": {"labels": labels},
+                "spec": {
+                    "tolerations": [{"operator": "Exists"}],
+                    "terminationGracePeriodSeconds": 0,
+                    "initContainers": [{
+                        "name": f"pull-{i}", "image": image, "imagePullPolicy": "IfNotPresent",
+                        "command": ["sh", "-c", "exit 0"],
+                        "resources": {"requests": {"cpu": "10m", "memory": "16Mi"},
+                                      "limits": {"cpu": "100m", "memory": "64Mi"}},
+                    } for i, image in enumerate(images)],
+                    "containers": [{"name": "pause", "image": pause_image,
+                                    "resources": {"requests": {"cpu": "1m", "memory": "8Mi"}}}],
+                },
+            },
+        },
+    }
+
+
+def prepull(images: List[str], namespace: str = "kube-system", timeout: float = 600, interval: float = 5,
+            keep: bool = False, runner: Callable[..., str] = run_kubectl,
+            sleep: Callable[[float], None] = time.sleep) -> Dict[str, Any]:
+    """
+    pre-pull DaemonSet 배포 후 모든 노드의 이미지 풀 완료 대기
+
+    Returns:
+        {"nodes": 완료 노드 수, "desired": 대상 노드 수, "seconds": 소요 시간, "failed": {노드: [이미지]}}
+    """
+    for image in images:
+        if image.endswith(":latest") or ":" not in image.rsplit("/", 1)[-1]:
+            logger.warning(f"⚠️ {image}: latest 태그는 imagePullPolicy Always가 기본이라 미리 받기 효과가 작습니다")
+    manifest = prepull_daemonset(images, namespace)
+    runner(["kubectl", "apply", "-f", "-"], input=json.dumps(manifest))
+    logger.info(f"📦 이미지 {len(images)}개 미리 받기 시작 ({namespace}/{PREPULL_NAME})")
+
+    start = time.monotonic()
+    done, desired, failed = 0, 0, {}
+    try:
+        while True:
+            daemonset = json.loads(runner(["kubectl", "get", "daemonset", PREPULL_NAME, "-n", namespace, "-o", "json"]))
+            desired = daemonset.get("status", {}).get("desiredNumberScheduled", 0)
+            pods = json.loads(runner(["kubectl", "get", "pods", "-n", namespace, "-l", f"app={PREPULL_NAME}",
+                                      "-o", "json"])).get("items", [])
+            done, failed = 0, {}
+            for pod in pods:
+                statuses = pod.get("status", {}).get("initContainerStatuses") or []
+                node = pod.get("spec", {}).get("nodeName", "?")
+                pulled = [s for s in statuses if s.get("imageID")]
+                errors = [s["image"] for s in statuses
+                          if (s.get("state", {}).get("waiting") or {}).get("reason") in _PULL_ERRORS]
+                if errors:
+                    failed[node] = errors
+                if len(statuses) == len(images) and len(pulled) == len(images):
+                    done += 1
+            if desired and done >= desired:
+                break
+            if time.monotonic() - start >= timeout:
+                logger.warning(f"⚠️ 미리 받기 시간 초과: {done}/{desired} 노드 완료")
+                break
+            sleep(interval)
+    finally:
+        if not keep:
+            runner(["kubectl", "delete", "daemonset", PREPULL_NAME, "-n", namespace, "--ignore-not-found",
+                    "--wait=false"])
+
+    result = {"nodes": done, "desired": desired, "seconds": round(time.monotonic() - start, 1), "failed": failed}
+    if failed:
+        logger.error(f"❌ 이미지 풀 실패: {failed}")
+    else:
+        logger.info(f"✅ 미리 받기 완료: {done}/{desired} 노드, {result['seconds']}초")
+    return result
+
+
+def _format(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}s"
+
+
+def _print_report(startups: List[PodStartup], summary: Dict[str, Any]):
+    print(f"{'POD':<40} {'NODE':<24} {'TYPE':<5} {'SCHED':>7} {'PULL':>7} {'START':>7} {'READY':>7} {'TOTAL':>7}")
+    for s in sorted(startups, key=lambda s: (s.total is None, -(s.total or 0))):
+        print(f"{s.name:<40} {(s.node or '-'):<24} {'cold' if s.cold else 'warm':<5} "
+              f"{_format(s.scheduling):>7} {_format(s.image_pull):>7} {_format(s.container_start):>7} "
+              f"{_format(s.readiness):>7} {_format(s.total):>7}")
+    print()
+    for label in ("cold", "warm"):
+        group = summary[label]
+        if not group["pods"]:
+            continue
+        phases = ", ".join(f"{phase} {group[phase]['p50']:.1f}s/{group[phase]['p90']:.1f}s" for phase in PHASES)
+        print(f"{label} ({group['pods']}개, p50/p90): {phases}")
+    if "warm_speedup_p50" in summary:
+        print(f"warm 기동이 중앙값 기준 {summary['warm_speedup_p50']:.1f}초 빠릅니다")
+    if summary["not_ready"]:
+        print(f"아직 Ready가 아닌 Pod: {summary['not_ready']}개")
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Pod 콜드 스타트 구간 분석 및 이미지 미리 받기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    profile_parser = sub.add_parser("profile", help="Pod 기동 구간 분석")
+    profile_parser.add_argument("-n", "--namespace", default="default")
+    profile_parser.add_argument("-l", "--selector", help="레이블 셀렉터 (예: app=sample-app)")
+    profile_parser.add_argument("--record", action="store_true", help="cold/warm 중앙값을 실행 이력 저장소에 기록")
+    profile_parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+
+    prepull_parser = sub.add_parser("prepull", help="모든 노드에 과정 이미지 미리 받기")
+    prepull_parser.add_argument("--image", action="append", default=[], help="이미지 (반복 가능)")
+    prepull_parser.add_argument("--manifest", action="append", type=Path, default=[],
+                                help="이미지를 추출할 매니페스트 (반복 가능)")
+    prepull_parser.add_argument("--namespace", default="kube-system", help="DaemonSet 네임스페이스")
+    prepull_parser.add_argument("--timeout", type=float, default=600, help="대기 시간(초)")
+    prepull_parser.add_argument("--keep", action="store_true", help="완료 후 DaemonSet 유지")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "prepull":
+            images = list(dict.fromkeys(args.image + images_from_manifests(args.manifest)))
+            if not images:
+                parser.error("--image 또는 --manifest가 필요합니다")
+            result = prepull(images, args.namespace, args.timeout, keep=args.keep)
+            return 1 if result["failed"] or result["nodes"] < result["desired"] else 0
+
+        startups = collect(args.namespace, args.selector)
+    except subprocess.CalledProcessError as e:
+        logger.error(f"❌ kubectl 실패: {(e.stderr or '').strip()}")
+        return 1
+
+    summary = summarize(startups)
+    if args.record:
+        record_summary(summary)
+    if args.json:
+        print(json.dumps({"pods": [asdict(s) for s in startups], "summary": summary}, ensure_ascii=False, indent=2))
+    else:
+        _print_report(startups, summary)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+Cloud Container 과정 리소스 적정화(right-sizing) 추천기
+파드 사용량 샘플(kubectl top / metrics-server / 녹화 파일)을 배열 기반 시계열에 적재하고,
+컨테이너별 CPU/메모리 백분위수로 requests/limits를 추천합니다.
+현재 매니페스트와 비교해 노드 빈 패킹(bin-packing) 기준 절감 효과도 계산합니다.
+
+추천 기준:
+- CPU request: P90 x (1 + 여유율), CPU limit: P99 x (1 + limit 여유율)
+- 메모리 request: P95 x (1 + 여유율), 메모리 limit: 최댓값 x (1 + limit 여유율)
+
+사용 예:
+    # 60초 동안 15초 간격으로 수집 (녹화 파일에 추가)
+    python rightsizing.py collect --namespace production --duration 60 --interval 15 --output samples.jsonl
+
+    # 녹화 파일과 현재 매니페스트로 추천
+    python rightsizing.py recommend samples.jsonl --manifest anti-affinity-deployment.yaml
+"""
+
+import re
+import sys
+import json
+import time
+import logging
+import argparse
+import subprocess
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Callable
+
+import numpy as np
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# 노드 할당 가능 리소스 기본값 (e2-standard-2 기준)
+DEFAULT_NODE_CPU_M = 1930.0
+DEFAULT_NODE_MEMORY = 5.5 * 1024 ** 3
+
+MIN_CPU_M = 10.0
+MIN_MEMORY = 16 * 1024 ** 2
+CPU_STEP_M = 5.0
+MEMORY_STEP = 1024 ** 2
+
+_CPU_UNITS = {"n": 1e-6, "u": 1e-3, "m": 1.0, "": 1000.0}
+_MEMORY_UNITS = {
+    "": 1, "k": 1000, "K": 1000, "M": 1000 ** 2, "G": 1000 ** 3, "T": 1000 ** 4,
+    "Ki": 1024, "Mi": 1024 ** 2, "Gi": 1024 ** 3, "Ti": 1024 ** 4,
+}
+_QUANTITY = re.compile(r'^([0-9.]+(?:e[0-9]+)?)([a-zA-Z]*)$')
+# Deployment 파드 이름: <이름>-<replicaset 해시>-<접미사>, StatefulSet: <이름>-<번호>
+_DEPLOYMENT_POD = re.compile(r'^(.+)-[a-z0-9]{6,10}-[a-z0-9]{5}$')
+_STATEFUL_POD = re.compile(r'^(.+)-\d+$')
+
+
+def parse_cpu(value: Any) -> float:
+    """CPU 수량을 밀리코어로 변환 (250m, 0.5, 1500000n)"""
+    if isinstance(value, (int, float)):
+        return float(value) * 1000.0
+    match = _QUANTITY.match(str(value).strip())
+    if not match or match.group(2) not in _CPU_UNITS:
+        raise ValueError(f"CPU 수량 형식 오류: {value}")
+    return float(match.group(1)) * _CPU_UNITS[match.group(2)]
+
+
+def parse_memory(value: Any) -> float:
+    """메모리 수량을 바이트로 변환 (64Mi, 1G, 123456)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _QUANTITY.match(str(value).strip())
+    if not match or match.group(2) not in _MEMORY_UNITS:
+        raise ValueError(f"메모리 수량 형식 오류: {value}")
+    return float(match.group(1)) * _MEMORY_UNITS[match.group(2)]
+
+
+def format_cpu(millicores: float) -> str:
+    return f"{int(millicores)}m"
+
+
+def format_memory(num_bytes: float) -> str:
+    return f"{int(round(num_bytes / MEMORY_STEP))}Mi"
+
+
+def workload_name(pod: str) -> str:
+    """파드 이름에서 워크로드 이름 추출"""
+    for pattern in (_DEPLOYMENT_POD, _STATEFUL_POD):
+        match = pattern.match(pod)
+        if match:
+            return match.group(1)
+    return pod
+
+
+class UsageSeries:
+    """
+    컨테이너 사용량 시계열 (열 단위 numpy 배열, 용량 2배씩 증가)
+
+    컨테이너 키(네임스페이스, 워크로드, 컨테이너)는 정수 인덱스로 저장해
+    샘플 수백만 개도 행당 20바이트로 유지합니다.
+    """
+
+    def __init__(self, initial_capacity: int = 4096):
+        self.keys: List[Tuple[str, str, str]] = []
+        self._key_index: Dict[Tuple[str, str, str], int] = {}
+        self.size = 0
+        self.ts = np.zeros(initial_capacity, dtype=np.float64)
+        self.key = np.zeros(initial_capacity, dtype=np.int32)
+        self.cpu = np.zeros(initial_capacity, dtype=np.float32)
+        self.memory = np.zeros(initial_capacity, dtype=np.float32)
+
+    def _grow(self, needed: int):
+        capacity = len(self.ts)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for column in ("ts", "key", "cpu", "memory"):
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, column, new)
+
+    def key_id(self, namespace: str, workload: str, container: str) -> int:
+        key = (namespace, workload, container)
+        index = self._key_index.get(key)
+        if index is None:
+            index = self._key_index[key] = len(self.keys)
+            self.keys.append(key)
+        return index
+
+    def append(self, ts: float, namespace: str, workload: str, container: str,
+               cpu_m: float, memory_bytes: float):
+        self._grow(self.size + 1)
+        i = self.size
+        self.ts[i] = ts
+        self.key[i] = self.key_id(namespace, workload, container)
+        self.cpu[i] = cpu_m
+        self.memory[i] = memory_bytes
+        self.size += 1
+
+    def extend(self, samples: Iterable[Dict[str, Any]]) -> int:
+        """샘플 일괄 적재 (dict: ts, namespace, pod|workload, container, cpu_m, memory_bytes)"""
+        count = 0
+        for sample in samples:
+            workload = sample.get("workload") or workload_name(sample["pod"])
+            self.append(sample["ts"], sample["namespace"], workload, sample["container"],
+                        sample["cpu_m"], sample["memory_bytes"])
+            count += 1
+        return count
+
+    def percentiles(self, column: str, quantiles: List[float]) -> np.ndarray:
+        """
+        컨테이너 키별 백분위수 (벡터 연산)
+
+        Returns:
+            shape (키 수, len(quantiles)) 배열, 샘플이 없는 키는 NaN
+        """
+        values = getattr(self, column)[:self.size].astype(np.float64)
+        keys = self.key[:self.size]
+        result = np.full((len(self.keys), len(quantiles)), np.nan)
+        if self.size == 0:
+            return result
+        # 키 -> 값 순으로 정렬하면 각 키의 샘플이 연속 구간에 오름차순으로 놓임
+        order = np.lexsort((values, keys))
+        sorted_values = values[order]
+        counts = np.bincount(keys, minlength=len(self.keys))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        present = counts > 0
+        for j, q in enumerate(quantiles):
+            # 선형 보간 백분위수 (numpy 기본 방식과 동일)
+            position = q * (counts[present] - 1)
+            lower = np.floor(position).astype(np.int64)
+            upper = np.minimum(lower + 1, counts[present] - 1)
+            frac = position - lower
+            base = starts[present]
+            result[present, j] = (sorted_values[base + lower] * (1 - frac) + sorted_values[base + upper] * frac)
+        return result
+
+    def sample_counts(self) -> np.ndarray:
+        return np.bincount(self.key[:self.size], minlength=len(self.keys))
+
+
+def parse_kubectl_top(output: str, namespace: str, ts: float) -> List[Dict[str, Any]]:
+    """`kubectl top pods --containers --no-headers` 출력 파싱 (-A 사용 시 첫 열이 네임스페이스)"""
+    samples = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 5:
+            sample_ns, pod, container, cpu, memory = fields
+        elif len(fields) == 4:
+            sample_ns = namespace
+            pod, container, cpu, memory = fields
+        else:
+            continue
+        if pod == "POD" or pod == "NAME":
+            continue
+        samples.append({"ts": ts, "namespace": sample_ns, "pod": pod, "container": container,
+                        "cpu_m": parse_cpu(cpu), "memory_bytes": parse_memory(memory)})
+    return samples
+
+
+def parse_pod_metrics(document: Dict[str, Any], ts: Optional[float] = None) -> List[Dict[str, Any]]:
+    """metrics-server PodMetricsList(JSON) 파싱"""
+    samples = []
+    for item in document.get("items", []):
+        metadata = item.get("metadata", {})
+        sample_ts = ts if ts is not None else time.time()
+        for container in item.get("containers", []):
+            usage = container.get("usage", {})
+            samples.append({"ts": sample_ts, "namespace": metadata.get("namespace", "default"),
+                            "pod": metadata["name"], "container": container["name"],
+                            "cpu_m": parse_cpu(usage.get("cpu", "0")),
+                            "memory_bytes": parse_memory(usage.get("memory", "0"))})
+    return samples
+
+
+def read_recording(path: Path) -> Iterable[Dict[str, Any]]:
+    """녹화 파일(JSON Lines) 스트리밍 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def collect(namespace: str, duration: float, interval: float, output: Path,
+            runner: Callable[[List[str]], str] = None, sleep: Callable[[float], None] = time.sleep) -> int:
+    """kubectl top 주기 수집 후 녹화 파일에 추가 (수집한 샘플 수 반환)"""
+    def run_top(command: List[str]) -> str:
+        return subprocess.run(command, capture_output=True, text=True, check=True, timeout=60).stdout
+
+    runner = runner or run_top
+    command = ["kubectl", "top", "pods", "--containers", "--no-headers"]
+    command += ["-A"] if namespace == "all" else ["-n", namespace]
+    total = 0
+    deadline = time.monotonic() + duration
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'a', encoding='utf-8') as f:
+        while True:
+            try:
+                samples = parse_kubectl_top(runner(command), namespace, time.time())
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"사용량 조회 실패 (metrics-server 준비 중일 수 있음): {e.stderr}")
+                samples = []
+            for sample in samples:
+                f.write(json.dumps(sample) + "\n")
+            f.flush()
+            total += len(samples)
+            if time.monotonic() + interval > deadline:
+                break
+            sleep(interval)
+    logger.info(f"샘플 {total}개 수집 완료: {output}")
+    return total
+
+
+@dataclass
+class ContainerResources:
+    """컨테이너 리소스 설정 (CPU 밀리코어, 메모리 바이트)"""
+    cpu_request: float = 0.0
+    cpu_limit: Optional[float] = None
+    memory_request: float = 0.0
+    memory_limit: Optional[float] = None
+
+
+@dataclass
+class Recommendation:
+    """컨테이너 추천 결과"""
+    namespace: str
+    workload: str
+    container: str
+    samples: int
+    replicas: int
+    current: Optional[ContainerResources]
+    recommended: ContainerResources
+    cpu_p90: float
+    cpu_p99: float
+    memory_p95: float
+    memory_max: float
+
+
+def load_manifests(paths: Iterable[Path]) -> Dict[Tuple[str, str, str], Tuple[int, ContainerResources]]:
+    """매니페스트의 워크로드 컨테이너 리소스 (키 -> (replicas, 리소스))"""
+    current = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            documents = list(yaml.safe_load_all(f))
+        for doc in documents:
+            if not isinstance(doc, dict) or doc.get("kind") not in ("Deployment", "StatefulSet", "DaemonSet"):
+                continue
+            metadata = doc.get("metadata", {})
+            spec = doc.get("spec", {})
+            replicas = int(spec.get("replicas", 1))
+            for container in spec.get("template", {}).get("spec", {}).get("containers", []):
+                resources = container.get("resources", {})
+                requests = resources.get("requests", {})
+                limits = resources.get("limits", {})
+                current[(metadata.get("namespace", "default"), metadata["name"], container["name"])] = (
+                    replicas,
+                    ContainerResources(
+                        cpu_request=parse_cpu(requests.get("cpu", 0)),
+                        cpu_limit=parse_cpu(limits["cpu"]) if "cpu" in limits else None,
+                        memory_request=parse_memory(requests.get("memory", 0)),
+                        memory_limit=parse_memory(limits["memory"]) if "memory" in limits else None))
+    return current
+
+
+def _round_up(values: np.ndarray, step: float, minimum: float) -> np.ndarray:
+    return np.maximum(np.ceil(values / step) * step, minimum)
+
+
+def recommend(series: UsageSeries, current: Optional[Dict] = None, margin: float = 0.15,
+              limit_margin: float = 0.3, min_samples: int = 3) -> List[Recommendation]:
+    """컨테이너별 requests/limits 추천"""
+    current = current or {}
+    cpu = series.percentiles("cpu", [0.90, 0.99])
+    memory = series.percentiles("memory", [0.95, 1.0])
+    counts = series.sample_counts()
+
+    cpu_request = _round_up(cpu[:, 0] * (1 + margin), CPU_STEP_M, MIN_CPU_M)
+    cpu_limit = np.maximum(_round_up(cpu[:, 1] * (1 + limit_margin), CPU_STEP_M, MIN_CPU_M), cpu_request)
+    memory_request = _round_up(memory[:, 0] * (1 + margin), MEMORY_STEP, MIN_MEMORY)
+    memory_limit = np.maximum(_round_up(memory[:, 1] * (1 + limit_margin), MEMORY_STEP, MIN_MEMORY),
+                              memory_request)
+
+    recommendations = []
+    for i, key in enumerate(series.keys):
+        if counts[i] < min_samples:
+            logger.warning(f"샘플 부족으로 추천 제외: {'/'.join(key)} ({counts[i]}개)")
+            continue
+        replicas, resources = current.get(key, (1, None))
+        recommendations.append(Recommendation(
+            namespace=key[0], workload=key[1], container=key[2], samples=int(counts[i]),
+            replicas=replicas, current=resources,
+            recommended=ContainerResources(float(cpu_request[i]), float(cpu_limit[i]),
+                                           float(memory_request[i]), float(memory_limit[i])),
+            cpu_p90=float(cpu[i, 0]), cpu_p99=float(cpu[i, 1]),
+            memory_p95=float(memory[i, 0]), memory_max=float(memory[i, 1])))
+    return recommendations
+
+
+def pack_nodes(pods: List[Tuple[float, float]], node_cpu: float, node_memory: float) -> int:
+    """First-Fit Decreasing으로 필요한 노드 수 계산"""
+    if not pods:
+        return 0
+    demands = np.array(pods, dtype=np.float64)
+    # 노드 용량 대비 더 큰 비율 기준으로 내림차순 정렬
+    order = np.argsort(-np.maximum(demands[:, 0] / node_cpu, demands[:, 1] / node_memory))
+    free_cpu = np.zeros(0)
+    free_memory = np.zeros(0)
+    for cpu, memory in demands[order]:
+        if cpu > node_cpu or memory > node_memory:
+            raise ValueError(f"노드보다 큰 파드 요청: cpu={cpu}m memory={memory}")
+        fits = np.flatnonzero((free_cpu >= cpu) & (free_memory >= memory))
+        if fits.size:
+            free_cpu[fits[0]] -= cpu
+            free_memory[fits[0]] -= memory
+        else:
+            free_cpu = np.append(free_cpu, node_cpu - cpu)
+            free_memory = np.append(free_memory, node_memory - memory)
+    return len(free_cpu)
+
+
+def savings_report(recommendations: List[Recommendation], node_cpu: float = DEFAULT_NODE_CPU_M,
+                   node_memory: float = DEFAULT_NODE_MEMORY) -> Dict[str, Any]:
+    """현재 매니페스트 대비 요청량/노드 수 절감 효과"""
+    compared = [r for r in recommendations if r.current is not None]
+    current_pods, recommended_pods = [], []
+    for r in compared:
+        current_pods += [(r.current.cpu_request, r.current.memory_request)] * r.replicas
+        recommended_pods += [(r.recommended.cpu_request, r.recommended.memory_request)] * r.replicas
+
+    current_cpu = sum(p[0] for p in current_pods)
+    current_memory = sum(p[1] for p in current_pods)
+    recommended_cpu = sum(p[0] for p in recommended_pods)
+    recommended_memory = sum(p[1] for p in recommended_pods)
+    current_nodes = pack_nodes(current_pods, node_cpu, node_memory)
+    recommended_nodes = pack_nodes(recommended_pods, node_cpu, node_memory)
+    return {
+        "containers_compared": len(compared),
+        "cpu_requests": {"current": format_cpu(current_cpu), "recommended": format_cpu(recommended_cpu)},
+        "memory_requests": {"current": format_memory(current_memory),
+                            "recommended": format_memory(recommended_memory)},
+        "nodes": {"current": current_nodes, "recommended": recommended_nodes,
+                  "saved": current_nodes - recommended_nodes},
+    }
+
+
+def set_resources_commands(recommendations: List[Recommendation], kind: str = "deployment") -> List[str]:
+    """추천값 적용용 kubectl set resources 명령"""
+    commands = []
+    for r in recommendations:
+        rec = r.recommended
+        commands.append(
+            f"kubectl set resources {kind}/{r.workload} -n {r.namespace} -c {r.container} "
+            f"--requests=cpu={format_cpu(rec.cpu_request)},memory={format_memory(rec.memory_request)} "
+            f"--limits=cpu={format_cpu(rec.cpu_limit)},memory={format_memory(rec.memory_limit)}")
+    return commands
+
+
+def _print_table(recommendations: List[Recommendation]):
+    header = f"{'WORKLOAD/CONTAINER':<36} {'SAMPLES':>7} {'CPU REQ':>15} {'MEM REQ':>17} {'CPU LIM':>8} {'MEM LIM':>8}"
+    print(header)
+    for r in recommendations:
+        rec = r.recommended
+        cur_cpu = format_cpu(r.current.cpu_request) if r.current else "-"
+        cur_mem = format_memory(r.current.memory_request) if r.current else "-"
+        print(f"{r.namespace + '/' + r.workload + '/' + r.container:<36} {r.samples:>7} "
+              f"{cur_cpu + ' -> ' + format_cpu(rec.cpu_request):>15} "
+              f"{cur_mem + ' -> ' + format_memory(rec.memory_request):>17} "
+              f"{format_cpu(rec.cpu_limit):>8} {format_memory(rec.memory_limit):>8}")
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="컨테이너 리소스 적정화 추천")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    collect_parser = sub.add_parser("collect", help="kubectl top 사용량 수집 (녹화 파일에 추가)")
+    collect_parser.add_argument("--namespace", default="default", help="네임스페이스 (all: 전체)")
+    collect_parser.add_argument("--duration", type=float, default=300, help="수집 시간(초)")
+    collect_parser.add_argument("--interval", type=float, default=15, help="수집 간격(초)")
+    collect_parser.add_argument("--output", type=Path, default=Path("rightsizing-samples.jsonl"))
+
+    recommend_parser = sub.add_parser("recommend", help="녹화 파일로 requests/limits 추천")
+    recommend_parser.add_argument("recordings", nargs="+", type=Path,
+                                  help="녹화 파일(JSON Lines) 또는 PodMetricsList JSON")
+    recommend_parser.add_argument("--manifest", action="append", type=Path, default=[],
+                                  help="비교할 현재 매니페스트 (반복 가능)")
+    recommend_parser.add_argument("--margin", type=float, default=0.15, help="request 여유율")
+    recommend_parser.add_argument("--limit-margin", type=float, default=0.3, help="limit 여유율")
+    recommend_parser.add_argument("--min-samples", type=int, default=3, help="추천에 필요한 최소 샘플 수")
+    recommend_parser.add_argument("--node-cpu", default=f"{int(DEFAULT_NODE_CPU_M)}m",
+                                  help="노드 할당 가능 CPU")
+    recommend_parser.add_argument("--node-memory", default="5632Mi", help="노드 할당 가능 메모리")
+    recommend_parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    args = parser.parse_args(argv)
+
+    if args.command == "collect":
+        collect(args.namespace, args.duration, args.interval, args.output)
+        return 0
+
+    series = UsageSeries()
+    for path in args.recordings:
+        if path.suffix == ".json":
+            with open(path, 'r', encoding='utf-8') as f:
+                series.extend(parse_pod_metrics(json.load(f), ts=path.stat().st_mtime))
+        else:
+            series.extend(read_recording(path))
+    recommendations = recommend(series, load_manifests(args.manifest), margin=args.margin,
+                                limit_margin=args.limit_margin, min_samples=args.min_samples)
+    report = savings_report(recommendations, parse_cpu(args.node_cpu), parse_memory(args.node_memory))
+
+    if args.json:
+        print(json.dumps({"recommendations": [asdict(r) for r in recommendations], "savings": report},
+                         ensure_ascii=False, indent=2))
+        return 0
+
+    _print_table(recommendations)
+    print()
+    print(f"요청 CPU: {report['cpu_requests']['current']} -> {report['cpu_requests']['recommended']}, "
+          f"요청 메모리: {report['memory_requests']['current']} -> {report['memory_requests']['recommended']}")
+    print(f"필요 노드 수 (빈 패킹): {report['nodes']['current']} -> {report['nodes']['recommended']}")
+    print("\n적용 명령:")
+    for command in set_resources_commands(recommendations):
+        print(f"  {command}")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
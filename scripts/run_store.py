@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Cloud Container 과정 실행 이력 저장소
+Dry-Run 테스트, 의존성 설치, 과정 자동화 실행마다 단계별 소요 시간과 결과를
+로컬 SQLite에 누적하고, 추세/백분위수/회귀(특정 커밋 대비 느려진 단계)를 조회합니다.
+
+모든 집계는 SQL(인덱스 + LIMIT/OFFSET)로 처리하므로 수천 건의 실행 이력도 메모리에 올리지 않습니다.
+
+사용 예:
+    python run_store.py runs --kind dry_run
+    python run_store.py trend dry_run --step kubernetes_commands --bucket day
+    python run_store.py percentiles dry_run
+    python run_store.py regressions dry_run --baseline a1b2c3d --threshold 0.4
+
+Bash 스크립트에서 기록:
+    python run_store.py record --kind day1 --status success --step create_gke_cluster=412.3 --step deploy_app=35.1:failed
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import socket
+import sqlite3
+import logging
+import argparse
+import subprocess
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(os.environ.get(
+    "MCP_RUN_STORE", Path.home() / ".cache" / "mcp_cloud" / "runs.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL,
+    status TEXT NOT NULL,
+    git_commit TEXT,
+    host TEXT,
+    meta TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_kind_started ON runs (kind, started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_kind_commit ON runs (kind, git_commit);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    step TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (run_id, step)
+);
+CREATE INDEX IF NOT EXISTS idx_steps_kind_step_duration ON steps (kind, step, duration);
+CREATE INDEX IF NOT EXISTS idx_steps_kind_step_started ON steps (kind, step, started_at);
+"""
+
+BUCKET_FORMATS = {"hour": "%Y-%m-%d %H:00", "day": "%Y-%m-%d", "week": "%Y-W%W", "month": "%Y-%m"}
+
+
+def current_commit(cwd: Optional[Path] = None) -> Optional[str]:
+    """현재 git 커밋 (짧은 해시, git 저장소가 아니면 None)"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=cwd or Path(__file__).parent, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None if result.returncode == 0 else None
+
+
+@dataclass
+class StepRecord:
+    """단계 실행 기록"""
+    step: str
+    duration: float
+    status: str = "success"
+    started_at: Optional[float] = None
+
+
+@dataclass
+class RunRecorder:
+    """진행 중인 실행의 단계 기록기"""
+    kind: str
+    started_at: float = field(default_factory=time.time)
+    steps: List[StepRecord] = field(default_factory=list)
+    meta: Dict[str, Any] = field(default_factory=dict)
+    status: Optional[str] = None
+    # StepProfiler (있으면 단계마다 프로파일링, step_profiler.py)
+    profiler: Any = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepRecord]:
+        """단계 소요 시간 기록 (예외 발생 시 failed, record.status로 직접 지정 가능)"""
+        record = StepRecord(step=name, duration=0.0, started_at=time.time())
+        start = time.perf_counter()
+        with self.profiler.profile(name) if self.profiler else nullcontext():
+            try:
+                yield record
+            except BaseException:
+                record.status = "failed"
+                raise
+            finally:
+                record.duration = time.perf_counter() - start
+                self.steps.append(record)
+
+    def add(self, name: str, duration: float, status: str = "success"):
+        self.steps.append(StepRecord(step=name, duration=duration, status=status, started_at=time.time()))
+
+
+class RunStore:
+    """실행 이력 SQLite 저장소"""
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (":memory:" 가능)
+        """
+        self.db_path = db_path
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # --- 기록 ---------------------------------------------------------------
+
+    def record_run(self, kind: str, steps: List[StepRecord], status: Optional[str] = None,
+                   started_at: Optional[float] = None, duration: Optional[float] = None,
+                   git_commit: Optional[str] = None, meta: Optional[Dict[str, Any]] = None) -> int:
+        """
+        실행 하나를 추가 (기존 기록은 덮어쓰지 않음)
+
+        Args:
+            status: 실행 결과 (없으면 단계 중 하나라도 실패 시 failed)
+            git_commit: 실행 시점 커밋 (없으면 현재 저장소 HEAD)
+
+        Returns:
+            실행 ID
+        """
+        started_at = started_at if started_at is not None else time.time()
+        if status is None:
+            status = "failed" if any(s.status != "success" for s in steps) else "success"
+        if duration is None:
+            duration = sum(s.duration for s in steps)
+        git_commit = git_commit or current_commit()
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (kind, started_at, duration, status, git_commit, host, meta) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, started_at, duration, status, git_commit, socket.gethostname(),
+                 json.dumps(meta or {}, ensure_ascii=False)))
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO steps (run_id, kind, step, started_at, duration, status) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, kind, s.step, s.started_at if s.started_at is not None else started_at,
+                  s.duration, s.status) for s in steps])
+        return run_id
+
+    @contextmanager
+    def recorder(self, kind: str, git_commit: Optional[str] = None) -> Iterator[RunRecorder]:
+        """with 블록 하나를 실행 하나로 기록 (예외 시 failed로 기록 후 다시 발생)"""
+        run = RunRecorder(kind=kind)
+        start = time.perf_counter()
+        try:
+            yield run
+        except BaseException:
+            run.status = "failed"
+            raise
+        finally:
+            self.record_run(kind, run.steps, status=run.status, started_at=run.started_at,
+                            duration=time.perf_counter() - start, git_commit=git_commit, meta=run.meta)
+
+    # --- 조회 ---------------------------------------------------------------
+
+    def runs(self, kind: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 실행 목록"""
+        sql = "SELECT id, kind, started_at, duration, status, git_commit FROM runs"
+        params: tuple = ()
+        if kind:
+            sql += " WHERE kind=?"
+            params = (kind,)
+        sql += " ORDER BY started_at DESC LIMIT ?"
+        return [dict(row) for row in self.conn.execute(sql, (*params, limit))]
+
+    def step_names(self, kind: str) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT step FROM steps WHERE kind=? ORDER BY step", (kind,))]
+
+    def _run_filter(self, since: Optional[float] = None, run_ids_sql: Optional[str] = None) -> tuple:
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(since)
+        if run_ids_sql:
+            clauses.append(f"run_id IN ({run_ids_sql})")
+        return (" AND " + " AND ".join(clauses)) if clauses else "", params
+
+    def percentiles(self, kind: str, step: str, quantiles: List[float] = (0.5, 0.9, 0.99),
+                    since: Optional[float] = None, run_ids_sql: Optional[str] = None,
+                    run_ids_params: tuple = ()) -> Dict[str, Any]:
+        """
+        단계 소요 시간 백분위수 (인덱스 순서로 해당 위치의 행 하나만 읽음, 최근접 순위 방식)
+
+        Returns:
+            {"count": n, "p50": ..., "p90": ...}
+        """
+        where, params = self._run_filter(since, run_ids_sql)
+        base = f"FROM steps WHERE kind=? AND step=? AND status='success'{where}"
+        base_params = (kind, step, *params, *run_ids_params)
+        count = self.conn.execute(f"SELECT COUNT(*) {base}", base_params).fetchone()[0]
+        result: Dict[str, Any] = {"count": count}
+        for q in quantiles:
+            key = f"p{int(q * 100) if (q * 100).is_integer() else q * 100}"
+            if count == 0:
+                result[key] = None
+                continue
+            offset = min(count - 1, max(0, math.ceil(q * count) - 1))
+            row = self.conn.execute(f"SELECT duration {base} ORDER BY duration LIMIT 1 OFFSET ?",
+                                    (*base_params, offset)).fetchone()
+            result[key] = row[0]
+        return result
+
+    def trend(self, kind: str, step: Optional[str] = None, bucket: str = "day",
+              since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """기간별 소요 시간 추세 (단계를 지정하지 않으면 실행 전체 기준)"""
+        fmt = BUCKET_FORMATS[bucket]
+        if step:
+            sql = ("SELECT strftime(?, started_at, 'unixepoch') AS period, COUNT(*) AS runs, "
+                   "AVG(duration) AS avg, MIN(duration) AS min, MAX(duration) AS max, "
+                   "SUM(status != 'success') AS failures FROM steps WHERE kind=? AND step=?")
+            params: list = [fmt, kind, step]
+        else:
+            sql = ("SELECT strftime(?, started_at, 'unixepoch') AS period, COUNT(*) AS runs, "
+                   "AVG(duration) AS avg, MIN(duration) AS min, MAX(duration) AS max, "
+                   "SUM(status != 'success') AS failures FROM runs WHERE kind=?")
+            params = [fmt, kind]
+        if since is not None:
+            sql += " AND started_at >= ?"
+            params.append(since)
+        sql += " GROUP BY period ORDER BY period"
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def regressions(self, kind: str, baseline_commit: str, threshold: float = 0.4,
+                    window: int = 20, min_runs: int = 1) -> List[Dict[str, Any]]:
+        """
+        기준 커밋 대비 느려진 단계
+
+        Args:
+            baseline_commit: 기준 커밋 (해당 커밋에서 기록된 실행들의 중앙값이 기준)
+            threshold: 회귀로 판단할 증가율 (0.4 = 40% 이상 느려짐)
+            window: 비교 대상 최근 실행 수 (기준 커밋 이후)
+            min_runs: 양쪽에 필요한 최소 표본 수
+
+        Raises:
+            ValueError: 기준 커밋으로 기록된 실행이 없음
+        """
+        row = self.conn.execute("SELECT MAX(started_at) FROM runs WHERE kind=? AND git_commit LIKE ?",
+                                (kind, f"{baseline_commit}%")).fetchone()
+        if row[0] is None:
+            raise ValueError(f"기준 커밋 {baseline_commit}으로 기록된 {kind} 실행이 없습니다")
+        baseline_sql = "SELECT id FROM runs WHERE kind=? AND git_commit LIKE ?"
+        recent_sql = ("SELECT id FROM runs WHERE kind=? AND started_at > ? "
+                      "ORDER BY started_at DESC LIMIT ?")
+
+        regressions = []
+        for step in self.step_names(kind):
+            before = self.percentiles(kind, step, [0.5], run_ids_sql=baseline_sql,
+                                      run_ids_params=(kind, f"{baseline_commit}%"))
+            after = self.percentiles(kind, step, [0.5], run_ids_sql=recent_sql,
+                                     run_ids_params=(kind, row[0], window))
+            if before["count"] < min_runs or after["count"] < min_runs or not before["p50"]:
+                continue
+            change = after["p50"] / before["p50"] - 1
+            if change >= threshold:
+                regressions.append({"step": step, "baseline_p50": before["p50"], "recent_p50": after["p50"],
+                                    "change": change, "baseline_runs": before["count"],
+                                    "recent_runs": after["count"]})
+        return sorted(regressions, key=lambda r: -r["change"])
+
+
+def record_safely(kind: str, run: RunRecorder, db_path: Path = DEFAULT_DB_PATH,
+                  status: Optional[str] = None) -> Optional[int]:
+    """실행 기록 (저장 실패가 본 작업을 실패시키지 않도록 경고만 남김)"""
+    try:
+        store = RunStore(db_path)
+        try:
+            return store.record_run(kind, run.steps, status=status or run.status, started_at=run.started_at,
+                                    meta=run.meta)
+        finally:
+            store.close()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"실행 이력 저장 실패: {e}")
+        return None
+
+
+def _parse_step(value: str) -> StepRecord:
+    """name=seconds[:status] 형식 파싱"""
+    name, sep, rest = value.partition("=")
+    if not sep:
+        raise ValueError(f"name=seconds[:status] 형식이 아닙니다: {value}")
+    seconds, _, status = rest.partition(":")
+    return StepRecord(step=name, duration=float(seconds), status=status or "success")
+
+
+def _print_rows(rows: List[Dict[str, Any]], as_json: bool):
+    if as_json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+    if not rows:
+        print("(결과 없음)")
+        return
+    columns = list(rows[0])
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join(f"{v:.3f}" if isinstance(v, float) else str(v) for v in row.values()))
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="Cloud Container 과정 실행 이력 저장소")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="이력 DB 경로")
+    parser.add_argument("--json", action="store_true", help="JSON 형식 출력")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = sub.add_parser("record", help="실행 기록 추가")
+    record_parser.add_argument("--kind", required=True, help="실행 종류 (dry_run, dependency_install, day1 ...)")
+    record_parser.add_argument("--step", action="append", default=[], help="name=seconds[:status] (반복 가능)")
+    record_parser.add_argument("--status", help="실행 결과 (없으면 단계 결과로 결정)")
+    record_parser.add_argument("--commit", help="커밋 (없으면 현재 HEAD)")
+
+    runs_parser = sub.add_parser("runs", help="최근 실행 목록")
+    runs_parser.add_argument("--kind")
+    runs_parser.add_argument("--limit", type=int, default=20)
+
+    trend_parser = sub.add_parser("trend", help="기간별 추세")
+    trend_parser.add_argument("kind")
+    trend_parser.add_argument("--step", help="단계 (없으면 실행 전체)")
+    trend_parser.add_argument("--bucket", choices=sorted(BUCKET_FORMATS), default="day")
+    trend_parser.add_argument("--days", type=float, help="최근 N일만")
+
+    pct_parser = sub.add_parser("percentiles", help="단계별 소요 시간 백분위수")
+    pct_parser.add_argument("kind")
+    pct_parser.add_argument("--step", action="append", help="단계 (없으면 전체)")
+    pct_parser.add_argument("--days", type=float, help="최근 N일만")
+
+    reg_parser = sub.add_parser("regressions", help="기준 커밋 대비 느려진 단계")
+    reg_parser.add_argument("kind")
+    reg_parser.add_argument("--baseline", required=True, help="기준 커밋")
+    reg_parser.add_argument("--threshold", type=float, default=0.4, help="회귀 판단 증가율 (0.4 = 40%%)")
+    reg_parser.add_argument("--window", type=int, default=20, help="비교할 최근 실행 수")
+    args = parser.parse_args(argv)
+
+    since = time.time() - args.days * 86400 if getattr(args, "days", None) else None
+    store = RunStore(args.db)
+    try:
+        if args.command == "record":
+            try:
+                steps = [_parse_step(value) for value in args.step]
+            except ValueError as e:
+                parser.error(str(e))
+            run_id = store.record_run(args.kind, steps, status=args.status, git_commit=args.commit)
+            print(run_id)
+            return 0
+        if args.command == "runs":
+            _print_rows(store.runs(args.kind, args.limit), args.json)
+            return 0
+        if args.command == "trend":
+            _print_rows(store.trend(args.kind, args.step, args.bucket, since), args.json)
+            return 0
+        if args.command == "percentiles":
+            rows = [{"step": step, **store.percentiles(args.kind, step, since=since)}
+                    for step in (args.step or store.step_names(args.kind))]
+            _print_rows(rows, args.json)
+            return 0
+        try:
+            rows = store.regressions(args.kind, args.baseline, args.threshold, args.window)
+        except ValueError as e:
+            logger.error(str(e))
+            return 2
+        if not args.json:
+            for row in rows:
+                print(f"⚠️ {row['step']}: {row['baseline_p50']:.2f}s -> {row['recent_p50']:.2f}s "
+                      f"({row['change'] * 100:+.0f}% since {args.baseline})")
+            if not rows:
+                print("회귀 없음")
+        else:
+            _print_rows(rows, True)
+        return 1 if rows else 0
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+                        stream=sys.stderr)
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+자동화 단계별 프로파일러
+Dry-Run 테스트, 의존성 설치, 과정 자동화의 각 단계를 샘플링(기본) 또는 결정적(cProfile) 프로파일러로 감싸
+단계별 프로파일 파일과 병합된 플레임 그래프 입력을 만들고, 단계 시간을 다음으로 나누어 보여줍니다.
+
+- cpu: 이 프로세스의 CPU 시간 (Python 코드 오버헤드, 샘플러 스레드 제외)
+- child_wait: 자식 프로세스(kubectl, gcloud, pip 등) 종료를 기다리며 막혀 있던 벽시계 시간
+- other: 나머지 (파일/네트워크 I/O, sleep 등)
+
+출력 (--profile-dir):
+- 01-<단계>.folded (sample) 또는 01-<단계>.prof (cprofile): 단계별 프로파일
+- profile.folded: 단계 이름을 최상위 프레임으로 병합한 스택 (flamegraph.pl, speedscope 입력)
+- profile.prof: cprofile 모드에서 병합한 pstats (snakeviz, flameprof 입력)
+- summary.json: 단계별 시간 분해
+
+사용 예:
+    python container_dry_run_test.py --profile
+    python install_container_dependencies.py --profile cprofile --profile-dir profiles/install
+    python step_profiler.py report profiles/dry_run-20250101-120000 --top 15
+    flamegraph.pl profiles/dry_run-20250101-120000/profile.folded > dry_run.svg
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import pstats
+import cProfile
+import logging
+import argparse
+import threading
+import subprocess
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("sample", "cprofile")
+DEFAULT_INTERVAL = 0.005
+MERGED_FOLDED = "profile.folded"
+MERGED_PSTATS = "profile.prof"
+SUMMARY_FILE = "summary.json"
+
+
+@dataclass
+class StepProfile:
+    """단계 시간 분해"""
+    step: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    child_wait: float = 0.0
+    child_cpu: float = 0.0
+    children: int = 0
+    samples: int = 0
+    path: Optional[str] = None
+
+    @property
+    def other(self) -> float:
+        return max(0.0, self.wall - self.cpu - self.child_wait)
+
+
+def default_profile_dir(kind: str) -> Path:
+    return Path("profiles") / f"{kind}-{time.strftime('%Y%m%d-%H%M%S')}"
+
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class _ChildWaitTracker:
+    """Popen.wait/communicate를 감싸 자식 프로세스를 기다린 시간과 생성 수 집계 (프로파일링 중에만 설치)"""
+
+    def __init__(self):
+        self.wait = 0.0
+        self.spawned = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._originals = None
+
+    def _timed(self, original):
+        @wraps(original)
+        def wrapper(popen, *args, **kwargs):
+            # communicate가 내부에서 wait를 부르므로 가장 바깥 호출만 집계
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            start = time.perf_counter()
+            try:
+                return original(popen, *args, **kwargs)
+            finally:
+                self._local.depth = depth
+                if depth == 0:
+                    with self._lock:
+                        self.wait += time.perf_counter() - start
+        return wrapper
+
+    def install(self):
+        popen = subprocess.Popen
+        self._originals = (popen.__init__, popen.wait, popen.communicate)
+        original_init = self._originals[0]
+
+        @wraps(original_init)
+        def init(process, *args, **kwargs):
+            original_init(process, *args, **kwargs)
+            with self._lock:
+                self.spawned += 1
+
+        popen.__init__ = init
+        popen.wait = self._timed(self._originals[1])
+        popen.communicate = self._timed(self._originals[2])
+
+    def uninstall(self):
+        if self._originals:
+            subprocess.Popen.__init__, subprocess.Popen.wait, subprocess.Popen.communicate = self._originals
+            self._originals = None
+
+
+class _Sampler(threading.Thread):
+    """
+    대상 스레드의 호출 스택을 주기적으로 수집 (벽시계 기준이므로 자식 대기 구간도 포함)
+    샘플러 자신이 쓴 CPU 시간(cpu)은 단계 CPU에서 빼도록 따로 기록합니다.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="step-profiler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.cpu = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        start = time.thread_time()
+        try:
+            self._sample()
+        finally:
+            self.cpu = time.thread_time() - start
+
+    def _sample(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                # 자식 대기 집계용 래퍼 프레임은 제외
+                if not (frame.f_code.co_filename == __file__ and frame.f_code.co_name == "wrapper"):
+                    stack.append(_frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> Counter:
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+class StepProfiler:
+    """단계별 프로파일러"""
+
+    def __init__(self, output_dir: Path, mode: str = "sample", interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            output_dir: 프로파일 출력 디렉토리
+            mode: sample (샘플링, 낮은 오버헤드) 또는 cprofile (결정적, 함수 호출 수 포함)
+            interval: 샘플링 간격 (초)
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"지원하지 않는 프로파일 모드: {mode} ({', '.join(PROFILE_MODES)})")
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.interval = interval
+        self.steps: List[StepProfile] = []
+        self._active = False
+
+    def _path(self, name: str, suffix: str) -> Path:
+        safe = re.sub(r"[^\w.-]+", "_", name).strip("_") or "step"
+        return self.output_dir / f"{len(self.steps) + 1:02d}-{safe}{suffix}"
+
+    @contextmanager
+    def profile(self, name: str) -> Iterator[Optional[StepProfile]]:
+        """단계 프로파일링 (다른 단계 안에서 다시 호출되면 바깥 단계에 포함)"""
+        if self._active:
+            yield None
+            return
+        self._active = True
+        result = StepProfile(step=name)
+        tracker = _ChildWaitTracker()
+        profiler = cProfile.Profile() if self.mode == "cprofile" else None
+        sampler = _Sampler(threading.get_ident(), self.interval) if profiler is None else None
+        # Popen 계측은 프로세스 전역이므로 단계가 예외로 끝나도 반드시 원복
+        tracker.install()
+        try:
+            times = os.times()
+            start = time.perf_counter()
+            if profiler:
+                profiler.enable()
+            else:
+                sampler.start()
+            try:
+                yield result
+            finally:
+                if profiler:
+                    profiler.disable()
+                else:
+                    stacks = sampler.stop()
+                result.wall = time.perf_counter() - start
+                end = os.times()
+                # os.times()는 프로세스 전체 CPU이므로 샘플러 스레드 몫은 제외
+                cpu = (end.user - times.user) + (end.system - times.system)
+                result.cpu = max(0.0, cpu - (sampler.cpu if sampler else 0.0))
+                result.child_cpu = (end.children_user - times.children_user) + \
+                    (end.children_system - times.children_system)
+                result.child_wait = min(tracker.wait, result.wall)
+                result.children = tracker.spawned
+                if profiler:
+                    path = self._path(name, ".prof")
+                    profiler.dump_stats(str(path))
+                else:
+                    path = self._path(name, ".folded")
+                    result.samples = sum(stacks.values())
+                    with open(path, 'w', encoding='utf-8') as f:
+                        for stack, count in stacks.most_common():
+                            f.write(f"{stack} {count}\n")
+                result.path = str(path)
+                self.steps.append(result)
+        finally:
+            tracker.uninstall()
+            self._active = False
+
+    def write_merged(self) -> Path:
+        """단계별 프로파일 병합 (sample: 단계 이름을 최상위 프레임으로 둔 folded 스택, cprofile: pstats)"""
+        paths = [step.path for step in self.steps if step.path]
+        if self.mode == "cprofile":
+            merged = self.output_dir / MERGED_PSTATS
+            if paths:
+                pstats.Stats(*paths).dump_stats(str(merged))
+            return merged
+        merged = self.output_dir / MERGED_FOLDED
+        with open(merged, 'w', encoding='utf-8') as out:
+            for step in self.steps:
+                root = step.step.replace(";", "_").replace(" ", "_")
+                with open(step.path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        out.write(f"{root};{line}")
+        return merged
+
+    def report(self) -> str:
+        return format_report([asdict(step) for step in self.steps])
+
+    def finish(self) -> Path:
+        """병합 출력과 summary.json 작성 후 시간 분해 표를 로그로 출력"""
+        merged = self.write_merged()
+        summary = {"mode": self.mode, "merged": str(merged),
+                   "steps": [{**asdict(step), "other": step.other} for step in self.steps]}
+        with open(self.output_dir / SUMMARY_FILE, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        logger.info("🔬 단계별 시간 분해\n" + self.report())
+        logger.info(f"🔬 프로파일이 {self.output_dir}에 저장되었습니다 (병합: {merged.name})")
+        return merged
+
+
+def format_report(steps: List[Dict[str, Any]]) -> str:
+    """단계별 wall/cpu/child_wait/other 표"""
+    lines = [f"{'단계':<28} {'wall':>8} {'cpu':>8} {'child_wait':>10} {'other':>8} {'자식':>5}"]
+    for step in steps:
+        other = max(0.0, step["wall"] - step["cpu"] - step["child_wait"])
+        lines.append(f"{step['step'][:28]:<28} {step['wall']:>8.3f} {step['cpu']:>8.3f} "
+                     f"{step['child_wait']:>10.3f} {other:>8.3f} {step['children']:>5}")
+    total = {key: sum(step[key] for step in steps) for key in ("wall", "cpu", "child_wait")}
+    if total["wall"] > 0:
+        lines.append(f"합계 wall {total['wall']:.3f}s: Python CPU {total['cpu'] / total['wall']:.0%}, "
+                     f"자식 프로세스 대기 {total['child_wait'] / total['wall']:.0%}")
+    return "\n".join(lines)
+
+
+def hot_frames(folded: Path, top: int = 10) -> List[tuple]:
+    """folded 스택에서 가장 많이 샘플된 최하위 프레임 (자체 시간 기준)"""
+    counts: Counter = Counter()
+    with open(folded, 'r', encoding='utf-8') as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            counts[stack.rsplit(";", 1)[-1]] += int(count)
+    return counts.most_common(top)
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """--profile [모드], --profile-dir 옵션 추가"""
+    parser.add_argument("--profile", nargs="?", const="sample", choices=PROFILE_MODES,
+                        help="단계별 프로파일링 (기본 sample)")
+    parser.add_argument("--profile-dir", type=Path, help="프로파일 출력 디렉토리 (기본 profiles/<종류>-<시각>)")
+
+
+def profiler_from_args(args: argparse.Namespace, kind: str) -> Optional[StepProfiler]:
+    if not args.profile:
+        return None
+    return StepProfiler(args.profile_dir or default_profile_dir(kind), mode=args.profile)
+
+
+def main(argv=None):
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="자동화 단계별 프로파일 조회")
+    subparsers = parser.add_subparsers(dest="action", required=True)
+    report = subparsers.add_parser("report", help="단계별 시간 분해와 가장 오래 걸린 프레임")
+    report.add_argument("profile_dir", type=Path, help="--profile 출력 디렉토리")
+    report.add_argument("--top", type=int, default=10, help="출력할 프레임 수 (sample 모드)")
+    args = parser.parse_args(argv)
+
+    summary_path = args.profile_dir / SUMMARY_FILE
+    if not summary_path.exists():
+        parser.error(f"{summary_path}이(가) 없습니다")
+    with open(summary_path, 'r', encoding='utf-8') as f:
+        summary = json.load(f)
+    print(format_report(summary["steps"]))
+    if summary["mode"] == "cprofile":
+        print()
+        pstats.Stats(str(args.profile_dir / MERGED_PSTATS)).sort_stats("cumulative").print_stats(args.top)
+    else:
+        total = sum(step["samples"] for step in summary["steps"]) or 1
+        print(f"\n{'자체 시간 상위 프레임':<60} {'비율':>6}")
+        for frame, count in hot_frames(args.profile_dir / MERGED_FOLDED, args.top):
+            print(f"{frame[:60]:<60} {count / total:>6.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+캐시/다이제스트 기반 멀티 이미지 빌드 테스트
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from image_builder import ImageSpec, ImageBuildOrchestrator, content_digest, is_ignored, DIGEST_TAG_PREFIX
+
+
+class FakeDocker:
+    """buildx inspect/imagetools/build와 docker image inspect를 흉내 내는 실행기"""
+
+    def __init__(self, driver="docker-container", registry=(), local_labels=None, fail_build=False):
+        self.driver = driver
+        self.registry = set(registry)
+        self.local_labels = dict(local_labels or {})
+        self.fail_build = fail_build
+        self.calls = []
+
+    def __call__(self, command):
+        self.calls.append(command)
+        args = command[2:] if command[:2] == ["docker", "buildx"] else command[1:]
+        if args[:1] == ["--builder"]:
+            args = args[2:]
+        if args[:1] == ["inspect"]:
+            return subprocess.CompletedProcess(command, 0, f"Name:   default\nDriver: {self.driver}\n", "")
+        if args[:2] == ["imagetools", "inspect"]:
+            return subprocess.CompletedProcess(command, 0 if args[-1] in self.registry else 1, "", "not found")
+        if args[:2] == ["imagetools", "create"]:
+            return subprocess.CompletedProcess(command, 0, "", "")
+        if args[:2] == ["image", "inspect"]:
+            label = self.local_labels.get(args[-1])
+            return subprocess.CompletedProcess(command, 0 if label else 1, f"{label}\n" if label else "", "")
+        if args[:1] == ["build"]:
+            if self.fail_build:
+                return subprocess.CompletedProcess(command, 1, "", "ERROR: failed to solve: exit code 1")
+            return subprocess.CompletedProcess(command, 0, "", "")
+        raise AssertionError(f"예상하지 못한 명령: {command}")
+
+    def builds(self):
+        return [call for call in self.calls if "build" in call]
+
+
+@pytest.fixture
+def app(tmp_path):
+    context = tmp_path / "app"
+    context.mkdir()
+    (context / "Dockerfile").write_text("FROM nginx:alpine\nCOPY . /usr/share/nginx/html\n")
+    (context / "index.html").write_text("<h1>v1</h1>")
+    (context / "logs").mkdir()
+    (context / "logs" / "debug.log").write_text("noise")
+    (context / ".dockerignore").write_text("# 빌드 제외\nlogs/\n*.tmp\n")
+    return context
+
+
+def spec_for(context, **kwargs):
+    return ImageSpec(name="gcr.io/p/app", tag="v1", context=str(context), **kwargs)
+
+
+class TestContentDigest:
+    """콘텐츠 다이제스트 테스트 클래스"""
+
+    def test_digest_tracks_build_inputs_only(self, app):
+        """컨텍스트/Dockerfile/라벨/실행 권한 변경은 반영하고 .dockerignore 대상은 무시하는지 테스트"""
+        base = content_digest(spec_for(app))
+        assert content_digest(spec_for(app)) == base
+
+        (app / "logs" / "debug.log").write_text("more noise")
+        (app / "scratch.tmp").write_text("temp")
+        assert content_digest(spec_for(app)) == base
+
+        assert content_digest(spec_for(app, labels={"mcp.day": "1"})) != base
+        (app / "index.html").write_text("<h1>v2</h1>")
+        changed = content_digest(spec_for(app))
+        assert changed != base
+        os.chmod(app / "index.html", 0o755)
+        assert content_digest(spec_for(app)) != changed
+
+    def test_dockerignore_rules(self):
+        """마지막 일치 패턴 우선과 ! 예외 테스트"""
+        patterns = ["logs", "*.md", "!README.md", "**/*.pyc"]
+        assert is_ignored("logs/app.log", patterns) and is_ignored("CHANGES.md", patterns)
+        assert not is_ignored("README.md", patterns)
+        assert is_ignored("pkg/mod.pyc", patterns) and not is_ignored("src/app.py", patterns)
+
+
+class TestImageBuildOrchestrator:
+    """빌드 생략/캐시 인자 테스트 클래스"""
+
+    def test_unchanged_image_is_tagged_not_rebuilt(self, app):
+        """레지스트리에 같은 다이제스트 태그가 있으면 빌드 없이 태그만 연결하는지 테스트"""
+        digest = content_digest(spec_for(app))
+        digest_ref = f"gcr.io/p/app:{DIGEST_TAG_PREFIX}{digest[:16]}"
+        docker = FakeDocker(registry={digest_ref})
+
+        report = ImageBuildOrchestrator([spec_for(app)], runner=docker).run()
+        assert report["summary"]["skipped"] == 1 and not docker.builds()
+        assert ["docker", "buildx", "imagetools", "create", "--tag", "gcr.io/p/app:v1", digest_ref] in docker.calls
+
+    def test_changed_image_built_with_registry_cache(self, app):
+        """변경된 이미지는 다이제스트 태그/라벨과 레지스트리 캐시 인자로 빌드 후 푸시하는지 테스트"""
+        docker = FakeDocker()
+        report = ImageBuildOrchestrator([spec_for(app, labels={"mcp.course": "container"})],
+                                        builder="mcp-builder", runner=docker).run()
+        assert report["summary"]["built"] == 1
+        [build] = docker.builds()
+        digest = report["images"][0]["digest"]
+        assert build[:4] == ["docker", "buildx", "--builder", "mcp-builder"]
+        assert f"gcr.io/p/app:{DIGEST_TAG_PREFIX}{digest[:16]}" in build
+        assert f"mcp.content-digest={digest}" in build and "mcp.course=container" in build
+        assert build[build.index("--cache-from") + 1] == "type=registry,ref=gcr.io/p/app:buildcache"
+        assert build[build.index("--cache-to") + 1] == "type=registry,ref=gcr.io/p/app:buildcache,mode=max"
+        assert build[-2:] == ["--push", str(app)]
+
+    def test_local_cache_and_no_push(self, app, tmp_path):
+        """local 캐시는 내보낸 캐시가 있을 때만 가져오고, 로컬 이미지 라벨이 같으면 생략하는지 테스트"""
+        cache_dir = tmp_path / "cache"
+        orchestrator = ImageBuildOrchestrator([spec_for(app)], push=False, cache_mode="local", cache_dir=cache_dir,
+                                              runner=FakeDocker())
+        local = cache_dir / "gcr.io_p_app"
+        assert orchestrator.cache_args(spec_for(app)) == ["--cache-to", f"type=local,dest={local},mode=max"]
+        local.mkdir(parents=True)
+        (local / "index.json").write_text("{}")
+        assert orchestrator.cache_args(spec_for(app))[:2] == ["--cache-from", f"type=local,src={local}"]
+
+        docker = FakeDocker(local_labels={"gcr.io/p/app:v1": content_digest(spec_for(app))})
+        report = ImageBuildOrchestrator([spec_for(app)], push=False, runner=docker).run()
+        assert report["summary"]["skipped"] == 1 and not docker.builds()
+
+    @pytest.mark.parametrize("driver,cached", [("docker", False), ("docker-container", True),
+                                               ("kubernetes", True)])
+    def test_cache_export_depends_on_driver(self, app, driver, cached):
+        """기본 docker 드라이버에서는 캐시 내보내기 인자 없이 빌드하는지 테스트"""
+        docker = FakeDocker(driver=driver)
+        report = ImageBuildOrchestrator([spec_for(app)], push=False, cache_mode="local", runner=docker).run()
+        assert report["summary"]["built"] == 1
+        [build] = docker.builds()
+        assert ("--cache-to" in build) is cached and "--load" in build
+
+    def test_build_failure_reported(self, app):
+        """빌드 실패가 다른 이미지를 막지 않고 결과에 기록되는지 테스트"""
+        other = app.parent / "api"
+        other.mkdir()
+        (other / "Dockerfile").write_text("FROM python:3.11-slim\n")
+        specs = [spec_for(app), ImageSpec(name="gcr.io/p/api", context=str(other))]
+        report = ImageBuildOrchestrator(specs, runner=FakeDocker(fail_build=True), cache_mode="none").run()
+        assert report["summary"] == {**report["summary"], "total": 2, "failed": 2}
+        assert "failed to solve" in report["images"][0]["error"]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Pod 배치 시뮬레이터 테스트
+"""
+
+import json
+
+import pytest
+import yaml
+
+from placement_simulator import (NodePool, CompiledWorkloads, workload_from_manifest, load_workloads, simulate,
+                                 minimum_nodes, selector_matches, HA_ZONES, main)
+
+GI = 1024 ** 3
+
+
+def deployment(name="ha-app", replicas=6, affinity=None, spread=None, cpu="250m", memory="64Mi"):
+    """day2-practice-improved.sh의 anti-affinity-deployment.yaml과 같은 구조"""
+    pod_spec = {"containers": [{"name": name, "image": "gcr.io/google-samples/hello-app:1.0",
+                                "resources": {"requests": {"cpu": cpu, "memory": memory}}}]}
+    if affinity:
+        pod_spec["affinity"] = affinity
+    if spread:
+        pod_spec["topologySpreadConstraints"] = spread
+    return {"apiVersion": "apps/v1", "kind": "Deployment",
+            "metadata": {"name": name, "namespace": "production"},
+            "spec": {"replicas": replicas, "selector": {"matchLabels": {"app": name}},
+                     "template": {"metadata": {"labels": {"app": name}}, "spec": pod_spec}}}
+
+
+def anti_affinity(name="ha-app"):
+    selector = {"matchExpressions": [{"key": "app", "operator": "In", "values": [name]}]}
+    return {"podAntiAffinity": {
+        "preferredDuringSchedulingIgnoredDuringExecution": [
+            {"weight": 100, "podAffinityTerm": {"labelSelector": selector, "topologyKey": "kubernetes.io/hostname"}}],
+        "requiredDuringSchedulingIgnoredDuringExecution": [
+            {"labelSelector": selector, "topologyKey": "topology.kubernetes.io/zone"}]}}
+
+
+def zone_spread(when="DoNotSchedule", name="web"):
+    return [{"maxSkew": 1, "topologyKey": "topology.kubernetes.io/zone", "whenUnsatisfiable": when,
+             "labelSelector": {"matchLabels": {"app": name}}}]
+
+
+def test_day2_zone_anti_affinity_leaves_three_pending():
+    """day2 ha-app: 레플리카 6개, 존 단위 required anti-affinity, 3개 존 -> 존마다 1개 배치, 3개 Pending"""
+    compiled = CompiledWorkloads([workload_from_manifest(deployment(affinity=anti_affinity()))])
+    result = simulate(compiled, [NodePool(nodes_per_zone=2)])
+
+    assert len(result.nodes) == 6
+    assert result.zone_distribution("production/ha-app") == {zone: 1 for zone in HA_ZONES}
+    assert [pod.replica for pod in result.pending] == [3, 4, 5]
+    assert result.pending[0].reason == "0/6 nodes are available: 6 node(s) didn't match pod anti-affinity rules"
+    assert result.summary()["scheduled"] == 3 and not result.schedulable
+
+    # 노드를 늘려도 존이 3개뿐이면 해결되지 않음, 레플리카 3개면 존당 1노드로 충분
+    assert minimum_nodes(compiled, [NodePool(max_nodes=4)]).nodes_per_zone is None
+    sizing = minimum_nodes(compiled.with_replicas(3), [NodePool()])
+    assert (sizing.nodes_per_zone, sizing.total_nodes) == (1, 3)
+
+
+def test_hostname_anti_affinity_prefers_empty_nodes():
+    """preferred hostname anti-affinity만 있으면 6개 노드에 하나씩 분산"""
+    affinity = anti_affinity()
+    del affinity["podAntiAffinity"]["requiredDuringSchedulingIgnoredDuringExecution"]
+    result = simulate(CompiledWorkloads([workload_from_manifest(deployment(affinity=affinity))]),
+                      [NodePool(nodes_per_zone=2)])
+    assert result.schedulable
+    assert len(set(result.placements["production/ha-app"])) == 6
+
+
+def test_spread_constraint_skew():
+    """존 c 노드가 작으면 maxSkew=1 DoNotSchedule은 a/b에 2개씩만 허용하고 나머지는 Pending"""
+    pools = [NodePool(name="big", zones=HA_ZONES[:2], nodes_per_zone=1, cpu=4000.0, memory=8 * GI),
+             NodePool(name="small", zones=HA_ZONES[2:], nodes_per_zone=1, cpu=300.0, memory=8 * GI)]
+    hard = CompiledWorkloads([workload_from_manifest(deployment("web", replicas=7, spread=zone_spread()))])
+    result = simulate(hard, pools)
+
+    assert result.zone_distribution("production/web") == {HA_ZONES[0]: 2, HA_ZONES[1]: 2, HA_ZONES[2]: 1}
+    assert [pod.replica for pod in result.pending] == [5, 6]
+    assert result.pending[0].reason == ("0/3 nodes are available: 1 Insufficient cpu, "
+                                        "2 node(s) didn't match pod topology spread constraints")
+
+    # ScheduleAnyway는 점수에만 반영되므로 skew를 넘겨서라도 모두 배치
+    soft = CompiledWorkloads([workload_from_manifest(
+        deployment("web", replicas=7, spread=zone_spread("ScheduleAnyway")))])
+    relaxed = simulate(soft, pools)
+    assert relaxed.schedulable
+    distribution = relaxed.zone_distribution("production/web")
+    assert distribution[HA_ZONES[2]] == 1 and distribution[HA_ZONES[0]] + distribution[HA_ZONES[1]] == 6
+
+
+def test_resources_and_daemonset_overhead(tmp_path):
+    """요청량/DaemonSet 오버헤드로 인한 Insufficient cpu와 최소 노드 수"""
+    daemonset = {"apiVersion": "apps/v1", "kind": "DaemonSet", "metadata": {"name": "agent"},
+                 "spec": {"template": {"spec": {"containers": [
+                     {"name": "agent", "resources": {"requests": {"cpu": "240m", "memory": "100Mi"}}}]}}}}
+    path = tmp_path / "app.yaml"
+    path.write_text(yaml.safe_dump_all([deployment("api", replicas=9, cpu="300m"), daemonset]), encoding="utf-8")
+
+    workloads, overhead = load_workloads([path])
+    assert overhead == (240.0, 100 * 1024 ** 2)
+    compiled = CompiledWorkloads(workloads)
+    # e2-medium 940m - 240m = 700m -> 노드당 2개, 3개 존 x 1노드 = 6개
+    result = simulate(compiled, [NodePool(nodes_per_zone=1)], overhead)
+    assert len(result.pending) == 3 and "Insufficient cpu" in result.pending[0].reason
+    assert minimum_nodes(compiled, [NodePool()], overhead).nodes_per_zone == 2
+
+
+def test_selector_matches():
+    labels = {"app": "web", "tier": "frontend", "version": "3"}
+    assert selector_matches({"matchLabels": {"app": "web"}}, labels)
+    assert not selector_matches(None, labels)
+    assert selector_matches({"matchExpressions": [{"key": "tier", "operator": "NotIn", "values": ["db"]},
+                                                  {"key": "version", "operator": "Gt", "values": ["2"]},
+                                                  {"key": "canary", "operator": "DoesNotExist"}]}, labels)
+    assert not selector_matches({"matchExpressions": [{"key": "app", "operator": "Exists"},
+                                                      {"key": "version", "operator": "Lt", "values": ["3"]}]}, labels)
+    with pytest.raises(ValueError, match="지원하지 않는 연산자"):
+        selector_matches({"matchExpressions": [{"key": "app", "operator": "Like"}]}, labels)
+
+
+def test_main_size_json(tmp_path, capsys):
+    """--size --replicas 출력과 Pending이 남을 때 종료 코드"""
+    path = tmp_path / "anti-affinity-deployment.yaml"
+    path.write_text(yaml.safe_dump(deployment(affinity=anti_affinity())), encoding="utf-8")
+
+    assert main([str(path), "--size", "--replicas", "3,6", "--max-nodes", "3", "--json"]) == 1
+    rows = json.loads(capsys.readouterr().out)
+    assert [(row["replicas"], row["nodes_per_zone"], row["pending"]) for row in rows] == [(3, 1, 0), (6, None, 3)]
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Pod 콜드 스타트 구간 분석기 테스트
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import run_store
+from pod_startup_profiler import (parse_go_duration, profile_pod, summarize, collect, images_from_manifests,
+                                  prepull, record_summary, PREPULL_NAME)
+
+T0 = 1_700_000_000
+
+
+def ts(offset):
+    return datetime.fromtimestamp(T0 + offset, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def make_pod(name, scheduled=2, started=7, ready=9, node="node-1"):
+    conditions = [{"type": "PodScheduled", "status": "True", "lastTransitionTime": ts(scheduled)}]
+    if ready is not None:
+        conditions.append({"type": "Ready", "status": "True", "lastTransitionTime": ts(ready)})
+    return {"metadata": {"name": name, "namespace": "default", "creationTimestamp": ts(0)},
+            "spec": {"nodeName": node},
+            "status": {"conditions": conditions,
+                       "containerStatuses": [{"state": {"running": {"startedAt": ts(started)}}}]}}
+
+
+def pulled(pod, message, at=5):
+    return {"involvedObject": {"name": pod}, "reason": "Pulled", "message": message, "eventTime": ts(at)}
+
+
+def pulling(pod, at=2):
+    return {"involvedObject": {"name": pod}, "reason": "Pulling", "eventTime": ts(at)}
+
+
+class TestStartupPhases:
+    """기동 구간 계산 테스트 클래스"""
+
+    @pytest.mark.parametrize("value,expected", [("1m2.5s", 62.5), ("850ms", 0.85), ("2.345s", 2.345),
+                                                ("1h", 3600.0), ("fast", None), ("3s extra", None)])
+    def test_parse_go_duration(self, value, expected):
+        """Go duration 문자열 파싱 테스트"""
+        assert parse_go_duration(value) == (pytest.approx(expected) if expected is not None else None)
+
+    def test_cold_pod_phases(self):
+        """이미지를 새로 받은 Pod의 스케줄링/풀/시작/Ready 구간 테스트"""
+        events = [pulling("web-1"), pulled("web-1", 'Successfully pulled image "nginx:1.25" in 3.5s '
+                                                    '(3.5s including waiting)')]
+        startup = profile_pod(make_pod("web-1"), events)
+        assert startup.cold and startup.ready
+        assert (startup.scheduling, startup.image_pull, startup.container_start, startup.readiness,
+                startup.total) == (2.0, 3.5, 1.5, 2.0, 9.0)
+
+    def test_warm_and_not_ready_pods(self):
+        """이미 있던 이미지(warm)와 아직 Ready가 아닌 Pod 테스트"""
+        warm = profile_pod(make_pod("web-2", started=3, ready=4),
+                           [pulled("web-2", 'Container image "nginx:1.25" already present on machine', at=2)])
+        assert not warm.cold and warm.image_pull == 0.0 and warm.total == 4.0
+
+        pending = profile_pod(make_pod("web-3", ready=None), [])
+        assert not pending.ready and pending.readiness is None and pending.scheduling == 2.0
+
+    def test_summary_and_collect(self):
+        """cold/warm 백분위수 요약과 Pod별 이벤트 묶기 테스트"""
+        pods = [make_pod("cold-1"), make_pod("cold-2", ready=11), make_pod("warm-1", started=3, ready=4),
+                make_pod("pending", ready=None)]
+        events = [pulled("cold-1", "Successfully pulled image in 3s"), pulled("cold-2", "Successfully pulled image in 4s"),
+                  pulled("warm-1", "already present on machine")]
+
+        def runner(command):
+            return json.dumps({"items": pods if command[2] == "pods" else events})
+
+        startups = collect("default", "app=web", runner=runner)
+        assert [s.name for s in startups if s.cold] == ["cold-1", "cold-2"]
+
+        summary = summarize(startups)
+        assert summary["pods"] == 4 and summary["not_ready"] == 1
+        assert summary["cold"]["pods"] == 2 and summary["warm"]["pods"] == 1
+        assert summary["cold"]["total"] == {"p50": 9.0, "p90": 11.0, "max": 11.0}
+        assert summary["cold"]["image_pull"]["p50"] == 3.0
+        assert summary["warm_speedup_p50"] == 5.0
+
+    def test_record_summary(self, monkeypatch):
+        """cold/warm 중앙값을 종류별 실행으로 기록하고 빈 그룹은 건너뛰는지 테스트"""
+        recorded = []
+        monkeypatch.setattr(run_store, "record_safely", lambda kind, run, status=None: recorded.append((kind, run)))
+        summary = summarize([profile_pod(make_pod("web-1"), [pulled("web-1", "pulled in 3.5s")])])
+        record_summary(summary)
+
+        [(kind, run)] = recorded
+        assert kind == "pod_startup_cold" and run.meta == {"pods": 1}
+        assert {step.step: step.duration for step in run.steps}["total"] == 9.0
+
+
+class TestPrepull:
+    """이미지 미리 받기 테스트 클래스"""
+
+    def test_images_from_manifests(self, tmp_path):
+        """Deployment/CronJob/Pod 매니페스트에서 이미지를 순서대로 중복 없이 추출하는지 테스트"""
+        manifest = tmp_path / "app.yaml"
+        manifest.write_text("""
+apiVersion: apps/v1
+kind: Deployment
+spec:
+  template:
+    spec:
+      initContainers: [{name: init, image: busybox:1.36}]
+      containers: [{name: web, image: nginx:1.25}, {name: sidecar, image: busybox:1.36}]
+---
+apiVersion: batch/v1
+kind: CronJob
+spec:
+  jobTemplate:
+    spec:
+      template:
+        spec:
+          containers: [{name: job, image: python:3.11-slim}]
+---
+apiVersion: v1
+kind: Pod
+spec:
+  containers: [{name: debug, image: nginx:1.25}]
+""")
+        assert images_from_manifests([manifest]) == ["busybox:1.36", "nginx:1.25", "python:3.11-slim"]
+
+    def test_prepull_waits_for_all_nodes_and_cleans_up(self):
+        """모든 노드의 초기화 컨테이너가 이미지를 받을 때까지 대기 후 DaemonSet을 삭제하는지 테스트"""
+        images = ["nginx:1.25", "busybox:1.36"]
+        polls = [
+            [{"imageID": "sha256:a"}, {}],
+            [{"imageID": "sha256:a"}, {"imageID": "sha256:b"}],
+        ]
+        calls, sleeps = [], []
+
+        def runner(command, input=None):
+            calls.append((command, input))
+            if command[:2] == ["kubectl", "get"] and command[2] == "daemonset":
+                return json.dumps({"status": {"desiredNumberScheduled": 2}})
+            if command[:3] == ["kubectl", "get", "pods"]:
+                # node-1은 처음부터 완료, node-2는 두 번째 조회에서 완료
+                node2 = polls.pop(0) if len(polls) > 1 else polls[0]
+                return json.dumps({"items": [
+                    {"spec": {"nodeName": "node-1"}, "status": {"initContainerStatuses": [
+                        {"image": image, "imageID": f"sha256:{image}"} for image in images]}},
+                    {"spec": {"nodeName": "node-2"}, "status": {"initContainerStatuses": [
+                        {"image": image, **status} for image, status in zip(images, node2)]}}]})
+            return ""
+
+        result = prepull(images, runner=runner, sleep=sleeps.append)
+        assert result["nodes"] == result["desired"] == 2 and not result["failed"]
+        assert len(sleeps) == 1
+
+        manifest = json.loads(calls[0][1])
+        assert [c["image"] for c in manifest["spec"]["template"]["spec"]["initContainers"]] == images
+        assert calls[-1][0][:4] == ["kubectl", "delete", "daemonset", PREPULL_NAME]
+
+    def test_prepull_reports_pull_errors(self):
+        """이미지 풀 실패 노드를 보고하고 시간 초과 후에도 DaemonSet을 삭제하는지 테스트"""
+        def runner(command, input=None):
+            if command[:3] == ["kubectl", "get", "daemonset"]:
+                return json.dumps({"status": {"desiredNumberScheduled": 1}})
+            if command[:3] == ["kubectl", "get", "pods"]:
+                waiting = {"image": "private/app:1", "state": {"waiting": {"reason": "ImagePullBackOff"}}}
+                return json.dumps({"items": [{"spec": {"nodeName": "node-1"},
+                                              "status": {"initContainerStatuses": [waiting]}}]})
+            runner.deleted = command[:3] == ["kubectl", "delete", "daemonset"]
+            return ""
+
+        result = prepull(["private/app:1"], timeout=0, runner=runner, sleep=lambda seconds: None)
+        assert result["failed"] == {"node-1": ["private/app:1"]} and result["nodes"] == 0
+        assert runner.deleted
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+리소스 적정화 추천기 테스트
+"""
+
+import json
+
+import numpy as np
+import pytest
+import yaml
+
+from rightsizing import (UsageSeries, ContainerResources, recommend, savings_report, pack_nodes, load_manifests,
+                         parse_cpu, parse_memory, parse_kubectl_top, workload_name, set_resources_commands, main)
+
+MI = 1024 ** 2
+
+
+def series_from(values):
+    """{(워크로드, 컨테이너): [(cpu_m, memory_bytes), ...]} -> UsageSeries"""
+    series = UsageSeries(initial_capacity=2)
+    for (workload, container), samples in values.items():
+        for ts, (cpu, memory) in enumerate(samples):
+            series.append(ts, "production", workload, container, cpu, memory)
+    return series
+
+
+def test_percentiles_match_numpy():
+    """키별 선형 보간 백분위수가 numpy와 같고, 샘플이 없는 키는 NaN"""
+    rng = np.random.default_rng(7)
+    series = UsageSeries(initial_capacity=4)
+    expected = {}
+    for name, size in (("a", 1), ("b", 17), ("c", 250)):
+        values = rng.gamma(2.0, 50.0, size).astype(np.float32)
+        expected[name] = values.astype(np.float64)
+        for i, value in enumerate(values):
+            series.append(i, "default", name, "app", float(value), 0.0)
+    series.key_id("default", "empty", "app")
+
+    quantiles = [0.0, 0.5, 0.9, 0.99, 1.0]
+    result = series.percentiles("cpu", quantiles)
+    for row, name in enumerate("abc"):
+        assert result[row] == pytest.approx(np.percentile(expected[name], [q * 100 for q in quantiles]))
+    assert np.isnan(result[3]).all()
+    assert series.sample_counts().tolist() == [1, 17, 250, 0]
+
+
+def test_headroom_and_rounding():
+    """request = P90/P95 x (1 + 여유율), limit = P99/최댓값 x (1 + limit 여유율), 단위 올림"""
+    series = series_from({("web", "nginx"): [(100.0, 64 * MI)] * 9 + [(200.0, 64 * MI)]})
+    [rec] = recommend(series)
+
+    # CPU P90 = 110m (100과 200 사이 보간) -> x1.15 = 126.5m -> 5m 단위 올림 130m
+    assert (rec.cpu_p90, rec.cpu_p99) == (pytest.approx(110.0), pytest.approx(191.0))
+    assert rec.recommended.cpu_request == 130.0
+    # CPU P99 = 191m -> x1.3 = 248.3m -> 250m
+    assert rec.recommended.cpu_limit == 250.0
+    # 메모리 64Mi -> request x1.15 = 73.6Mi -> 74Mi, limit x1.3 = 83.2Mi -> 84Mi
+    assert (rec.recommended.memory_request, rec.recommended.memory_limit) == (74 * MI, 84 * MI)
+
+    [wider] = recommend(series, margin=0.5, limit_margin=0.0)
+    assert wider.recommended.cpu_request == 165.0
+    # limit은 request보다 작아지지 않음
+    assert wider.recommended.cpu_limit == 195.0 and wider.recommended.memory_limit == 96 * MI
+
+
+def test_floors_and_min_samples():
+    """최소 request 하한과 샘플이 부족한 컨테이너 제외"""
+    series = series_from({("idle", "sidecar"): [(0.5, 1 * MI)] * 5, ("new", "app"): [(300.0, 200 * MI)] * 2})
+    [rec] = recommend(series, min_samples=3)
+
+    assert (rec.workload, rec.samples) == ("idle", 5)
+    assert (rec.recommended.cpu_request, rec.recommended.memory_request) == (10.0, 16 * MI)
+    assert [r.workload for r in recommend(series, min_samples=2)] == ["idle", "new"]
+
+
+def test_change_recommended_against_manifest(tmp_path):
+    """과다 요청은 낮추고 부족한 요청은 올리며, 빈 패킹 노드 수 절감 계산"""
+    manifest = tmp_path / "deploy.yaml"
+    manifest.write_text(yaml.safe_dump_all([
+        {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": {"name": "ha-app", "namespace": "production"},
+         "spec": {"replicas": 6, "template": {"spec": {"containers": [
+             {"name": "ha-app", "resources": {"requests": {"cpu": "1", "memory": "1Gi"},
+                                              "limits": {"cpu": "2", "memory": "2Gi"}}}]}}}},
+        {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": {"name": "api", "namespace": "production"},
+         "spec": {"template": {"spec": {"containers": [
+             {"name": "api", "resources": {"requests": {"cpu": "50m", "memory": "32Mi"}}}]}}}},
+    ]), encoding="utf-8")
+    current = load_manifests([manifest])
+    assert current[("production", "ha-app", "ha-app")] == (6, ContainerResources(1000.0, 2000.0, 1024 * MI, 2048 * MI))
+    assert current[("production", "api", "api")] == (1, ContainerResources(50.0, None, 32 * MI, None))
+
+    series = series_from({("ha-app", "ha-app"): [(200.0, 100 * MI)] * 10,
+                          ("api", "api"): [(400.0, 300 * MI)] * 10,
+                          ("unknown", "app"): [(5.0, 10 * MI)] * 10})
+    recommendations = {r.workload: r for r in recommend(series, current)}
+
+    ha, api = recommendations["ha-app"], recommendations["api"]
+    assert ha.recommended.cpu_request < ha.current.cpu_request
+    assert ha.recommended.memory_request < ha.current.memory_request
+    assert api.recommended.cpu_request > api.current.cpu_request
+    assert api.recommended.memory_request > api.current.memory_request
+    assert recommendations["unknown"].current is None
+
+    report = savings_report(list(recommendations.values()), node_cpu=1930.0, node_memory=5.5 * 1024 * MI)
+    assert report["containers_compared"] == 2
+    assert report["cpu_requests"] == {"current": "6050m", "recommended": "1840m"}
+    # 1000m 파드는 1930m 노드에 하나씩 -> 6개, 230m x 6 + 460m = 1840m -> 1개
+    assert report["nodes"] == {"current": 6, "recommended": 1, "saved": 5}
+    assert set_resources_commands([api]) == [
+        "kubectl set resources deployment/api -n production -c api "
+        "--requests=cpu=460m,memory=345Mi --limits=cpu=520m,memory=390Mi"]
+
+
+def test_pack_nodes():
+    assert pack_nodes([], 1000.0, 1000.0) == 0
+    assert pack_nodes([(600.0, 100.0), (500.0, 100.0), (400.0, 100.0), (500.0, 100.0)], 1000.0, 1000.0) == 2
+    # 메모리가 더 빡빡하면 메모리 기준으로 노드 수 결정
+    assert pack_nodes([(100.0, 600.0)] * 3, 1000.0, 1000.0) == 3
+    with pytest.raises(ValueError, match="노드보다 큰 파드"):
+        pack_nodes([(1500.0, 1.0)], 1000.0, 1000.0)
+
+
+def test_parsing():
+    assert (parse_cpu("250m"), parse_cpu("0.5"), parse_cpu(2), parse_cpu("1500000n")) == (250.0, 500.0, 2000.0, 1.5)
+    assert (parse_memory("64Mi"), parse_memory("1G"), parse_memory(123)) == (64 * MI, 1e9, 123.0)
+    with pytest.raises(ValueError):
+        parse_cpu("lots")
+    assert workload_name("ha-app-7d4b9c8f6d-x2k9p") == "ha-app"
+    assert workload_name("prometheus-0") == "prometheus"
+
+    samples = parse_kubectl_top("ha-app-7d4b9c8f6d-x2k9p   ha-app   3m   12Mi\n"
+                                "monitoring prometheus-0 prometheus 120m 410Mi\n", "production", 1.0)
+    assert [(s["namespace"], s["pod"], s["cpu_m"]) for s in samples] == [
+        ("production", "ha-app-7d4b9c8f6d-x2k9p", 3.0), ("monitoring", "prometheus-0", 120.0)]
+
+
+def test_main_recommend_json(tmp_path, capsys):
+    recording = tmp_path / "samples.jsonl"
+    recording.write_text("".join(json.dumps({"ts": i, "namespace": "production", "pod": "web-0",
+                                             "container": "web", "cpu_m": 40.0, "memory_bytes": 50 * MI}) + "\n"
+                                 for i in range(4)), encoding="utf-8")
+    assert main(["recommend", str(recording), "--json"]) == 0
+    output = json.loads(capsys.readouterr().out)
+    [rec] = output["recommendations"]
+    assert (rec["workload"], rec["recommended"]["cpu_request"]) == ("web", 50.0)
+    assert output["savings"]["containers_compared"] == 0
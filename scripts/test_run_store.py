@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+실행 이력 저장소 테스트
+"""
+
+import json
+import time
+
+import pytest
+
+from run_store import RunStore, StepRecord, record_safely, RunRecorder, main
+
+DAY = 86400
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RunStore(tmp_path / "runs.db")
+    yield store
+    store.close()
+
+
+def add_runs(store, kind, commit, durations, started_at=0.0, step="build", status="success"):
+    for i, duration in enumerate(durations):
+        store.record_run(kind, [StepRecord(step, duration, status)], started_at=started_at + i,
+                         git_commit=commit)
+
+
+class TestRunStore:
+    """실행 이력 저장소 테스트 클래스"""
+
+    def test_record_and_list_runs(self, store):
+        """실행 추가(덮어쓰지 않음), 단계 결과로 실행 상태 결정, 최근 순 목록 테스트"""
+        first = store.record_run("dry_run", [StepRecord("syntax", 1.0), StepRecord("yaml", 2.0)],
+                                 started_at=100.0, git_commit="aaa")
+        second = store.record_run("dry_run", [StepRecord("syntax", 1.5, "failed")], started_at=200.0,
+                                  git_commit="bbb")
+        store.record_run("dependency_install", [StepRecord("kubectl", 3.0)], started_at=300.0, git_commit="bbb")
+
+        runs = store.runs("dry_run")
+        assert [run["id"] for run in runs] == [second, first]
+        assert [run["status"] for run in runs] == ["failed", "success"]
+        assert runs[1]["duration"] == pytest.approx(3.0)
+        assert len(store.runs()) == 3 and store.step_names("dry_run") == ["syntax", "yaml"]
+
+    def test_percentiles_nearest_rank(self, store):
+        """최근접 순위 백분위수와 실패 단계 제외, 기간 필터 테스트"""
+        add_runs(store, "dry_run", "aaa", [7, 3, 10, 1, 5, 9, 2, 8, 4, 6], started_at=1000.0)
+        add_runs(store, "dry_run", "aaa", [100.0], started_at=2000.0, status="failed")
+
+        assert store.percentiles("dry_run", "build") == {"count": 10, "p50": 5, "p90": 9, "p99": 10}
+        assert store.percentiles("dry_run", "build", [0.25, 0.5])["p25"] == 3
+        assert store.percentiles("dry_run", "build", since=1005.0) == {"count": 5, "p50": 6, "p90": 9, "p99": 9}
+        assert store.percentiles("dry_run", "missing") == {"count": 0, "p50": None, "p90": None, "p99": None}
+
+    def test_trend_buckets(self, store):
+        """기간별 실행 수/평균/실패 수 집계 테스트"""
+        add_runs(store, "day1", "aaa", [10, 20], started_at=0.0)
+        add_runs(store, "day1", "aaa", [30], started_at=DAY, status="failed")
+
+        rows = store.trend("day1", "build", "day")
+        assert [(row["period"], row["runs"], row["avg"], row["failures"]) for row in rows] == [
+            ("1970-01-01", 2, 15.0, 0), ("1970-01-02", 1, 30.0, 1)]
+        assert [row["runs"] for row in store.trend("day1", bucket="month")] == [3]
+
+    def test_regressions_since_commit(self, store):
+        """기준 커밋 대비 중앙값이 임계값 이상 느려진 단계만 보고하는지 테스트"""
+        for i in range(5):
+            store.record_run("dry_run", [StepRecord("build", 10.0), StepRecord("lint", 2.0)],
+                             started_at=float(i), git_commit="a1b2c3d4")
+        for i in range(5):
+            store.record_run("dry_run", [StepRecord("build", 15.0), StepRecord("lint", 2.2)],
+                             started_at=100.0 + i, git_commit="e5f6a7b8")
+
+        regressions = store.regressions("dry_run", "a1b2c3d", threshold=0.4)
+        assert [(r["step"], r["baseline_p50"], r["recent_p50"]) for r in regressions] == [("build", 10.0, 15.0)]
+        assert regressions[0]["change"] == pytest.approx(0.5)
+        assert regressions[0]["baseline_runs"] == regressions[0]["recent_runs"] == 5
+        assert store.regressions("dry_run", "a1b2c3d", threshold=0.6) == []
+        with pytest.raises(ValueError):
+            store.regressions("dry_run", "ffffff")
+
+    def test_thousands_of_runs(self, store):
+        """수천 건에서도 인덱스 조회로 백분위수를 계산하는지 테스트"""
+        with store.conn:
+            store.conn.executemany("INSERT INTO runs (id, kind, started_at, duration, status, git_commit) "
+                                   "VALUES (?, 'dry_run', ?, ?, 'success', 'aaa')",
+                                   [(i, float(i), float(i)) for i in range(1, 5001)])
+            store.conn.executemany("INSERT INTO steps (run_id, kind, step, started_at, duration, status) "
+                                   "VALUES (?, 'dry_run', 'build', ?, ?, 'success')",
+                                   [(i, float(i), float(5001 - i)) for i in range(1, 5001)])
+        started = time.perf_counter()
+        result = store.percentiles("dry_run", "build")
+        assert result == {"count": 5000, "p50": 2500.0, "p90": 4500.0, "p99": 4950.0}
+        assert time.perf_counter() - started < 1.0
+
+    def test_recorder_and_record_safely(self, store, tmp_path):
+        """with 블록 실행 기록(예외 시 failed)과 저장 실패 시 경고만 남기는지 테스트"""
+        with pytest.raises(RuntimeError):
+            with store.recorder("day1", git_commit="aaa") as run:
+                with run.step("create_cluster"):
+                    pass
+                with run.step("deploy_app"):
+                    raise RuntimeError("boom")
+        [row] = store.runs("day1")
+        assert row["status"] == "failed"
+        statuses = dict(store.conn.execute("SELECT step, status FROM steps WHERE run_id=?", (row["id"],)))
+        assert statuses == {"create_cluster": "success", "deploy_app": "failed"}
+
+        run = RunRecorder(kind="dry_run")
+        run.add("syntax", 1.0)
+        assert record_safely("dry_run", run, db_path=tmp_path) is None
+
+    def test_cli_record_and_query(self, tmp_path, capsys):
+        """record 명령으로 기록 후 percentiles/regressions 조회 테스트"""
+        db = str(tmp_path / "runs.db")
+        assert main(["--db", db, "record", "--kind", "day1", "--commit", "aaa",
+                     "--step", "create_gke_cluster=400", "--step", "deploy_app=35.5:failed"]) == 0
+        capsys.readouterr()
+
+        assert main(["--db", db, "--json", "percentiles", "day1"]) == 0
+        rows = json.loads(capsys.readouterr().out)
+        assert rows == [{"step": "create_gke_cluster", "count": 1, "p50": 400.0, "p90": 400.0, "p99": 400.0},
+                        {"step": "deploy_app", "count": 0, "p50": None, "p90": None, "p99": None}]
+        assert main(["--db", db, "regressions", "day1", "--baseline", "zzz"]) == 2
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+단계별 프로파일러 테스트
+"""
+
+import sys
+import json
+import time
+import subprocess
+
+import pytest
+
+from step_profiler import StepProfiler, main, MERGED_FOLDED, MERGED_PSTATS, SUMMARY_FILE
+
+
+def spin(seconds):
+    end = time.thread_time() + seconds
+    while time.thread_time() < end:
+        pass
+
+
+def test_child_wait_and_popen_restored(tmp_path):
+    """자식 프로세스 대기 시간/생성 수 집계와 단계 종료 후 Popen 원복 테스트"""
+    originals = (subprocess.Popen.__init__, subprocess.Popen.wait, subprocess.Popen.communicate)
+    profiler = StepProfiler(tmp_path)
+    with profiler.profile("child") as step:
+        subprocess.run([sys.executable, "-c", "import time; time.sleep(0.3)"], check=True)
+
+    assert step.children == 1
+    assert 0.25 <= step.child_wait <= step.wall
+    assert step.child_cpu > 0
+    assert (subprocess.Popen.__init__, subprocess.Popen.wait, subprocess.Popen.communicate) == originals
+
+
+def test_popen_restored_when_step_fails(tmp_path):
+    """단계가 예외로 끝나도 Popen을 원복하고 단계를 기록하는지 테스트"""
+    originals = (subprocess.Popen.__init__, subprocess.Popen.wait, subprocess.Popen.communicate)
+    profiler = StepProfiler(tmp_path, mode="cprofile")
+    with pytest.raises(RuntimeError):
+        with profiler.profile("broken"):
+            raise RuntimeError("boom")
+
+    assert (subprocess.Popen.__init__, subprocess.Popen.wait, subprocess.Popen.communicate) == originals
+    assert [step.step for step in profiler.steps] == ["broken"]
+    # 실패 후에도 다음 단계를 프로파일링
+    with profiler.profile("next") as step:
+        pass
+    assert step is not None
+
+
+def test_cpu_excludes_sampler_thread(tmp_path):
+    """대기만 하는 단계의 CPU에 바쁜 샘플러 스레드의 CPU가 섞이지 않는지 테스트"""
+    profiler = StepProfiler(tmp_path, interval=0.0001)
+    with profiler.profile("idle") as idle:
+        time.sleep(0.4)
+    with profiler.profile("busy") as busy:
+        spin(0.3)
+
+    assert idle.samples > 0
+    assert idle.cpu < 0.02
+    assert busy.cpu >= 0.25
+    assert idle.other > 0.3
+
+
+def test_sample_mode_outputs(tmp_path):
+    """단계별 folded 파일, 단계 이름을 최상위로 둔 병합 출력, summary.json, report 테스트"""
+    profiler = StepProfiler(tmp_path, interval=0.001)
+    with profiler.profile("first step"):
+        spin(0.05)
+    with profiler.profile("second"):
+        with profiler.profile("nested") as nested:
+            spin(0.05)
+    assert nested is None
+    merged = profiler.finish()
+
+    assert [step.step for step in profiler.steps] == ["first step", "second"]
+    assert [p.name for p in sorted(tmp_path.glob("0*"))] == ["01-first_step.folded", "02-second.folded"]
+    roots = {line.split(";", 1)[0] for line in merged.read_text(encoding="utf-8").splitlines()}
+    assert merged.name == MERGED_FOLDED and roots == {"first_step", "second"}
+    assert any("spin (test_step_profiler.py" in line for line in merged.read_text(encoding="utf-8").splitlines())
+    summary = json.loads((tmp_path / SUMMARY_FILE).read_text(encoding="utf-8"))
+    assert summary["mode"] == "sample" and len(summary["steps"]) == 2
+
+
+def test_cprofile_mode_and_report(tmp_path, capsys):
+    """cprofile 모드의 병합 pstats와 report 명령 출력 테스트"""
+    profiler = StepProfiler(tmp_path, mode="cprofile")
+    with profiler.profile("compute"):
+        spin(0.02)
+    assert profiler.finish().name == MERGED_PSTATS
+    assert (tmp_path / "01-compute.prof").exists()
+
+    assert main(["report", str(tmp_path), "--top", "5"]) == 0
+    out = capsys.readouterr().out
+    assert "compute" in out and "spin" in out
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(ValueError, match="지원하지 않는 프로파일 모드"):
+        StepProfiler(tmp_path, mode="perf")